@@ -0,0 +1,200 @@
+"""
+Strongly connected components of the item graph.
+
+Items are nodes and every unlocked recipe adds an edge from each of its inputs
+to the outputs it is a producer of. Items in the same non-trivial component
+feed each other (rubber / plastic recycling, rocket fuel's compacted coal fed
+back into turbofuel, ...); every other item sits on a plain DAG. Raw resources
+are treated as leaves, so byproduct outputs of raw items (e.g. water from
+alumina solution) do not make loops, matching how the solver taps them.
+
+Side streams do not count as producers where a real one exists: an item is
+produced by the recipes that make it as their main output; only if none is
+unlocked by the ones that make it as a byproduct; and only if neither by
+unpacking recipes (one that exactly reverses another unlocked recipe into
+more outputs than it takes, e.g. Unpackage Fuel -> fuel + empty canister).
+Otherwise packaging round trips and byproduct back-edges would tie most of the
+game into one component as soon as enough recipes are unlocked. A chain that
+really runs a round trip (only unpacking makes the item) still shows it as a
+loop.
+
+Components are found with Tarjan's algorithm (iterative, so deep modded
+chains do not hit the recursion limit) over the integer bitsets of the
+DependencyClosure.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from data.dependency_closure import DependencyClosure, bit_indices
+
+
+@dataclass
+class ComponentAnalysis:
+    """Strongly connected components of the item graph for one unlocked set."""
+    item_ids: List[str]
+    item_index: Dict[str, int]
+    unlocked_mask: int
+
+    # Component items (item indices), inputs before outputs between components
+    components: List[List[int]]
+
+    # Per item index: index into components
+    component_of: List[int]
+
+    # Per component: True if its items feed each other
+    cyclic: List[bool]
+
+    # Item bitset of every item in a cyclic component
+    loop_mask: int
+
+    # Per item index: item bitset of everything made directly from the item
+    successors: List[int]
+
+    def _index(self, item_id: str) -> Optional[int]:
+        return self.item_index.get(item_id)
+
+    def in_loop(self, item_id: str) -> bool:
+        """Check whether an item sits in a recycling loop."""
+        i = self._index(item_id)
+        return i is not None and bool(self.loop_mask >> i & 1)
+
+    def component(self, item_id: str) -> List[str]:
+        """Item IDs in the same component as an item (including itself)."""
+        i = self._index(item_id)
+        if i is None:
+            return []
+        return [self.item_ids[j] for j in self.components[self.component_of[i]]]
+
+    def is_loop_edge(self, from_item_id: str, to_item_id: str) -> bool:
+        """Check whether a flow between two items closes a loop."""
+        i = self._index(from_item_id)
+        j = self._index(to_item_id)
+        if i is None or j is None:
+            return False
+        c = self.component_of[i]
+        return c == self.component_of[j] and self.cyclic[c]
+
+    def loops(self) -> List[List[str]]:
+        """Item IDs of every cyclic component."""
+        return [
+            [self.item_ids[i] for i in items]
+            for items, cyclic in zip(self.components, self.cyclic)
+            if cyclic
+        ]
+
+    def loop_items(self) -> List[str]:
+        """IDs of every item that sits in a loop."""
+        return [self.item_ids[i] for i in bit_indices(self.loop_mask)]
+
+
+def build_component_analysis(closure: DependencyClosure, unlocked_mask: int) -> ComponentAnalysis:
+    """
+    Find the strongly connected components of the item graph.
+
+    Args:
+        closure: Dependency closure of the dataset (provides recipe bitsets)
+        unlocked_mask: Recipe bitset of the recipes that add edges
+
+    Returns:
+        ComponentAnalysis
+    """
+    num_items = len(closure.item_ids)
+    produced_mask = ~closure.raw_mask
+
+    unlocked = list(bit_indices(unlocked_mask))
+    signatures = {(closure.recipe_inputs[r], closure.recipe_outputs[r]) for r in unlocked}
+    unpacking = {
+        r for r in unlocked
+        if (closure.recipe_outputs[r], closure.recipe_inputs[r]) in signatures
+        and bin(closure.recipe_outputs[r]).count("1") > bin(closure.recipe_inputs[r]).count("1")
+    }
+    main_made = 0
+    made = 0
+    for r in unlocked:
+        if r not in unpacking:
+            main_made |= closure.recipe_main_output[r]
+            made |= closure.recipe_outputs[r]
+
+    # successors[i]: item bitset of everything made directly from item i
+    successors = [0] * num_items
+    for r in unlocked:
+        outputs = closure.recipe_outputs[r] & produced_mask
+        if r in unpacking:
+            outputs &= ~made
+        else:
+            outputs &= closure.recipe_main_output[r] | ~main_made
+        if outputs:
+            for i in bit_indices(closure.recipe_inputs[r]):
+                successors[i] |= outputs
+
+    index_of = [-1] * num_items
+    lowlink = [0] * num_items
+    on_stack = [False] * num_items
+    stack: List[int] = []
+    found: List[List[int]] = []
+    counter = 0
+
+    for root in range(num_items):
+        if index_of[root] != -1:
+            continue
+        index_of[root] = lowlink[root] = counter
+        counter += 1
+        stack.append(root)
+        on_stack[root] = True
+        work = [(root, iter(bit_indices(successors[root])))]
+        while work:
+            node, children = work[-1]
+            advanced = False
+            for child in children:
+                if index_of[child] == -1:
+                    index_of[child] = lowlink[child] = counter
+                    counter += 1
+                    stack.append(child)
+                    on_stack[child] = True
+                    work.append((child, iter(bit_indices(successors[child]))))
+                    advanced = True
+                    break
+                if on_stack[child] and index_of[child] < lowlink[node]:
+                    lowlink[node] = index_of[child]
+            if advanced:
+                continue
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                if lowlink[node] < lowlink[parent]:
+                    lowlink[parent] = lowlink[node]
+            if lowlink[node] == index_of[node]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack[member] = False
+                    component.append(member)
+                    if member == node:
+                        break
+                found.append(sorted(component))
+
+    # Tarjan emits a component after everything downstream of it
+    components = found[::-1]
+    component_of = [0] * num_items
+    cyclic = []
+    loop_mask = 0
+    for c, items in enumerate(components):
+        for i in items:
+            component_of[i] = c
+        is_cyclic = len(items) > 1 or bool(successors[items[0]] >> items[0] & 1)
+        cyclic.append(is_cyclic)
+        if is_cyclic:
+            for i in items:
+                loop_mask |= 1 << i
+
+    return ComponentAnalysis(
+        item_ids=closure.item_ids,
+        item_index=closure.item_index,
+        unlocked_mask=unlocked_mask,
+        components=components,
+        component_of=component_of,
+        cyclic=cyclic,
+        loop_mask=loop_mask,
+        successors=successors,
+    )
@@ -0,0 +1,476 @@
+"""
+Dataset handles: one ITEMS / RECIPES pair plus its derived indexes.
+
+The module-level accessors in data/satisfactory_db.py delegate to the base
+dataset. Modded or user-defined content is layered on top with
+`Dataset.with_overlay()`, which is copy-on-write: the overlay's items and
+recipes are read-through views of its parent, and the per-key indexes
+(producers, consumers, rates, records) are only rebuilt for the keys the
+overlay touches. Dense index structures (recipe matrix, closures, unlock
+codec) are built lazily per dataset on first use.
+
+All item and recipe data handed out by a Dataset is deeply read-only (see
+data/readonly.py), so one dataset can be shared by every session without
+defensive copies.
+"""
+
+from collections import OrderedDict
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Set, Tuple
+import itertools
+import threading
+
+from data.components import ComponentAnalysis, build_component_analysis
+from data.dependency_closure import DependencyClosure, build_dependency_closure
+from data.integrity import IntegrityReport, check_dataset, require_valid
+from data.item_depth import DepthTable, build_depth_table
+from data.recipe_matrix import RecipeMatrix, build_recipe_matrix
+from data.readonly import freeze
+from data.recipe_rates import RecipeRates, build_rate_table
+from data.records import (
+    Item, Recipe, build_item_records, build_recipe_records, item_from_dict, recipe_from_dict
+)
+from data.search_index import SearchHit, SearchIndex, build_search_index
+from data.unlock_mask import UnlockCodec, UnlockMask
+
+# Per-unlocked-set analyses kept per dataset (components, depth tables)
+COMPONENT_CACHE_SIZE = 64
+
+# Source of Dataset.token values; never reused within a process
+_TOKENS = itertools.count()
+
+
+class OverlayMapping(Mapping):
+    """
+    Read-only view of a base mapping with some keys replaced, added or removed.
+
+    Iteration keeps the base order (replaced keys stay in place), followed by
+    added keys in insertion order.
+    """
+
+    def __init__(self, base: Mapping, changes: Optional[Dict] = None, removed: Iterable = ()):
+        self._base = base
+        self._changes = dict(changes or {})
+        self._removed = frozenset(removed) - self._changes.keys()
+        self._added = [key for key in self._changes if key not in base]
+        self._len = (
+            len(base)
+            - sum(1 for key in self._removed if key in base)
+            + len(self._added)
+        )
+
+    def __getitem__(self, key):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._removed:
+            raise KeyError(key)
+        return self._base[key]
+
+    def __contains__(self, key) -> bool:
+        if key in self._changes:
+            return True
+        return key not in self._removed and key in self._base
+
+    def get(self, key, default=None):
+        if key in self._changes:
+            return self._changes[key]
+        if key in self._removed:
+            return default
+        return self._base.get(key, default)
+
+    def __iter__(self) -> Iterator:
+        removed = self._removed
+        for key in self._base:
+            if key not in removed:
+                yield key
+        yield from self._added
+
+    def __len__(self) -> int:
+        return self._len
+
+    @property
+    def changed_keys(self) -> Set:
+        """Keys replaced or added on top of the base mapping."""
+        return set(self._changes)
+
+    def __repr__(self) -> str:
+        return f"OverlayMapping({len(self)} keys, {len(self._changes)} changed, {len(self._removed)} removed)"
+
+
+def _build_item_indexes(recipes: Mapping) -> Tuple[Dict[str, tuple], Dict[str, tuple]]:
+    """
+    Build the item -> producing recipes and item -> consuming recipes indexes.
+
+    Both indexes are filled in a single pass over RECIPES and keep RECIPES order.
+    """
+    producers: Dict[str, list] = {}
+    consumers: Dict[str, list] = {}
+    for recipe in recipes.values():
+        for item_id in dict.fromkeys(output["item"] for output in recipe["outputs"]):
+            producers.setdefault(item_id, []).append(recipe)
+        for item_id in dict.fromkeys(inp["item"] for inp in recipe["inputs"]):
+            consumers.setdefault(item_id, []).append(recipe)
+    return (
+        {item_id: tuple(found) for item_id, found in producers.items()},
+        {item_id: tuple(found) for item_id, found in consumers.items()},
+    )
+
+
+def _recipe_items(recipe: Optional[Dict], side: str) -> Set[str]:
+    return {flow["item"] for flow in recipe[side]} if recipe else set()
+
+
+def _patch_item_index(
+    base_index: Mapping,
+    base_recipes: Mapping,
+    recipes: Mapping,
+    touched: Set[str],
+    side: str
+) -> Dict[str, tuple]:
+    """
+    Recompute index entries for the items whose recipe lists an overlay changes.
+
+    Unchanged recipes keep their base position, replaced recipes are swapped in
+    place and added recipes are appended.
+    """
+    affected: Dict[str, None] = {}
+    for recipe_id in touched:
+        # Items referenced by either the base or the overlay version
+        for item_id in _recipe_items(base_recipes.get(recipe_id), side):
+            affected[item_id] = None
+        for item_id in _recipe_items(recipes.get(recipe_id), side):
+            affected[item_id] = None
+
+    patched = {}
+    for item_id in affected:
+        entries = []
+        seen = set()
+        for recipe in base_index.get(item_id, ()):
+            recipe_id = recipe["id"]
+            if recipe_id in touched:
+                recipe = recipes.get(recipe_id)
+                if recipe is None or item_id not in _recipe_items(recipe, side):
+                    continue
+            entries.append(recipe)
+            seen.add(recipe_id)
+        for recipe_id in touched:
+            recipe = recipes.get(recipe_id)
+            if recipe_id not in seen and item_id in _recipe_items(recipe, side):
+                entries.append(recipe)
+        patched[item_id] = tuple(entries)
+    return patched
+
+
+class Dataset:
+    """A named ITEMS / RECIPES pair with its lookup indexes."""
+
+    def __init__(self, items: Mapping, recipes: Mapping, name: str = "base"):
+        """
+        Build a dataset and all of its per-key indexes.
+
+        Args:
+            items: Items database
+            recipes: Recipes database
+            name: Dataset name (e.g. "base" or a modpack name)
+        """
+        self.name = name
+        # Identifies this handle in process-wide caches without keeping it alive
+        self.token = next(_TOKENS)
+        self.parent: Optional["Dataset"] = None
+        self.integrity: Optional[IntegrityReport] = None  # set once verified
+        # Deeply read-only: shared by every session, never copied defensively
+        self.items = freeze(items)
+        self.recipes = freeze(recipes)
+        recipes = self.recipes
+
+        self._producers, self._consumers = _build_item_indexes(recipes)
+        self._rates = build_rate_table(recipes)
+        self._item_records = build_item_records(items)
+        self._recipe_records = build_recipe_records(recipes, self._rates)
+        self._producer_records = self._records_for(self._producers)
+
+        self._raw_resources: Optional[Mapping] = None
+        self._craftable_items: Optional[Mapping] = None
+        self._unlock_codec: Optional[UnlockCodec] = None
+        self._recipe_matrix: Optional[RecipeMatrix] = None
+        self._dependency_closure: Optional[DependencyClosure] = None
+        self._search_index: Optional[SearchIndex] = None
+        self._components: "OrderedDict[int, ComponentAnalysis]" = OrderedDict()
+        self._depth_tables: "OrderedDict[int, DepthTable]" = OrderedDict()
+        # Guards the two LRU caches above; sessions share one dataset
+        self._cache_lock = threading.Lock()
+
+    def _records_for(self, index: Mapping) -> Dict[str, Tuple[Recipe, ...]]:
+        return {
+            item_id: tuple(self._recipe_records[recipe["id"]] for recipe in found)
+            for item_id, found in index.items()
+        }
+
+    # Overlays
+
+    def with_overlay(
+        self,
+        items: Optional[Dict[str, Dict]] = None,
+        recipes: Optional[Dict[str, Dict]] = None,
+        removed_items: Iterable[str] = (),
+        removed_recipes: Iterable[str] = (),
+        name: Optional[str] = None,
+        verdict: Optional[IntegrityReport] = None
+    ) -> "Dataset":
+        """
+        Layer added / replaced / removed items and recipes on top of this dataset.
+
+        Nothing in this dataset is copied or mutated; the overlay shares every
+        untouched record and index entry with it. The integrity check is the
+        exception: it runs over the combined data, not just the touched keys,
+        since removing one recipe can strand items anywhere in the graph. It
+        is linear in the dataset (about a millisecond for the base game);
+        pass `verdict` to skip it when the combined data is already checked.
+
+        Args:
+            items: Items to add or replace (ITEMS schema)
+            recipes: Recipes to add or replace (RECIPES schema)
+            removed_items: Item IDs to hide
+            removed_recipes: Recipe IDs to hide
+            name: Overlay name (defaults to "<parent>+overlay")
+            verdict: Integrity report already computed for the combined data
+                (optional; checked here otherwise)
+
+        Returns:
+            New Dataset
+
+        Raises:
+            DatasetIntegrityError: If the combined data fails the integrity check
+        """
+        items = {item_id: freeze(item) for item_id, item in (items or {}).items()}
+        recipes = {recipe_id: freeze(recipe) for recipe_id, recipe in (recipes or {}).items()}
+        removed_items = set(removed_items)
+        removed_recipes = set(removed_recipes)
+        touched_recipes = set(recipes) | (removed_recipes & set(self.recipes))
+
+        overlay = Dataset.__new__(Dataset)
+        overlay.name = name or f"{self.name}+overlay"
+        overlay.token = next(_TOKENS)
+        overlay.parent = self
+        overlay.items = OverlayMapping(self.items, items, removed_items)
+        overlay.recipes = OverlayMapping(self.recipes, recipes, removed_recipes)
+        # Check the combined data up front: code downstream of a dataset
+        # indexes items without guards
+        if verdict is None:
+            verdict = check_dataset(overlay.items, overlay.recipes)
+        overlay.integrity = require_valid(verdict, overlay.name)
+
+        overlay._producers = OverlayMapping(
+            self._producers,
+            _patch_item_index(
+                self._producers, self.recipes, overlay.recipes, touched_recipes, "outputs"
+            ),
+        )
+        overlay._consumers = OverlayMapping(
+            self._consumers,
+            _patch_item_index(
+                self._consumers, self.recipes, overlay.recipes, touched_recipes, "inputs"
+            ),
+        )
+        overlay._rates = OverlayMapping(self._rates, build_rate_table(recipes), removed_recipes)
+        overlay._item_records = OverlayMapping(
+            self._item_records,
+            {item_id: item_from_dict(item) for item_id, item in items.items()},
+            removed_items,
+        )
+        overlay._recipe_records = OverlayMapping(
+            self._recipe_records,
+            {
+                recipe_id: recipe_from_dict(recipe, overlay._rates[recipe_id])
+                for recipe_id, recipe in recipes.items()
+            },
+            removed_recipes,
+        )
+        overlay._producer_records = OverlayMapping(
+            self._producer_records,
+            overlay._records_for({
+                item_id: overlay._producers[item_id]
+                for item_id in overlay._producers.changed_keys
+            }),
+        )
+
+        overlay._raw_resources = None
+        overlay._craftable_items = None
+        overlay._unlock_codec = None
+        overlay._recipe_matrix = None
+        overlay._dependency_closure = None
+        overlay._search_index = None
+        overlay._components = OrderedDict()
+        overlay._depth_tables = OrderedDict()
+        overlay._cache_lock = threading.Lock()
+        return overlay
+
+    # Dict accessors
+
+    def get_all_items(self) -> Mapping:
+        """Return all items."""
+        return self.items
+
+    def get_all_recipes(self) -> Mapping:
+        """Return all recipes."""
+        return self.recipes
+
+    def get_item_by_id(self, item_id) -> Optional[Dict]:
+        """Get item by ID."""
+        return self.items.get(item_id)
+
+    def get_recipe_by_id(self, recipe_id) -> Optional[Dict]:
+        """Get recipe by ID."""
+        return self.recipes.get(recipe_id)
+
+    def get_recipes_for_item(self, item_id) -> Tuple[Mapping, ...]:
+        """Get all recipes that produce a given item."""
+        return self._producers.get(item_id, ())
+
+    def get_recipes_using_item(self, item_id) -> Tuple[Mapping, ...]:
+        """Get all recipes that consume a given item as an input."""
+        return self._consumers.get(item_id, ())
+
+    def get_raw_resources(self) -> Mapping:
+        """Get all raw resource items (read-only, built on first use)."""
+        if self._raw_resources is None:
+            self._raw_resources = MappingProxyType(
+                {k: v for k, v in self.items.items() if v["isRawResource"]}
+            )
+        return self._raw_resources
+
+    def get_craftable_items(self) -> Mapping:
+        """Get all non-raw items that can be crafted (read-only, built on first use)."""
+        if self._craftable_items is None:
+            self._craftable_items = MappingProxyType(
+                {k: v for k, v in self.items.items() if not v["isRawResource"]}
+            )
+        return self._craftable_items
+
+    # Record accessors
+
+    def get_item_records(self) -> Mapping:
+        """Return all items as immutable records."""
+        return self._item_records
+
+    def get_recipe_records(self) -> Mapping:
+        """Return all recipes as immutable records."""
+        return self._recipe_records
+
+    def get_item_record(self, item_id) -> Optional[Item]:
+        """Get item record by ID."""
+        return self._item_records.get(item_id)
+
+    def get_recipe_record(self, recipe_id) -> Optional[Recipe]:
+        """Get recipe record by ID."""
+        return self._recipe_records.get(recipe_id)
+
+    def get_recipe_records_for_item(self, item_id) -> Tuple[Recipe, ...]:
+        """Get records of all recipes that produce a given item."""
+        return self._producer_records.get(item_id, ())
+
+    def get_recipe_rates(self, recipe_id) -> Optional[RecipeRates]:
+        """Get per-machine input/output rates (items/min at 100% clock) for a recipe."""
+        return self._rates.get(recipe_id)
+
+    # Dense index structures, built on first use
+
+    def get_unlock_codec(self) -> UnlockCodec:
+        """Get the codec mapping recipe IDs to unlock bitmask positions."""
+        if self._unlock_codec is None:
+            self._unlock_codec = UnlockCodec(list(self.recipes))
+        return self._unlock_codec
+
+    def encode_unlocked(self, recipe_ids: Iterable[str]) -> UnlockMask:
+        """Encode a set of unlocked recipe IDs as an immutable UnlockMask."""
+        return self.get_unlock_codec().encode(recipe_ids)
+
+    def get_recipe_matrix(self) -> RecipeMatrix:
+        """Get the sparse item x recipe matrix (items/min per machine)."""
+        if self._recipe_matrix is None:
+            self._recipe_matrix = build_recipe_matrix(self.items, self.recipes, self._rates)
+        return self._recipe_matrix
+
+    def get_dependency_closure(self) -> DependencyClosure:
+        """Get the per-item dependency closure bitsets."""
+        if self._dependency_closure is None:
+            self._dependency_closure = build_dependency_closure(self.get_recipe_matrix())
+        return self._dependency_closure
+
+    def _unlock_bits(self, unlocked_recipes: Optional[Iterable[str]]) -> int:
+        if unlocked_recipes is None:
+            return self.get_unlock_codec().full_mask
+        return self.encode_unlocked(unlocked_recipes).bits
+
+    def _cached(self, cache: OrderedDict, mask: int, build):
+        with self._cache_lock:
+            value = cache.get(mask)
+            if value is not None:
+                cache.move_to_end(mask)
+                return value
+        # Built outside the lock: builds are slow and a depth table build
+        # reads the component cache. A racing build of the same mask is
+        # harmless, the first one stored wins.
+        value = build()
+        with self._cache_lock:
+            value = cache.setdefault(mask, value)
+            while len(cache) > COMPONENT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return value
+
+    def get_component_analysis(self, unlocked_recipes: Optional[Iterable[str]] = None) -> ComponentAnalysis:
+        """
+        Get the strongly connected components of the item graph for an unlocked set.
+
+        Analyses are cached per unlock bitmask.
+
+        Args:
+            unlocked_recipes: Unlocked recipe IDs or UnlockMask (default: every recipe)
+
+        Returns:
+            ComponentAnalysis
+        """
+        return self._component_analysis(self._unlock_bits(unlocked_recipes))
+
+    def _component_analysis(self, mask: int) -> ComponentAnalysis:
+        return self._cached(
+            self._components, mask,
+            lambda: build_component_analysis(self.get_dependency_closure(), mask)
+        )
+
+    def get_depth_table(self, unlocked_recipes: Optional[Iterable[str]] = None) -> DepthTable:
+        """
+        Get the topological rank and depth of every item for an unlocked set.
+
+        Tables are cached per unlock bitmask.
+
+        Args:
+            unlocked_recipes: Unlocked recipe IDs or UnlockMask (default: every recipe)
+
+        Returns:
+            DepthTable
+        """
+        mask = self._unlock_bits(unlocked_recipes)
+        return self._cached(
+            self._depth_tables, mask,
+            lambda: build_depth_table(self._component_analysis(mask))
+        )
+
+    def get_search_index(self) -> SearchIndex:
+        """Get the prefix / fuzzy search index over item and recipe names."""
+        if self._search_index is None:
+            self._search_index = build_search_index(self.items, self.recipes)
+        return self._search_index
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """Search item names, recipe names and categories (see SearchIndex.search)."""
+        return self.get_search_index().search(query, kinds, limit)
+
+    def __repr__(self) -> str:
+        return f"Dataset({self.name!r}, {len(self.items)} items, {len(self.recipes)} recipes)"
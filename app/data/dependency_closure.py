@@ -0,0 +1,191 @@
+"""
+Transitive dependency closures of every item, as integer bitsets.
+
+Bit r of a recipe bitset stands for recipe index r and bit i of an item bitset
+for item index i, using the indices of the RecipeMatrix. With the closures
+precomputed, questions like "which unlocks matter for this target?" or "can
+this item be built with the current unlocks?" are answered with a handful of
+bitwise operations instead of a full ProductionChainSolver.solve.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, Iterable, List
+
+from data.recipe_matrix import RecipeMatrix
+
+
+@dataclass
+class DependencyClosure:
+    """Per-item closure bitsets over recipe and item indices."""
+    item_ids: List[str]
+    recipe_ids: List[str]
+    item_index: Dict[str, int]
+    recipe_index: Dict[str, int]
+
+    # Per item index: every recipe / item that can appear in the item's chain
+    recipe_bits: List[int]
+    item_bits: List[int]
+
+    # Per recipe index: input / output items, and the main (first) output
+    recipe_inputs: List[int]
+    recipe_outputs: List[int]
+    recipe_main_output: List[int]
+
+    raw_mask: int
+
+    def recipe_mask(self, recipe_ids: Iterable[str]) -> int:
+        """Encode recipe IDs as a bitset (unknown IDs are ignored)."""
+        index = self.recipe_index
+        mask = 0
+        for recipe_id in recipe_ids:
+            r = index.get(recipe_id)
+            if r is not None:
+                mask |= 1 << r
+        return mask
+
+    def recipes_in(self, mask: int) -> List[str]:
+        """Decode a recipe bitset into recipe IDs (index order)."""
+        return [self.recipe_ids[r] for r in bit_indices(mask)]
+
+    def items_in(self, mask: int) -> List[str]:
+        """Decode an item bitset into item IDs (index order)."""
+        return [self.item_ids[i] for i in bit_indices(mask)]
+
+    def chain_recipes(self, item_id: str) -> int:
+        """Bitset of recipes that could appear in the chain of an item."""
+        i = self.item_index.get(item_id)
+        return self.recipe_bits[i] if i is not None else 0
+
+    def chain_raw_resources(self, item_id: str) -> int:
+        """Bitset of raw resources that could appear in the chain of an item."""
+        i = self.item_index.get(item_id)
+        return self.item_bits[i] & self.raw_mask if i is not None else 0
+
+    def relevant_unlocks(self, item_id: str, unlocked_mask: int) -> int:
+        """
+        Narrow an unlocked-recipe bitset to the recipes that matter for an item.
+
+        Two unlocked sets that agree on this mask give the same chain for the
+        item, so it is a safe cache key for per-item results.
+        """
+        return self.chain_recipes(item_id) & unlocked_mask
+
+    def buildable_items(self, unlocked_mask: int) -> int:
+        """
+        Bitset of items that can be produced from raw resources with the given unlocks.
+
+        Computed as a fixpoint: an unlocked recipe fires once all of its inputs
+        are buildable, which makes its outputs buildable.
+        """
+        buildable = self.raw_mask
+        pending = list(bit_indices(unlocked_mask))
+        changed = True
+        while changed and pending:
+            changed = False
+            still_pending = []
+            for r in pending:
+                if self.recipe_inputs[r] & ~buildable:
+                    still_pending.append(r)
+                else:
+                    buildable |= self.recipe_outputs[r]
+                    changed = True
+            pending = still_pending
+        return buildable
+
+    def can_build(self, item_id: str, unlocked_mask: int) -> bool:
+        """Check whether an item can be produced with the given unlocks."""
+        i = self.item_index.get(item_id)
+        if i is None:
+            return False
+        if self.raw_mask >> i & 1:
+            return True
+        # Cheap rejection: no unlocked recipe anywhere in the chain
+        if not self.recipe_bits[i] & unlocked_mask:
+            return False
+        return bool(self.buildable_items(self.relevant_unlocks(item_id, unlocked_mask)) >> i & 1)
+
+
+def bit_indices(mask: int) -> Iterable[int]:
+    """Yield the indices of the set bits of a mask, lowest first."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+def build_dependency_closure(matrix: RecipeMatrix) -> DependencyClosure:
+    """
+    Compute the dependency closure bitsets of every item.
+
+    Closures are propagated to a fixpoint, so recycling loops (e.g. rubber and
+    plastic) are handled without special cases.
+
+    Args:
+        matrix: Compiled recipe matrix of the dataset
+
+    Returns:
+        DependencyClosure
+    """
+    num_items = matrix.num_items
+    num_recipes = matrix.num_recipes
+
+    recipe_inputs = [0] * num_recipes
+    recipe_outputs = [0] * num_recipes
+    recipe_main_output = [0] * num_recipes
+    for r in range(num_recipes):
+        # Columns list inputs, then outputs in recipe order
+        for i, rate in matrix.recipe_column(r):
+            if rate < 0:
+                recipe_inputs[r] |= 1 << i
+            else:
+                if not recipe_outputs[r]:
+                    recipe_main_output[r] = 1 << i
+                recipe_outputs[r] |= 1 << i
+
+    producers: List[List[int]] = [[] for _ in range(num_items)]
+    for r in range(num_recipes):
+        for i in bit_indices(recipe_outputs[r]):
+            producers[i].append(r)
+
+    raw_mask = 0
+    for i in range(num_items):
+        if matrix.is_raw[i]:
+            raw_mask |= 1 << i
+
+    # Raw resources are leaves: their chain is just themselves
+    recipe_bits = [0] * num_items
+    item_bits = [1 << i for i in range(num_items)]
+    for i in range(num_items):
+        if not matrix.is_raw[i]:
+            for r in producers[i]:
+                recipe_bits[i] |= 1 << r
+                item_bits[i] |= recipe_inputs[r]
+
+    changed = True
+    while changed:
+        changed = False
+        for i in range(num_items):
+            if matrix.is_raw[i]:
+                continue
+            recipes = recipe_bits[i]
+            items = item_bits[i]
+            for j in bit_indices(items & ~(1 << i)):
+                recipes |= recipe_bits[j]
+                items |= item_bits[j]
+            if recipes != recipe_bits[i] or items != item_bits[i]:
+                recipe_bits[i] = recipes
+                item_bits[i] = items
+                changed = True
+
+    return DependencyClosure(
+        item_ids=matrix.item_ids,
+        recipe_ids=matrix.recipe_ids,
+        item_index=matrix.item_index,
+        recipe_index=matrix.recipe_index,
+        recipe_bits=recipe_bits,
+        item_bits=item_bits,
+        recipe_inputs=recipe_inputs,
+        recipe_outputs=recipe_outputs,
+        recipe_main_output=recipe_main_output,
+        raw_mask=raw_mask,
+    )
@@ -0,0 +1,430 @@
+"""
+Streaming importer for the game's own Docs.json (or en-US.json).
+
+The file shipped in `<game>/CommunityResources/Docs/` is tens of MB of UTF-16
+JSON: a top-level array of `{"NativeClass": ..., "Classes": [...]}` groups.
+It is read in fixed-size chunks and parsed one class object at a time, so
+memory stays bounded by the largest single class, and only item descriptors,
+production buildings, recipes and schematics are converted into the
+ITEMS / RECIPES schema of data/satisfactory_db.py.
+
+Conversions follow the existing schema: recipe amounts are items/min at 100%
+clock (fluids in m3/min), craftingSpeed is the craft duration in seconds and
+powerConsumption is the building's MW draw.
+
+Converted datasets are cached as compiled snapshots keyed by the hash of the
+input file (see data/snapshot.py).
+
+Usage (from the app directory):
+    python -m data.docs_importer path/to/Docs.json
+    python -m data.docs_importer path/to/Docs.json --output data/game_data.py
+"""
+
+import argparse
+import codecs
+import json
+import pprint
+import re
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from data import snapshot
+from data.readonly import thaw
+
+CHUNK_SIZE = 1 << 16
+
+ITEM_CLASSES = {
+    "FGItemDescriptor",
+    "FGResourceDescriptor",
+    "FGItemDescriptorBiomass",
+    "FGItemDescriptorNuclearFuel",
+    "FGItemDescriptorPowerBoosterFuel",
+    "FGPowerShardDescriptor",
+    "FGAmmoTypeProjectile",
+    "FGAmmoTypeSpreadshot",
+    "FGAmmoTypeInstantHit",
+    "FGEquipmentDescriptor",
+    "FGConsumableDescriptor",
+}
+BUILDING_CLASSES = {
+    "FGBuildableManufacturer",
+    "FGBuildableManufacturerVariablePower",
+}
+RECIPE_CLASS = "FGRecipe"
+SCHEMATIC_CLASS = "FGSchematic"
+
+# Building class -> recipe category used in RECIPES
+MACHINE_CATEGORIES = {
+    "Build_SmelterMk1_C": "smelting1",
+    "Build_FoundryMk1_C": "smelting2",
+    "Build_ConstructorMk1_C": "crafting1",
+    "Build_AssemblerMk1_C": "crafting2",
+    "Build_ManufacturerMk1_C": "crafting3",
+    "Build_OilRefinery_C": "refining",
+    "Build_Blender_C": "blending",
+    "Build_Packager_C": "packaging",
+    "Build_Converter_C": "converting",
+    "Build_QuantumEncoder_C": "encoding",
+    "Build_HadronCollider_C": "accelerating",
+}
+
+STACK_SIZES = {
+    "SS_ONE": 1,
+    "SS_SMALL": 50,
+    "SS_MEDIUM": 100,
+    "SS_BIG": 200,
+    "SS_HUGE": 500,
+    "SS_FLUID": 1,
+}
+
+_NATIVE_CLASS_RE = re.compile(r"FactoryGame\.(\w+)")
+_CLASS_REF_RE = re.compile(r"\.(\w+_C)\b")
+_ITEM_AMOUNT_RE = re.compile(r"ItemClass=[^,]*\.(\w+_C)[^,]*,Amount=([\d.]+)")
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+_ALTERNATE_PREFIX = "Alternate:"
+
+
+class DocsFormatError(ValueError):
+    """Raised when the input does not look like a Docs.json file."""
+
+
+def _open_text(path: Path):
+    """Open a Docs.json file as text, detecting UTF-16 / UTF-8 from the BOM."""
+    with open(path, "rb") as f:
+        head = f.read(4)
+    if head.startswith(codecs.BOM_UTF16_LE) or head.startswith(codecs.BOM_UTF16_BE):
+        encoding = "utf-16"
+    elif head.startswith(codecs.BOM_UTF8):
+        encoding = "utf-8-sig"
+    # No BOM: JSON starts with an ASCII character, so a zero byte next to
+    # it gives away the UTF-16 byte order
+    elif len(head) >= 2 and head[0] == 0 and head[1] != 0:
+        encoding = "utf-16-be"
+    elif len(head) >= 2 and head[1] == 0 and head[0] != 0:
+        encoding = "utf-16-le"
+    else:
+        encoding = "utf-8"
+    return open(path, "r", encoding=encoding, newline="")
+
+
+class _ChunkReader:
+    """Sliding text buffer over a file, consumed by JSONDecoder.raw_decode."""
+
+    _WHITESPACE = " \t\r\n"
+
+    def __init__(self, f):
+        self.f = f
+        self.buf = ""
+        self.pos = 0
+        self.eof = False
+        self.decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.f.read(CHUNK_SIZE)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the buffer stays bounded
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> str:
+        """Skip whitespace and return the next character ('' at EOF)."""
+        while True:
+            while self.pos < len(self.buf) and self.buf[self.pos] in self._WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buf):
+                return self.buf[self.pos]
+            if not self._fill():
+                return ""
+
+    def expect(self, char: str):
+        if self.peek() != char:
+            raise DocsFormatError(f"Expected '{char}' at offset {self.pos}")
+        self.pos += 1
+
+    def value(self):
+        """Decode the next complete JSON value, reading more input as needed."""
+        self.peek()
+        while True:
+            try:
+                value, end = self.decoder.raw_decode(self.buf, self.pos)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self.buf) and not self.eof and self._fill():
+                continue
+            self.pos = end
+            return value
+
+
+def iter_native_classes(path: Path) -> Iterator[Tuple[str, Dict]]:
+    """
+    Stream (native class name, class object) pairs from a Docs.json file.
+
+    Args:
+        path: Docs.json / en-US.json path
+
+    Yields:
+        Tuples like ("FGRecipe", {"ClassName": "Recipe_IronPlate_C", ...})
+    """
+    with _open_text(path) as f:
+        reader = _ChunkReader(f)
+        reader.expect("[")
+        if reader.peek() == "]":
+            return
+        while True:
+            reader.expect("{")
+            native_class = ""
+            while reader.peek() != "}":
+                key = reader.value()
+                reader.expect(":")
+                if key == "Classes":
+                    reader.expect("[")
+                    while reader.peek() != "]":
+                        class_obj = reader.value()
+                        yield native_class, class_obj
+                        if reader.peek() == ",":
+                            reader.pos += 1
+                    reader.expect("]")
+                else:
+                    value = reader.value()
+                    if key == "NativeClass":
+                        match = _NATIVE_CLASS_RE.search(value)
+                        native_class = match.group(1) if match else value
+                if reader.peek() == ",":
+                    reader.pos += 1
+            reader.expect("}")
+            if reader.peek() == ",":
+                reader.pos += 1
+                continue
+            reader.expect("]")
+            return
+
+
+def _slug(name: str) -> str:
+    return _SLUG_RE.sub("_", name.lower()).strip("_")
+
+
+def _number(text, default: float = 0.0) -> float:
+    try:
+        value = float(text)
+    except (TypeError, ValueError):
+        return default
+    return _tidy(value)
+
+
+def _tidy(value: float):
+    """Round float noise away and keep whole numbers as ints, like game_data.py."""
+    value = round(value, 6)
+    return int(value) if value == int(value) else value
+
+
+def convert_docs(path: Path) -> Dict[str, Dict]:
+    """
+    Convert a Docs.json file into the ITEMS / RECIPES schema.
+
+    Args:
+        path: Docs.json / en-US.json path
+
+    Returns:
+        {"items": ITEMS-like dict, "recipes": RECIPES-like dict}
+    """
+    descriptors: Dict[str, Dict] = {}     # Desc_*_C -> raw fields we need
+    buildings: Dict[str, Dict] = {}       # Build_*_C -> name / power
+    raw_recipes: List[Dict] = []
+    recipe_tiers: Dict[str, int] = {}     # Recipe_*_C -> lowest unlocking tier
+
+    for native_class, obj in iter_native_classes(path):
+        class_name = obj.get("ClassName", "")
+        if native_class in ITEM_CLASSES:
+            descriptors[class_name] = {
+                "name": obj.get("mDisplayName", class_name),
+                "stack": obj.get("mStackSize", ""),
+                "form": obj.get("mForm", ""),
+                "resource": native_class == "FGResourceDescriptor",
+            }
+        elif native_class in BUILDING_CLASSES:
+            buildings[class_name] = {
+                "name": obj.get("mDisplayName", class_name),
+                "power": _number(obj.get("mPowerConsumption")),
+                "variable_power": native_class == "FGBuildableManufacturerVariablePower",
+            }
+        elif native_class == RECIPE_CLASS:
+            raw_recipes.append({
+                "class": class_name,
+                "name": obj.get("mDisplayName", class_name),
+                "ingredients": obj.get("mIngredients", ""),
+                "product": obj.get("mProduct", ""),
+                "duration": _number(obj.get("mManufactoringDuration"), 1.0),
+                "produced_in": _CLASS_REF_RE.findall(obj.get("mProducedIn", "")),
+                "power_constant": _number(obj.get("mVariablePowerConsumptionConstant")),
+                "power_factor": _number(obj.get("mVariablePowerConsumptionFactor")),
+            })
+        elif native_class == SCHEMATIC_CLASS:
+            tier = int(_number(obj.get("mTechTier")))
+            for recipe_class in _CLASS_REF_RE.findall(json.dumps(obj.get("mUnlocks", ""))):
+                if recipe_class.startswith("Recipe_"):
+                    recipe_tiers[recipe_class] = min(tier, recipe_tiers.get(recipe_class, tier))
+
+    return _build_dataset(descriptors, buildings, raw_recipes, recipe_tiers)
+
+
+def _build_dataset(
+    descriptors: Dict[str, Dict],
+    buildings: Dict[str, Dict],
+    raw_recipes: List[Dict],
+    recipe_tiers: Dict[str, int]
+) -> Dict[str, Dict]:
+    item_ids = {}
+    for class_name, desc in descriptors.items():
+        item_ids[class_name] = _unique(_slug(desc["name"]), item_ids.values())
+
+    def is_fluid(class_name: str) -> bool:
+        return descriptors[class_name]["form"] in ("RF_LIQUID", "RF_GAS")
+
+    def amounts(text: str, duration: float) -> Optional[List[Dict]]:
+        flows = []
+        for class_name, amount in _ITEM_AMOUNT_RE.findall(text):
+            if class_name not in item_ids:
+                return None
+            per_craft = float(amount) / (1000.0 if is_fluid(class_name) else 1.0)
+            flows.append({"amount": _tidy(per_craft * 60.0 / duration), "item": item_ids[class_name]})
+        return flows
+
+    recipes: Dict[str, Dict] = {}
+    for raw in sorted(raw_recipes, key=lambda r: r["name"]):
+        machine_class = next((b for b in raw["produced_in"] if b in buildings), None)
+        if machine_class is None:
+            continue  # build-gun / workbench-only recipe
+        inputs = amounts(raw["ingredients"], raw["duration"])
+        outputs = amounts(raw["product"], raw["duration"])
+        if not outputs or inputs is None:
+            continue
+
+        name = raw["name"]
+        alternate = name.startswith(_ALTERNATE_PREFIX)
+        base_name = name[len(_ALTERNATE_PREFIX):].strip() if alternate else name
+        machine = buildings[machine_class]
+        power = machine["power"]
+        if machine["variable_power"]:
+            # Variable-power machines: use the average draw over the cycle
+            power = _tidy(raw["power_constant"] + raw["power_factor"] / 2)
+
+        recipe_id = _unique(_slug(base_name), recipes)
+        recipes[recipe_id] = {
+            "alternateRecipe": alternate,
+            "category": MACHINE_CATEGORIES.get(machine_class, _slug(machine["name"])),
+            "craftingSpeed": raw["duration"],
+            "id": recipe_id,
+            "inputs": inputs,
+            "machineType": machine["name"],
+            "name": name,
+            "outputs": outputs,
+            "powerConsumption": power,
+            "unlockTier": recipe_tiers.get(raw["class"], 0),
+        }
+
+    # Keep only items that take part in a recipe; unproduced inputs are raw
+    produced = {out["item"] for r in recipes.values() for out in r["outputs"]}
+    consumed = {inp["item"] for r in recipes.values() for inp in r["inputs"]}
+    items: Dict[str, Dict] = {}
+    for class_name, desc in descriptors.items():
+        item_id = item_ids[class_name]
+        if item_id not in produced and item_id not in consumed:
+            continue
+        is_raw = desc["resource"] or item_id not in produced
+        if is_raw:
+            category = "Raw Resource"
+        elif is_fluid(class_name):
+            category = "Fluid"
+        elif "Ingot" in class_name:
+            category = "Ingot"
+        else:
+            category = "Component"
+        items[item_id] = {
+            "category": category,
+            "id": item_id,
+            "isRawResource": is_raw,
+            "name": desc["name"],
+            "stackSize": STACK_SIZES.get(desc["stack"], 100),
+        }
+
+    return {
+        "items": dict(sorted(items.items())),
+        "recipes": dict(sorted(recipes.items())),
+    }
+
+
+def _unique(candidate: str, taken) -> str:
+    taken = set(taken)
+    if candidate not in taken:
+        return candidate
+    n = 2
+    while f"{candidate}_{n}" in taken:
+        n += 1
+    return f"{candidate}_{n}"
+
+
+def load_docs(path: Path, source_digest: Optional[str] = None) -> Dict[str, Dict]:
+    """
+    Load a converted Docs.json dataset, using the compiled snapshot when fresh.
+
+    Args:
+        path: Docs.json / en-US.json path
+        source_digest: Precomputed content hash of the file (optional)
+
+    Returns:
+        {"items": ..., "recipes": ...}
+    """
+    path = Path(path)
+    return snapshot.load_cached(path, lambda: convert_docs(path), source_digest)
+
+
+def write_game_data_module(dataset: Dict[str, Dict], output_path: Path, source_name: str):
+    """
+    Write a converted dataset as a data/game_data.py module.
+
+    Args:
+        dataset: {"items": ..., "recipes": ...}
+        output_path: Module path to write
+        source_name: Name of the Docs file, recorded in the module docstring
+    """
+    header = (
+        '"""\n'
+        "Satisfactory game data: Items and Recipes (expanded)\n"
+        "\n"
+        f"Generated by data/docs_importer.py from {source_name}.\n"
+        "Format intentionally matches the original in-project schema: ITEMS, RECIPES.\n"
+        "Accessors live in data/satisfactory_db.py, which loads this module through a\n"
+        "compiled snapshot (see data/snapshot.py).\n"
+        '"""\n'
+    )
+    body = (
+        f"\n# Items database\nITEMS = {pprint.pformat(thaw(dataset['items']), width=120)}\n"
+        f"\n# Recipes database\nRECIPES = {pprint.pformat(thaw(dataset['recipes']), width=120)}\n"
+    )
+    Path(output_path).write_text(header + body, encoding="utf-8")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Import Satisfactory Docs.json into ITEMS/RECIPES")
+    parser.add_argument("docs", type=Path, help="Path to Docs.json or en-US.json")
+    parser.add_argument("--output", type=Path, help="Write a game_data.py module to this path")
+    args = parser.parse_args(argv)
+
+    dataset = load_docs(args.docs)
+    print(f"{len(dataset['items'])} items, {len(dataset['recipes'])} recipes")
+    if args.output:
+        write_game_data_module(dataset, args.output, args.docs.name)
+        print(f"Wrote {args.output}")
+
+
+if __name__ == "__main__":
+    main()
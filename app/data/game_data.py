@@ -0,0 +1,3503 @@
+"""
+Satisfactory game data: Items and Recipes (expanded)
+
+Generated on 2026-02-19 from community datasets.
+Format intentionally matches the original in-project schema: ITEMS, RECIPES.
+Accessors live in data/satisfactory_db.py, which loads this module through a
+compiled snapshot (see data/snapshot.py).
+"""
+
+# Items database
+ITEMS = {'adaptive_control_unit': {'category': 'Component',
+                           'id': 'adaptive_control_unit',
+                           'isRawResource': False,
+                           'name': 'Adaptive Control Unit',
+                           'stackSize': 50},
+ 'ai_expansion_server': {'category': 'Component',
+                         'id': 'ai_expansion_server',
+                         'isRawResource': False,
+                         'name': 'AI Expansion Server',
+                         'stackSize': 100},
+ 'ai_limiter': {'category': 'Component',
+                'id': 'ai_limiter',
+                'isRawResource': False,
+                'name': 'AI Limiter',
+                'stackSize': 100},
+ 'alclad_aluminum_sheet': {'category': 'Component',
+                           'id': 'alclad_aluminum_sheet',
+                           'isRawResource': False,
+                           'name': 'Alclad Aluminum Sheet',
+                           'stackSize': 100},
+ 'alien_dna_capsule': {'category': 'Material',
+                       'id': 'alien_dna_capsule',
+                       'isRawResource': False,
+                       'name': 'Alien DNA Capsule',
+                       'stackSize': 100},
+ 'alien_power_matrix': {'category': 'Component',
+                        'id': 'alien_power_matrix',
+                        'isRawResource': False,
+                        'name': 'Alien Power Matrix',
+                        'stackSize': 100},
+ 'alien_protein': {'category': 'Raw Resource',
+                   'id': 'alien_protein',
+                   'isRawResource': True,
+                   'name': 'Alien Protein',
+                   'stackSize': 100},
+ 'alumina_solution': {'category': 'Fluid',
+                      'id': 'alumina_solution',
+                      'isRawResource': False,
+                      'name': 'Alumina Solution',
+                      'stackSize': 1},
+ 'aluminum_casing': {'category': 'Material',
+                     'id': 'aluminum_casing',
+                     'isRawResource': False,
+                     'name': 'Aluminum Casing',
+                     'stackSize': 200},
+ 'aluminum_ingot': {'category': 'Ingot',
+                    'id': 'aluminum_ingot',
+                    'isRawResource': False,
+                    'name': 'Aluminum Ingot',
+                    'stackSize': 100},
+ 'aluminum_scrap': {'category': 'Oil Product',
+                    'id': 'aluminum_scrap',
+                    'isRawResource': False,
+                    'name': 'Aluminum Scrap',
+                    'stackSize': 100},
+ 'assembly_director_system': {'category': 'Component',
+                              'id': 'assembly_director_system',
+                              'isRawResource': False,
+                              'name': 'Assembly Director System',
+                              'stackSize': 50},
+ 'automated_wiring': {'category': 'Component',
+                      'id': 'automated_wiring',
+                      'isRawResource': False,
+                      'name': 'Automated Wiring',
+                      'stackSize': 50},
+ 'ballistic_warp_drive': {'category': 'Component',
+                          'id': 'ballistic_warp_drive',
+                          'isRawResource': False,
+                          'name': 'Ballistic Warp Drive',
+                          'stackSize': 100},
+ 'battery': {'category': 'Oil Product', 'id': 'battery', 'isRawResource': False, 'name': 'Battery', 'stackSize': 100},
+ 'bauxite': {'category': 'Raw Resource', 'id': 'bauxite', 'isRawResource': True, 'name': 'Bauxite', 'stackSize': 100},
+ 'biomass': {'category': 'Material', 'id': 'biomass', 'isRawResource': False, 'name': 'Biomass', 'stackSize': 200},
+ 'black_powder': {'category': 'Component',
+                  'id': 'black_powder',
+                  'isRawResource': False,
+                  'name': 'Black Powder',
+                  'stackSize': 100},
+ 'blue_power_slug': {'category': 'Raw Resource',
+                     'id': 'blue_power_slug',
+                     'isRawResource': True,
+                     'name': 'Blue Power Slug',
+                     'stackSize': 50},
+ 'cable': {'category': 'Oil Product', 'id': 'cable', 'isRawResource': False, 'name': 'Cable', 'stackSize': 100},
+ 'caterium_ingot': {'category': 'Ingot',
+                    'id': 'caterium_ingot',
+                    'isRawResource': False,
+                    'name': 'Caterium Ingot',
+                    'stackSize': 100},
+ 'caterium_ore': {'category': 'Raw Resource',
+                  'id': 'caterium_ore',
+                  'isRawResource': True,
+                  'name': 'Caterium Ore',
+                  'stackSize': 100},
+ 'circuit_board': {'category': 'Component',
+                   'id': 'circuit_board',
+                   'isRawResource': False,
+                   'name': 'Circuit Board',
+                   'stackSize': 200},
+ 'cluster_nobelisk': {'category': 'Component',
+                      'id': 'cluster_nobelisk',
+                      'isRawResource': False,
+                      'name': 'Cluster Nobelisk',
+                      'stackSize': 50},
+ 'coal': {'category': 'Raw Resource', 'id': 'coal', 'isRawResource': True, 'name': 'Coal', 'stackSize': 100},
+ 'compacted_coal': {'category': 'Oil Product',
+                    'id': 'compacted_coal',
+                    'isRawResource': False,
+                    'name': 'Compacted Coal',
+                    'stackSize': 100},
+ 'computer': {'category': 'Component', 'id': 'computer', 'isRawResource': False, 'name': 'Computer', 'stackSize': 100},
+ 'concrete': {'category': 'Oil Product',
+              'id': 'concrete',
+              'isRawResource': False,
+              'name': 'Concrete',
+              'stackSize': 100},
+ 'cooling_system': {'category': 'Oil Product',
+                    'id': 'cooling_system',
+                    'isRawResource': False,
+                    'name': 'Cooling System',
+                    'stackSize': 100},
+ 'copper_ingot': {'category': 'Ingot',
+                  'id': 'copper_ingot',
+                  'isRawResource': False,
+                  'name': 'Copper Ingot',
+                  'stackSize': 100},
+ 'copper_ore': {'category': 'Raw Resource',
+                'id': 'copper_ore',
+                'isRawResource': True,
+                'name': 'Copper Ore',
+                'stackSize': 100},
+ 'copper_powder': {'category': 'Material',
+                   'id': 'copper_powder',
+                   'isRawResource': False,
+                   'name': 'Copper Powder',
+                   'stackSize': 100},
+ 'copper_sheet': {'category': 'Oil Product',
+                  'id': 'copper_sheet',
+                  'isRawResource': False,
+                  'name': 'Copper Sheet',
+                  'stackSize': 100},
+ 'crude_oil': {'category': 'Raw Resource',
+               'id': 'crude_oil',
+               'isRawResource': True,
+               'name': 'Crude Oil',
+               'stackSize': 1},
+ 'crystal_oscillator': {'category': 'Component',
+                        'id': 'crystal_oscillator',
+                        'isRawResource': False,
+                        'name': 'Crystal Oscillator',
+                        'stackSize': 100},
+ 'dark_matter_crystal': {'category': 'Component',
+                         'id': 'dark_matter_crystal',
+                         'isRawResource': False,
+                         'name': 'Dark Matter Crystal',
+                         'stackSize': 100},
+ 'dark_matter_residue': {'category': 'Fluid',
+                         'id': 'dark_matter_residue',
+                         'isRawResource': False,
+                         'name': 'Dark Matter Residue',
+                         'stackSize': 1},
+ 'diamonds': {'category': 'Component', 'id': 'diamonds', 'isRawResource': False, 'name': 'Diamonds', 'stackSize': 100},
+ 'dissolved_silica': {'category': 'Fluid',
+                      'id': 'dissolved_silica',
+                      'isRawResource': False,
+                      'name': 'Dissolved Silica',
+                      'stackSize': 1},
+ 'em_control_rod': {'category': 'Component',
+                    'id': 'em_control_rod',
+                    'isRawResource': False,
+                    'name': 'Electromagnetic Control Rod',
+                    'stackSize': 100},
+ 'empty_canister': {'category': 'Material',
+                    'id': 'empty_canister',
+                    'isRawResource': False,
+                    'name': 'Empty Canister',
+                    'stackSize': 100},
+ 'empty_fluid_tank': {'category': 'Material',
+                      'id': 'empty_fluid_tank',
+                      'isRawResource': False,
+                      'name': 'Empty Fluid Tank',
+                      'stackSize': 100},
+ 'encased_industrial_beam': {'category': 'Component',
+                             'id': 'encased_industrial_beam',
+                             'isRawResource': False,
+                             'name': 'Encased Industrial Beam',
+                             'stackSize': 100},
+ 'encased_plutonium_cell': {'category': 'Component',
+                            'id': 'encased_plutonium_cell',
+                            'isRawResource': False,
+                            'name': 'Encased Plutonium Cell',
+                            'stackSize': 100},
+ 'excited_photonic_matter': {'category': 'Fluid',
+                             'id': 'excited_photonic_matter',
+                             'isRawResource': False,
+                             'name': 'Excited Photonic Matter',
+                             'stackSize': 1},
+ 'explosive_rebar': {'category': 'Component',
+                     'id': 'explosive_rebar',
+                     'isRawResource': False,
+                     'name': 'Explosive Rebar',
+                     'stackSize': 100},
+ 'fabric': {'category': 'Oil Product', 'id': 'fabric', 'isRawResource': False, 'name': 'Fabric', 'stackSize': 100},
+ 'ficsite_ingot': {'category': 'Ingot',
+                   'id': 'ficsite_ingot',
+                   'isRawResource': False,
+                   'name': 'Ficsite Ingot',
+                   'stackSize': 100},
+ 'ficsite_trigon': {'category': 'Material',
+                    'id': 'ficsite_trigon',
+                    'isRawResource': False,
+                    'name': 'Ficsite Trigon',
+                    'stackSize': 100},
+ 'ficsonium': {'category': 'Component',
+               'id': 'ficsonium',
+               'isRawResource': False,
+               'name': 'Ficsonium',
+               'stackSize': 100},
+ 'ficsonium_fuel_rod': {'category': 'Component',
+                        'id': 'ficsonium_fuel_rod',
+                        'isRawResource': False,
+                        'name': 'Ficsonium Fuel Rod',
+                        'stackSize': 100},
+ 'filter': {'category': 'Component', 'id': 'filter', 'isRawResource': False, 'name': 'Gas Filter', 'stackSize': 100},
+ 'fuel': {'category': 'Fluid', 'id': 'fuel', 'isRawResource': False, 'name': 'Fuel', 'stackSize': 1},
+ 'fused_modular_frame': {'category': 'Oil Product',
+                         'id': 'fused_modular_frame',
+                         'isRawResource': False,
+                         'name': 'Fused Modular Frame',
+                         'stackSize': 50},
+ 'gas_nobelisk': {'category': 'Component',
+                  'id': 'gas_nobelisk',
+                  'isRawResource': False,
+                  'name': 'Gas Nobelisk',
+                  'stackSize': 50},
+ 'hatcher_remains': {'category': 'Raw Resource',
+                     'id': 'hatcher_remains',
+                     'isRawResource': True,
+                     'name': 'Hatcher Remains',
+                     'stackSize': 100},
+ 'heat_sink': {'category': 'Component',
+               'id': 'heat_sink',
+               'isRawResource': False,
+               'name': 'Heat Sink',
+               'stackSize': 100},
+ 'heavy_modular_frame': {'category': 'Component',
+                         'id': 'heavy_modular_frame',
+                         'isRawResource': False,
+                         'name': 'Heavy Modular Frame',
+                         'stackSize': 100},
+ 'heavy_oil_residue': {'category': 'Fluid',
+                       'id': 'heavy_oil_residue',
+                       'isRawResource': False,
+                       'name': 'Heavy Oil Residue',
+                       'stackSize': 1},
+ 'high_speed_connector': {'category': 'Component',
+                          'id': 'high_speed_connector',
+                          'isRawResource': False,
+                          'name': 'High-Speed Connector',
+                          'stackSize': 100},
+ 'hog_remains': {'category': 'Raw Resource',
+                 'id': 'hog_remains',
+                 'isRawResource': True,
+                 'name': 'Hog Remains',
+                 'stackSize': 100},
+ 'homing_rifle_ammo': {'category': 'Component',
+                       'id': 'homing_rifle_ammo',
+                       'isRawResource': False,
+                       'name': 'Homing Rifle Ammo',
+                       'stackSize': 500},
+ 'iodine_infused_filter': {'category': 'Component',
+                           'id': 'iodine_infused_filter',
+                           'isRawResource': False,
+                           'name': 'Iodine Infused Filter',
+                           'stackSize': 100},
+ 'ionized_fuel': {'category': 'Fluid',
+                  'id': 'ionized_fuel',
+                  'isRawResource': False,
+                  'name': 'Ionized Fuel',
+                  'stackSize': 1},
+ 'iron_ingot': {'category': 'Ingot',
+                'id': 'iron_ingot',
+                'isRawResource': False,
+                'name': 'Iron Ingot',
+                'stackSize': 100},
+ 'iron_ore': {'category': 'Raw Resource',
+              'id': 'iron_ore',
+              'isRawResource': True,
+              'name': 'Iron Ore',
+              'stackSize': 100},
+ 'iron_plate': {'category': 'Ingot',
+                'id': 'iron_plate',
+                'isRawResource': False,
+                'name': 'Iron Plate',
+                'stackSize': 100},
+ 'iron_rebar': {'category': 'Material',
+                'id': 'iron_rebar',
+                'isRawResource': False,
+                'name': 'Iron Rebar',
+                'stackSize': 100},
+ 'iron_rod': {'category': 'Material', 'id': 'iron_rod', 'isRawResource': False, 'name': 'Iron Rod', 'stackSize': 100},
+ 'leaves': {'category': 'Raw Resource', 'id': 'leaves', 'isRawResource': True, 'name': 'Leaves', 'stackSize': 500},
+ 'limestone': {'category': 'Raw Resource',
+               'id': 'limestone',
+               'isRawResource': True,
+               'name': 'Limestone',
+               'stackSize': 100},
+ 'liquid_biofuel': {'category': 'Fluid',
+                    'id': 'liquid_biofuel',
+                    'isRawResource': False,
+                    'name': 'Liquid Biofuel',
+                    'stackSize': 1},
+ 'magnetic_field_generator': {'category': 'Component',
+                              'id': 'magnetic_field_generator',
+                              'isRawResource': False,
+                              'name': 'Magnetic Field Generator',
+                              'stackSize': 50},
+ 'modular_engine': {'category': 'Component',
+                    'id': 'modular_engine',
+                    'isRawResource': False,
+                    'name': 'Modular Engine',
+                    'stackSize': 50},
+ 'modular_frame': {'category': 'Component',
+                   'id': 'modular_frame',
+                   'isRawResource': False,
+                   'name': 'Modular Frame',
+                   'stackSize': 50},
+ 'motor': {'category': 'Component', 'id': 'motor', 'isRawResource': False, 'name': 'Motor', 'stackSize': 50},
+ 'mycelia': {'category': 'Raw Resource', 'id': 'mycelia', 'isRawResource': True, 'name': 'Mycelia', 'stackSize': 200},
+ 'neural_quantum_processor': {'category': 'Component',
+                              'id': 'neural_quantum_processor',
+                              'isRawResource': False,
+                              'name': 'Neural-Quantum Processor',
+                              'stackSize': 100},
+ 'nitric_acid': {'category': 'Fluid',
+                 'id': 'nitric_acid',
+                 'isRawResource': False,
+                 'name': 'Nitric Acid',
+                 'stackSize': 1},
+ 'nitrogen_gas': {'category': 'Raw Resource',
+                  'id': 'nitrogen_gas',
+                  'isRawResource': True,
+                  'name': 'Nitrogen Gas',
+                  'stackSize': 1},
+ 'nobelisk': {'category': 'Component', 'id': 'nobelisk', 'isRawResource': False, 'name': 'Nobelisk', 'stackSize': 50},
+ 'non_fissile_uranium': {'category': 'Oil Product',
+                         'id': 'non_fissile_uranium',
+                         'isRawResource': False,
+                         'name': 'Non-fissile Uranium',
+                         'stackSize': 100},
+ 'nuclear_pasta': {'category': 'Component',
+                   'id': 'nuclear_pasta',
+                   'isRawResource': False,
+                   'name': 'Nuclear Pasta',
+                   'stackSize': 100},
+ 'nuke_nobelisk': {'category': 'Component',
+                   'id': 'nuke_nobelisk',
+                   'isRawResource': False,
+                   'name': 'Nuke Nobelisk',
+                   'stackSize': 50},
+ 'packaged_alumina_solution': {'category': 'Material',
+                               'id': 'packaged_alumina_solution',
+                               'isRawResource': False,
+                               'name': 'Packaged Alumina Solution',
+                               'stackSize': 100},
+ 'packaged_fuel': {'category': 'Oil Product',
+                   'id': 'packaged_fuel',
+                   'isRawResource': False,
+                   'name': 'Packaged Fuel',
+                   'stackSize': 100},
+ 'packaged_heavy_oil_residue': {'category': 'Material',
+                                'id': 'packaged_heavy_oil_residue',
+                                'isRawResource': False,
+                                'name': 'Packaged Heavy Oil Residue',
+                                'stackSize': 100},
+ 'packaged_ionized_fuel': {'category': 'Material',
+                           'id': 'packaged_ionized_fuel',
+                           'isRawResource': False,
+                           'name': 'Packaged Ionized Fuel',
+                           'stackSize': 100},
+ 'packaged_liquid_biofuel': {'category': 'Material',
+                             'id': 'packaged_liquid_biofuel',
+                             'isRawResource': False,
+                             'name': 'Packaged Liquid Biofuel',
+                             'stackSize': 100},
+ 'packaged_nitric_acid': {'category': 'Material',
+                          'id': 'packaged_nitric_acid',
+                          'isRawResource': False,
+                          'name': 'Packaged Nitric Acid',
+                          'stackSize': 100},
+ 'packaged_nitrogen_gas': {'category': 'Material',
+                           'id': 'packaged_nitrogen_gas',
+                           'isRawResource': False,
+                           'name': 'Packaged Nitrogen Gas',
+                           'stackSize': 100},
+ 'packaged_oil': {'category': 'Material',
+                  'id': 'packaged_oil',
+                  'isRawResource': False,
+                  'name': 'Packaged Oil',
+                  'stackSize': 100},
+ 'packaged_rocket_fuel': {'category': 'Material',
+                          'id': 'packaged_rocket_fuel',
+                          'isRawResource': False,
+                          'name': 'Packaged Rocket Fuel',
+                          'stackSize': 100},
+ 'packaged_sulfuric_acid': {'category': 'Material',
+                            'id': 'packaged_sulfuric_acid',
+                            'isRawResource': False,
+                            'name': 'Packaged Sulfuric Acid',
+                            'stackSize': 100},
+ 'packaged_turbofuel': {'category': 'Material',
+                        'id': 'packaged_turbofuel',
+                        'isRawResource': False,
+                        'name': 'Packaged Turbofuel',
+                        'stackSize': 100},
+ 'packaged_water': {'category': 'Material',
+                    'id': 'packaged_water',
+                    'isRawResource': False,
+                    'name': 'Packaged Water',
+                    'stackSize': 100},
+ 'petroleum_coke': {'category': 'Oil Product',
+                    'id': 'petroleum_coke',
+                    'isRawResource': False,
+                    'name': 'Petroleum Coke',
+                    'stackSize': 100},
+ 'plastic': {'category': 'Oil Product', 'id': 'plastic', 'isRawResource': False, 'name': 'Plastic', 'stackSize': 100},
+ 'plutonium_fuel_rod': {'category': 'Component',
+                        'id': 'plutonium_fuel_rod',
+                        'isRawResource': False,
+                        'name': 'Plutonium Fuel Rod',
+                        'stackSize': 100},
+ 'plutonium_pellet': {'category': 'Component',
+                      'id': 'plutonium_pellet',
+                      'isRawResource': False,
+                      'name': 'Plutonium Pellet',
+                      'stackSize': 100},
+ 'plutonium_waste': {'category': 'Component',
+                     'id': 'plutonium_waste',
+                     'isRawResource': False,
+                     'name': 'Plutonium Waste',
+                     'stackSize': 500},
+ 'polymer_resin': {'category': 'Oil Product',
+                   'id': 'polymer_resin',
+                   'isRawResource': False,
+                   'name': 'Polymer Resin',
+                   'stackSize': 100},
+ 'portable_miner': {'category': 'Component',
+                    'id': 'portable_miner',
+                    'isRawResource': False,
+                    'name': 'Portable Miner',
+                    'stackSize': 1},
+ 'power_shard': {'category': 'Material',
+                 'id': 'power_shard',
+                 'isRawResource': False,
+                 'name': 'Power Shard',
+                 'stackSize': 100},
+ 'pressure_conversion_cube': {'category': 'Component',
+                              'id': 'pressure_conversion_cube',
+                              'isRawResource': False,
+                              'name': 'Pressure Conversion Cube',
+                              'stackSize': 100},
+ 'pulse_nobelisk': {'category': 'Component',
+                    'id': 'pulse_nobelisk',
+                    'isRawResource': False,
+                    'name': 'Pulse Nobelisk',
+                    'stackSize': 50},
+ 'purple_power_slug': {'category': 'Raw Resource',
+                       'id': 'purple_power_slug',
+                       'isRawResource': True,
+                       'name': 'Purple Power Slug',
+                       'stackSize': 100},
+ 'quartz_crystal': {'category': 'Oil Product',
+                    'id': 'quartz_crystal',
+                    'isRawResource': False,
+                    'name': 'Quartz Crystal',
+                    'stackSize': 100},
+ 'quickwire': {'category': 'Material',
+               'id': 'quickwire',
+               'isRawResource': False,
+               'name': 'Quickwire',
+               'stackSize': 500},
+ 'radio_control_unit': {'category': 'Component',
+                        'id': 'radio_control_unit',
+                        'isRawResource': False,
+                        'name': 'Radio Control Unit',
+                        'stackSize': 100},
+ 'raw_quartz': {'category': 'Raw Resource',
+                'id': 'raw_quartz',
+                'isRawResource': True,
+                'name': 'Raw Quartz',
+                'stackSize': 100},
+ 'reanimated_sam': {'category': 'Material',
+                    'id': 'reanimated_sam',
+                    'isRawResource': False,
+                    'name': 'Reanimated SAM',
+                    'stackSize': 100},
+ 'reinforced_iron_plate': {'category': 'Component',
+                           'id': 'reinforced_iron_plate',
+                           'isRawResource': False,
+                           'name': 'Reinforced Iron Plate',
+                           'stackSize': 100},
+ 'rifle_ammo': {'category': 'Component',
+                'id': 'rifle_ammo',
+                'isRawResource': False,
+                'name': 'Rifle Ammo',
+                'stackSize': 500},
+ 'rocket_fuel': {'category': 'Fluid',
+                 'id': 'rocket_fuel',
+                 'isRawResource': False,
+                 'name': 'Rocket Fuel',
+                 'stackSize': 1},
+ 'rotor': {'category': 'Component', 'id': 'rotor', 'isRawResource': False, 'name': 'Rotor', 'stackSize': 100},
+ 'rubber': {'category': 'Oil Product', 'id': 'rubber', 'isRawResource': False, 'name': 'Rubber', 'stackSize': 100},
+ 'sam': {'category': 'Raw Resource', 'id': 'sam', 'isRawResource': True, 'name': 'SAM', 'stackSize': 100},
+ 'sam_fluctuator': {'category': 'Component',
+                    'id': 'sam_fluctuator',
+                    'isRawResource': False,
+                    'name': 'SAM Fluctuator',
+                    'stackSize': 100},
+ 'screw': {'category': 'Material', 'id': 'screw', 'isRawResource': False, 'name': 'Screw', 'stackSize': 500},
+ 'shatter_rebar': {'category': 'Component',
+                   'id': 'shatter_rebar',
+                   'isRawResource': False,
+                   'name': 'Shatter Rebar',
+                   'stackSize': 100},
+ 'silica': {'category': 'Oil Product', 'id': 'silica', 'isRawResource': False, 'name': 'Silica', 'stackSize': 100},
+ 'singularity_cell': {'category': 'Component',
+                      'id': 'singularity_cell',
+                      'isRawResource': False,
+                      'name': 'Singularity Cell',
+                      'stackSize': 100},
+ 'smart_plating': {'category': 'Component',
+                   'id': 'smart_plating',
+                   'isRawResource': False,
+                   'name': 'Smart Plating',
+                   'stackSize': 50},
+ 'smokeless_powder': {'category': 'Oil Product',
+                      'id': 'smokeless_powder',
+                      'isRawResource': False,
+                      'name': 'Smokeless Powder',
+                      'stackSize': 100},
+ 'solid_biofuel': {'category': 'Material',
+                   'id': 'solid_biofuel',
+                   'isRawResource': False,
+                   'name': 'Solid Biofuel',
+                   'stackSize': 200},
+ 'spitter_remains': {'category': 'Raw Resource',
+                     'id': 'spitter_remains',
+                     'isRawResource': True,
+                     'name': 'Spitter Remains',
+                     'stackSize': 100},
+ 'stator': {'category': 'Component', 'id': 'stator', 'isRawResource': False, 'name': 'Stator', 'stackSize': 100},
+ 'steel_beam': {'category': 'Material',
+                'id': 'steel_beam',
+                'isRawResource': False,
+                'name': 'Steel Beam',
+                'stackSize': 100},
+ 'steel_ingot': {'category': 'Ingot',
+                 'id': 'steel_ingot',
+                 'isRawResource': False,
+                 'name': 'Steel Ingot',
+                 'stackSize': 100},
+ 'steel_pipe': {'category': 'Ingot',
+                'id': 'steel_pipe',
+                'isRawResource': False,
+                'name': 'Steel Pipe',
+                'stackSize': 100},
+ 'stinger_remains': {'category': 'Raw Resource',
+                     'id': 'stinger_remains',
+                     'isRawResource': True,
+                     'name': 'Stinger Remains',
+                     'stackSize': 100},
+ 'stun_rebar': {'category': 'Component',
+                'id': 'stun_rebar',
+                'isRawResource': False,
+                'name': 'Stun Rebar',
+                'stackSize': 100},
+ 'sulfur': {'category': 'Raw Resource', 'id': 'sulfur', 'isRawResource': True, 'name': 'Sulfur', 'stackSize': 100},
+ 'sulfuric_acid': {'category': 'Fluid',
+                   'id': 'sulfuric_acid',
+                   'isRawResource': False,
+                   'name': 'Sulfuric Acid',
+                   'stackSize': 1},
+ 'supercomputer': {'category': 'Component',
+                   'id': 'supercomputer',
+                   'isRawResource': False,
+                   'name': 'Supercomputer',
+                   'stackSize': 100},
+ 'superposition_oscillator': {'category': 'Component',
+                              'id': 'superposition_oscillator',
+                              'isRawResource': False,
+                              'name': 'Superposition Oscillator',
+                              'stackSize': 100},
+ 'thermal_propulsion_rocket': {'category': 'Component',
+                               'id': 'thermal_propulsion_rocket',
+                               'isRawResource': False,
+                               'name': 'Thermal Propulsion Rocket',
+                               'stackSize': 50},
+ 'time_crystal': {'category': 'Component',
+                  'id': 'time_crystal',
+                  'isRawResource': False,
+                  'name': 'Time Crystal',
+                  'stackSize': 100},
+ 'turbo_motor': {'category': 'Component',
+                 'id': 'turbo_motor',
+                 'isRawResource': False,
+                 'name': 'Turbo Motor',
+                 'stackSize': 100},
+ 'turbo_rifle_ammo': {'category': 'Oil Product',
+                      'id': 'turbo_rifle_ammo',
+                      'isRawResource': False,
+                      'name': 'Turbo Rifle Ammo',
+                      'stackSize': 500},
+ 'turbofuel': {'category': 'Fluid', 'id': 'turbofuel', 'isRawResource': False, 'name': 'Turbofuel', 'stackSize': 1},
+ 'uranium': {'category': 'Raw Resource', 'id': 'uranium', 'isRawResource': True, 'name': 'Uranium', 'stackSize': 100},
+ 'uranium_cell': {'category': 'Oil Product',
+                  'id': 'uranium_cell',
+                  'isRawResource': False,
+                  'name': 'Encased Uranium Cell',
+                  'stackSize': 100},
+ 'uranium_fuel_rod': {'category': 'Component',
+                      'id': 'uranium_fuel_rod',
+                      'isRawResource': False,
+                      'name': 'Uranium Fuel Rod',
+                      'stackSize': 100},
+ 'uranium_waste': {'category': 'Component',
+                   'id': 'uranium_waste',
+                   'isRawResource': False,
+                   'name': 'Uranium Waste',
+                   'stackSize': 500},
+ 'versatile_framework': {'category': 'Component',
+                         'id': 'versatile_framework',
+                         'isRawResource': False,
+                         'name': 'Versatile Framework',
+                         'stackSize': 50},
+ 'water': {'category': 'Raw Resource', 'id': 'water', 'isRawResource': True, 'name': 'Water', 'stackSize': 1},
+ 'wire': {'category': 'Material', 'id': 'wire', 'isRawResource': False, 'name': 'Wire', 'stackSize': 500},
+ 'wood': {'category': 'Raw Resource', 'id': 'wood', 'isRawResource': True, 'name': 'Wood', 'stackSize': 100},
+ 'yellow_power_slug': {'category': 'Raw Resource',
+                       'id': 'yellow_power_slug',
+                       'isRawResource': True,
+                       'name': 'Yellow Power Slug',
+                       'stackSize': 100}}
+
+# Recipes database
+RECIPES = {'adaptive_control_unit': {'alternateRecipe': False,
+                           'category': 'crafting3',
+                           'craftingSpeed': 60,
+                           'id': 'adaptive_control_unit',
+                           'inputs': [{'amount': 5, 'item': 'automated_wiring'}, {'amount': 5, 'item': 'circuit_board'},
+                                      {'amount': 1, 'item': 'heavy_modular_frame'}, {'amount': 2, 'item': 'computer'}],
+                           'machineType': 'Manufacturer',
+                           'name': 'Adaptive Control Unit',
+                           'outputs': [{'amount': 1, 'item': 'adaptive_control_unit'}],
+                           'powerConsumption': 55,
+                           'unlockTier': 5},
+ 'adhered_iron_plate': {'alternateRecipe': True,
+                        'category': 'crafting2',
+                        'craftingSpeed': 16,
+                        'id': 'adhered_iron_plate',
+                        'inputs': [{'amount': 11.25, 'item': 'iron_plate'}, {'amount': 3.75, 'item': 'rubber'}],
+                        'machineType': 'Assembler',
+                        'name': 'Alternate: Adhered Iron Plate',
+                        'outputs': [{'amount': 3.75, 'item': 'reinforced_iron_plate'}],
+                        'powerConsumption': 15,
+                        'unlockTier': 0},
+ 'ai_expansion_server': {'alternateRecipe': False,
+                         'category': 'encoding',
+                         'craftingSpeed': 15,
+                         'id': 'ai_expansion_server',
+                         'inputs': [{'amount': 4, 'item': 'magnetic_field_generator'},
+                                    {'amount': 4, 'item': 'neural_quantum_processor'},
+                                    {'amount': 4, 'item': 'superposition_oscillator'},
+                                    {'amount': 100, 'item': 'excited_photonic_matter'}],
+                         'machineType': 'Quantum Encoder',
+                         'name': 'AI Expansion Server',
+                         'outputs': [{'amount': 4, 'item': 'ai_expansion_server'},
+                                     {'amount': 100, 'item': 'dark_matter_residue'}],
+                         'powerConsumption': 1000,
+                         'unlockTier': 9},
+ 'ai_limiter': {'alternateRecipe': False,
+                'category': 'crafting2',
+                'craftingSpeed': 12,
+                'id': 'ai_limiter',
+                'inputs': [{'amount': 25, 'item': 'copper_sheet'}, {'amount': 100, 'item': 'quickwire'}],
+                'machineType': 'Assembler',
+                'name': 'AI Limiter',
+                'outputs': [{'amount': 5, 'item': 'ai_limiter'}],
+                'powerConsumption': 15,
+                'unlockTier': 5},
+ 'alclad_aluminum_sheet': {'alternateRecipe': False,
+                           'category': 'crafting2',
+                           'craftingSpeed': 6,
+                           'id': 'alclad_aluminum_sheet',
+                           'inputs': [{'amount': 30, 'item': 'aluminum_ingot'}, {'amount': 10, 'item': 'copper_ingot'}],
+                           'machineType': 'Assembler',
+                           'name': 'Alclad Aluminum Sheet',
+                           'outputs': [{'amount': 30, 'item': 'alclad_aluminum_sheet'}],
+                           'powerConsumption': 15,
+                           'unlockTier': 7},
+ 'alclad_casing': {'alternateRecipe': True,
+                   'category': 'crafting2',
+                   'craftingSpeed': 8,
+                   'id': 'alclad_casing',
+                   'inputs': [{'amount': 150, 'item': 'aluminum_ingot'}, {'amount': 75, 'item': 'copper_ingot'}],
+                   'machineType': 'Assembler',
+                   'name': 'Alternate: Alclad Casing',
+                   'outputs': [{'amount': 112.5, 'item': 'aluminum_casing'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 7},
+ 'alien_dna_capsule': {'alternateRecipe': False,
+                       'category': 'crafting1',
+                       'craftingSpeed': 6,
+                       'id': 'alien_dna_capsule',
+                       'inputs': [{'amount': 10, 'item': 'alien_protein'}],
+                       'machineType': 'Constructor',
+                       'name': 'Alien DNA Capsule',
+                       'outputs': [{'amount': 10, 'item': 'alien_dna_capsule'}],
+                       'powerConsumption': 4,
+                       'unlockTier': 0},
+ 'alien_power_matrix': {'alternateRecipe': False,
+                        'category': 'encoding',
+                        'craftingSpeed': 24,
+                        'id': 'alien_power_matrix',
+                        'inputs': [{'amount': 12.5, 'item': 'sam_fluctuator'}, {'amount': 7.5, 'item': 'power_shard'},
+                                   {'amount': 7.5, 'item': 'superposition_oscillator'},
+                                   {'amount': 60, 'item': 'excited_photonic_matter'}],
+                        'machineType': 'Quantum Encoder',
+                        'name': 'Alien Power Matrix',
+                        'outputs': [{'amount': 2.5, 'item': 'alien_power_matrix'},
+                                    {'amount': 60, 'item': 'dark_matter_residue'}],
+                        'powerConsumption': 1000,
+                        'unlockTier': 9},
+ 'alumina_solution': {'alternateRecipe': False,
+                      'category': 'refining',
+                      'craftingSpeed': 6,
+                      'id': 'alumina_solution',
+                      'inputs': [{'amount': 120, 'item': 'bauxite'}, {'amount': 180, 'item': 'water'}],
+                      'machineType': 'Refinery',
+                      'name': 'Alumina Solution',
+                      'outputs': [{'amount': 120, 'item': 'alumina_solution'}, {'amount': 50, 'item': 'silica'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 7},
+ 'aluminum_beam': {'alternateRecipe': True,
+                   'category': 'crafting1',
+                   'craftingSpeed': 8,
+                   'id': 'aluminum_beam',
+                   'inputs': [{'amount': 22.5, 'item': 'aluminum_ingot'}],
+                   'machineType': 'Constructor',
+                   'name': 'Alternate: Aluminum Beam',
+                   'outputs': [{'amount': 22.5, 'item': 'steel_beam'}],
+                   'powerConsumption': 4,
+                   'unlockTier': 4},
+ 'aluminum_casing': {'alternateRecipe': False,
+                     'category': 'crafting1',
+                     'craftingSpeed': 2,
+                     'id': 'aluminum_casing',
+                     'inputs': [{'amount': 90, 'item': 'aluminum_ingot'}],
+                     'machineType': 'Constructor',
+                     'name': 'Aluminum Casing',
+                     'outputs': [{'amount': 60, 'item': 'aluminum_casing'}],
+                     'powerConsumption': 4,
+                     'unlockTier': 7},
+ 'aluminum_ingot': {'alternateRecipe': False,
+                    'category': 'smelting2',
+                    'craftingSpeed': 4,
+                    'id': 'aluminum_ingot',
+                    'inputs': [{'amount': 90, 'item': 'aluminum_scrap'}, {'amount': 75, 'item': 'silica'}],
+                    'machineType': 'Foundry',
+                    'name': 'Aluminum Ingot',
+                    'outputs': [{'amount': 60, 'item': 'aluminum_ingot'}],
+                    'powerConsumption': 16,
+                    'unlockTier': 7},
+ 'aluminum_rod': {'alternateRecipe': True,
+                  'category': 'crafting1',
+                  'craftingSpeed': 8,
+                  'id': 'aluminum_rod',
+                  'inputs': [{'amount': 7.5, 'item': 'aluminum_ingot'}],
+                  'machineType': 'Constructor',
+                  'name': 'Alternate: Aluminum Rod',
+                  'outputs': [{'amount': 52.5, 'item': 'iron_rod'}],
+                  'powerConsumption': 4,
+                  'unlockTier': 0},
+ 'aluminum_scrap': {'alternateRecipe': False,
+                    'category': 'refining',
+                    'craftingSpeed': 1,
+                    'id': 'aluminum_scrap',
+                    'inputs': [{'amount': 240, 'item': 'alumina_solution'}, {'amount': 120, 'item': 'coal'}],
+                    'machineType': 'Refinery',
+                    'name': 'Aluminum Scrap',
+                    'outputs': [{'amount': 360, 'item': 'aluminum_scrap'}, {'amount': 120, 'item': 'water'}],
+                    'powerConsumption': 30,
+                    'unlockTier': 7},
+ 'assembly_director_system': {'alternateRecipe': False,
+                              'category': 'crafting2',
+                              'craftingSpeed': 80,
+                              'id': 'assembly_director_system',
+                              'inputs': [{'amount': 1.5, 'item': 'adaptive_control_unit'},
+                                         {'amount': 0.75, 'item': 'supercomputer'}],
+                              'machineType': 'Assembler',
+                              'name': 'Assembly Director System',
+                              'outputs': [{'amount': 0.75, 'item': 'assembly_director_system'}],
+                              'powerConsumption': 15,
+                              'unlockTier': 7},
+ 'automated_miner': {'alternateRecipe': True,
+                     'category': 'crafting2',
+                     'craftingSpeed': 60,
+                     'id': 'automated_miner',
+                     'inputs': [{'amount': 4, 'item': 'steel_pipe'}, {'amount': 4, 'item': 'iron_plate'}],
+                     'machineType': 'Assembler',
+                     'name': 'Alternate: Automated Miner',
+                     'outputs': [{'amount': 1, 'item': 'portable_miner'}],
+                     'powerConsumption': 15,
+                     'unlockTier': 0},
+ 'automated_speed_wiring': {'alternateRecipe': True,
+                            'category': 'crafting3',
+                            'craftingSpeed': 32,
+                            'id': 'automated_speed_wiring',
+                            'inputs': [{'amount': 3.75, 'item': 'stator'}, {'amount': 75, 'item': 'wire'},
+                                       {'amount': 1.875, 'item': 'high_speed_connector'}],
+                            'machineType': 'Manufacturer',
+                            'name': 'Alternate: Automated Speed Wiring',
+                            'outputs': [{'amount': 7.5, 'item': 'automated_wiring'}],
+                            'powerConsumption': 55,
+                            'unlockTier': 4},
+ 'automated_wiring': {'alternateRecipe': False,
+                      'category': 'crafting2',
+                      'craftingSpeed': 24,
+                      'id': 'automated_wiring',
+                      'inputs': [{'amount': 2.5, 'item': 'stator'}, {'amount': 50, 'item': 'cable'}],
+                      'machineType': 'Assembler',
+                      'name': 'Automated Wiring',
+                      'outputs': [{'amount': 2.5, 'item': 'automated_wiring'}],
+                      'powerConsumption': 15,
+                      'unlockTier': 4},
+ 'ballistic_warp_drive': {'alternateRecipe': False,
+                          'category': 'crafting3',
+                          'craftingSpeed': 60,
+                          'id': 'ballistic_warp_drive',
+                          'inputs': [{'amount': 1, 'item': 'thermal_propulsion_rocket'},
+                                     {'amount': 5, 'item': 'singularity_cell'},
+                                     {'amount': 2, 'item': 'superposition_oscillator'},
+                                     {'amount': 40, 'item': 'dark_matter_crystal'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Ballistic Warp Drive',
+                          'outputs': [{'amount': 1, 'item': 'ballistic_warp_drive'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 9},
+ 'battery': {'alternateRecipe': False,
+             'category': 'blending',
+             'craftingSpeed': 3,
+             'id': 'battery',
+             'inputs': [{'amount': 50, 'item': 'sulfuric_acid'}, {'amount': 40, 'item': 'alumina_solution'},
+                        {'amount': 20, 'item': 'aluminum_casing'}],
+             'machineType': 'Blender',
+             'name': 'Battery',
+             'outputs': [{'amount': 20, 'item': 'battery'}, {'amount': 30, 'item': 'water'}],
+             'powerConsumption': 75,
+             'unlockTier': 7},
+ 'bauxite_caterium': {'alternateRecipe': False,
+                      'category': 'converting',
+                      'craftingSpeed': 6,
+                      'id': 'bauxite_caterium',
+                      'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 150, 'item': 'caterium_ore'}],
+                      'machineType': 'Converter',
+                      'name': 'Bauxite (Caterium)',
+                      'outputs': [{'amount': 120, 'item': 'bauxite'}],
+                      'powerConsumption': 250,
+                      'unlockTier': 7},
+ 'bauxite_copper': {'alternateRecipe': False,
+                    'category': 'converting',
+                    'craftingSpeed': 6,
+                    'id': 'bauxite_copper',
+                    'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 180, 'item': 'copper_ore'}],
+                    'machineType': 'Converter',
+                    'name': 'Bauxite (Copper)',
+                    'outputs': [{'amount': 120, 'item': 'bauxite'}],
+                    'powerConsumption': 250,
+                    'unlockTier': 7},
+ 'biocoal': {'alternateRecipe': True,
+             'category': 'crafting1',
+             'craftingSpeed': 8,
+             'id': 'biocoal',
+             'inputs': [{'amount': 37.5, 'item': 'biomass'}],
+             'machineType': 'Constructor',
+             'name': 'Alternate: Biocoal',
+             'outputs': [{'amount': 45, 'item': 'coal'}],
+             'powerConsumption': 4,
+             'unlockTier': 3},
+ 'biomass_from_alien_protein': {'alternateRecipe': False,
+                                'category': 'crafting1',
+                                'craftingSpeed': 4,
+                                'id': 'biomass_from_alien_protein',
+                                'inputs': [{'amount': 15, 'item': 'alien_protein'}],
+                                'machineType': 'Constructor',
+                                'name': 'Biomass (Alien Protein)',
+                                'outputs': [{'amount': 1500, 'item': 'biomass'}],
+                                'powerConsumption': 4,
+                                'unlockTier': 0},
+ 'biomass_from_leaves': {'alternateRecipe': False,
+                         'category': 'crafting1',
+                         'craftingSpeed': 5,
+                         'id': 'biomass_from_leaves',
+                         'inputs': [{'amount': 120, 'item': 'leaves'}],
+                         'machineType': 'Constructor',
+                         'name': 'Biomass (Leaves)',
+                         'outputs': [{'amount': 60, 'item': 'biomass'}],
+                         'powerConsumption': 4,
+                         'unlockTier': 0},
+ 'biomass_from_mycelia': {'alternateRecipe': False,
+                          'category': 'crafting1',
+                          'craftingSpeed': 4,
+                          'id': 'biomass_from_mycelia',
+                          'inputs': [{'amount': 15, 'item': 'mycelia'}],
+                          'machineType': 'Constructor',
+                          'name': 'Biomass (Mycelia)',
+                          'outputs': [{'amount': 150, 'item': 'biomass'}],
+                          'powerConsumption': 4,
+                          'unlockTier': 0},
+ 'biomass_from_wood': {'alternateRecipe': False,
+                       'category': 'crafting1',
+                       'craftingSpeed': 4,
+                       'id': 'biomass_from_wood',
+                       'inputs': [{'amount': 60, 'item': 'wood'}],
+                       'machineType': 'Constructor',
+                       'name': 'Biomass (Wood)',
+                       'outputs': [{'amount': 300, 'item': 'biomass'}],
+                       'powerConsumption': 4,
+                       'unlockTier': 0},
+ 'black_powder': {'alternateRecipe': False,
+                  'category': 'crafting2',
+                  'craftingSpeed': 4,
+                  'id': 'black_powder',
+                  'inputs': [{'amount': 15, 'item': 'coal'}, {'amount': 15, 'item': 'sulfur'}],
+                  'machineType': 'Assembler',
+                  'name': 'Black Powder',
+                  'outputs': [{'amount': 30, 'item': 'black_powder'}],
+                  'powerConsumption': 15,
+                  'unlockTier': 4},
+ 'bolted_frame': {'alternateRecipe': True,
+                  'category': 'crafting2',
+                  'craftingSpeed': 24,
+                  'id': 'bolted_frame',
+                  'inputs': [{'amount': 7.5, 'item': 'reinforced_iron_plate'}, {'amount': 140, 'item': 'screw'}],
+                  'machineType': 'Assembler',
+                  'name': 'Alternate: Bolted Frame',
+                  'outputs': [{'amount': 5, 'item': 'modular_frame'}],
+                  'powerConsumption': 15,
+                  'unlockTier': 2},
+ 'bolted_iron_plate': {'alternateRecipe': True,
+                       'category': 'crafting2',
+                       'craftingSpeed': 12,
+                       'id': 'bolted_iron_plate',
+                       'inputs': [{'amount': 90, 'item': 'iron_plate'}, {'amount': 250, 'item': 'screw'}],
+                       'machineType': 'Assembler',
+                       'name': 'Alternate: Bolted Iron Plate',
+                       'outputs': [{'amount': 15, 'item': 'reinforced_iron_plate'}],
+                       'powerConsumption': 15,
+                       'unlockTier': 0},
+ 'cable': {'alternateRecipe': False,
+           'category': 'crafting1',
+           'craftingSpeed': 2,
+           'id': 'cable',
+           'inputs': [{'amount': 60, 'item': 'wire'}],
+           'machineType': 'Constructor',
+           'name': 'Cable',
+           'outputs': [{'amount': 30, 'item': 'cable'}],
+           'powerConsumption': 4,
+           'unlockTier': 0},
+ 'cast_screw': {'alternateRecipe': True,
+                'category': 'crafting1',
+                'craftingSpeed': 24,
+                'id': 'cast_screw',
+                'inputs': [{'amount': 12.5, 'item': 'iron_ingot'}],
+                'machineType': 'Constructor',
+                'name': 'Alternate: Cast Screw',
+                'outputs': [{'amount': 50, 'item': 'screw'}],
+                'powerConsumption': 4,
+                'unlockTier': 0},
+ 'caterium_circuit_board': {'alternateRecipe': True,
+                            'category': 'crafting2',
+                            'craftingSpeed': 48,
+                            'id': 'caterium_circuit_board',
+                            'inputs': [{'amount': 12.5, 'item': 'plastic'}, {'amount': 37.5, 'item': 'quickwire'}],
+                            'machineType': 'Assembler',
+                            'name': 'Alternate: Caterium Circuit Board',
+                            'outputs': [{'amount': 8.75, 'item': 'circuit_board'}],
+                            'powerConsumption': 15,
+                            'unlockTier': 5},
+ 'caterium_computer': {'alternateRecipe': True,
+                       'category': 'crafting3',
+                       'craftingSpeed': 16,
+                       'id': 'caterium_computer',
+                       'inputs': [{'amount': 15, 'item': 'circuit_board'}, {'amount': 52.5, 'item': 'quickwire'},
+                                  {'amount': 22.5, 'item': 'rubber'}],
+                       'machineType': 'Manufacturer',
+                       'name': 'Alternate: Caterium Computer',
+                       'outputs': [{'amount': 3.75, 'item': 'computer'}],
+                       'powerConsumption': 55,
+                       'unlockTier': 5},
+ 'caterium_ingot': {'alternateRecipe': False,
+                    'category': 'smelting1',
+                    'craftingSpeed': 4,
+                    'id': 'caterium_ingot',
+                    'inputs': [{'amount': 45, 'item': 'caterium_ore'}],
+                    'machineType': 'Smelter',
+                    'name': 'Caterium Ingot',
+                    'outputs': [{'amount': 15, 'item': 'caterium_ingot'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 3},
+ 'caterium_ore_copper': {'alternateRecipe': False,
+                         'category': 'converting',
+                         'craftingSpeed': 6,
+                         'id': 'caterium_ore_copper',
+                         'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 150, 'item': 'copper_ore'}],
+                         'machineType': 'Converter',
+                         'name': 'Caterium Ore (Copper)',
+                         'outputs': [{'amount': 120, 'item': 'caterium_ore'}],
+                         'powerConsumption': 250,
+                         'unlockTier': 3},
+ 'caterium_ore_quartz': {'alternateRecipe': False,
+                         'category': 'converting',
+                         'craftingSpeed': 6,
+                         'id': 'caterium_ore_quartz',
+                         'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 120, 'item': 'raw_quartz'}],
+                         'machineType': 'Converter',
+                         'name': 'Caterium Ore (Quartz)',
+                         'outputs': [{'amount': 120, 'item': 'caterium_ore'}],
+                         'powerConsumption': 250,
+                         'unlockTier': 3},
+ 'caterium_wire': {'alternateRecipe': True,
+                   'category': 'crafting1',
+                   'craftingSpeed': 4,
+                   'id': 'caterium_wire',
+                   'inputs': [{'amount': 15, 'item': 'caterium_ingot'}],
+                   'machineType': 'Constructor',
+                   'name': 'Alternate: Caterium Wire',
+                   'outputs': [{'amount': 120, 'item': 'wire'}],
+                   'powerConsumption': 4,
+                   'unlockTier': 0},
+ 'charcoal': {'alternateRecipe': True,
+              'category': 'crafting1',
+              'craftingSpeed': 4,
+              'id': 'charcoal',
+              'inputs': [{'amount': 15, 'item': 'wood'}],
+              'machineType': 'Constructor',
+              'name': 'Alternate: Charcoal',
+              'outputs': [{'amount': 150, 'item': 'coal'}],
+              'powerConsumption': 4,
+              'unlockTier': 3},
+ 'cheap_silica': {'alternateRecipe': True,
+                  'category': 'crafting2',
+                  'craftingSpeed': 8,
+                  'id': 'cheap_silica',
+                  'inputs': [{'amount': 22.5, 'item': 'raw_quartz'}, {'amount': 37.5, 'item': 'limestone'}],
+                  'machineType': 'Assembler',
+                  'name': 'Alternate: Cheap Silica',
+                  'outputs': [{'amount': 52.5, 'item': 'silica'}],
+                  'powerConsumption': 15,
+                  'unlockTier': 4},
+ 'circuit_board': {'alternateRecipe': False,
+                   'category': 'crafting2',
+                   'craftingSpeed': 8,
+                   'id': 'circuit_board',
+                   'inputs': [{'amount': 15, 'item': 'copper_sheet'}, {'amount': 30, 'item': 'plastic'}],
+                   'machineType': 'Assembler',
+                   'name': 'Circuit Board',
+                   'outputs': [{'amount': 7.5, 'item': 'circuit_board'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 5},
+ 'classic_battery': {'alternateRecipe': True,
+                     'category': 'crafting3',
+                     'craftingSpeed': 8,
+                     'id': 'classic_battery',
+                     'inputs': [{'amount': 45, 'item': 'sulfur'}, {'amount': 52.5, 'item': 'alclad_aluminum_sheet'},
+                                {'amount': 60, 'item': 'plastic'}, {'amount': 90, 'item': 'wire'}],
+                     'machineType': 'Manufacturer',
+                     'name': 'Alternate: Classic Battery',
+                     'outputs': [{'amount': 30, 'item': 'battery'}],
+                     'powerConsumption': 55,
+                     'unlockTier': 7},
+ 'cloudy_diamonds': {'alternateRecipe': True,
+                     'category': 'accelerating',
+                     'craftingSpeed': 3,
+                     'id': 'cloudy_diamonds',
+                     'inputs': [{'amount': 240, 'item': 'coal'}, {'amount': 480, 'item': 'limestone'}],
+                     'machineType': 'Particle Accelerator',
+                     'name': 'Alternate: Cloudy Diamonds',
+                     'outputs': [{'amount': 20, 'item': 'diamonds'}],
+                     'powerConsumption': 500,
+                     'unlockTier': 9},
+ 'cluster_nobelisk': {'alternateRecipe': False,
+                      'category': 'crafting2',
+                      'craftingSpeed': 24,
+                      'id': 'cluster_nobelisk',
+                      'inputs': [{'amount': 7.5, 'item': 'nobelisk'}, {'amount': 10, 'item': 'smokeless_powder'}],
+                      'machineType': 'Assembler',
+                      'name': 'Cluster Nobelisk',
+                      'outputs': [{'amount': 2.5, 'item': 'cluster_nobelisk'}],
+                      'powerConsumption': 15,
+                      'unlockTier': 11},
+ 'coal_iron': {'alternateRecipe': False,
+               'category': 'converting',
+               'craftingSpeed': 6,
+               'id': 'coal_iron',
+               'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 180, 'item': 'iron_ore'}],
+               'machineType': 'Converter',
+               'name': 'Coal (Iron)',
+               'outputs': [{'amount': 120, 'item': 'coal'}],
+               'powerConsumption': 250,
+               'unlockTier': 3},
+ 'coal_limestone': {'alternateRecipe': False,
+                    'category': 'converting',
+                    'craftingSpeed': 6,
+                    'id': 'coal_limestone',
+                    'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 360, 'item': 'limestone'}],
+                    'machineType': 'Converter',
+                    'name': 'Coal (Limestone)',
+                    'outputs': [{'amount': 120, 'item': 'coal'}],
+                    'powerConsumption': 250,
+                    'unlockTier': 3},
+ 'coated_cable': {'alternateRecipe': True,
+                  'category': 'refining',
+                  'craftingSpeed': 8,
+                  'id': 'coated_cable',
+                  'inputs': [{'amount': 37.5, 'item': 'wire'}, {'amount': 15, 'item': 'heavy_oil_residue'}],
+                  'machineType': 'Refinery',
+                  'name': 'Alternate: Coated Cable',
+                  'outputs': [{'amount': 67.5, 'item': 'cable'}],
+                  'powerConsumption': 30,
+                  'unlockTier': 0},
+ 'coated_iron_canister': {'alternateRecipe': True,
+                          'category': 'crafting2',
+                          'craftingSpeed': 4,
+                          'id': 'coated_iron_canister',
+                          'inputs': [{'amount': 30, 'item': 'iron_plate'}, {'amount': 15, 'item': 'copper_sheet'}],
+                          'machineType': 'Assembler',
+                          'name': 'Alternate: Coated Iron Canister',
+                          'outputs': [{'amount': 60, 'item': 'empty_canister'}],
+                          'powerConsumption': 15,
+                          'unlockTier': 5},
+ 'coated_iron_plate': {'alternateRecipe': True,
+                       'category': 'crafting2',
+                       'craftingSpeed': 8,
+                       'id': 'coated_iron_plate',
+                       'inputs': [{'amount': 37.5, 'item': 'iron_ingot'}, {'amount': 7.5, 'item': 'plastic'}],
+                       'machineType': 'Assembler',
+                       'name': 'Alternate: Coated Iron Plate',
+                       'outputs': [{'amount': 75, 'item': 'iron_plate'}],
+                       'powerConsumption': 15,
+                       'unlockTier': 0},
+ 'coke_steel_ingot': {'alternateRecipe': True,
+                      'category': 'smelting2',
+                      'craftingSpeed': 12,
+                      'id': 'coke_steel_ingot',
+                      'inputs': [{'amount': 75, 'item': 'iron_ore'}, {'amount': 75, 'item': 'petroleum_coke'}],
+                      'machineType': 'Foundry',
+                      'name': 'Alternate: Coke Steel Ingot',
+                      'outputs': [{'amount': 100, 'item': 'steel_ingot'}],
+                      'powerConsumption': 16,
+                      'unlockTier': 4},
+ 'compacted_coal': {'alternateRecipe': True,
+                    'category': 'crafting2',
+                    'craftingSpeed': 12,
+                    'id': 'compacted_coal',
+                    'inputs': [{'amount': 25, 'item': 'coal'}, {'amount': 25, 'item': 'sulfur'}],
+                    'machineType': 'Assembler',
+                    'name': 'Alternate: Compacted Coal',
+                    'outputs': [{'amount': 25, 'item': 'compacted_coal'}],
+                    'powerConsumption': 15,
+                    'unlockTier': 4},
+ 'compacted_steel_ingot': {'alternateRecipe': True,
+                           'category': 'smelting2',
+                           'craftingSpeed': 16,
+                           'id': 'compacted_steel_ingot',
+                           'inputs': [{'amount': 22.5, 'item': 'iron_ore'},
+                                      {'amount': 11.25, 'item': 'compacted_coal'}],
+                           'machineType': 'Foundry',
+                           'name': 'Alternate: Compacted Steel Ingot',
+                           'outputs': [{'amount': 37.5, 'item': 'steel_ingot'}],
+                           'powerConsumption': 16,
+                           'unlockTier': 4},
+ 'computer': {'alternateRecipe': False,
+              'category': 'crafting3',
+              'craftingSpeed': 24,
+              'id': 'computer',
+              'inputs': [{'amount': 10, 'item': 'circuit_board'}, {'amount': 20, 'item': 'cable'},
+                         {'amount': 40, 'item': 'plastic'}],
+              'machineType': 'Manufacturer',
+              'name': 'Computer',
+              'outputs': [{'amount': 2.5, 'item': 'computer'}],
+              'powerConsumption': 55,
+              'unlockTier': 5},
+ 'concrete': {'alternateRecipe': False,
+              'category': 'crafting1',
+              'craftingSpeed': 4,
+              'id': 'concrete',
+              'inputs': [{'amount': 45, 'item': 'limestone'}],
+              'machineType': 'Constructor',
+              'name': 'Concrete',
+              'outputs': [{'amount': 15, 'item': 'concrete'}],
+              'powerConsumption': 4,
+              'unlockTier': 0},
+ 'cooling_device': {'alternateRecipe': True,
+                    'category': 'blending',
+                    'craftingSpeed': 24,
+                    'id': 'cooling_device',
+                    'inputs': [{'amount': 10, 'item': 'heat_sink'}, {'amount': 2.5, 'item': 'motor'},
+                               {'amount': 60, 'item': 'nitrogen_gas'}],
+                    'machineType': 'Blender',
+                    'name': 'Alternate: Cooling Device',
+                    'outputs': [{'amount': 5, 'item': 'cooling_system'}],
+                    'powerConsumption': 75,
+                    'unlockTier': 8},
+ 'cooling_system': {'alternateRecipe': False,
+                    'category': 'blending',
+                    'craftingSpeed': 10,
+                    'id': 'cooling_system',
+                    'inputs': [{'amount': 12, 'item': 'heat_sink'}, {'amount': 12, 'item': 'rubber'},
+                               {'amount': 30, 'item': 'water'}, {'amount': 150, 'item': 'nitrogen_gas'}],
+                    'machineType': 'Blender',
+                    'name': 'Cooling System',
+                    'outputs': [{'amount': 6, 'item': 'cooling_system'}],
+                    'powerConsumption': 75,
+                    'unlockTier': 8},
+ 'copper_alloy_ingot': {'alternateRecipe': True,
+                        'category': 'smelting2',
+                        'craftingSpeed': 6,
+                        'id': 'copper_alloy_ingot',
+                        'inputs': [{'amount': 50, 'item': 'copper_ore'}, {'amount': 50, 'item': 'iron_ore'}],
+                        'machineType': 'Foundry',
+                        'name': 'Alternate: Copper Alloy Ingot',
+                        'outputs': [{'amount': 100, 'item': 'copper_ingot'}],
+                        'powerConsumption': 16,
+                        'unlockTier': 0},
+ 'copper_ingot': {'alternateRecipe': False,
+                  'category': 'smelting1',
+                  'craftingSpeed': 2,
+                  'id': 'copper_ingot',
+                  'inputs': [{'amount': 30, 'item': 'copper_ore'}],
+                  'machineType': 'Smelter',
+                  'name': 'Copper Ingot',
+                  'outputs': [{'amount': 30, 'item': 'copper_ingot'}],
+                  'powerConsumption': 4,
+                  'unlockTier': 0},
+ 'copper_ore_quartz': {'alternateRecipe': False,
+                       'category': 'converting',
+                       'craftingSpeed': 6,
+                       'id': 'copper_ore_quartz',
+                       'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 100, 'item': 'raw_quartz'}],
+                       'machineType': 'Converter',
+                       'name': 'Copper Ore (Quartz)',
+                       'outputs': [{'amount': 120, 'item': 'copper_ore'}],
+                       'powerConsumption': 250,
+                       'unlockTier': 0},
+ 'copper_ore_sulfur': {'alternateRecipe': False,
+                       'category': 'converting',
+                       'craftingSpeed': 6,
+                       'id': 'copper_ore_sulfur',
+                       'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 120, 'item': 'sulfur'}],
+                       'machineType': 'Converter',
+                       'name': 'Copper Ore (Sulfur)',
+                       'outputs': [{'amount': 120, 'item': 'copper_ore'}],
+                       'powerConsumption': 250,
+                       'unlockTier': 0},
+ 'copper_powder': {'alternateRecipe': False,
+                   'category': 'crafting1',
+                   'craftingSpeed': 6,
+                   'id': 'copper_powder',
+                   'inputs': [{'amount': 300, 'item': 'copper_ingot'}],
+                   'machineType': 'Constructor',
+                   'name': 'Copper Powder',
+                   'outputs': [{'amount': 50, 'item': 'copper_powder'}],
+                   'powerConsumption': 4,
+                   'unlockTier': 8},
+ 'copper_rotor': {'alternateRecipe': True,
+                  'category': 'crafting2',
+                  'craftingSpeed': 16,
+                  'id': 'copper_rotor',
+                  'inputs': [{'amount': 22.5, 'item': 'copper_sheet'}, {'amount': 195, 'item': 'screw'}],
+                  'machineType': 'Assembler',
+                  'name': 'Alternate: Copper Rotor',
+                  'outputs': [{'amount': 11.25, 'item': 'rotor'}],
+                  'powerConsumption': 15,
+                  'unlockTier': 2},
+ 'copper_sheet': {'alternateRecipe': False,
+                  'category': 'crafting1',
+                  'craftingSpeed': 6,
+                  'id': 'copper_sheet',
+                  'inputs': [{'amount': 20, 'item': 'copper_ingot'}],
+                  'machineType': 'Constructor',
+                  'name': 'Copper Sheet',
+                  'outputs': [{'amount': 10, 'item': 'copper_sheet'}],
+                  'powerConsumption': 4,
+                  'unlockTier': 2},
+ 'crystal_computer': {'alternateRecipe': True,
+                      'category': 'crafting2',
+                      'craftingSpeed': 36,
+                      'id': 'crystal_computer',
+                      'inputs': [{'amount': 5, 'item': 'circuit_board'},
+                                 {'amount': 1.6666666666666667, 'item': 'crystal_oscillator'}],
+                      'machineType': 'Assembler',
+                      'name': 'Alternate: Crystal Computer',
+                      'outputs': [{'amount': 3.3333333333333335, 'item': 'computer'}],
+                      'powerConsumption': 15,
+                      'unlockTier': 5},
+ 'crystal_oscillator': {'alternateRecipe': False,
+                        'category': 'crafting3',
+                        'craftingSpeed': 120,
+                        'id': 'crystal_oscillator',
+                        'inputs': [{'amount': 18, 'item': 'quartz_crystal'}, {'amount': 14, 'item': 'cable'},
+                                   {'amount': 2.5, 'item': 'reinforced_iron_plate'}],
+                        'machineType': 'Manufacturer',
+                        'name': 'Crystal Oscillator',
+                        'outputs': [{'amount': 1, 'item': 'crystal_oscillator'}],
+                        'powerConsumption': 55,
+                        'unlockTier': 4},
+ 'dark_ion_fuel': {'alternateRecipe': True,
+                   'category': 'converting',
+                   'craftingSpeed': 3,
+                   'id': 'dark_ion_fuel',
+                   'inputs': [{'amount': 240, 'item': 'packaged_rocket_fuel'},
+                              {'amount': 80, 'item': 'dark_matter_crystal'}],
+                   'machineType': 'Converter',
+                   'name': 'Alternate: Dark-Ion Fuel',
+                   'outputs': [{'amount': 200, 'item': 'ionized_fuel'}, {'amount': 40, 'item': 'compacted_coal'}],
+                   'powerConsumption': 250,
+                   'unlockTier': 9},
+ 'dark_matter_crystal': {'alternateRecipe': False,
+                         'category': 'accelerating',
+                         'craftingSpeed': 2,
+                         'id': 'dark_matter_crystal',
+                         'inputs': [{'amount': 30, 'item': 'diamonds'}, {'amount': 150, 'item': 'dark_matter_residue'}],
+                         'machineType': 'Particle Accelerator',
+                         'name': 'Dark Matter Crystal',
+                         'outputs': [{'amount': 30, 'item': 'dark_matter_crystal'}],
+                         'powerConsumption': 1000,
+                         'unlockTier': 9},
+ 'dark_matter_crystallization': {'alternateRecipe': True,
+                                 'category': 'accelerating',
+                                 'craftingSpeed': 3,
+                                 'id': 'dark_matter_crystallization',
+                                 'inputs': [{'amount': 200, 'item': 'dark_matter_residue'}],
+                                 'machineType': 'Particle Accelerator',
+                                 'name': 'Alternate: Dark Matter Crystallization',
+                                 'outputs': [{'amount': 20, 'item': 'dark_matter_crystal'}],
+                                 'powerConsumption': 1000,
+                                 'unlockTier': 9},
+ 'dark_matter_residue': {'alternateRecipe': False,
+                         'category': 'converting',
+                         'craftingSpeed': 6,
+                         'id': 'dark_matter_residue',
+                         'inputs': [{'amount': 50, 'item': 'reanimated_sam'}],
+                         'machineType': 'Converter',
+                         'name': 'Dark Matter Residue',
+                         'outputs': [{'amount': 100, 'item': 'dark_matter_residue'}],
+                         'powerConsumption': 250,
+                         'unlockTier': 9},
+ 'dark_matter_trap': {'alternateRecipe': True,
+                      'category': 'accelerating',
+                      'craftingSpeed': 2,
+                      'id': 'dark_matter_trap',
+                      'inputs': [{'amount': 30, 'item': 'time_crystal'},
+                                 {'amount': 150, 'item': 'dark_matter_residue'}],
+                      'machineType': 'Particle Accelerator',
+                      'name': 'Alternate: Dark Matter Trap',
+                      'outputs': [{'amount': 60, 'item': 'dark_matter_crystal'}],
+                      'powerConsumption': 1000,
+                      'unlockTier': 9},
+ 'diamonds': {'alternateRecipe': False,
+              'category': 'accelerating',
+              'craftingSpeed': 2,
+              'id': 'diamonds',
+              'inputs': [{'amount': 600, 'item': 'coal'}],
+              'machineType': 'Particle Accelerator',
+              'name': 'Diamonds',
+              'outputs': [{'amount': 30, 'item': 'diamonds'}],
+              'powerConsumption': 500,
+              'unlockTier': 9},
+ 'diluted_fuel': {'alternateRecipe': True,
+                  'category': 'blending',
+                  'craftingSpeed': 6,
+                  'id': 'diluted_fuel',
+                  'inputs': [{'amount': 50, 'item': 'heavy_oil_residue'}, {'amount': 100, 'item': 'water'}],
+                  'machineType': 'Blender',
+                  'name': 'Alternate: Diluted Fuel',
+                  'outputs': [{'amount': 100, 'item': 'fuel'}],
+                  'powerConsumption': 75,
+                  'unlockTier': 5},
+ 'diluted_packaged_fuel': {'alternateRecipe': True,
+                           'category': 'refining',
+                           'craftingSpeed': 2,
+                           'id': 'diluted_packaged_fuel',
+                           'inputs': [{'amount': 30, 'item': 'heavy_oil_residue'},
+                                      {'amount': 60, 'item': 'packaged_water'}],
+                           'machineType': 'Refinery',
+                           'name': 'Alternate: Diluted Packaged Fuel',
+                           'outputs': [{'amount': 60, 'item': 'packaged_fuel'}],
+                           'powerConsumption': 30,
+                           'unlockTier': 5},
+ 'distilled_silica': {'alternateRecipe': True,
+                      'category': 'blending',
+                      'craftingSpeed': 6,
+                      'id': 'distilled_silica',
+                      'inputs': [{'amount': 120, 'item': 'dissolved_silica'}, {'amount': 50, 'item': 'limestone'},
+                                 {'amount': 100, 'item': 'water'}],
+                      'machineType': 'Blender',
+                      'name': 'Alternate: Distilled Silica',
+                      'outputs': [{'amount': 270, 'item': 'silica'}, {'amount': 80, 'item': 'water'}],
+                      'powerConsumption': 75,
+                      'unlockTier': 4},
+ 'electric_motor': {'alternateRecipe': True,
+                    'category': 'crafting2',
+                    'craftingSpeed': 16,
+                    'id': 'electric_motor',
+                    'inputs': [{'amount': 3.75, 'item': 'em_control_rod'}, {'amount': 7.5, 'item': 'rotor'}],
+                    'machineType': 'Assembler',
+                    'name': 'Alternate: Electric Motor',
+                    'outputs': [{'amount': 7.5, 'item': 'motor'}],
+                    'powerConsumption': 15,
+                    'unlockTier': 4},
+ 'electrode_aluminum_scrap': {'alternateRecipe': True,
+                              'category': 'refining',
+                              'craftingSpeed': 4,
+                              'id': 'electrode_aluminum_scrap',
+                              'inputs': [{'amount': 180, 'item': 'alumina_solution'},
+                                         {'amount': 60, 'item': 'petroleum_coke'}],
+                              'machineType': 'Refinery',
+                              'name': 'Alternate: Electrode Aluminum Scrap',
+                              'outputs': [{'amount': 300, 'item': 'aluminum_scrap'}, {'amount': 105, 'item': 'water'}],
+                              'powerConsumption': 30,
+                              'unlockTier': 7},
+ 'electrode_circuit_board': {'alternateRecipe': True,
+                             'category': 'crafting2',
+                             'craftingSpeed': 12,
+                             'id': 'electrode_circuit_board',
+                             'inputs': [{'amount': 20, 'item': 'rubber'}, {'amount': 40, 'item': 'petroleum_coke'}],
+                             'machineType': 'Assembler',
+                             'name': 'Alternate: Electrode Circuit Board',
+                             'outputs': [{'amount': 5, 'item': 'circuit_board'}],
+                             'powerConsumption': 15,
+                             'unlockTier': 5},
+ 'electromagnetic_connection_rod': {'alternateRecipe': True,
+                                    'category': 'crafting2',
+                                    'craftingSpeed': 15,
+                                    'id': 'electromagnetic_connection_rod',
+                                    'inputs': [{'amount': 8, 'item': 'stator'},
+                                               {'amount': 4, 'item': 'high_speed_connector'}],
+                                    'machineType': 'Assembler',
+                                    'name': 'Alternate: Electromagnetic Connection Rod',
+                                    'outputs': [{'amount': 8, 'item': 'em_control_rod'}],
+                                    'powerConsumption': 15,
+                                    'unlockTier': 8},
+ 'em_control_rod': {'alternateRecipe': False,
+                    'category': 'crafting2',
+                    'craftingSpeed': 30,
+                    'id': 'em_control_rod',
+                    'inputs': [{'amount': 6, 'item': 'stator'}, {'amount': 4, 'item': 'ai_limiter'}],
+                    'machineType': 'Assembler',
+                    'name': 'Electromagnetic Control Rod',
+                    'outputs': [{'amount': 4, 'item': 'em_control_rod'}],
+                    'powerConsumption': 15,
+                    'unlockTier': 8},
+ 'empty_canister': {'alternateRecipe': False,
+                    'category': 'crafting1',
+                    'craftingSpeed': 4,
+                    'id': 'empty_canister',
+                    'inputs': [{'amount': 30, 'item': 'plastic'}],
+                    'machineType': 'Constructor',
+                    'name': 'Empty Canister',
+                    'outputs': [{'amount': 60, 'item': 'empty_canister'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 5},
+ 'empty_fluid_tank': {'alternateRecipe': False,
+                      'category': 'crafting1',
+                      'craftingSpeed': 1,
+                      'id': 'empty_fluid_tank',
+                      'inputs': [{'amount': 60, 'item': 'aluminum_ingot'}],
+                      'machineType': 'Constructor',
+                      'name': 'Empty Fluid Tank',
+                      'outputs': [{'amount': 60, 'item': 'empty_fluid_tank'}],
+                      'powerConsumption': 4,
+                      'unlockTier': 8},
+ 'encased_industrial_beam': {'alternateRecipe': False,
+                             'category': 'crafting2',
+                             'craftingSpeed': 10,
+                             'id': 'encased_industrial_beam',
+                             'inputs': [{'amount': 18, 'item': 'steel_beam'}, {'amount': 36, 'item': 'concrete'}],
+                             'machineType': 'Assembler',
+                             'name': 'Encased Industrial Beam',
+                             'outputs': [{'amount': 6, 'item': 'encased_industrial_beam'}],
+                             'powerConsumption': 15,
+                             'unlockTier': 4},
+ 'encased_industrial_pipe': {'alternateRecipe': True,
+                             'category': 'crafting2',
+                             'craftingSpeed': 15,
+                             'id': 'encased_industrial_pipe',
+                             'inputs': [{'amount': 24, 'item': 'steel_pipe'}, {'amount': 20, 'item': 'concrete'}],
+                             'machineType': 'Assembler',
+                             'name': 'Alternate: Encased Industrial Pipe',
+                             'outputs': [{'amount': 4, 'item': 'encased_industrial_beam'}],
+                             'powerConsumption': 15,
+                             'unlockTier': 4},
+ 'encased_plutonium_cell': {'alternateRecipe': False,
+                            'category': 'crafting2',
+                            'craftingSpeed': 12,
+                            'id': 'encased_plutonium_cell',
+                            'inputs': [{'amount': 10, 'item': 'plutonium_pellet'}, {'amount': 20, 'item': 'concrete'}],
+                            'machineType': 'Assembler',
+                            'name': 'Encased Plutonium Cell',
+                            'outputs': [{'amount': 5, 'item': 'encased_plutonium_cell'}],
+                            'powerConsumption': 15,
+                            'unlockTier': 8},
+ 'excited_photonic_matter': {'alternateRecipe': False,
+                             'category': 'converting',
+                             'craftingSpeed': 3,
+                             'id': 'excited_photonic_matter',
+                             'inputs': [],
+                             'machineType': 'Converter',
+                             'name': 'Excited Photonic Matter',
+                             'outputs': [{'amount': 200, 'item': 'excited_photonic_matter'}],
+                             'powerConsumption': 250,
+                             'unlockTier': 9},
+ 'explosive_rebar': {'alternateRecipe': False,
+                     'category': 'crafting3',
+                     'craftingSpeed': 12,
+                     'id': 'explosive_rebar',
+                     'inputs': [{'amount': 10, 'item': 'iron_rebar'}, {'amount': 10, 'item': 'smokeless_powder'},
+                                {'amount': 10, 'item': 'steel_pipe'}],
+                     'machineType': 'Manufacturer',
+                     'name': 'Explosive Rebar',
+                     'outputs': [{'amount': 5, 'item': 'explosive_rebar'}],
+                     'powerConsumption': 55,
+                     'unlockTier': 11},
+ 'fabric': {'alternateRecipe': False,
+            'category': 'crafting2',
+            'craftingSpeed': 4,
+            'id': 'fabric',
+            'inputs': [{'amount': 15, 'item': 'mycelia'}, {'amount': 75, 'item': 'biomass'}],
+            'machineType': 'Assembler',
+            'name': 'Fabric',
+            'outputs': [{'amount': 15, 'item': 'fabric'}],
+            'powerConsumption': 15,
+            'unlockTier': 1},
+ 'fertile_uranium': {'alternateRecipe': True,
+                     'category': 'blending',
+                     'craftingSpeed': 12,
+                     'id': 'fertile_uranium',
+                     'inputs': [{'amount': 25, 'item': 'uranium'}, {'amount': 25, 'item': 'uranium_waste'},
+                                {'amount': 15, 'item': 'nitric_acid'}, {'amount': 25, 'item': 'sulfuric_acid'}],
+                     'machineType': 'Blender',
+                     'name': 'Alternate: Fertile Uranium',
+                     'outputs': [{'amount': 100, 'item': 'non_fissile_uranium'}, {'amount': 40, 'item': 'water'}],
+                     'powerConsumption': 75,
+                     'unlockTier': 8},
+ 'ficsite_ingot_aluminum': {'alternateRecipe': False,
+                            'category': 'converting',
+                            'craftingSpeed': 2,
+                            'id': 'ficsite_ingot_aluminum',
+                            'inputs': [{'amount': 60, 'item': 'reanimated_sam'},
+                                       {'amount': 120, 'item': 'aluminum_ingot'}],
+                            'machineType': 'Converter',
+                            'name': 'Ficsite Ingot (Aluminum)',
+                            'outputs': [{'amount': 30, 'item': 'ficsite_ingot'}],
+                            'powerConsumption': 250,
+                            'unlockTier': 9},
+ 'ficsite_ingot_caterium': {'alternateRecipe': False,
+                            'category': 'converting',
+                            'craftingSpeed': 4,
+                            'id': 'ficsite_ingot_caterium',
+                            'inputs': [{'amount': 45, 'item': 'reanimated_sam'},
+                                       {'amount': 60, 'item': 'caterium_ingot'}],
+                            'machineType': 'Converter',
+                            'name': 'Ficsite Ingot (Caterium)',
+                            'outputs': [{'amount': 15, 'item': 'ficsite_ingot'}],
+                            'powerConsumption': 250,
+                            'unlockTier': 9},
+ 'ficsite_ingot_iron': {'alternateRecipe': False,
+                        'category': 'converting',
+                        'craftingSpeed': 6,
+                        'id': 'ficsite_ingot_iron',
+                        'inputs': [{'amount': 40, 'item': 'reanimated_sam'}, {'amount': 240, 'item': 'iron_ingot'}],
+                        'machineType': 'Converter',
+                        'name': 'Ficsite Ingot (Iron)',
+                        'outputs': [{'amount': 10, 'item': 'ficsite_ingot'}],
+                        'powerConsumption': 250,
+                        'unlockTier': 9},
+ 'ficsite_trigon': {'alternateRecipe': False,
+                    'category': 'crafting1',
+                    'craftingSpeed': 6,
+                    'id': 'ficsite_trigon',
+                    'inputs': [{'amount': 10, 'item': 'ficsite_ingot'}],
+                    'machineType': 'Constructor',
+                    'name': 'Ficsite Trigon',
+                    'outputs': [{'amount': 30, 'item': 'ficsite_trigon'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 9},
+ 'ficsonium': {'alternateRecipe': False,
+               'category': 'accelerating',
+               'craftingSpeed': 6,
+               'id': 'ficsonium',
+               'inputs': [{'amount': 10, 'item': 'plutonium_waste'}, {'amount': 10, 'item': 'singularity_cell'},
+                          {'amount': 200, 'item': 'dark_matter_residue'}],
+               'machineType': 'Particle Accelerator',
+               'name': 'Ficsonium',
+               'outputs': [{'amount': 10, 'item': 'ficsonium'}],
+               'powerConsumption': 1000,
+               'unlockTier': 9},
+ 'ficsonium_fuel_rod': {'alternateRecipe': False,
+                        'category': 'encoding',
+                        'craftingSpeed': 24,
+                        'id': 'ficsonium_fuel_rod',
+                        'inputs': [{'amount': 5, 'item': 'ficsonium'}, {'amount': 5, 'item': 'em_control_rod'},
+                                   {'amount': 100, 'item': 'ficsite_trigon'},
+                                   {'amount': 50, 'item': 'excited_photonic_matter'}],
+                        'machineType': 'Quantum Encoder',
+                        'name': 'Ficsonium Fuel Rod',
+                        'outputs': [{'amount': 2.5, 'item': 'ficsonium_fuel_rod'},
+                                    {'amount': 50, 'item': 'dark_matter_residue'}],
+                        'powerConsumption': 1000,
+                        'unlockTier': 9},
+ 'filter': {'alternateRecipe': False,
+            'category': 'crafting3',
+            'craftingSpeed': 8,
+            'id': 'filter',
+            'inputs': [{'amount': 15, 'item': 'fabric'}, {'amount': 30, 'item': 'coal'},
+                       {'amount': 15, 'item': 'iron_plate'}],
+            'machineType': 'Manufacturer',
+            'name': 'Gas Filter',
+            'outputs': [{'amount': 7.5, 'item': 'filter'}],
+            'powerConsumption': 55,
+            'unlockTier': 6},
+ 'fine_black_powder': {'alternateRecipe': True,
+                       'category': 'crafting2',
+                       'craftingSpeed': 8,
+                       'id': 'fine_black_powder',
+                       'inputs': [{'amount': 7.5, 'item': 'sulfur'}, {'amount': 15, 'item': 'compacted_coal'}],
+                       'machineType': 'Assembler',
+                       'name': 'Alternate: Fine Black Powder',
+                       'outputs': [{'amount': 45, 'item': 'black_powder'}],
+                       'powerConsumption': 15,
+                       'unlockTier': 4},
+ 'fine_concrete': {'alternateRecipe': True,
+                   'category': 'crafting2',
+                   'craftingSpeed': 12,
+                   'id': 'fine_concrete',
+                   'inputs': [{'amount': 15, 'item': 'silica'}, {'amount': 60, 'item': 'limestone'}],
+                   'machineType': 'Assembler',
+                   'name': 'Alternate: Fine Concrete',
+                   'outputs': [{'amount': 50, 'item': 'concrete'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 0},
+ 'flexible_framework': {'alternateRecipe': True,
+                        'category': 'crafting3',
+                        'craftingSpeed': 16,
+                        'id': 'flexible_framework',
+                        'inputs': [{'amount': 3.75, 'item': 'modular_frame'}, {'amount': 22.5, 'item': 'steel_beam'},
+                                   {'amount': 30, 'item': 'rubber'}],
+                        'machineType': 'Manufacturer',
+                        'name': 'Alternate: Flexible Framework',
+                        'outputs': [{'amount': 7.5, 'item': 'versatile_framework'}],
+                        'powerConsumption': 55,
+                        'unlockTier': 3},
+ 'fuel': {'alternateRecipe': False,
+          'category': 'refining',
+          'craftingSpeed': 6,
+          'id': 'fuel',
+          'inputs': [{'amount': 60, 'item': 'crude_oil'}],
+          'machineType': 'Refinery',
+          'name': 'Fuel',
+          'outputs': [{'amount': 40, 'item': 'fuel'}, {'amount': 30, 'item': 'polymer_resin'}],
+          'powerConsumption': 30,
+          'unlockTier': 5},
+ 'fused_modular_frame': {'alternateRecipe': False,
+                         'category': 'blending',
+                         'craftingSpeed': 40,
+                         'id': 'fused_modular_frame',
+                         'inputs': [{'amount': 1.5, 'item': 'heavy_modular_frame'},
+                                    {'amount': 75, 'item': 'aluminum_casing'},
+                                    {'amount': 37.5, 'item': 'nitrogen_gas'}],
+                         'machineType': 'Blender',
+                         'name': 'Fused Modular Frame',
+                         'outputs': [{'amount': 1.5, 'item': 'fused_modular_frame'}],
+                         'powerConsumption': 75,
+                         'unlockTier': 8},
+ 'fused_quickwire': {'alternateRecipe': True,
+                     'category': 'crafting2',
+                     'craftingSpeed': 8,
+                     'id': 'fused_quickwire',
+                     'inputs': [{'amount': 7.5, 'item': 'caterium_ingot'}, {'amount': 37.5, 'item': 'copper_ingot'}],
+                     'machineType': 'Assembler',
+                     'name': 'Alternate: Fused Quickwire',
+                     'outputs': [{'amount': 90, 'item': 'quickwire'}],
+                     'powerConsumption': 15,
+                     'unlockTier': 3},
+ 'fused_wire': {'alternateRecipe': True,
+                'category': 'crafting2',
+                'craftingSpeed': 20,
+                'id': 'fused_wire',
+                'inputs': [{'amount': 12, 'item': 'copper_ingot'}, {'amount': 3, 'item': 'caterium_ingot'}],
+                'machineType': 'Assembler',
+                'name': 'Alternate: Fused Wire',
+                'outputs': [{'amount': 90, 'item': 'wire'}],
+                'powerConsumption': 15,
+                'unlockTier': 0},
+ 'gas_nobelisk': {'alternateRecipe': False,
+                  'category': 'crafting2',
+                  'craftingSpeed': 12,
+                  'id': 'gas_nobelisk',
+                  'inputs': [{'amount': 5, 'item': 'nobelisk'}, {'amount': 50, 'item': 'biomass'}],
+                  'machineType': 'Assembler',
+                  'name': 'Gas Nobelisk',
+                  'outputs': [{'amount': 5, 'item': 'gas_nobelisk'}],
+                  'powerConsumption': 15,
+                  'unlockTier': 11},
+ 'hatcher_protein': {'alternateRecipe': False,
+                     'category': 'crafting1',
+                     'craftingSpeed': 3,
+                     'id': 'hatcher_protein',
+                     'inputs': [{'amount': 20, 'item': 'hatcher_remains'}],
+                     'machineType': 'Constructor',
+                     'name': 'Hatcher Protein',
+                     'outputs': [{'amount': 20, 'item': 'alien_protein'}],
+                     'powerConsumption': 4,
+                     'unlockTier': 0},
+ 'heat_exchanger': {'alternateRecipe': True,
+                    'category': 'crafting2',
+                    'craftingSpeed': 6,
+                    'id': 'heat_exchanger',
+                    'inputs': [{'amount': 30, 'item': 'aluminum_casing'}, {'amount': 30, 'item': 'rubber'}],
+                    'machineType': 'Assembler',
+                    'name': 'Alternate: Heat Exchanger',
+                    'outputs': [{'amount': 10, 'item': 'heat_sink'}],
+                    'powerConsumption': 15,
+                    'unlockTier': 8},
+ 'heat_fused_frame': {'alternateRecipe': True,
+                      'category': 'blending',
+                      'craftingSpeed': 20,
+                      'id': 'heat_fused_frame',
+                      'inputs': [{'amount': 3, 'item': 'heavy_modular_frame'},
+                                 {'amount': 150, 'item': 'aluminum_ingot'}, {'amount': 24, 'item': 'nitric_acid'},
+                                 {'amount': 30, 'item': 'fuel'}],
+                      'machineType': 'Blender',
+                      'name': 'Alternate: Heat-Fused Frame',
+                      'outputs': [{'amount': 3, 'item': 'fused_modular_frame'}],
+                      'powerConsumption': 75,
+                      'unlockTier': 8},
+ 'heat_sink': {'alternateRecipe': False,
+               'category': 'crafting2',
+               'craftingSpeed': 8,
+               'id': 'heat_sink',
+               'inputs': [{'amount': 37.5, 'item': 'alclad_aluminum_sheet'}, {'amount': 22.5, 'item': 'copper_sheet'}],
+               'machineType': 'Assembler',
+               'name': 'Heat Sink',
+               'outputs': [{'amount': 7.5, 'item': 'heat_sink'}],
+               'powerConsumption': 15,
+               'unlockTier': 8},
+ 'heavy_encased_frame': {'alternateRecipe': True,
+                         'category': 'crafting3',
+                         'craftingSpeed': 64,
+                         'id': 'heavy_encased_frame',
+                         'inputs': [{'amount': 7.5, 'item': 'modular_frame'},
+                                    {'amount': 9.375, 'item': 'encased_industrial_beam'},
+                                    {'amount': 33.75, 'item': 'steel_pipe'}, {'amount': 20.625, 'item': 'concrete'}],
+                         'machineType': 'Manufacturer',
+                         'name': 'Alternate: Heavy Encased Frame',
+                         'outputs': [{'amount': 2.8125, 'item': 'heavy_modular_frame'}],
+                         'powerConsumption': 55,
+                         'unlockTier': 4},
+ 'heavy_flexible_frame': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 16,
+                          'id': 'heavy_flexible_frame',
+                          'inputs': [{'amount': 18.75, 'item': 'modular_frame'},
+                                     {'amount': 11.25, 'item': 'encased_industrial_beam'},
+                                     {'amount': 75, 'item': 'rubber'}, {'amount': 390, 'item': 'screw'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Heavy Flexible Frame',
+                          'outputs': [{'amount': 3.75, 'item': 'heavy_modular_frame'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 4},
+ 'heavy_modular_frame': {'alternateRecipe': False,
+                         'category': 'crafting3',
+                         'craftingSpeed': 30,
+                         'id': 'heavy_modular_frame',
+                         'inputs': [{'amount': 10, 'item': 'modular_frame'}, {'amount': 40, 'item': 'steel_pipe'},
+                                    {'amount': 10, 'item': 'encased_industrial_beam'},
+                                    {'amount': 240, 'item': 'screw'}],
+                         'machineType': 'Manufacturer',
+                         'name': 'Heavy Modular Frame',
+                         'outputs': [{'amount': 2, 'item': 'heavy_modular_frame'}],
+                         'powerConsumption': 55,
+                         'unlockTier': 4},
+ 'heavy_oil_residue': {'alternateRecipe': True,
+                       'category': 'refining',
+                       'craftingSpeed': 6,
+                       'id': 'heavy_oil_residue',
+                       'inputs': [{'amount': 30, 'item': 'crude_oil'}],
+                       'machineType': 'Refinery',
+                       'name': 'Alternate: Heavy Oil Residue',
+                       'outputs': [{'amount': 40, 'item': 'heavy_oil_residue'},
+                                   {'amount': 20, 'item': 'polymer_resin'}],
+                       'powerConsumption': 30,
+                       'unlockTier': 5},
+ 'high_speed_connector': {'alternateRecipe': False,
+                          'category': 'crafting3',
+                          'craftingSpeed': 16,
+                          'id': 'high_speed_connector',
+                          'inputs': [{'amount': 210, 'item': 'quickwire'}, {'amount': 37.5, 'item': 'cable'},
+                                     {'amount': 3.75, 'item': 'circuit_board'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'High-Speed Connector',
+                          'outputs': [{'amount': 3.75, 'item': 'high_speed_connector'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 5},
+ 'hog_protein': {'alternateRecipe': False,
+                 'category': 'crafting1',
+                 'craftingSpeed': 3,
+                 'id': 'hog_protein',
+                 'inputs': [{'amount': 20, 'item': 'hog_remains'}],
+                 'machineType': 'Constructor',
+                 'name': 'Hog Protein',
+                 'outputs': [{'amount': 20, 'item': 'alien_protein'}],
+                 'powerConsumption': 4,
+                 'unlockTier': 0},
+ 'homing_rifle_ammo': {'alternateRecipe': False,
+                       'category': 'crafting2',
+                       'craftingSpeed': 24,
+                       'id': 'homing_rifle_ammo',
+                       'inputs': [{'amount': 50, 'item': 'rifle_ammo'},
+                                  {'amount': 2.5, 'item': 'high_speed_connector'}],
+                       'machineType': 'Assembler',
+                       'name': 'Homing Rifle Ammo',
+                       'outputs': [{'amount': 25, 'item': 'homing_rifle_ammo'}],
+                       'powerConsumption': 15,
+                       'unlockTier': 11},
+ 'infused_uranium_cell': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 12,
+                          'id': 'infused_uranium_cell',
+                          'inputs': [{'amount': 25, 'item': 'uranium'}, {'amount': 15, 'item': 'silica'},
+                                     {'amount': 25, 'item': 'sulfur'}, {'amount': 75, 'item': 'quickwire'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Infused Uranium Cell',
+                          'outputs': [{'amount': 20, 'item': 'uranium_cell'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 8},
+ 'instant_plutonium_cell': {'alternateRecipe': True,
+                            'category': 'accelerating',
+                            'craftingSpeed': 120,
+                            'id': 'instant_plutonium_cell',
+                            'inputs': [{'amount': 75, 'item': 'non_fissile_uranium'},
+                                       {'amount': 10, 'item': 'aluminum_casing'}],
+                            'machineType': 'Particle Accelerator',
+                            'name': 'Alternate: Instant Plutonium Cell',
+                            'outputs': [{'amount': 10, 'item': 'encased_plutonium_cell'}],
+                            'powerConsumption': 500,
+                            'unlockTier': 8},
+ 'instant_scrap': {'alternateRecipe': True,
+                   'category': 'blending',
+                   'craftingSpeed': 6,
+                   'id': 'instant_scrap',
+                   'inputs': [{'amount': 150, 'item': 'bauxite'}, {'amount': 100, 'item': 'coal'},
+                              {'amount': 50, 'item': 'sulfuric_acid'}, {'amount': 60, 'item': 'water'}],
+                   'machineType': 'Blender',
+                   'name': 'Alternate: Instant Scrap',
+                   'outputs': [{'amount': 300, 'item': 'aluminum_scrap'}, {'amount': 50, 'item': 'water'}],
+                   'powerConsumption': 75,
+                   'unlockTier': 7},
+ 'insulated_cable': {'alternateRecipe': True,
+                     'category': 'crafting2',
+                     'craftingSpeed': 12,
+                     'id': 'insulated_cable',
+                     'inputs': [{'amount': 45, 'item': 'wire'}, {'amount': 30, 'item': 'rubber'}],
+                     'machineType': 'Assembler',
+                     'name': 'Alternate: Insulated Cable',
+                     'outputs': [{'amount': 100, 'item': 'cable'}],
+                     'powerConsumption': 15,
+                     'unlockTier': 0},
+ 'insulated_crystal_oscillator': {'alternateRecipe': True,
+                                  'category': 'crafting3',
+                                  'craftingSpeed': 32,
+                                  'id': 'insulated_crystal_oscillator',
+                                  'inputs': [{'amount': 18.75, 'item': 'quartz_crystal'},
+                                             {'amount': 13.125, 'item': 'rubber'},
+                                             {'amount': 1.875, 'item': 'ai_limiter'}],
+                                  'machineType': 'Manufacturer',
+                                  'name': 'Alternate: Insulated Crystal Oscillator',
+                                  'outputs': [{'amount': 1.875, 'item': 'crystal_oscillator'}],
+                                  'powerConsumption': 55,
+                                  'unlockTier': 4},
+ 'iodine_infused_filter': {'alternateRecipe': False,
+                           'category': 'crafting3',
+                           'craftingSpeed': 16,
+                           'id': 'iodine_infused_filter',
+                           'inputs': [{'amount': 3.75, 'item': 'filter'}, {'amount': 30, 'item': 'quickwire'},
+                                      {'amount': 3.75, 'item': 'aluminum_casing'}],
+                           'machineType': 'Manufacturer',
+                           'name': 'Iodine-Infused Filter',
+                           'outputs': [{'amount': 3.75, 'item': 'iodine_infused_filter'}],
+                           'powerConsumption': 55,
+                           'unlockTier': 7},
+ 'ionized_fuel': {'alternateRecipe': False,
+                  'category': 'refining',
+                  'craftingSpeed': 24,
+                  'id': 'ionized_fuel',
+                  'inputs': [{'amount': 40, 'item': 'rocket_fuel'}, {'amount': 2.5, 'item': 'power_shard'}],
+                  'machineType': 'Refinery',
+                  'name': 'Ionized Fuel',
+                  'outputs': [{'amount': 40, 'item': 'ionized_fuel'}, {'amount': 5, 'item': 'compacted_coal'}],
+                  'powerConsumption': 30,
+                  'unlockTier': 9},
+ 'iron_alloy_ingot': {'alternateRecipe': True,
+                      'category': 'smelting2',
+                      'craftingSpeed': 12,
+                      'id': 'iron_alloy_ingot',
+                      'inputs': [{'amount': 40, 'item': 'iron_ore'}, {'amount': 10, 'item': 'copper_ore'}],
+                      'machineType': 'Foundry',
+                      'name': 'Alternate: Iron Alloy Ingot',
+                      'outputs': [{'amount': 75, 'item': 'iron_ingot'}],
+                      'powerConsumption': 16,
+                      'unlockTier': 0},
+ 'iron_ingot': {'alternateRecipe': False,
+                'category': 'smelting1',
+                'craftingSpeed': 2,
+                'id': 'iron_ingot',
+                'inputs': [{'amount': 30, 'item': 'iron_ore'}],
+                'machineType': 'Smelter',
+                'name': 'Iron Ingot',
+                'outputs': [{'amount': 30, 'item': 'iron_ingot'}],
+                'powerConsumption': 4,
+                'unlockTier': 0},
+ 'iron_ore_limestone': {'alternateRecipe': False,
+                        'category': 'converting',
+                        'craftingSpeed': 6,
+                        'id': 'iron_ore_limestone',
+                        'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 240, 'item': 'limestone'}],
+                        'machineType': 'Converter',
+                        'name': 'Iron Ore (Limestone)',
+                        'outputs': [{'amount': 120, 'item': 'iron_ore'}],
+                        'powerConsumption': 250,
+                        'unlockTier': 0},
+ 'iron_pipe': {'alternateRecipe': True,
+               'category': 'crafting1',
+               'craftingSpeed': 12,
+               'id': 'iron_pipe',
+               'inputs': [{'amount': 100, 'item': 'iron_ingot'}],
+               'machineType': 'Constructor',
+               'name': 'Alternate: Iron Pipe',
+               'outputs': [{'amount': 25, 'item': 'steel_pipe'}],
+               'powerConsumption': 4,
+               'unlockTier': 4},
+ 'iron_plate': {'alternateRecipe': False,
+                'category': 'crafting1',
+                'craftingSpeed': 6,
+                'id': 'iron_plate',
+                'inputs': [{'amount': 30, 'item': 'iron_ingot'}],
+                'machineType': 'Constructor',
+                'name': 'Iron Plate',
+                'outputs': [{'amount': 20, 'item': 'iron_plate'}],
+                'powerConsumption': 4,
+                'unlockTier': 0},
+ 'iron_rebar': {'alternateRecipe': False,
+                'category': 'crafting1',
+                'craftingSpeed': 4,
+                'id': 'iron_rebar',
+                'inputs': [{'amount': 15, 'item': 'iron_rod'}],
+                'machineType': 'Constructor',
+                'name': 'Iron Rebar',
+                'outputs': [{'amount': 15, 'item': 'iron_rebar'}],
+                'powerConsumption': 4,
+                'unlockTier': 11},
+ 'iron_rod': {'alternateRecipe': False,
+              'category': 'crafting1',
+              'craftingSpeed': 4,
+              'id': 'iron_rod',
+              'inputs': [{'amount': 15, 'item': 'iron_ingot'}],
+              'machineType': 'Constructor',
+              'name': 'Iron Rod',
+              'outputs': [{'amount': 15, 'item': 'iron_rod'}],
+              'powerConsumption': 4,
+              'unlockTier': 0},
+ 'iron_wire': {'alternateRecipe': True,
+               'category': 'crafting1',
+               'craftingSpeed': 24,
+               'id': 'iron_wire',
+               'inputs': [{'amount': 12.5, 'item': 'iron_ingot'}],
+               'machineType': 'Constructor',
+               'name': 'Alternate: Iron Wire',
+               'outputs': [{'amount': 22.5, 'item': 'wire'}],
+               'powerConsumption': 4,
+               'unlockTier': 0},
+ 'leached_caterium_ingot': {'alternateRecipe': True,
+                            'category': 'refining',
+                            'craftingSpeed': 10,
+                            'id': 'leached_caterium_ingot',
+                            'inputs': [{'amount': 54, 'item': 'caterium_ore'}, {'amount': 30, 'item': 'sulfuric_acid'}],
+                            'machineType': 'Refinery',
+                            'name': 'Alternate: Leached Caterium Ingot',
+                            'outputs': [{'amount': 36, 'item': 'caterium_ingot'}],
+                            'powerConsumption': 30,
+                            'unlockTier': 3},
+ 'leached_copper_ingot': {'alternateRecipe': True,
+                          'category': 'refining',
+                          'craftingSpeed': 12,
+                          'id': 'leached_copper_ingot',
+                          'inputs': [{'amount': 45, 'item': 'copper_ore'}, {'amount': 25, 'item': 'sulfuric_acid'}],
+                          'machineType': 'Refinery',
+                          'name': 'Alternate: Leached Copper Ingot',
+                          'outputs': [{'amount': 110, 'item': 'copper_ingot'}],
+                          'powerConsumption': 30,
+                          'unlockTier': 0},
+ 'leached_iron_ingot': {'alternateRecipe': True,
+                        'category': 'refining',
+                        'craftingSpeed': 6,
+                        'id': 'leached_iron_ingot',
+                        'inputs': [{'amount': 50, 'item': 'iron_ore'}, {'amount': 10, 'item': 'sulfuric_acid'}],
+                        'machineType': 'Refinery',
+                        'name': 'Alternate: Leached Iron Ingot',
+                        'outputs': [{'amount': 100, 'item': 'iron_ingot'}],
+                        'powerConsumption': 30,
+                        'unlockTier': 0},
+ 'limestone_sulfur': {'alternateRecipe': False,
+                      'category': 'converting',
+                      'craftingSpeed': 6,
+                      'id': 'limestone_sulfur',
+                      'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 20, 'item': 'sulfur'}],
+                      'machineType': 'Converter',
+                      'name': 'Limestone (Sulfur)',
+                      'outputs': [{'amount': 120, 'item': 'limestone'}],
+                      'powerConsumption': 250,
+                      'unlockTier': 0},
+ 'liquid_biofuel': {'alternateRecipe': False,
+                    'category': 'refining',
+                    'craftingSpeed': 4,
+                    'id': 'liquid_biofuel',
+                    'inputs': [{'amount': 90, 'item': 'solid_biofuel'}, {'amount': 45, 'item': 'water'}],
+                    'machineType': 'Refinery',
+                    'name': 'Liquid Biofuel',
+                    'outputs': [{'amount': 60, 'item': 'liquid_biofuel'}],
+                    'powerConsumption': 30,
+                    'unlockTier': 5},
+ 'magnetic_field_generator': {'alternateRecipe': False,
+                              'category': 'crafting2',
+                              'craftingSpeed': 120,
+                              'id': 'magnetic_field_generator',
+                              'inputs': [{'amount': 2.5, 'item': 'versatile_framework'},
+                                         {'amount': 1, 'item': 'em_control_rod'}],
+                              'machineType': 'Assembler',
+                              'name': 'Magnetic Field Generator',
+                              'outputs': [{'amount': 1, 'item': 'magnetic_field_generator'}],
+                              'powerConsumption': 15,
+                              'unlockTier': 8},
+ 'modular_engine': {'alternateRecipe': False,
+                    'category': 'crafting3',
+                    'craftingSpeed': 60,
+                    'id': 'modular_engine',
+                    'inputs': [{'amount': 2, 'item': 'motor'}, {'amount': 15, 'item': 'rubber'},
+                               {'amount': 2, 'item': 'smart_plating'}],
+                    'machineType': 'Manufacturer',
+                    'name': 'Modular Engine',
+                    'outputs': [{'amount': 1, 'item': 'modular_engine'}],
+                    'powerConsumption': 55,
+                    'unlockTier': 5},
+ 'modular_frame': {'alternateRecipe': False,
+                   'category': 'crafting2',
+                   'craftingSpeed': 60,
+                   'id': 'modular_frame',
+                   'inputs': [{'amount': 3, 'item': 'reinforced_iron_plate'}, {'amount': 12, 'item': 'iron_rod'}],
+                   'machineType': 'Assembler',
+                   'name': 'Modular Frame',
+                   'outputs': [{'amount': 2, 'item': 'modular_frame'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 2},
+ 'molded_steel_pipe': {'alternateRecipe': True,
+                       'category': 'smelting2',
+                       'craftingSpeed': 6,
+                       'id': 'molded_steel_pipe',
+                       'inputs': [{'amount': 50, 'item': 'steel_ingot'}, {'amount': 30, 'item': 'concrete'}],
+                       'machineType': 'Foundry',
+                       'name': 'Alternate: Molded Steel Pipe',
+                       'outputs': [{'amount': 50, 'item': 'steel_pipe'}],
+                       'powerConsumption': 16,
+                       'unlockTier': 4},
+ 'motor': {'alternateRecipe': False,
+           'category': 'crafting2',
+           'craftingSpeed': 12,
+           'id': 'motor',
+           'inputs': [{'amount': 10, 'item': 'rotor'}, {'amount': 10, 'item': 'stator'}],
+           'machineType': 'Assembler',
+           'name': 'Motor',
+           'outputs': [{'amount': 5, 'item': 'motor'}],
+           'powerConsumption': 15,
+           'unlockTier': 4},
+ 'neural_quantum_processor': {'alternateRecipe': False,
+                              'category': 'encoding',
+                              'craftingSpeed': 20,
+                              'id': 'neural_quantum_processor',
+                              'inputs': [{'amount': 15, 'item': 'time_crystal'}, {'amount': 3, 'item': 'supercomputer'},
+                                         {'amount': 45, 'item': 'ficsite_trigon'},
+                                         {'amount': 75, 'item': 'excited_photonic_matter'}],
+                              'machineType': 'Quantum Encoder',
+                              'name': 'Neural-Quantum Processor',
+                              'outputs': [{'amount': 3, 'item': 'neural_quantum_processor'},
+                                          {'amount': 75, 'item': 'dark_matter_residue'}],
+                              'powerConsumption': 1000,
+                              'unlockTier': 9},
+ 'nitric_acid': {'alternateRecipe': False,
+                 'category': 'blending',
+                 'craftingSpeed': 6,
+                 'id': 'nitric_acid',
+                 'inputs': [{'amount': 120, 'item': 'nitrogen_gas'}, {'amount': 30, 'item': 'water'},
+                            {'amount': 10, 'item': 'iron_plate'}],
+                 'machineType': 'Blender',
+                 'name': 'Nitric Acid',
+                 'outputs': [{'amount': 30, 'item': 'nitric_acid'}],
+                 'powerConsumption': 75,
+                 'unlockTier': 8},
+ 'nitro_rocket_fuel': {'alternateRecipe': True,
+                       'category': 'blending',
+                       'craftingSpeed': 2.4,
+                       'id': 'nitro_rocket_fuel',
+                       'inputs': [{'amount': 100, 'item': 'fuel'}, {'amount': 75, 'item': 'nitrogen_gas'},
+                                  {'amount': 100, 'item': 'sulfur'}, {'amount': 50, 'item': 'coal'}],
+                       'machineType': 'Blender',
+                       'name': 'Alternate: Nitro Rocket Fuel',
+                       'outputs': [{'amount': 150, 'item': 'rocket_fuel'}, {'amount': 25, 'item': 'compacted_coal'}],
+                       'powerConsumption': 75,
+                       'unlockTier': 8},
+ 'nitrogen_gas_bauxite': {'alternateRecipe': False,
+                          'category': 'converting',
+                          'craftingSpeed': 6,
+                          'id': 'nitrogen_gas_bauxite',
+                          'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 100, 'item': 'bauxite'}],
+                          'machineType': 'Converter',
+                          'name': 'Nitrogen Gas (Bauxite)',
+                          'outputs': [{'amount': 120, 'item': 'nitrogen_gas'}],
+                          'powerConsumption': 250,
+                          'unlockTier': 8},
+ 'nitrogen_gas_caterium': {'alternateRecipe': False,
+                           'category': 'converting',
+                           'craftingSpeed': 6,
+                           'id': 'nitrogen_gas_caterium',
+                           'inputs': [{'amount': 10, 'item': 'reanimated_sam'},
+                                      {'amount': 120, 'item': 'caterium_ore'}],
+                           'machineType': 'Converter',
+                           'name': 'Nitrogen Gas (Caterium)',
+                           'outputs': [{'amount': 120, 'item': 'nitrogen_gas'}],
+                           'powerConsumption': 250,
+                           'unlockTier': 8},
+ 'nobelisk': {'alternateRecipe': False,
+              'category': 'crafting2',
+              'craftingSpeed': 6,
+              'id': 'nobelisk',
+              'inputs': [{'amount': 20, 'item': 'black_powder'}, {'amount': 20, 'item': 'steel_pipe'}],
+              'machineType': 'Assembler',
+              'name': 'Nobelisk',
+              'outputs': [{'amount': 10, 'item': 'nobelisk'}],
+              'powerConsumption': 15,
+              'unlockTier': 11},
+ 'non_fissile_uranium': {'alternateRecipe': False,
+                         'category': 'blending',
+                         'craftingSpeed': 24,
+                         'id': 'non_fissile_uranium',
+                         'inputs': [{'amount': 37.5, 'item': 'uranium_waste'}, {'amount': 25, 'item': 'silica'},
+                                    {'amount': 15, 'item': 'nitric_acid'}, {'amount': 15, 'item': 'sulfuric_acid'}],
+                         'machineType': 'Blender',
+                         'name': 'Non-Fissile Uranium',
+                         'outputs': [{'amount': 50, 'item': 'non_fissile_uranium'}, {'amount': 15, 'item': 'water'}],
+                         'powerConsumption': 75,
+                         'unlockTier': 8},
+ 'nuclear_pasta': {'alternateRecipe': False,
+                   'category': 'accelerating',
+                   'craftingSpeed': 120,
+                   'id': 'nuclear_pasta',
+                   'inputs': [{'amount': 100, 'item': 'copper_powder'},
+                              {'amount': 0.5, 'item': 'pressure_conversion_cube'}],
+                   'machineType': 'Particle Accelerator',
+                   'name': 'Nuclear Pasta',
+                   'outputs': [{'amount': 0.5, 'item': 'nuclear_pasta'}],
+                   'powerConsumption': 1000,
+                   'unlockTier': 8},
+ 'nuke_nobelisk': {'alternateRecipe': False,
+                   'category': 'crafting3',
+                   'craftingSpeed': 120,
+                   'id': 'nuke_nobelisk',
+                   'inputs': [{'amount': 2.5, 'item': 'nobelisk'}, {'amount': 10, 'item': 'uranium_cell'},
+                              {'amount': 5, 'item': 'smokeless_powder'}, {'amount': 3, 'item': 'ai_limiter'}],
+                   'machineType': 'Manufacturer',
+                   'name': 'Nuke Nobelisk',
+                   'outputs': [{'amount': 2.5, 'item': 'nuke_nobelisk'}],
+                   'powerConsumption': 55,
+                   'unlockTier': 11},
+ 'oc_supercomputer': {'alternateRecipe': True,
+                      'category': 'crafting2',
+                      'craftingSpeed': 20,
+                      'id': 'oc_supercomputer',
+                      'inputs': [{'amount': 6, 'item': 'radio_control_unit'}, {'amount': 6, 'item': 'cooling_system'}],
+                      'machineType': 'Assembler',
+                      'name': 'Alternate: OC Supercomputer',
+                      'outputs': [{'amount': 3, 'item': 'supercomputer'}],
+                      'powerConsumption': 15,
+                      'unlockTier': 5},
+ 'oil_based_diamonds': {'alternateRecipe': True,
+                        'category': 'accelerating',
+                        'craftingSpeed': 3,
+                        'id': 'oil_based_diamonds',
+                        'inputs': [{'amount': 200, 'item': 'crude_oil'}],
+                        'machineType': 'Particle Accelerator',
+                        'name': 'Alternate: Oil-Based Diamonds',
+                        'outputs': [{'amount': 40, 'item': 'diamonds'}],
+                        'powerConsumption': 500,
+                        'unlockTier': 9},
+ 'packaged_alumina_solution': {'alternateRecipe': False,
+                               'category': 'packaging',
+                               'craftingSpeed': 1,
+                               'id': 'packaged_alumina_solution',
+                               'inputs': [{'amount': 120, 'item': 'alumina_solution'},
+                                          {'amount': 120, 'item': 'empty_canister'}],
+                               'machineType': 'Packager',
+                               'name': 'Packaged Alumina Solution',
+                               'outputs': [{'amount': 120, 'item': 'packaged_alumina_solution'}],
+                               'powerConsumption': 10,
+                               'unlockTier': 7},
+ 'packaged_fuel': {'alternateRecipe': False,
+                   'category': 'packaging',
+                   'craftingSpeed': 3,
+                   'id': 'packaged_fuel',
+                   'inputs': [{'amount': 40, 'item': 'fuel'}, {'amount': 40, 'item': 'empty_canister'}],
+                   'machineType': 'Packager',
+                   'name': 'Packaged Fuel',
+                   'outputs': [{'amount': 40, 'item': 'packaged_fuel'}],
+                   'powerConsumption': 10,
+                   'unlockTier': 5},
+ 'packaged_heavy_oil_residue': {'alternateRecipe': False,
+                                'category': 'packaging',
+                                'craftingSpeed': 4,
+                                'id': 'packaged_heavy_oil_residue',
+                                'inputs': [{'amount': 30, 'item': 'heavy_oil_residue'},
+                                           {'amount': 30, 'item': 'empty_canister'}],
+                                'machineType': 'Packager',
+                                'name': 'Packaged Heavy Oil Residue',
+                                'outputs': [{'amount': 30, 'item': 'packaged_heavy_oil_residue'}],
+                                'powerConsumption': 10,
+                                'unlockTier': 5},
+ 'packaged_ionized_fuel': {'alternateRecipe': False,
+                           'category': 'packaging',
+                           'craftingSpeed': 3,
+                           'id': 'packaged_ionized_fuel',
+                           'inputs': [{'amount': 80, 'item': 'ionized_fuel'},
+                                      {'amount': 40, 'item': 'empty_fluid_tank'}],
+                           'machineType': 'Packager',
+                           'name': 'Packaged Ionized Fuel',
+                           'outputs': [{'amount': 40, 'item': 'packaged_ionized_fuel'}],
+                           'powerConsumption': 10,
+                           'unlockTier': 8},
+ 'packaged_liquid_biofuel': {'alternateRecipe': False,
+                             'category': 'packaging',
+                             'craftingSpeed': 3,
+                             'id': 'packaged_liquid_biofuel',
+                             'inputs': [{'amount': 40, 'item': 'liquid_biofuel'},
+                                        {'amount': 40, 'item': 'empty_canister'}],
+                             'machineType': 'Packager',
+                             'name': 'Packaged Liquid Biofuel',
+                             'outputs': [{'amount': 40, 'item': 'packaged_liquid_biofuel'}],
+                             'powerConsumption': 10,
+                             'unlockTier': 5},
+ 'packaged_nitric_acid': {'alternateRecipe': False,
+                          'category': 'packaging',
+                          'craftingSpeed': 2,
+                          'id': 'packaged_nitric_acid',
+                          'inputs': [{'amount': 30, 'item': 'nitric_acid'}, {'amount': 30, 'item': 'empty_fluid_tank'}],
+                          'machineType': 'Packager',
+                          'name': 'Packaged Nitric Acid',
+                          'outputs': [{'amount': 30, 'item': 'packaged_nitric_acid'}],
+                          'powerConsumption': 10,
+                          'unlockTier': 8},
+ 'packaged_nitrogen_gas': {'alternateRecipe': False,
+                           'category': 'packaging',
+                           'craftingSpeed': 1,
+                           'id': 'packaged_nitrogen_gas',
+                           'inputs': [{'amount': 240, 'item': 'nitrogen_gas'},
+                                      {'amount': 60, 'item': 'empty_fluid_tank'}],
+                           'machineType': 'Packager',
+                           'name': 'Packaged Nitrogen Gas',
+                           'outputs': [{'amount': 60, 'item': 'packaged_nitrogen_gas'}],
+                           'powerConsumption': 10,
+                           'unlockTier': 8},
+ 'packaged_oil': {'alternateRecipe': False,
+                  'category': 'packaging',
+                  'craftingSpeed': 4,
+                  'id': 'packaged_oil',
+                  'inputs': [{'amount': 30, 'item': 'crude_oil'}, {'amount': 30, 'item': 'empty_canister'}],
+                  'machineType': 'Packager',
+                  'name': 'Packaged Oil',
+                  'outputs': [{'amount': 30, 'item': 'packaged_oil'}],
+                  'powerConsumption': 10,
+                  'unlockTier': 5},
+ 'packaged_rocket_fuel': {'alternateRecipe': False,
+                          'category': 'packaging',
+                          'craftingSpeed': 1,
+                          'id': 'packaged_rocket_fuel',
+                          'inputs': [{'amount': 120, 'item': 'rocket_fuel'},
+                                     {'amount': 60, 'item': 'empty_fluid_tank'}],
+                          'machineType': 'Packager',
+                          'name': 'Packaged Rocket Fuel',
+                          'outputs': [{'amount': 60, 'item': 'packaged_rocket_fuel'}],
+                          'powerConsumption': 10,
+                          'unlockTier': 8},
+ 'packaged_sulfuric_acid': {'alternateRecipe': False,
+                            'category': 'packaging',
+                            'craftingSpeed': 3,
+                            'id': 'packaged_sulfuric_acid',
+                            'inputs': [{'amount': 40, 'item': 'sulfuric_acid'},
+                                       {'amount': 40, 'item': 'empty_canister'}],
+                            'machineType': 'Packager',
+                            'name': 'Packaged Sulfuric Acid',
+                            'outputs': [{'amount': 40, 'item': 'packaged_sulfuric_acid'}],
+                            'powerConsumption': 10,
+                            'unlockTier': 7},
+ 'packaged_turbofuel': {'alternateRecipe': False,
+                        'category': 'packaging',
+                        'craftingSpeed': 6,
+                        'id': 'packaged_turbofuel',
+                        'inputs': [{'amount': 20, 'item': 'turbofuel'}, {'amount': 20, 'item': 'empty_canister'}],
+                        'machineType': 'Packager',
+                        'name': 'Packaged Turbofuel',
+                        'outputs': [{'amount': 20, 'item': 'packaged_turbofuel'}],
+                        'powerConsumption': 10,
+                        'unlockTier': 6},
+ 'packaged_water': {'alternateRecipe': False,
+                    'category': 'packaging',
+                    'craftingSpeed': 2,
+                    'id': 'packaged_water',
+                    'inputs': [{'amount': 60, 'item': 'water'}, {'amount': 60, 'item': 'empty_canister'}],
+                    'machineType': 'Packager',
+                    'name': 'Packaged Water',
+                    'outputs': [{'amount': 60, 'item': 'packaged_water'}],
+                    'powerConsumption': 10,
+                    'unlockTier': 5},
+ 'petroleum_coke': {'alternateRecipe': False,
+                    'category': 'refining',
+                    'craftingSpeed': 6,
+                    'id': 'petroleum_coke',
+                    'inputs': [{'amount': 40, 'item': 'heavy_oil_residue'}],
+                    'machineType': 'Refinery',
+                    'name': 'Petroleum Coke',
+                    'outputs': [{'amount': 120, 'item': 'petroleum_coke'}],
+                    'powerConsumption': 30,
+                    'unlockTier': 5},
+ 'petroleum_diamonds': {'alternateRecipe': True,
+                        'category': 'accelerating',
+                        'craftingSpeed': 2,
+                        'id': 'petroleum_diamonds',
+                        'inputs': [{'amount': 720, 'item': 'petroleum_coke'}],
+                        'machineType': 'Particle Accelerator',
+                        'name': 'Alternate: Petroleum Diamonds',
+                        'outputs': [{'amount': 30, 'item': 'diamonds'}],
+                        'powerConsumption': 500,
+                        'unlockTier': 9},
+ 'pink_diamonds': {'alternateRecipe': True,
+                   'category': 'converting',
+                   'craftingSpeed': 4,
+                   'id': 'pink_diamonds',
+                   'inputs': [{'amount': 120, 'item': 'coal'}, {'amount': 45, 'item': 'quartz_crystal'}],
+                   'machineType': 'Converter',
+                   'name': 'Alternate: Pink Diamonds',
+                   'outputs': [{'amount': 15, 'item': 'diamonds'}],
+                   'powerConsumption': 250,
+                   'unlockTier': 9},
+ 'plastic': {'alternateRecipe': False,
+             'category': 'refining',
+             'craftingSpeed': 6,
+             'id': 'plastic',
+             'inputs': [{'amount': 30, 'item': 'crude_oil'}],
+             'machineType': 'Refinery',
+             'name': 'Plastic',
+             'outputs': [{'amount': 20, 'item': 'plastic'}, {'amount': 10, 'item': 'heavy_oil_residue'}],
+             'powerConsumption': 30,
+             'unlockTier': 5},
+ 'plastic_ai_limiter': {'alternateRecipe': True,
+                        'category': 'crafting2',
+                        'craftingSpeed': 15,
+                        'id': 'plastic_ai_limiter',
+                        'inputs': [{'amount': 120, 'item': 'quickwire'}, {'amount': 28, 'item': 'plastic'}],
+                        'machineType': 'Assembler',
+                        'name': 'Alternate: Plastic AI Limiter',
+                        'outputs': [{'amount': 8, 'item': 'ai_limiter'}],
+                        'powerConsumption': 15,
+                        'unlockTier': 5},
+ 'plastic_smart_plating': {'alternateRecipe': True,
+                           'category': 'crafting3',
+                           'craftingSpeed': 24,
+                           'id': 'plastic_smart_plating',
+                           'inputs': [{'amount': 2.5, 'item': 'reinforced_iron_plate'},
+                                      {'amount': 2.5, 'item': 'rotor'}, {'amount': 7.5, 'item': 'plastic'}],
+                           'machineType': 'Manufacturer',
+                           'name': 'Alternate: Plastic Smart Plating',
+                           'outputs': [{'amount': 5, 'item': 'smart_plating'}],
+                           'powerConsumption': 55,
+                           'unlockTier': 2},
+ 'plutonium_fuel_rod': {'alternateRecipe': False,
+                        'category': 'crafting3',
+                        'craftingSpeed': 240,
+                        'id': 'plutonium_fuel_rod',
+                        'inputs': [{'amount': 7.5, 'item': 'encased_plutonium_cell'},
+                                   {'amount': 4.5, 'item': 'steel_beam'}, {'amount': 1.5, 'item': 'em_control_rod'},
+                                   {'amount': 2.5, 'item': 'heat_sink'}],
+                        'machineType': 'Manufacturer',
+                        'name': 'Plutonium Fuel Rod',
+                        'outputs': [{'amount': 0.25, 'item': 'plutonium_fuel_rod'}],
+                        'powerConsumption': 55,
+                        'unlockTier': 8},
+ 'plutonium_fuel_unit': {'alternateRecipe': True,
+                         'category': 'crafting2',
+                         'craftingSpeed': 120,
+                         'id': 'plutonium_fuel_unit',
+                         'inputs': [{'amount': 10, 'item': 'encased_plutonium_cell'},
+                                    {'amount': 0.5, 'item': 'pressure_conversion_cube'}],
+                         'machineType': 'Assembler',
+                         'name': 'Alternate: Plutonium Fuel Unit',
+                         'outputs': [{'amount': 0.5, 'item': 'plutonium_fuel_rod'}],
+                         'powerConsumption': 15,
+                         'unlockTier': 8},
+ 'plutonium_pellet': {'alternateRecipe': False,
+                      'category': 'accelerating',
+                      'craftingSpeed': 60,
+                      'id': 'plutonium_pellet',
+                      'inputs': [{'amount': 100, 'item': 'non_fissile_uranium'},
+                                 {'amount': 25, 'item': 'uranium_waste'}],
+                      'machineType': 'Particle Accelerator',
+                      'name': 'Plutonium Pellet',
+                      'outputs': [{'amount': 30, 'item': 'plutonium_pellet'}],
+                      'powerConsumption': 500,
+                      'unlockTier': 8},
+ 'polyester_fabric': {'alternateRecipe': True,
+                      'category': 'refining',
+                      'craftingSpeed': 2,
+                      'id': 'polyester_fabric',
+                      'inputs': [{'amount': 30, 'item': 'polymer_resin'}, {'amount': 30, 'item': 'water'}],
+                      'machineType': 'Refinery',
+                      'name': 'Alternate: Polyester Fabric',
+                      'outputs': [{'amount': 30, 'item': 'fabric'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 1},
+ 'polymer_resin': {'alternateRecipe': True,
+                   'category': 'refining',
+                   'craftingSpeed': 6,
+                   'id': 'polymer_resin',
+                   'inputs': [{'amount': 60, 'item': 'crude_oil'}],
+                   'machineType': 'Refinery',
+                   'name': 'Alternate: Polymer Resin',
+                   'outputs': [{'amount': 130, 'item': 'polymer_resin'}, {'amount': 20, 'item': 'heavy_oil_residue'}],
+                   'powerConsumption': 30,
+                   'unlockTier': 5},
+ 'power_shard_blue': {'alternateRecipe': False,
+                      'category': 'crafting1',
+                      'craftingSpeed': 8,
+                      'id': 'power_shard_blue',
+                      'inputs': [{'amount': 7.5, 'item': 'blue_power_slug'}],
+                      'machineType': 'Constructor',
+                      'name': 'Power Shard (1)',
+                      'outputs': [{'amount': 7.5, 'item': 'power_shard'}],
+                      'powerConsumption': 4,
+                      'unlockTier': 0},
+ 'power_shard_purple': {'alternateRecipe': False,
+                        'category': 'crafting1',
+                        'craftingSpeed': 24,
+                        'id': 'power_shard_purple',
+                        'inputs': [{'amount': 2.5, 'item': 'purple_power_slug'}],
+                        'machineType': 'Constructor',
+                        'name': 'Power Shard (5)',
+                        'outputs': [{'amount': 12.5, 'item': 'power_shard'}],
+                        'powerConsumption': 4,
+                        'unlockTier': 0},
+ 'power_shard_yellow': {'alternateRecipe': False,
+                        'category': 'crafting1',
+                        'craftingSpeed': 12,
+                        'id': 'power_shard_yellow',
+                        'inputs': [{'amount': 5, 'item': 'yellow_power_slug'}],
+                        'machineType': 'Constructor',
+                        'name': 'Power Shard (2)',
+                        'outputs': [{'amount': 10, 'item': 'power_shard'}],
+                        'powerConsumption': 4,
+                        'unlockTier': 0},
+ 'pressure_conversion_cube': {'alternateRecipe': False,
+                              'category': 'crafting2',
+                              'craftingSpeed': 60,
+                              'id': 'pressure_conversion_cube',
+                              'inputs': [{'amount': 1, 'item': 'fused_modular_frame'},
+                                         {'amount': 2, 'item': 'radio_control_unit'}],
+                              'machineType': 'Assembler',
+                              'name': 'Pressure Conversion Cube',
+                              'outputs': [{'amount': 1, 'item': 'pressure_conversion_cube'}],
+                              'powerConsumption': 15,
+                              'unlockTier': 8},
+ 'pulse_nobelisk': {'alternateRecipe': False,
+                    'category': 'crafting2',
+                    'craftingSpeed': 60,
+                    'id': 'pulse_nobelisk',
+                    'inputs': [{'amount': 5, 'item': 'nobelisk'}, {'amount': 1, 'item': 'crystal_oscillator'}],
+                    'machineType': 'Assembler',
+                    'name': 'Pulse Nobelisk',
+                    'outputs': [{'amount': 5, 'item': 'pulse_nobelisk'}],
+                    'powerConsumption': 15,
+                    'unlockTier': 11},
+ 'pure_aluminum_ingot': {'alternateRecipe': True,
+                         'category': 'smelting1',
+                         'craftingSpeed': 2,
+                         'id': 'pure_aluminum_ingot',
+                         'inputs': [{'amount': 60, 'item': 'aluminum_scrap'}],
+                         'machineType': 'Smelter',
+                         'name': 'Alternate: Pure Aluminum Ingot',
+                         'outputs': [{'amount': 30, 'item': 'aluminum_ingot'}],
+                         'powerConsumption': 4,
+                         'unlockTier': 7},
+ 'pure_caterium_ingot': {'alternateRecipe': True,
+                         'category': 'refining',
+                         'craftingSpeed': 5,
+                         'id': 'pure_caterium_ingot',
+                         'inputs': [{'amount': 24, 'item': 'caterium_ore'}, {'amount': 24, 'item': 'water'}],
+                         'machineType': 'Refinery',
+                         'name': 'Alternate: Pure Caterium Ingot',
+                         'outputs': [{'amount': 12, 'item': 'caterium_ingot'}],
+                         'powerConsumption': 30,
+                         'unlockTier': 3},
+ 'pure_copper_ingot': {'alternateRecipe': True,
+                       'category': 'refining',
+                       'craftingSpeed': 24,
+                       'id': 'pure_copper_ingot',
+                       'inputs': [{'amount': 15, 'item': 'copper_ore'}, {'amount': 10, 'item': 'water'}],
+                       'machineType': 'Refinery',
+                       'name': 'Alternate: Pure Copper Ingot',
+                       'outputs': [{'amount': 37.5, 'item': 'copper_ingot'}],
+                       'powerConsumption': 30,
+                       'unlockTier': 0},
+ 'pure_iron_ingot': {'alternateRecipe': True,
+                     'category': 'refining',
+                     'craftingSpeed': 12,
+                     'id': 'pure_iron_ingot',
+                     'inputs': [{'amount': 35, 'item': 'iron_ore'}, {'amount': 20, 'item': 'water'}],
+                     'machineType': 'Refinery',
+                     'name': 'Alternate: Pure Iron Ingot',
+                     'outputs': [{'amount': 65, 'item': 'iron_ingot'}],
+                     'powerConsumption': 30,
+                     'unlockTier': 0},
+ 'pure_quartz_crystal': {'alternateRecipe': True,
+                         'category': 'refining',
+                         'craftingSpeed': 8,
+                         'id': 'pure_quartz_crystal',
+                         'inputs': [{'amount': 67.5, 'item': 'raw_quartz'}, {'amount': 37.5, 'item': 'water'}],
+                         'machineType': 'Refinery',
+                         'name': 'Alternate: Pure Quartz Crystal',
+                         'outputs': [{'amount': 52.5, 'item': 'quartz_crystal'}],
+                         'powerConsumption': 30,
+                         'unlockTier': 4},
+ 'quartz_crystal': {'alternateRecipe': False,
+                    'category': 'crafting1',
+                    'craftingSpeed': 8,
+                    'id': 'quartz_crystal',
+                    'inputs': [{'amount': 37.5, 'item': 'raw_quartz'}],
+                    'machineType': 'Constructor',
+                    'name': 'Quartz Crystal',
+                    'outputs': [{'amount': 22.5, 'item': 'quartz_crystal'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 4},
+ 'quartz_purification': {'alternateRecipe': True,
+                         'category': 'refining',
+                         'craftingSpeed': 12,
+                         'id': 'quartz_purification',
+                         'inputs': [{'amount': 120, 'item': 'raw_quartz'}, {'amount': 10, 'item': 'nitric_acid'}],
+                         'machineType': 'Refinery',
+                         'name': 'Alternate: Quartz Purification',
+                         'outputs': [{'amount': 75, 'item': 'quartz_crystal'},
+                                     {'amount': 60, 'item': 'dissolved_silica'}],
+                         'powerConsumption': 30,
+                         'unlockTier': 8},
+ 'quickwire': {'alternateRecipe': False,
+               'category': 'crafting1',
+               'craftingSpeed': 5,
+               'id': 'quickwire',
+               'inputs': [{'amount': 12, 'item': 'caterium_ingot'}],
+               'machineType': 'Constructor',
+               'name': 'Quickwire',
+               'outputs': [{'amount': 60, 'item': 'quickwire'}],
+               'powerConsumption': 4,
+               'unlockTier': 3},
+ 'quickwire_cable': {'alternateRecipe': True,
+                     'category': 'crafting2',
+                     'craftingSpeed': 24,
+                     'id': 'quickwire_cable',
+                     'inputs': [{'amount': 7.5, 'item': 'quickwire'}, {'amount': 5, 'item': 'rubber'}],
+                     'machineType': 'Assembler',
+                     'name': 'Alternate: Quickwire Cable',
+                     'outputs': [{'amount': 27.5, 'item': 'cable'}],
+                     'powerConsumption': 15,
+                     'unlockTier': 0},
+ 'quickwire_stator': {'alternateRecipe': True,
+                      'category': 'crafting2',
+                      'craftingSpeed': 15,
+                      'id': 'quickwire_stator',
+                      'inputs': [{'amount': 16, 'item': 'steel_pipe'}, {'amount': 60, 'item': 'quickwire'}],
+                      'machineType': 'Assembler',
+                      'name': 'Alternate: Quickwire Stator',
+                      'outputs': [{'amount': 8, 'item': 'stator'}],
+                      'powerConsumption': 15,
+                      'unlockTier': 4},
+ 'radio_connection_unit': {'alternateRecipe': True,
+                           'category': 'crafting3',
+                           'craftingSpeed': 16,
+                           'id': 'radio_connection_unit',
+                           'inputs': [{'amount': 15, 'item': 'heat_sink'},
+                                      {'amount': 7.5, 'item': 'high_speed_connector'},
+                                      {'amount': 45, 'item': 'quartz_crystal'}],
+                           'machineType': 'Manufacturer',
+                           'name': 'Alternate: Radio Connection Unit',
+                           'outputs': [{'amount': 3.75, 'item': 'radio_control_unit'}],
+                           'powerConsumption': 55,
+                           'unlockTier': 7},
+ 'radio_control_system': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 40,
+                          'id': 'radio_control_system',
+                          'inputs': [{'amount': 1.5, 'item': 'crystal_oscillator'},
+                                     {'amount': 15, 'item': 'circuit_board'}, {'amount': 90, 'item': 'aluminum_casing'},
+                                     {'amount': 45, 'item': 'rubber'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Radio Control System',
+                          'outputs': [{'amount': 4.5, 'item': 'radio_control_unit'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 7},
+ 'radio_control_unit': {'alternateRecipe': False,
+                        'category': 'crafting3',
+                        'craftingSpeed': 48,
+                        'id': 'radio_control_unit',
+                        'inputs': [{'amount': 40, 'item': 'aluminum_casing'},
+                                   {'amount': 1.25, 'item': 'crystal_oscillator'},
+                                   {'amount': 2.5, 'item': 'computer'}],
+                        'machineType': 'Manufacturer',
+                        'name': 'Radio Control Unit',
+                        'outputs': [{'amount': 2.5, 'item': 'radio_control_unit'}],
+                        'powerConsumption': 55,
+                        'unlockTier': 7},
+ 'raw_quartz_bauxite': {'alternateRecipe': False,
+                        'category': 'converting',
+                        'craftingSpeed': 6,
+                        'id': 'raw_quartz_bauxite',
+                        'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 100, 'item': 'bauxite'}],
+                        'machineType': 'Converter',
+                        'name': 'Raw Quartz (Bauxite)',
+                        'outputs': [{'amount': 120, 'item': 'raw_quartz'}],
+                        'powerConsumption': 250,
+                        'unlockTier': 4},
+ 'raw_quartz_coal': {'alternateRecipe': False,
+                     'category': 'converting',
+                     'craftingSpeed': 6,
+                     'id': 'raw_quartz_coal',
+                     'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 240, 'item': 'coal'}],
+                     'machineType': 'Converter',
+                     'name': 'Raw Quartz (Coal)',
+                     'outputs': [{'amount': 120, 'item': 'raw_quartz'}],
+                     'powerConsumption': 250,
+                     'unlockTier': 4},
+ 'reactor_plutonium': {'alternateRecipe': False,
+                       'category': 'nuke-reacting',
+                       'craftingSpeed': 600,
+                       'id': 'reactor_plutonium',
+                       'inputs': [{'amount': 0.1, 'item': 'plutonium_fuel_rod'}, {'amount': 240, 'item': 'water'}],
+                       'machineType': 'Nuclear Power Plant',
+                       'name': 'Reactor Cycle (Plutonium)',
+                       'outputs': [{'amount': 1, 'item': 'plutonium_waste'}],
+                       'powerConsumption': 0,
+                       'unlockTier': 8},
+ 'reactor_uranium': {'alternateRecipe': False,
+                     'category': 'nuke-reacting',
+                     'craftingSpeed': 300,
+                     'id': 'reactor_uranium',
+                     'inputs': [{'amount': 0.2, 'item': 'uranium_fuel_rod'}, {'amount': 240, 'item': 'water'}],
+                     'machineType': 'Nuclear Power Plant',
+                     'name': 'Reactor Cycle (Uranium)',
+                     'outputs': [{'amount': 10, 'item': 'uranium_waste'}],
+                     'powerConsumption': 0,
+                     'unlockTier': 8},
+ 'reanimated_sam': {'alternateRecipe': False,
+                    'category': 'crafting1',
+                    'craftingSpeed': 2,
+                    'id': 'reanimated_sam',
+                    'inputs': [{'amount': 120, 'item': 'sam'}],
+                    'machineType': 'Constructor',
+                    'name': 'Reanimated SAM',
+                    'outputs': [{'amount': 30, 'item': 'reanimated_sam'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 10},
+ 'recycled_plastic': {'alternateRecipe': True,
+                      'category': 'refining',
+                      'craftingSpeed': 12,
+                      'id': 'recycled_plastic',
+                      'inputs': [{'amount': 30, 'item': 'rubber'}, {'amount': 30, 'item': 'fuel'}],
+                      'machineType': 'Refinery',
+                      'name': 'Alternate: Recycled Plastic',
+                      'outputs': [{'amount': 60, 'item': 'plastic'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 5},
+ 'recycled_rubber': {'alternateRecipe': True,
+                     'category': 'refining',
+                     'craftingSpeed': 12,
+                     'id': 'recycled_rubber',
+                     'inputs': [{'amount': 30, 'item': 'plastic'}, {'amount': 30, 'item': 'fuel'}],
+                     'machineType': 'Refinery',
+                     'name': 'Alternate: Recycled Rubber',
+                     'outputs': [{'amount': 60, 'item': 'rubber'}],
+                     'powerConsumption': 30,
+                     'unlockTier': 5},
+ 'reinforced_iron_plate': {'alternateRecipe': False,
+                           'category': 'crafting2',
+                           'craftingSpeed': 12,
+                           'id': 'reinforced_iron_plate',
+                           'inputs': [{'amount': 30, 'item': 'iron_plate'}, {'amount': 60, 'item': 'screw'}],
+                           'machineType': 'Assembler',
+                           'name': 'Reinforced Iron Plate',
+                           'outputs': [{'amount': 5, 'item': 'reinforced_iron_plate'}],
+                           'powerConsumption': 15,
+                           'unlockTier': 0},
+ 'residual_fuel': {'alternateRecipe': False,
+                   'category': 'refining',
+                   'craftingSpeed': 6,
+                   'id': 'residual_fuel',
+                   'inputs': [{'amount': 60, 'item': 'heavy_oil_residue'}],
+                   'machineType': 'Refinery',
+                   'name': 'Residual Fuel',
+                   'outputs': [{'amount': 40, 'item': 'fuel'}],
+                   'powerConsumption': 30,
+                   'unlockTier': 5},
+ 'residual_plastic': {'alternateRecipe': True,
+                      'category': 'refining',
+                      'craftingSpeed': 6,
+                      'id': 'residual_plastic',
+                      'inputs': [{'amount': 60, 'item': 'polymer_resin'}, {'amount': 20, 'item': 'water'}],
+                      'machineType': 'Refinery',
+                      'name': 'Residual Plastic',
+                      'outputs': [{'amount': 20, 'item': 'plastic'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 5},
+ 'residual_rubber': {'alternateRecipe': True,
+                     'category': 'refining',
+                     'craftingSpeed': 6,
+                     'id': 'residual_rubber',
+                     'inputs': [{'amount': 40, 'item': 'polymer_resin'}, {'amount': 40, 'item': 'water'}],
+                     'machineType': 'Refinery',
+                     'name': 'Residual Rubber',
+                     'outputs': [{'amount': 20, 'item': 'rubber'}],
+                     'powerConsumption': 30,
+                     'unlockTier': 5},
+ 'rifle_ammo': {'alternateRecipe': False,
+                'category': 'crafting2',
+                'craftingSpeed': 12,
+                'id': 'rifle_ammo',
+                'inputs': [{'amount': 15, 'item': 'copper_sheet'}, {'amount': 10, 'item': 'smokeless_powder'}],
+                'machineType': 'Assembler',
+                'name': 'Rifle Ammo',
+                'outputs': [{'amount': 75, 'item': 'rifle_ammo'}],
+                'powerConsumption': 15,
+                'unlockTier': 11},
+ 'rigor_motor': {'alternateRecipe': True,
+                 'category': 'crafting3',
+                 'craftingSpeed': 48,
+                 'id': 'rigor_motor',
+                 'inputs': [{'amount': 3.75, 'item': 'rotor'}, {'amount': 3.75, 'item': 'stator'},
+                            {'amount': 1.25, 'item': 'crystal_oscillator'}],
+                 'machineType': 'Manufacturer',
+                 'name': 'Alternate: Rigor Motor',
+                 'outputs': [{'amount': 7.5, 'item': 'motor'}],
+                 'powerConsumption': 55,
+                 'unlockTier': 4},
+ 'rocket_fuel': {'alternateRecipe': False,
+                 'category': 'blending',
+                 'craftingSpeed': 6,
+                 'id': 'rocket_fuel',
+                 'inputs': [{'amount': 60, 'item': 'turbofuel'}, {'amount': 10, 'item': 'nitric_acid'}],
+                 'machineType': 'Blender',
+                 'name': 'Rocket Fuel',
+                 'outputs': [{'amount': 100, 'item': 'rocket_fuel'}, {'amount': 10, 'item': 'compacted_coal'}],
+                 'powerConsumption': 75,
+                 'unlockTier': 8},
+ 'rotor': {'alternateRecipe': False,
+           'category': 'crafting2',
+           'craftingSpeed': 15,
+           'id': 'rotor',
+           'inputs': [{'amount': 20, 'item': 'iron_rod'}, {'amount': 100, 'item': 'screw'}],
+           'machineType': 'Assembler',
+           'name': 'Rotor',
+           'outputs': [{'amount': 4, 'item': 'rotor'}],
+           'powerConsumption': 15,
+           'unlockTier': 2},
+ 'rubber': {'alternateRecipe': False,
+            'category': 'refining',
+            'craftingSpeed': 6,
+            'id': 'rubber',
+            'inputs': [{'amount': 30, 'item': 'crude_oil'}],
+            'machineType': 'Refinery',
+            'name': 'Rubber',
+            'outputs': [{'amount': 20, 'item': 'rubber'}, {'amount': 20, 'item': 'heavy_oil_residue'}],
+            'powerConsumption': 30,
+            'unlockTier': 5},
+ 'rubber_concrete': {'alternateRecipe': True,
+                     'category': 'crafting2',
+                     'craftingSpeed': 6,
+                     'id': 'rubber_concrete',
+                     'inputs': [{'amount': 100, 'item': 'limestone'}, {'amount': 20, 'item': 'rubber'}],
+                     'machineType': 'Assembler',
+                     'name': 'Alternate: Rubber Concrete',
+                     'outputs': [{'amount': 90, 'item': 'concrete'}],
+                     'powerConsumption': 15,
+                     'unlockTier': 0},
+ 'sam_fluctuator': {'alternateRecipe': False,
+                    'category': 'crafting3',
+                    'craftingSpeed': 6,
+                    'id': 'sam_fluctuator',
+                    'inputs': [{'amount': 60, 'item': 'reanimated_sam'}, {'amount': 50, 'item': 'wire'},
+                               {'amount': 30, 'item': 'steel_pipe'}],
+                    'machineType': 'Manufacturer',
+                    'name': 'SAM Fluctuator',
+                    'outputs': [{'amount': 10, 'item': 'sam_fluctuator'}],
+                    'powerConsumption': 55,
+                    'unlockTier': 10},
+ 'screw': {'alternateRecipe': False,
+           'category': 'crafting1',
+           'craftingSpeed': 6,
+           'id': 'screw',
+           'inputs': [{'amount': 10, 'item': 'iron_rod'}],
+           'machineType': 'Constructor',
+           'name': 'Screw',
+           'outputs': [{'amount': 40, 'item': 'screw'}],
+           'powerConsumption': 4,
+           'unlockTier': 0},
+ 'shatter_rebar': {'alternateRecipe': False,
+                   'category': 'crafting2',
+                   'craftingSpeed': 12,
+                   'id': 'shatter_rebar',
+                   'inputs': [{'amount': 10, 'item': 'iron_rebar'}, {'amount': 15, 'item': 'quartz_crystal'}],
+                   'machineType': 'Assembler',
+                   'name': 'Shatter Rebar',
+                   'outputs': [{'amount': 5, 'item': 'shatter_rebar'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 11},
+ 'silica': {'alternateRecipe': False,
+            'category': 'crafting1',
+            'craftingSpeed': 8,
+            'id': 'silica',
+            'inputs': [{'amount': 22.5, 'item': 'raw_quartz'}],
+            'machineType': 'Constructor',
+            'name': 'Silica',
+            'outputs': [{'amount': 37.5, 'item': 'silica'}],
+            'powerConsumption': 4,
+            'unlockTier': 4},
+ 'silicon_circuit_board': {'alternateRecipe': True,
+                           'category': 'crafting2',
+                           'craftingSpeed': 24,
+                           'id': 'silicon_circuit_board',
+                           'inputs': [{'amount': 27.5, 'item': 'copper_sheet'}, {'amount': 27.5, 'item': 'silica'}],
+                           'machineType': 'Assembler',
+                           'name': 'Alternate: Silicon Circuit Board',
+                           'outputs': [{'amount': 12.5, 'item': 'circuit_board'}],
+                           'powerConsumption': 15,
+                           'unlockTier': 5},
+ 'silicone_high_speed_connector': {'alternateRecipe': True,
+                                   'category': 'crafting3',
+                                   'craftingSpeed': 40,
+                                   'id': 'silicone_high_speed_connector',
+                                   'inputs': [{'amount': 90, 'item': 'quickwire'}, {'amount': 37.5, 'item': 'silica'},
+                                              {'amount': 3, 'item': 'circuit_board'}],
+                                   'machineType': 'Manufacturer',
+                                   'name': 'Alternate: Silicone High-Speed Connector',
+                                   'outputs': [{'amount': 3, 'item': 'high_speed_connector'}],
+                                   'powerConsumption': 55,
+                                   'unlockTier': 5},
+ 'singularity_cell': {'alternateRecipe': False,
+                      'category': 'crafting3',
+                      'craftingSpeed': 60,
+                      'id': 'singularity_cell',
+                      'inputs': [{'amount': 1, 'item': 'nuclear_pasta'}, {'amount': 20, 'item': 'dark_matter_crystal'},
+                                 {'amount': 100, 'item': 'iron_plate'}, {'amount': 200, 'item': 'concrete'}],
+                      'machineType': 'Manufacturer',
+                      'name': 'Singularity Cell',
+                      'outputs': [{'amount': 10, 'item': 'singularity_cell'}],
+                      'powerConsumption': 55,
+                      'unlockTier': 9},
+ 'sloppy_alumina': {'alternateRecipe': True,
+                    'category': 'refining',
+                    'craftingSpeed': 3,
+                    'id': 'sloppy_alumina',
+                    'inputs': [{'amount': 200, 'item': 'bauxite'}, {'amount': 200, 'item': 'water'}],
+                    'machineType': 'Refinery',
+                    'name': 'Alternate: Sloppy Alumina',
+                    'outputs': [{'amount': 240, 'item': 'alumina_solution'}],
+                    'powerConsumption': 30,
+                    'unlockTier': 7},
+ 'smart_plating': {'alternateRecipe': False,
+                   'category': 'crafting2',
+                   'craftingSpeed': 30,
+                   'id': 'smart_plating',
+                   'inputs': [{'amount': 2, 'item': 'reinforced_iron_plate'}, {'amount': 2, 'item': 'rotor'}],
+                   'machineType': 'Assembler',
+                   'name': 'Smart Plating',
+                   'outputs': [{'amount': 2, 'item': 'smart_plating'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 2},
+ 'smokeless_powder': {'alternateRecipe': False,
+                      'category': 'refining',
+                      'craftingSpeed': 6,
+                      'id': 'smokeless_powder',
+                      'inputs': [{'amount': 20, 'item': 'black_powder'}, {'amount': 10, 'item': 'heavy_oil_residue'}],
+                      'machineType': 'Refinery',
+                      'name': 'Smokeless Powder',
+                      'outputs': [{'amount': 20, 'item': 'smokeless_powder'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 4},
+ 'solid_biofuel': {'alternateRecipe': False,
+                   'category': 'crafting1',
+                   'craftingSpeed': 4,
+                   'id': 'solid_biofuel',
+                   'inputs': [{'amount': 120, 'item': 'biomass'}],
+                   'machineType': 'Constructor',
+                   'name': 'Solid Biofuel',
+                   'outputs': [{'amount': 60, 'item': 'solid_biofuel'}],
+                   'powerConsumption': 4,
+                   'unlockTier': 1},
+ 'solid_steel_ingot': {'alternateRecipe': True,
+                       'category': 'smelting2',
+                       'craftingSpeed': 3,
+                       'id': 'solid_steel_ingot',
+                       'inputs': [{'amount': 40, 'item': 'iron_ingot'}, {'amount': 40, 'item': 'coal'}],
+                       'machineType': 'Foundry',
+                       'name': 'Alternate: Solid Steel Ingot',
+                       'outputs': [{'amount': 60, 'item': 'steel_ingot'}],
+                       'powerConsumption': 16,
+                       'unlockTier': 4},
+ 'spitter_protein': {'alternateRecipe': False,
+                     'category': 'crafting1',
+                     'craftingSpeed': 3,
+                     'id': 'spitter_protein',
+                     'inputs': [{'amount': 20, 'item': 'spitter_remains'}],
+                     'machineType': 'Constructor',
+                     'name': 'Spitter Protein',
+                     'outputs': [{'amount': 20, 'item': 'alien_protein'}],
+                     'powerConsumption': 4,
+                     'unlockTier': 0},
+ 'stator': {'alternateRecipe': False,
+            'category': 'crafting2',
+            'craftingSpeed': 12,
+            'id': 'stator',
+            'inputs': [{'amount': 15, 'item': 'steel_pipe'}, {'amount': 40, 'item': 'wire'}],
+            'machineType': 'Assembler',
+            'name': 'Stator',
+            'outputs': [{'amount': 5, 'item': 'stator'}],
+            'powerConsumption': 15,
+            'unlockTier': 4},
+ 'steamed_copper_sheet': {'alternateRecipe': True,
+                          'category': 'refining',
+                          'craftingSpeed': 8,
+                          'id': 'steamed_copper_sheet',
+                          'inputs': [{'amount': 22.5, 'item': 'copper_ingot'}, {'amount': 22.5, 'item': 'water'}],
+                          'machineType': 'Refinery',
+                          'name': 'Alternate: Steamed Copper Sheet',
+                          'outputs': [{'amount': 22.5, 'item': 'copper_sheet'}],
+                          'powerConsumption': 30,
+                          'unlockTier': 2},
+ 'steel_beam': {'alternateRecipe': False,
+                'category': 'crafting1',
+                'craftingSpeed': 4,
+                'id': 'steel_beam',
+                'inputs': [{'amount': 60, 'item': 'steel_ingot'}],
+                'machineType': 'Constructor',
+                'name': 'Steel Beam',
+                'outputs': [{'amount': 15, 'item': 'steel_beam'}],
+                'powerConsumption': 4,
+                'unlockTier': 4},
+ 'steel_canister': {'alternateRecipe': True,
+                    'category': 'crafting1',
+                    'craftingSpeed': 6,
+                    'id': 'steel_canister',
+                    'inputs': [{'amount': 40, 'item': 'steel_ingot'}],
+                    'machineType': 'Constructor',
+                    'name': 'Alternate: Steel Canister',
+                    'outputs': [{'amount': 40, 'item': 'empty_canister'}],
+                    'powerConsumption': 4,
+                    'unlockTier': 5},
+ 'steel_cast_plate': {'alternateRecipe': True,
+                      'category': 'smelting2',
+                      'craftingSpeed': 4,
+                      'id': 'steel_cast_plate',
+                      'inputs': [{'amount': 15, 'item': 'iron_ingot'}, {'amount': 15, 'item': 'steel_ingot'}],
+                      'machineType': 'Foundry',
+                      'name': 'Alternate: Steel Cast Plate',
+                      'outputs': [{'amount': 45, 'item': 'iron_plate'}],
+                      'powerConsumption': 16,
+                      'unlockTier': 0},
+ 'steel_ingot': {'alternateRecipe': False,
+                 'category': 'smelting2',
+                 'craftingSpeed': 4,
+                 'id': 'steel_ingot',
+                 'inputs': [{'amount': 45, 'item': 'iron_ore'}, {'amount': 45, 'item': 'coal'}],
+                 'machineType': 'Foundry',
+                 'name': 'Steel Ingot',
+                 'outputs': [{'amount': 45, 'item': 'steel_ingot'}],
+                 'powerConsumption': 16,
+                 'unlockTier': 4},
+ 'steel_pipe': {'alternateRecipe': False,
+                'category': 'crafting1',
+                'craftingSpeed': 6,
+                'id': 'steel_pipe',
+                'inputs': [{'amount': 30, 'item': 'steel_ingot'}],
+                'machineType': 'Constructor',
+                'name': 'Steel Pipe',
+                'outputs': [{'amount': 20, 'item': 'steel_pipe'}],
+                'powerConsumption': 4,
+                'unlockTier': 4},
+ 'steel_rod': {'alternateRecipe': True,
+               'category': 'crafting1',
+               'craftingSpeed': 5,
+               'id': 'steel_rod',
+               'inputs': [{'amount': 12, 'item': 'steel_ingot'}],
+               'machineType': 'Constructor',
+               'name': 'Alternate: Steel Rod',
+               'outputs': [{'amount': 48, 'item': 'iron_rod'}],
+               'powerConsumption': 4,
+               'unlockTier': 0},
+ 'steel_rotor': {'alternateRecipe': True,
+                 'category': 'crafting2',
+                 'craftingSpeed': 12,
+                 'id': 'steel_rotor',
+                 'inputs': [{'amount': 10, 'item': 'steel_pipe'}, {'amount': 30, 'item': 'wire'}],
+                 'machineType': 'Assembler',
+                 'name': 'Alternate: Steel Rotor',
+                 'outputs': [{'amount': 5, 'item': 'rotor'}],
+                 'powerConsumption': 15,
+                 'unlockTier': 2},
+ 'steel_screw': {'alternateRecipe': True,
+                 'category': 'crafting1',
+                 'craftingSpeed': 12,
+                 'id': 'steel_screw',
+                 'inputs': [{'amount': 5, 'item': 'steel_beam'}],
+                 'machineType': 'Constructor',
+                 'name': 'Alternate: Steel Screw',
+                 'outputs': [{'amount': 260, 'item': 'screw'}],
+                 'powerConsumption': 4,
+                 'unlockTier': 0},
+ 'steeled_frame': {'alternateRecipe': True,
+                   'category': 'crafting2',
+                   'craftingSpeed': 60,
+                   'id': 'steeled_frame',
+                   'inputs': [{'amount': 2, 'item': 'reinforced_iron_plate'}, {'amount': 10, 'item': 'steel_pipe'}],
+                   'machineType': 'Assembler',
+                   'name': 'Alternate: Steeled Frame',
+                   'outputs': [{'amount': 3, 'item': 'modular_frame'}],
+                   'powerConsumption': 15,
+                   'unlockTier': 2},
+ 'stinger_protein': {'alternateRecipe': False,
+                     'category': 'crafting1',
+                     'craftingSpeed': 3,
+                     'id': 'stinger_protein',
+                     'inputs': [{'amount': 20, 'item': 'stinger_remains'}],
+                     'machineType': 'Constructor',
+                     'name': 'Stinger Protein',
+                     'outputs': [{'amount': 20, 'item': 'alien_protein'}],
+                     'powerConsumption': 4,
+                     'unlockTier': 0},
+ 'stitched_iron_plate': {'alternateRecipe': True,
+                         'category': 'crafting2',
+                         'craftingSpeed': 32,
+                         'id': 'stitched_iron_plate',
+                         'inputs': [{'amount': 18.75, 'item': 'iron_plate'}, {'amount': 37.5, 'item': 'wire'}],
+                         'machineType': 'Assembler',
+                         'name': 'Alternate: Stitched Iron Plate',
+                         'outputs': [{'amount': 5.625, 'item': 'reinforced_iron_plate'}],
+                         'powerConsumption': 15,
+                         'unlockTier': 0},
+ 'stun_rebar': {'alternateRecipe': False,
+                'category': 'crafting2',
+                'craftingSpeed': 6,
+                'id': 'stun_rebar',
+                'inputs': [{'amount': 10, 'item': 'iron_rebar'}, {'amount': 50, 'item': 'quickwire'}],
+                'machineType': 'Assembler',
+                'name': 'Stun Rebar',
+                'outputs': [{'amount': 10, 'item': 'stun_rebar'}],
+                'powerConsumption': 15,
+                'unlockTier': 11},
+ 'sulfur_coal': {'alternateRecipe': False,
+                 'category': 'converting',
+                 'craftingSpeed': 6,
+                 'id': 'sulfur_coal',
+                 'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 200, 'item': 'coal'}],
+                 'machineType': 'Converter',
+                 'name': 'Sulfur (Coal)',
+                 'outputs': [{'amount': 120, 'item': 'sulfur'}],
+                 'powerConsumption': 250,
+                 'unlockTier': 4},
+ 'sulfur_iron': {'alternateRecipe': False,
+                 'category': 'converting',
+                 'craftingSpeed': 6,
+                 'id': 'sulfur_iron',
+                 'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 300, 'item': 'iron_ore'}],
+                 'machineType': 'Converter',
+                 'name': 'Sulfur (Iron)',
+                 'outputs': [{'amount': 120, 'item': 'sulfur'}],
+                 'powerConsumption': 250,
+                 'unlockTier': 4},
+ 'sulfuric_acid': {'alternateRecipe': False,
+                   'category': 'refining',
+                   'craftingSpeed': 6,
+                   'id': 'sulfuric_acid',
+                   'inputs': [{'amount': 50, 'item': 'sulfur'}, {'amount': 50, 'item': 'water'}],
+                   'machineType': 'Refinery',
+                   'name': 'Sulfuric Acid',
+                   'outputs': [{'amount': 50, 'item': 'sulfuric_acid'}],
+                   'powerConsumption': 30,
+                   'unlockTier': 7},
+ 'super_state_computer': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 25,
+                          'id': 'super_state_computer',
+                          'inputs': [{'amount': 7.2, 'item': 'computer'}, {'amount': 2.4, 'item': 'em_control_rod'},
+                                     {'amount': 24, 'item': 'battery'}, {'amount': 60, 'item': 'wire'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Super-State Computer',
+                          'outputs': [{'amount': 2.4, 'item': 'supercomputer'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 5},
+ 'supercomputer': {'alternateRecipe': False,
+                   'category': 'crafting3',
+                   'craftingSpeed': 32,
+                   'id': 'supercomputer',
+                   'inputs': [{'amount': 7.5, 'item': 'computer'}, {'amount': 3.75, 'item': 'ai_limiter'},
+                              {'amount': 5.625, 'item': 'high_speed_connector'}, {'amount': 52.5, 'item': 'plastic'}],
+                   'machineType': 'Manufacturer',
+                   'name': 'Supercomputer',
+                   'outputs': [{'amount': 1.875, 'item': 'supercomputer'}],
+                   'powerConsumption': 55,
+                   'unlockTier': 5},
+ 'superposition_oscillator': {'alternateRecipe': False,
+                              'category': 'encoding',
+                              'craftingSpeed': 12,
+                              'id': 'superposition_oscillator',
+                              'inputs': [{'amount': 30, 'item': 'dark_matter_crystal'},
+                                         {'amount': 5, 'item': 'crystal_oscillator'},
+                                         {'amount': 45, 'item': 'alclad_aluminum_sheet'},
+                                         {'amount': 50, 'item': 'excited_photonic_matter'}],
+                              'machineType': 'Quantum Encoder',
+                              'name': 'Superposition Oscillator',
+                              'outputs': [{'amount': 5, 'item': 'superposition_oscillator'},
+                                          {'amount': 125, 'item': 'dark_matter_residue'}],
+                              'powerConsumption': 1000,
+                              'unlockTier': 9},
+ 'synthetic_power_shard': {'alternateRecipe': False,
+                           'category': 'encoding',
+                           'craftingSpeed': 12,
+                           'id': 'synthetic_power_shard',
+                           'inputs': [{'amount': 10, 'item': 'time_crystal'},
+                                      {'amount': 10, 'item': 'dark_matter_crystal'},
+                                      {'amount': 60, 'item': 'quartz_crystal'},
+                                      {'amount': 60, 'item': 'excited_photonic_matter'}],
+                           'machineType': 'Quantum Encoder',
+                           'name': 'Synthetic Power Shard',
+                           'outputs': [{'amount': 5, 'item': 'power_shard'},
+                                       {'amount': 60, 'item': 'dark_matter_residue'}],
+                           'powerConsumption': 1000,
+                           'unlockTier': 9},
+ 'thermal_propulsion_rocket': {'alternateRecipe': False,
+                               'category': 'crafting3',
+                               'craftingSpeed': 120,
+                               'id': 'thermal_propulsion_rocket',
+                               'inputs': [{'amount': 2.5, 'item': 'modular_engine'},
+                                          {'amount': 1, 'item': 'turbo_motor'}, {'amount': 3, 'item': 'cooling_system'},
+                                          {'amount': 1, 'item': 'fused_modular_frame'}],
+                               'machineType': 'Manufacturer',
+                               'name': 'Thermal Propulsion Rocket',
+                               'outputs': [{'amount': 1, 'item': 'thermal_propulsion_rocket'}],
+                               'powerConsumption': 55,
+                               'unlockTier': 8},
+ 'time_crystal': {'alternateRecipe': False,
+                  'category': 'converting',
+                  'craftingSpeed': 10,
+                  'id': 'time_crystal',
+                  'inputs': [{'amount': 12, 'item': 'diamonds'}],
+                  'machineType': 'Converter',
+                  'name': 'Time Crystal',
+                  'outputs': [{'amount': 6, 'item': 'time_crystal'}],
+                  'powerConsumption': 250,
+                  'unlockTier': 9},
+ 'turbo_blend_fuel': {'alternateRecipe': True,
+                      'category': 'blending',
+                      'craftingSpeed': 8,
+                      'id': 'turbo_blend_fuel',
+                      'inputs': [{'amount': 15, 'item': 'fuel'}, {'amount': 30, 'item': 'heavy_oil_residue'},
+                                 {'amount': 22.5, 'item': 'sulfur'}, {'amount': 22.5, 'item': 'petroleum_coke'}],
+                      'machineType': 'Blender',
+                      'name': 'Alternate: Turbo Blend Fuel',
+                      'outputs': [{'amount': 45, 'item': 'turbofuel'}],
+                      'powerConsumption': 75,
+                      'unlockTier': 6},
+ 'turbo_diamonds': {'alternateRecipe': True,
+                    'category': 'accelerating',
+                    'craftingSpeed': 3,
+                    'id': 'turbo_diamonds',
+                    'inputs': [{'amount': 600, 'item': 'coal'}, {'amount': 40, 'item': 'packaged_turbofuel'}],
+                    'machineType': 'Particle Accelerator',
+                    'name': 'Alternate: Turbo Diamonds',
+                    'outputs': [{'amount': 60, 'item': 'diamonds'}],
+                    'powerConsumption': 500,
+                    'unlockTier': 9},
+ 'turbo_electric_motor': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 64,
+                          'id': 'turbo_electric_motor',
+                          'inputs': [{'amount': 6.5625, 'item': 'motor'},
+                                     {'amount': 8.4375, 'item': 'radio_control_unit'},
+                                     {'amount': 4.6875, 'item': 'em_control_rod'},
+                                     {'amount': 6.5625, 'item': 'rotor'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Turbo Electric Motor',
+                          'outputs': [{'amount': 2.8125, 'item': 'turbo_motor'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 7},
+ 'turbo_heavy_fuel': {'alternateRecipe': True,
+                      'category': 'refining',
+                      'craftingSpeed': 8,
+                      'id': 'turbo_heavy_fuel',
+                      'inputs': [{'amount': 37.5, 'item': 'heavy_oil_residue'},
+                                 {'amount': 30, 'item': 'compacted_coal'}],
+                      'machineType': 'Refinery',
+                      'name': 'Alternate: Turbo Heavy Fuel',
+                      'outputs': [{'amount': 30, 'item': 'turbofuel'}],
+                      'powerConsumption': 30,
+                      'unlockTier': 6},
+ 'turbo_motor': {'alternateRecipe': False,
+                 'category': 'crafting3',
+                 'craftingSpeed': 32,
+                 'id': 'turbo_motor',
+                 'inputs': [{'amount': 7.5, 'item': 'cooling_system'}, {'amount': 3.75, 'item': 'radio_control_unit'},
+                            {'amount': 7.5, 'item': 'motor'}, {'amount': 45, 'item': 'rubber'}],
+                 'machineType': 'Manufacturer',
+                 'name': 'Turbo Motor',
+                 'outputs': [{'amount': 1.875, 'item': 'turbo_motor'}],
+                 'powerConsumption': 55,
+                 'unlockTier': 7},
+ 'turbo_pressure_motor': {'alternateRecipe': True,
+                          'category': 'crafting3',
+                          'craftingSpeed': 32,
+                          'id': 'turbo_pressure_motor',
+                          'inputs': [{'amount': 7.5, 'item': 'motor'},
+                                     {'amount': 1.875, 'item': 'pressure_conversion_cube'},
+                                     {'amount': 45, 'item': 'packaged_nitrogen_gas'},
+                                     {'amount': 15, 'item': 'stator'}],
+                          'machineType': 'Manufacturer',
+                          'name': 'Alternate: Turbo Pressure Motor',
+                          'outputs': [{'amount': 3.75, 'item': 'turbo_motor'}],
+                          'powerConsumption': 55,
+                          'unlockTier': 7},
+ 'turbo_rifle_ammo': {'alternateRecipe': False,
+                      'category': 'crafting3',
+                      'craftingSpeed': 12,
+                      'id': 'turbo_rifle_ammo',
+                      'inputs': [{'amount': 125, 'item': 'rifle_ammo'}, {'amount': 15, 'item': 'aluminum_casing'},
+                                 {'amount': 15, 'item': 'packaged_turbofuel'}],
+                      'machineType': 'Manufacturer',
+                      'name': 'Turbo Rifle Ammo',
+                      'outputs': [{'amount': 250, 'item': 'turbo_rifle_ammo'}],
+                      'powerConsumption': 55,
+                      'unlockTier': 11},
+ 'turbo_rifle_ammo__alt_turbo_rifle_ammo': {'alternateRecipe': True,
+                                            'category': 'blending',
+                                            'craftingSpeed': 12,
+                                            'id': 'turbo_rifle_ammo__alt_turbo_rifle_ammo',
+                                            'inputs': [{'amount': 125, 'item': 'rifle_ammo'},
+                                                       {'amount': 15, 'item': 'aluminum_casing'},
+                                                       {'amount': 15, 'item': 'turbofuel'}],
+                                            'machineType': 'Blender',
+                                            'name': 'Turbo Rifle Ammo',
+                                            'outputs': [{'amount': 250, 'item': 'turbo_rifle_ammo'}],
+                                            'powerConsumption': 75,
+                                            'unlockTier': 11},
+ 'turbofuel': {'alternateRecipe': False,
+               'category': 'refining',
+               'craftingSpeed': 16,
+               'id': 'turbofuel',
+               'inputs': [{'amount': 22.5, 'item': 'fuel'}, {'amount': 15, 'item': 'compacted_coal'}],
+               'machineType': 'Refinery',
+               'name': 'Turbofuel',
+               'outputs': [{'amount': 18.75, 'item': 'turbofuel'}],
+               'powerConsumption': 30,
+               'unlockTier': 6},
+ 'unpackage_alumina_solution': {'alternateRecipe': False,
+                                'category': 'packaging',
+                                'craftingSpeed': 1,
+                                'id': 'unpackage_alumina_solution',
+                                'inputs': [{'amount': 120, 'item': 'packaged_alumina_solution'}],
+                                'machineType': 'Packager',
+                                'name': 'Unpackage Alumina Solution',
+                                'outputs': [{'amount': 120, 'item': 'alumina_solution'},
+                                            {'amount': 120, 'item': 'empty_canister'}],
+                                'powerConsumption': 10,
+                                'unlockTier': 7},
+ 'unpackage_fuel': {'alternateRecipe': False,
+                    'category': 'packaging',
+                    'craftingSpeed': 2,
+                    'id': 'unpackage_fuel',
+                    'inputs': [{'amount': 60, 'item': 'packaged_fuel'}],
+                    'machineType': 'Packager',
+                    'name': 'Unpackage Fuel',
+                    'outputs': [{'amount': 60, 'item': 'fuel'}, {'amount': 60, 'item': 'empty_canister'}],
+                    'powerConsumption': 10,
+                    'unlockTier': 5},
+ 'unpackage_heavy_oil_residue': {'alternateRecipe': False,
+                                 'category': 'packaging',
+                                 'craftingSpeed': 6,
+                                 'id': 'unpackage_heavy_oil_residue',
+                                 'inputs': [{'amount': 20, 'item': 'packaged_heavy_oil_residue'}],
+                                 'machineType': 'Packager',
+                                 'name': 'Unpackage Heavy Oil Residue',
+                                 'outputs': [{'amount': 20, 'item': 'heavy_oil_residue'},
+                                             {'amount': 20, 'item': 'empty_canister'}],
+                                 'powerConsumption': 10,
+                                 'unlockTier': 5},
+ 'unpackage_ionized_fuel': {'alternateRecipe': False,
+                            'category': 'packaging',
+                            'craftingSpeed': 3,
+                            'id': 'unpackage_ionized_fuel',
+                            'inputs': [{'amount': 40, 'item': 'packaged_ionized_fuel'}],
+                            'machineType': 'Packager',
+                            'name': 'Unpackage Ionized Fuel',
+                            'outputs': [{'amount': 80, 'item': 'ionized_fuel'},
+                                        {'amount': 40, 'item': 'empty_fluid_tank'}],
+                            'powerConsumption': 10,
+                            'unlockTier': 9},
+ 'unpackage_liquid_biofuel': {'alternateRecipe': False,
+                              'category': 'packaging',
+                              'craftingSpeed': 2,
+                              'id': 'unpackage_liquid_biofuel',
+                              'inputs': [{'amount': 60, 'item': 'packaged_liquid_biofuel'}],
+                              'machineType': 'Packager',
+                              'name': 'Unpackage Liquid Biofuel',
+                              'outputs': [{'amount': 60, 'item': 'liquid_biofuel'},
+                                          {'amount': 60, 'item': 'empty_canister'}],
+                              'powerConsumption': 10,
+                              'unlockTier': 5},
+ 'unpackage_nitric_acid': {'alternateRecipe': False,
+                           'category': 'packaging',
+                           'craftingSpeed': 3,
+                           'id': 'unpackage_nitric_acid',
+                           'inputs': [{'amount': 20, 'item': 'packaged_nitric_acid'}],
+                           'machineType': 'Packager',
+                           'name': 'Unpackage Nitric Acid',
+                           'outputs': [{'amount': 20, 'item': 'nitric_acid'},
+                                       {'amount': 20, 'item': 'empty_fluid_tank'}],
+                           'powerConsumption': 10,
+                           'unlockTier': 8},
+ 'unpackage_nitrogen_gas': {'alternateRecipe': False,
+                            'category': 'packaging',
+                            'craftingSpeed': 1,
+                            'id': 'unpackage_nitrogen_gas',
+                            'inputs': [{'amount': 60, 'item': 'packaged_nitrogen_gas'}],
+                            'machineType': 'Packager',
+                            'name': 'Unpackage Nitrogen Gas',
+                            'outputs': [{'amount': 240, 'item': 'nitrogen_gas'},
+                                        {'amount': 60, 'item': 'empty_fluid_tank'}],
+                            'powerConsumption': 10,
+                            'unlockTier': 8},
+ 'unpackage_oil': {'alternateRecipe': False,
+                   'category': 'packaging',
+                   'craftingSpeed': 2,
+                   'id': 'unpackage_oil',
+                   'inputs': [{'amount': 60, 'item': 'packaged_oil'}],
+                   'machineType': 'Packager',
+                   'name': 'Unpackage Oil',
+                   'outputs': [{'amount': 60, 'item': 'crude_oil'}, {'amount': 60, 'item': 'empty_canister'}],
+                   'powerConsumption': 10,
+                   'unlockTier': 5},
+ 'unpackage_rocket_fuel': {'alternateRecipe': False,
+                           'category': 'packaging',
+                           'craftingSpeed': 1,
+                           'id': 'unpackage_rocket_fuel',
+                           'inputs': [{'amount': 60, 'item': 'packaged_rocket_fuel'}],
+                           'machineType': 'Packager',
+                           'name': 'Unpackage Rocket Fuel',
+                           'outputs': [{'amount': 120, 'item': 'rocket_fuel'},
+                                       {'amount': 60, 'item': 'empty_fluid_tank'}],
+                           'powerConsumption': 10,
+                           'unlockTier': 8},
+ 'unpackage_sulfuric_acid': {'alternateRecipe': False,
+                             'category': 'packaging',
+                             'craftingSpeed': 1,
+                             'id': 'unpackage_sulfuric_acid',
+                             'inputs': [{'amount': 60, 'item': 'packaged_sulfuric_acid'}],
+                             'machineType': 'Packager',
+                             'name': 'Unpackage Sulfuric Acid',
+                             'outputs': [{'amount': 60, 'item': 'sulfuric_acid'},
+                                         {'amount': 60, 'item': 'empty_canister'}],
+                             'powerConsumption': 10,
+                             'unlockTier': 7},
+ 'unpackage_turbofuel': {'alternateRecipe': False,
+                         'category': 'packaging',
+                         'craftingSpeed': 6,
+                         'id': 'unpackage_turbofuel',
+                         'inputs': [{'amount': 20, 'item': 'packaged_turbofuel'}],
+                         'machineType': 'Packager',
+                         'name': 'Unpackage Turbo Fuel',
+                         'outputs': [{'amount': 20, 'item': 'turbofuel'}, {'amount': 20, 'item': 'empty_canister'}],
+                         'powerConsumption': 10,
+                         'unlockTier': 6},
+ 'unpackage_water': {'alternateRecipe': False,
+                     'category': 'packaging',
+                     'craftingSpeed': 1,
+                     'id': 'unpackage_water',
+                     'inputs': [{'amount': 120, 'item': 'packaged_water'}],
+                     'machineType': 'Packager',
+                     'name': 'Unpackage Water',
+                     'outputs': [{'amount': 120, 'item': 'water'}, {'amount': 120, 'item': 'empty_canister'}],
+                     'powerConsumption': 10,
+                     'unlockTier': 5},
+ 'uranium_cell': {'alternateRecipe': False,
+                  'category': 'blending',
+                  'craftingSpeed': 12,
+                  'id': 'uranium_cell',
+                  'inputs': [{'amount': 50, 'item': 'uranium'}, {'amount': 15, 'item': 'concrete'},
+                             {'amount': 40, 'item': 'sulfuric_acid'}],
+                  'machineType': 'Blender',
+                  'name': 'Encased Uranium Cell',
+                  'outputs': [{'amount': 25, 'item': 'uranium_cell'}, {'amount': 10, 'item': 'sulfuric_acid'}],
+                  'powerConsumption': 75,
+                  'unlockTier': 8},
+ 'uranium_fuel_rod': {'alternateRecipe': False,
+                      'category': 'crafting3',
+                      'craftingSpeed': 150,
+                      'id': 'uranium_fuel_rod',
+                      'inputs': [{'amount': 20, 'item': 'uranium_cell'},
+                                 {'amount': 1.2, 'item': 'encased_industrial_beam'},
+                                 {'amount': 2, 'item': 'em_control_rod'}],
+                      'machineType': 'Manufacturer',
+                      'name': 'Uranium Fuel Rod',
+                      'outputs': [{'amount': 0.4, 'item': 'uranium_fuel_rod'}],
+                      'powerConsumption': 55,
+                      'unlockTier': 8},
+ 'uranium_fuel_unit': {'alternateRecipe': True,
+                       'category': 'crafting3',
+                       'craftingSpeed': 300,
+                       'id': 'uranium_fuel_unit',
+                       'inputs': [{'amount': 20, 'item': 'uranium_cell'}, {'amount': 2, 'item': 'em_control_rod'},
+                                  {'amount': 0.6, 'item': 'crystal_oscillator'}, {'amount': 2, 'item': 'rotor'}],
+                       'machineType': 'Manufacturer',
+                       'name': 'Alternate: Uranium Fuel Unit',
+                       'outputs': [{'amount': 0.6, 'item': 'uranium_fuel_rod'}],
+                       'powerConsumption': 55,
+                       'unlockTier': 8},
+ 'uranium_ore_bauxite': {'alternateRecipe': False,
+                         'category': 'converting',
+                         'craftingSpeed': 6,
+                         'id': 'uranium_ore_bauxite',
+                         'inputs': [{'amount': 10, 'item': 'reanimated_sam'}, {'amount': 480, 'item': 'bauxite'}],
+                         'machineType': 'Converter',
+                         'name': 'Uranium Ore (Bauxite)',
+                         'outputs': [{'amount': 120, 'item': 'uranium'}],
+                         'powerConsumption': 250,
+                         'unlockTier': 8},
+ 'versatile_framework': {'alternateRecipe': False,
+                         'category': 'crafting2',
+                         'craftingSpeed': 24,
+                         'id': 'versatile_framework',
+                         'inputs': [{'amount': 2.5, 'item': 'modular_frame'}, {'amount': 30, 'item': 'steel_beam'}],
+                         'machineType': 'Assembler',
+                         'name': 'Versatile Framework',
+                         'outputs': [{'amount': 5, 'item': 'versatile_framework'}],
+                         'powerConsumption': 15,
+                         'unlockTier': 3},
+ 'wet_concrete': {'alternateRecipe': True,
+                  'category': 'refining',
+                  'craftingSpeed': 3,
+                  'id': 'wet_concrete',
+                  'inputs': [{'amount': 120, 'item': 'limestone'}, {'amount': 100, 'item': 'water'}],
+                  'machineType': 'Refinery',
+                  'name': 'Alternate: Wet Concrete',
+                  'outputs': [{'amount': 80, 'item': 'concrete'}],
+                  'powerConsumption': 30,
+                  'unlockTier': 0},
+ 'wire': {'alternateRecipe': False,
+          'category': 'crafting1',
+          'craftingSpeed': 4,
+          'id': 'wire',
+          'inputs': [{'amount': 15, 'item': 'copper_ingot'}],
+          'machineType': 'Constructor',
+          'name': 'Wire',
+          'outputs': [{'amount': 30, 'item': 'wire'}],
+          'powerConsumption': 4,
+          'unlockTier': 0}}
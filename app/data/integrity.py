@@ -0,0 +1,160 @@
+"""
+One-time integrity check of a game dataset.
+
+Catches bad data at load time instead of mid-solve:
+
+- errors: dangling item references in recipe inputs / outputs, non-positive
+  craftingSpeed or amounts, recipes without outputs, mismatched IDs;
+- warnings: items that cannot be built from raw resources even with every
+  recipe unlocked.
+
+The verdict for the bundled game data is cached in data/.snapshot/ next to
+the compiled ITEMS / RECIPES snapshot and keyed by the same content hash, so
+the check only runs again when data/game_data.py (or CHECKER_VERSION)
+changes. Code downstream of
+a verified dataset (the solver in particular) can index items and rates
+directly instead of guarding every lookup.
+"""
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
+
+from data import snapshot
+
+# Bump whenever check_dataset changes what it reports, so cached verdicts
+# from an older checker are not trusted
+CHECKER_VERSION = 1
+
+
+class DatasetIntegrityError(ValueError):
+    """Raised when a dataset fails its integrity check."""
+
+    def __init__(self, name: str, errors: List[str]):
+        self.errors = errors
+        shown = "; ".join(errors[:5])
+        more = f" (+{len(errors) - 5} more)" if len(errors) > 5 else ""
+        super().__init__(f"Dataset '{name}' failed integrity check: {shown}{more}")
+
+
+@dataclass
+class IntegrityReport:
+    """Outcome of a dataset integrity check."""
+    errors: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def ok(self) -> bool:
+        return not self.errors
+
+    def to_payload(self) -> Dict[str, Any]:
+        """Plain data form (for the snapshot cache)."""
+        return {"errors": list(self.errors), "warnings": list(self.warnings)}
+
+    @classmethod
+    def from_payload(cls, payload: Dict[str, Any]) -> "IntegrityReport":
+        return cls(errors=list(payload["errors"]), warnings=list(payload["warnings"]))
+
+
+def check_dataset(items: Mapping, recipes: Mapping) -> IntegrityReport:
+    """
+    Check ITEMS / RECIPES for structural problems.
+
+    Args:
+        items: Items database
+        recipes: Recipes database
+
+    Returns:
+        IntegrityReport
+    """
+    report = IntegrityReport()
+
+    for item_id, item in items.items():
+        if item.get("id") != item_id:
+            report.errors.append(f"Item '{item_id}' has id '{item.get('id')}'")
+
+    for recipe_id, recipe in recipes.items():
+        if recipe.get("id") != recipe_id:
+            report.errors.append(f"Recipe '{recipe_id}' has id '{recipe.get('id')}'")
+        if not recipe.get("craftingSpeed", 0) > 0:
+            report.errors.append(f"Recipe '{recipe_id}' has non-positive craftingSpeed")
+        if not recipe.get("outputs"):
+            report.errors.append(f"Recipe '{recipe_id}' has no outputs")
+        for side in ("inputs", "outputs"):
+            for flow in recipe.get(side, ()):
+                if flow["item"] not in items:
+                    report.errors.append(
+                        f"Recipe '{recipe_id}' {side[:-1]} references unknown item '{flow['item']}'"
+                    )
+                if not flow["amount"] > 0:
+                    report.errors.append(
+                        f"Recipe '{recipe_id}' has non-positive amount of '{flow['item']}'"
+                    )
+
+    if report.errors:
+        # Reachability needs a structurally valid recipe graph
+        return report
+
+    # Fixpoint over every recipe: what can be made from raw resources at all
+    buildable = {item_id for item_id, item in items.items() if item["isRawResource"]}
+    pending = list(recipes.values())
+    changed = True
+    while changed and pending:
+        changed = False
+        still_pending = []
+        for recipe in pending:
+            if all(flow["item"] in buildable for flow in recipe["inputs"]):
+                buildable.update(flow["item"] for flow in recipe["outputs"])
+                changed = True
+            else:
+                still_pending.append(recipe)
+        pending = still_pending
+
+    for item_id in items:
+        if item_id not in buildable:
+            report.warnings.append(f"Item '{item_id}' cannot be built from raw resources")
+
+    return report
+
+
+def load_verdict(
+    items: Mapping,
+    recipes: Mapping,
+    source_path: Path,
+    source_digest: Optional[str] = None
+) -> IntegrityReport:
+    """
+    Get the integrity verdict of a dataset loaded from a source file.
+
+    The verdict is cached next to the source's compiled snapshot, keyed by
+    the source hash and CHECKER_VERSION, so each version of the source is
+    only checked once per version of the checker.
+
+    Args:
+        items: Items database built from the source
+        recipes: Recipes database built from the source
+        source_path: File the dataset was loaded from
+        source_digest: Precomputed content hash of the source (optional)
+
+    Returns:
+        IntegrityReport
+    """
+    payload = snapshot.load_cached(
+        source_path,
+        lambda: check_dataset(items, recipes).to_payload(),
+        source_digest,
+        name=f"{Path(source_path).stem}.integrity-v{CHECKER_VERSION}",
+    )
+    return IntegrityReport.from_payload(payload)
+
+
+def require_valid(report: IntegrityReport, name: str) -> IntegrityReport:
+    """
+    Raise if a report has errors.
+
+    Raises:
+        DatasetIntegrityError: If the dataset failed the check
+    """
+    if not report.ok:
+        raise DatasetIntegrityError(name, report.errors)
+    return report
@@ -0,0 +1,97 @@
+"""
+Topological rank and production depth of every item.
+
+Built on the strongly connected components of the item graph: each loop is
+collapsed into a single node, so the condensed graph is a DAG and every item
+gets
+
+- a rank: its position in one topological order (inputs before outputs), and
+- a depth: the longest path from raw resources, counted in recipe steps.
+
+Raw resources (and items nothing unlocked can make) have depth 0, an item made
+straight from raw resources has depth 1, and items sharing a loop share a
+depth. Demand aggregation, diagram stages and "complexity" sorting can all
+read these instead of walking the graph again.
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Optional
+
+from data.components import ComponentAnalysis
+from data.dependency_closure import bit_indices
+
+
+@dataclass
+class DepthTable:
+    """Topological rank and longest-path depth per item."""
+    item_ids: List[str]
+    item_index: Dict[str, int]
+
+    # Item indices in topological order (inputs before outputs)
+    order: List[int]
+
+    # Per item index: position in order / longest path from raw resources
+    rank: List[int]
+    depth: List[int]
+
+    def rank_of(self, item_id: str) -> Optional[int]:
+        """Topological rank of an item (None if unknown)."""
+        i = self.item_index.get(item_id)
+        return self.rank[i] if i is not None else None
+
+    def depth_of(self, item_id: str) -> int:
+        """Longest-path depth of an item from raw resources (0 if unknown)."""
+        i = self.item_index.get(item_id)
+        return self.depth[i] if i is not None else 0
+
+    @property
+    def max_depth(self) -> int:
+        return max(self.depth, default=0)
+
+    def topological_order(self) -> List[str]:
+        """Item IDs with inputs before outputs."""
+        return [self.item_ids[i] for i in self.order]
+
+    def stages(self) -> List[List[str]]:
+        """Item IDs grouped by depth (index = depth), each in topological order."""
+        grouped: List[List[str]] = [[] for _ in range(self.max_depth + 1)]
+        for i in self.order:
+            grouped[self.depth[i]].append(self.item_ids[i])
+        return grouped
+
+
+def build_depth_table(analysis: ComponentAnalysis) -> DepthTable:
+    """
+    Compute the topological rank and depth of every item.
+
+    Args:
+        analysis: Component analysis of the item graph for one unlocked set
+
+    Returns:
+        DepthTable
+    """
+    num_items = len(analysis.item_ids)
+    component_of = analysis.component_of
+
+    # Components are already in topological order, so one pass settles depths
+    component_depth = [0] * len(analysis.components)
+    for c, items in enumerate(analysis.components):
+        depth = component_depth[c]
+        for i in items:
+            for j in bit_indices(analysis.successors[i]):
+                target = component_of[j]
+                if target != c and component_depth[target] < depth + 1:
+                    component_depth[target] = depth + 1
+
+    order = [i for items in analysis.components for i in items]
+    rank = [0] * num_items
+    for position, i in enumerate(order):
+        rank[i] = position
+
+    return DepthTable(
+        item_ids=analysis.item_ids,
+        item_index=analysis.item_index,
+        order=order,
+        rank=rank,
+        depth=[component_depth[component_of[i]] for i in range(num_items)],
+    )
@@ -0,0 +1,57 @@
+"""
+Deeply read-only views of game data.
+
+ITEMS / RECIPES are shared by every session in the process, so they are
+handed out frozen: dicts become MappingProxyType views and lists become
+tuples. Reading works exactly as before (`recipe["inputs"][0]["item"]`), but
+any attempt to modify the shared data raises TypeError / AttributeError
+instead of silently corrupting it for everyone, and callers never need to take
+defensive copies.
+"""
+
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any
+
+
+def freeze(value: Any) -> Any:
+    """
+    Return a deeply read-only version of a JSON-like value.
+
+    Already frozen mappings are returned as they are, so freezing is cheap to
+    repeat on data that may already be shared.
+
+    Args:
+        value: dict / list / scalar value
+
+    Returns:
+        MappingProxyType for mappings, tuple for lists, the value otherwise
+    """
+    if isinstance(value, MappingProxyType):
+        return value
+    if isinstance(value, Mapping):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, set):
+        return frozenset(value)
+    return value
+
+
+def thaw(value: Any) -> Any:
+    """
+    Return a mutable deep copy of a (possibly frozen) JSON-like value.
+
+    Args:
+        value: Frozen or plain value
+
+    Returns:
+        dicts and lists (safe to modify or serialize)
+    """
+    if isinstance(value, Mapping):
+        return {key: thaw(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [thaw(item) for item in value]
+    if isinstance(value, frozenset):
+        return set(value)
+    return value
@@ -0,0 +1,197 @@
+"""
+Compiled, index-based view of the recipe graph.
+
+Items and recipes get dense integer indices (in ITEMS / RECIPES order) and the
+recipe inputs and outputs become a sparse item x recipe stoichiometry matrix in
+items/min per machine at 100% clock. The matrix is stored twice, column-major
+(per recipe) and row-major (per item), as flat `array` buffers so scoring,
+aggregation and LP code can work on indices instead of nested dicts.
+
+Entries are signed: outputs are positive, inputs negative. A recipe that both
+consumes and produces an item (e.g. water in Distilled Silica) keeps one entry
+per side, so gross flows stay available; summing a column gives net flows.
+"""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, List, Sequence, Tuple
+
+from data.recipe_rates import RecipeRates
+
+
+@dataclass
+class RecipeMatrix:
+    """Sparse item x recipe stoichiometry matrix with parallel recipe metadata."""
+    item_ids: List[str]
+    recipe_ids: List[str]
+    item_index: Dict[str, int]
+    recipe_index: Dict[str, int]
+
+    # Column-major (CSC): entries of recipe r are col_ptr[r]:col_ptr[r + 1]
+    col_ptr: array
+    col_items: array
+    col_values: array
+
+    # Row-major (CSR): entries of item i are row_ptr[i]:row_ptr[i + 1]
+    row_ptr: array
+    row_recipes: array
+    row_values: array
+
+    # Per-recipe metadata, indexed by recipe index
+    power: array
+    crafting_speed: array
+    tier: array
+    alternate: array
+    machine_type: array  # index into machine_types
+    machine_types: List[str]
+
+    # Per-item metadata, indexed by item index
+    is_raw: array
+
+    @property
+    def num_items(self) -> int:
+        return len(self.item_ids)
+
+    @property
+    def num_recipes(self) -> int:
+        return len(self.recipe_ids)
+
+    @property
+    def nnz(self) -> int:
+        return len(self.col_values)
+
+    def recipe_column(self, recipe_idx: int) -> List[Tuple[int, float]]:
+        """Get (item index, rate) entries of a recipe; inputs are negative."""
+        start, end = self.col_ptr[recipe_idx], self.col_ptr[recipe_idx + 1]
+        return list(zip(self.col_items[start:end], self.col_values[start:end]))
+
+    def item_row(self, item_idx: int) -> List[Tuple[int, float]]:
+        """Get (recipe index, rate) entries of an item; consumers are negative."""
+        start, end = self.row_ptr[item_idx], self.row_ptr[item_idx + 1]
+        return list(zip(self.row_recipes[start:end], self.row_values[start:end]))
+
+    def net_item_rates(self, machines: Sequence[float]) -> List[float]:
+        """
+        Multiply the matrix by a per-recipe machine count vector.
+
+        Args:
+            machines: Machine count per recipe index
+
+        Returns:
+            Net items/min per item index (positive = surplus, negative = demand)
+        """
+        net = [0.0] * self.num_items
+        col_ptr, col_items, col_values = self.col_ptr, self.col_items, self.col_values
+        for r, count in enumerate(machines):
+            if count:
+                for k in range(col_ptr[r], col_ptr[r + 1]):
+                    net[col_items[k]] += col_values[k] * count
+        return net
+
+    def recipe_weights(self, item_weights: Sequence[float]) -> List[float]:
+        """
+        Multiply the transposed matrix by a per-item weight vector.
+
+        Args:
+            item_weights: Weight per item index (e.g. a cost per item/min)
+
+        Returns:
+            Weighted net flow per recipe index
+        """
+        weights = [0.0] * self.num_recipes
+        col_ptr, col_items, col_values = self.col_ptr, self.col_items, self.col_values
+        for r in range(self.num_recipes):
+            total = 0.0
+            for k in range(col_ptr[r], col_ptr[r + 1]):
+                total += col_values[k] * item_weights[col_items[k]]
+            weights[r] = total
+        return weights
+
+
+def build_recipe_matrix(
+    items: Dict[str, Dict],
+    recipes: Dict[str, Dict],
+    rates: Dict[str, RecipeRates]
+) -> RecipeMatrix:
+    """
+    Compile ITEMS / RECIPES into a RecipeMatrix.
+
+    Args:
+        items: Items database
+        recipes: Recipes database
+        rates: Per-machine rate table for the recipes
+
+    Returns:
+        RecipeMatrix
+    """
+    item_ids = list(items)
+    item_index = {item_id: i for i, item_id in enumerate(item_ids)}
+    recipe_ids = list(recipes)
+    recipe_index = {recipe_id: r for r, recipe_id in enumerate(recipe_ids)}
+
+    col_ptr = array("l", [0])
+    col_items = array("l")
+    col_values = array("d")
+    power = array("d")
+    crafting_speed = array("d")
+    tier = array("l")
+    alternate = array("b")
+    machine_type = array("l")
+    machine_types: List[str] = []
+    machine_type_index: Dict[str, int] = {}
+
+    for recipe_id, recipe in recipes.items():
+        recipe_rates = rates[recipe_id]
+        for item_id, rate in recipe_rates.inputs:
+            col_items.append(item_index[item_id])
+            col_values.append(-rate)
+        for item_id, rate in recipe_rates.outputs:
+            col_items.append(item_index[item_id])
+            col_values.append(rate)
+        col_ptr.append(len(col_values))
+
+        power.append(recipe["powerConsumption"])
+        crafting_speed.append(recipe["craftingSpeed"])
+        tier.append(recipe["unlockTier"])
+        alternate.append(1 if recipe["alternateRecipe"] else 0)
+        if recipe["machineType"] not in machine_type_index:
+            machine_type_index[recipe["machineType"]] = len(machine_types)
+            machine_types.append(recipe["machineType"])
+        machine_type.append(machine_type_index[recipe["machineType"]])
+
+    # Transpose CSC -> CSR with a counting sort over item indices
+    counts = [0] * (len(item_ids) + 1)
+    for i in col_items:
+        counts[i + 1] += 1
+    for i in range(len(item_ids)):
+        counts[i + 1] += counts[i]
+    row_ptr = array("l", counts)
+    row_recipes = array("l", [0]) * len(col_items)
+    row_values = array("d", [0.0]) * len(col_items)
+    cursor = counts[:-1]
+    for r in range(len(recipe_ids)):
+        for k in range(col_ptr[r], col_ptr[r + 1]):
+            i = col_items[k]
+            row_recipes[cursor[i]] = r
+            row_values[cursor[i]] = col_values[k]
+            cursor[i] += 1
+
+    return RecipeMatrix(
+        item_ids=item_ids,
+        recipe_ids=recipe_ids,
+        item_index=item_index,
+        recipe_index=recipe_index,
+        col_ptr=col_ptr,
+        col_items=col_items,
+        col_values=col_values,
+        row_ptr=row_ptr,
+        row_recipes=row_recipes,
+        row_values=row_values,
+        power=power,
+        crafting_speed=crafting_speed,
+        tier=tier,
+        alternate=alternate,
+        machine_type=machine_type,
+        machine_types=machine_types,
+        is_raw=array("b", (1 if item["isRawResource"] else 0 for item in items.values())),
+    )
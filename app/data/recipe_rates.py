@@ -0,0 +1,71 @@
+"""
+Per-machine recipe rates (items/min at 100% clock), precomputed once per dataset.
+
+This is the single place the `(amount / craftingSpeed) * 60` conversion is
+done; the solver, objectives and the recipe matrix all read from here.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+
+class RecipeRates(NamedTuple):
+    """Items/min consumed and produced by one machine running a recipe at 100% clock."""
+    inputs: Tuple[Tuple[str, float], ...]   # (item_id, rate) in recipe input order
+    outputs: Tuple[Tuple[str, float], ...]  # (item_id, rate) in recipe output order
+    total_input: float
+    total_output: float
+
+    def output_rate(self, item_id: str) -> Optional[float]:
+        """Get the output rate for an item, or None if the recipe does not produce it."""
+        for output_item_id, rate in self.outputs:
+            if output_item_id == item_id:
+                return rate
+        return None
+
+    def input_rate(self, item_id: str) -> Optional[float]:
+        """Get the input rate for an item, or None if the recipe does not consume it."""
+        for input_item_id, rate in self.inputs:
+            if input_item_id == item_id:
+                return rate
+        return None
+
+
+def per_minute(amount: float, crafting_speed: float) -> float:
+    """Convert an amount per craft into items/min for one machine."""
+    return (amount / crafting_speed) * 60
+
+
+def build_recipe_rates(recipe: Dict) -> RecipeRates:
+    """
+    Compute the per-machine rates of a single recipe.
+
+    Args:
+        recipe: Recipe dictionary
+
+    Returns:
+        RecipeRates
+    """
+    crafting_speed = recipe["craftingSpeed"]
+    return RecipeRates(
+        inputs=tuple(
+            (inp["item"], per_minute(inp["amount"], crafting_speed)) for inp in recipe["inputs"]
+        ),
+        outputs=tuple(
+            (out["item"], per_minute(out["amount"], crafting_speed)) for out in recipe["outputs"]
+        ),
+        total_input=per_minute(sum(inp["amount"] for inp in recipe["inputs"]), crafting_speed),
+        total_output=per_minute(sum(out["amount"] for out in recipe["outputs"]), crafting_speed),
+    )
+
+
+def build_rate_table(recipes: Dict[str, Dict]) -> Dict[str, RecipeRates]:
+    """
+    Compute per-machine rates for every recipe.
+
+    Args:
+        recipes: Recipes database
+
+    Returns:
+        Dict of recipe_id -> RecipeRates
+    """
+    return {recipe_id: build_recipe_rates(recipe) for recipe_id, recipe in recipes.items()}
@@ -0,0 +1,113 @@
+"""
+Immutable record layer over the ITEMS / RECIPES dicts.
+
+Records are NamedTuples: attribute access is a slot lookup instead of a string
+key hash, inputs/outputs are tuples, and every record is hashable and safe to
+share between sessions. The dict form in data/satisfactory_db.py stays the
+canonical schema; records are derived from it once per dataset.
+"""
+
+from typing import Dict, NamedTuple, Optional, Tuple
+
+from data.recipe_rates import RecipeRates, build_recipe_rates
+
+
+class Item(NamedTuple):
+    """Item record (mirrors an ITEMS entry)."""
+    id: str
+    name: str
+    category: str
+    stack_size: int
+    is_raw_resource: bool
+
+
+class RecipeIO(NamedTuple):
+    """One input or output of a recipe, as an amount per craft."""
+    item: str
+    amount: float
+
+
+class Recipe(NamedTuple):
+    """Recipe record (mirrors a RECIPES entry) with its per-machine rates."""
+    id: str
+    name: str
+    category: str
+    unlock_tier: int
+    machine_type: str
+    power_consumption: float
+    crafting_speed: float
+    alternate_recipe: bool
+    inputs: Tuple[RecipeIO, ...]
+    outputs: Tuple[RecipeIO, ...]
+    rates: RecipeRates
+
+
+def item_from_dict(item: Dict) -> Item:
+    """Build an Item record from an ITEMS entry."""
+    return Item(
+        id=item["id"],
+        name=item["name"],
+        category=item["category"],
+        stack_size=item["stackSize"],
+        is_raw_resource=item["isRawResource"],
+    )
+
+
+def recipe_from_dict(recipe: Dict, rates: Optional[RecipeRates] = None) -> Recipe:
+    """Build a Recipe record from a RECIPES entry."""
+    return Recipe(
+        id=recipe["id"],
+        name=recipe["name"],
+        category=recipe["category"],
+        unlock_tier=recipe["unlockTier"],
+        machine_type=recipe["machineType"],
+        power_consumption=recipe["powerConsumption"],
+        crafting_speed=recipe["craftingSpeed"],
+        alternate_recipe=recipe["alternateRecipe"],
+        inputs=tuple(RecipeIO(inp["item"], inp["amount"]) for inp in recipe["inputs"]),
+        outputs=tuple(RecipeIO(out["item"], out["amount"]) for out in recipe["outputs"]),
+        rates=rates if rates is not None else build_recipe_rates(recipe),
+    )
+
+
+def recipe_to_dict(recipe: Recipe) -> Dict:
+    """Convert a Recipe record back to the RECIPES dict schema."""
+    return {
+        "id": recipe.id,
+        "name": recipe.name,
+        "category": recipe.category,
+        "unlockTier": recipe.unlock_tier,
+        "machineType": recipe.machine_type,
+        "powerConsumption": recipe.power_consumption,
+        "craftingSpeed": recipe.crafting_speed,
+        "alternateRecipe": recipe.alternate_recipe,
+        "inputs": [{"item": io.item, "amount": io.amount} for io in recipe.inputs],
+        "outputs": [{"item": io.item, "amount": io.amount} for io in recipe.outputs],
+    }
+
+
+def item_to_dict(item: Item) -> Dict:
+    """Convert an Item record back to the ITEMS dict schema."""
+    return {
+        "id": item.id,
+        "name": item.name,
+        "category": item.category,
+        "stackSize": item.stack_size,
+        "isRawResource": item.is_raw_resource,
+    }
+
+
+def build_item_records(items: Dict[str, Dict]) -> Dict[str, Item]:
+    """Build Item records for every entry of an items database."""
+    return {item_id: item_from_dict(item) for item_id, item in items.items()}
+
+
+def build_recipe_records(
+    recipes: Dict[str, Dict],
+    rates: Dict[str, RecipeRates]
+) -> Dict[str, Recipe]:
+    """Build Recipe records for every entry of a recipes database."""
+    return {
+        recipe_id: recipe_from_dict(recipe, rates[recipe_id])
+        for recipe_id, recipe in recipes.items()
+    }
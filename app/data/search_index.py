@@ -0,0 +1,186 @@
+"""
+Prebuilt search index over item names, recipe names and categories.
+
+Two structures are built once per dataset:
+
+- a prefix trie over lowercase word tokens, so "rein iron" finds
+  "Reinforced Iron Plate" in O(len(query)) trie steps plus a set intersection;
+- a trigram index over whole names for typo-tolerant fuzzy matching
+  ("moter" -> "Motor"), scored by trigram Jaccard similarity.
+
+The UI uses it to show a handful of matches instead of materializing every
+item and recipe as a widget.
+"""
+
+import re
+from typing import Dict, Iterable, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# Minimum trigram similarity for a fuzzy hit
+FUZZY_THRESHOLD = 0.3
+
+
+class SearchHit(NamedTuple):
+    """One search result."""
+    kind: str        # "item" or "recipe"
+    id: str
+    name: str
+    category: str
+    score: float     # higher is better; prefix hits score >= 1.0
+
+
+def _tokens(text: str) -> List[str]:
+    return _TOKEN_RE.findall(text.lower())
+
+
+def _trigrams(text: str) -> Set[str]:
+    padded = f"  {' '.join(_tokens(text))} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class _TrieNode:
+    __slots__ = ("children", "entries")
+
+    def __init__(self):
+        self.children: Dict[str, "_TrieNode"] = {}
+        self.entries: Set[int] = set()  # entries with a token under this prefix
+
+
+class SearchIndex:
+    """Prefix trie + trigram index over (kind, id, name, category) entries."""
+
+    def __init__(self, entries: Iterable[Tuple[str, str, str, str]]):
+        """
+        Build the index.
+
+        Args:
+            entries: (kind, id, name, category) tuples
+        """
+        self.entries: List[Tuple[str, str, str, str]] = list(entries)
+        self._root = _TrieNode()
+        self._trigrams: Dict[str, Set[int]] = {}
+        self._trigram_counts: List[int] = []
+
+        for idx, (_, entry_id, name, category) in enumerate(self.entries):
+            for token in set(_tokens(name)) | set(_tokens(category)) | set(_tokens(entry_id)):
+                node = self._root
+                for char in token:
+                    node = node.children.setdefault(char, _TrieNode())
+                    node.entries.add(idx)
+            grams = _trigrams(name)
+            self._trigram_counts.append(len(grams))
+            for gram in grams:
+                self._trigrams.setdefault(gram, set()).add(idx)
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def _prefix_entries(self, prefix: str) -> Set[int]:
+        node = self._root
+        for char in prefix:
+            node = node.children.get(char)
+            if node is None:
+                return set()
+        return node.entries
+
+    def prefix_search(self, query: str) -> Set[int]:
+        """Entries where every query word is a prefix of one of the entry's words."""
+        words = _tokens(query)
+        if not words:
+            return set()
+        # Intersect smallest sets first
+        candidate_sets = sorted((self._prefix_entries(w) for w in words), key=len)
+        result = set(candidate_sets[0])
+        for entries in candidate_sets[1:]:
+            result &= entries
+            if not result:
+                break
+        return result
+
+    def fuzzy_search(self, query: str) -> Dict[int, float]:
+        """Entries whose name is trigram-similar to the query, with their similarity."""
+        grams = _trigrams(query)
+        if not grams:
+            return {}
+        shared: Dict[int, int] = {}
+        for gram in grams:
+            for idx in self._trigrams.get(gram, ()):
+                shared[idx] = shared.get(idx, 0) + 1
+        scores = {}
+        for idx, count in shared.items():
+            similarity = count / (len(grams) + self._trigram_counts[idx] - count)
+            if similarity >= FUZZY_THRESHOLD:
+                scores[idx] = similarity
+        return scores
+
+    def search(
+        self,
+        query: str,
+        kinds: Optional[Sequence[str]] = None,
+        limit: int = 20
+    ) -> List[SearchHit]:
+        """
+        Search names and categories.
+
+        Prefix hits rank first (exact name, leading words, any name words, then
+        category / ID matches), followed by fuzzy hits.
+
+        Args:
+            query: Free-text query
+            kinds: Restrict to these entry kinds ("item", "recipe")
+            limit: Maximum number of hits
+
+        Returns:
+            Hits sorted by score (descending), then name
+        """
+        query_lower = " ".join(_tokens(query))
+        if not query_lower:
+            return []
+
+        words = query_lower.split()
+        scores: Dict[int, float] = {}
+        for idx in self.prefix_search(query):
+            name_tokens = _tokens(self.entries[idx][2])
+            name_lower = " ".join(name_tokens)
+            if name_lower == query_lower:
+                scores[idx] = 4.0
+            elif name_lower.startswith(query_lower):
+                scores[idx] = 3.0
+            elif all(any(t.startswith(w) for t in name_tokens) for w in words):
+                scores[idx] = 2.0
+            else:
+                # Matched through the category or ID only
+                scores[idx] = 1.0
+        for idx, similarity in self.fuzzy_search(query).items():
+            scores.setdefault(idx, similarity)
+
+        hits = [
+            SearchHit(*self.entries[idx], score=score)
+            for idx, score in scores.items()
+            if kinds is None or self.entries[idx][0] in kinds
+        ]
+        hits.sort(key=lambda hit: (-hit.score, hit.name))
+        return hits[:limit]
+
+
+def build_search_index(items, recipes) -> SearchIndex:
+    """
+    Build a SearchIndex over a dataset's items and recipes.
+
+    Args:
+        items: Items database
+        recipes: Recipes database
+
+    Returns:
+        SearchIndex
+    """
+    entries = [
+        ("item", item_id, item["name"], item["category"])
+        for item_id, item in items.items()
+    ]
+    entries.extend(
+        ("recipe", recipe_id, recipe["name"], recipe["category"])
+        for recipe_id, recipe in recipes.items()
+    )
+    return SearchIndex(entries)
@@ -0,0 +1,148 @@
+"""
+Compiled snapshots of generated data, keyed by the content hash of their source.
+
+A snapshot is a marshal dump of plain Python data (dicts, lists, strings and
+numbers) written next to the package in data/.snapshot/. Loading one is much
+cheaper than executing a multi-thousand-line dict literal, and the content hash
+guarantees a snapshot is only used while its source file is unchanged.
+"""
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+# Bump when the payload layout changes so old snapshots are ignored
+SNAPSHOT_FORMAT = 1
+
+SNAPSHOT_DIR = Path(
+    os.environ.get("SATISFACTORY_SNAPSHOT_DIR", Path(__file__).with_name(".snapshot"))
+)
+
+
+def file_hash(source_path: Path) -> str:
+    """
+    Compute the content hash of a source file.
+
+    Args:
+        source_path: File to hash
+
+    Returns:
+        Hex SHA-256 digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(source_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def snapshot_path(source_path: Path, source_digest: str, name: Optional[str] = None) -> Path:
+    """
+    Get the snapshot file path for a source file and its content hash.
+
+    The interpreter version is part of the name because marshal output is not
+    guaranteed to be portable between Python versions.
+
+    Args:
+        source_path: File the payload is derived from
+        source_digest: Content hash of the source
+        name: Snapshot name (default: the source file stem); lets several
+            payloads derived from one source sit side by side
+    """
+    python_tag = f"py{sys.version_info[0]}{sys.version_info[1]}"
+    name = name or Path(source_path).stem
+    return SNAPSHOT_DIR / f"{name}-{source_digest[:16]}-{python_tag}.marshal"
+
+
+def read_snapshot(path: Path, source_digest: str) -> Optional[Dict[str, Any]]:
+    """
+    Read a snapshot payload.
+
+    Args:
+        path: Snapshot file
+        source_digest: Expected content hash of the source
+
+    Returns:
+        Payload dict, or None if missing, unreadable or stale
+    """
+    try:
+        with open(path, "rb") as f:
+            envelope = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return None
+
+    if not isinstance(envelope, dict):
+        return None
+    if envelope.get("format") != SNAPSHOT_FORMAT or envelope.get("hash") != source_digest:
+        return None
+    return envelope.get("payload")
+
+
+def write_snapshot(path: Path, source_digest: str, payload: Dict[str, Any]) -> bool:
+    """
+    Atomically write a snapshot payload and drop older snapshots of the same source.
+
+    Args:
+        path: Snapshot file
+        source_digest: Content hash of the source
+        payload: Plain data to store
+
+    Returns:
+        True if written, False if the snapshot directory is not writable
+    """
+    envelope = {"format": SNAPSHOT_FORMAT, "hash": source_digest, "payload": payload}
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                marshal.dump(envelope, f)
+            os.replace(tmp_name, path)
+        except BaseException:
+            os.unlink(tmp_name)
+            raise
+    except (OSError, ValueError):
+        return False
+
+    # Stale snapshots of the same source are never read again
+    source_stem, _, python_tag = path.stem.rsplit("-", 2)
+    for old in path.parent.glob(f"{source_stem}-*-{python_tag}.marshal"):
+        if old != path:
+            try:
+                old.unlink()
+            except OSError:
+                pass
+    return True
+
+
+def load_cached(
+    source_path: Path,
+    build: Callable[[], Dict[str, Any]],
+    source_digest: Optional[str] = None,
+    name: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Load a payload from its snapshot, rebuilding it when the source has changed.
+
+    Args:
+        source_path: File the payload is derived from
+        build: Callable that builds the payload from the source
+        source_digest: Precomputed content hash of the source (optional)
+        name: Snapshot name (default: the source file stem)
+
+    Returns:
+        Payload dict
+    """
+    if source_digest is None:
+        source_digest = file_hash(source_path)
+    path = snapshot_path(source_path, source_digest, name)
+
+    payload = read_snapshot(path, source_digest)
+    if payload is None:
+        payload = build()
+        write_snapshot(path, source_digest, payload)
+    return payload
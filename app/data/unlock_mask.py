@@ -0,0 +1,194 @@
+"""
+Canonical bitmask form of unlocked recipe sets.
+
+An UnlockMask packs an unlocked set into a single int (bit r = recipe index r
+in RECIPES order). It behaves like a read-only set of recipe IDs, so it can be
+passed anywhere a `Set[str]` is expected, but comparing and set algebra are
+single int operations and it never needs a defensive copy. It hashes like the
+frozenset of the same IDs (it also compares equal to it); the hash is computed
+once per mask.
+"""
+
+import hashlib
+from collections.abc import Set as AbstractSet
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence
+
+
+class UnlockCodec:
+    """Maps recipe IDs to bit positions for one recipe ordering."""
+
+    def __init__(self, recipe_ids: Sequence[str]):
+        """
+        Initialize the codec.
+
+        Args:
+            recipe_ids: Recipe IDs in index order (bit r = recipe_ids[r])
+        """
+        self.recipe_ids: List[str] = list(recipe_ids)
+        self.recipe_index: Dict[str, int] = {
+            recipe_id: r for r, recipe_id in enumerate(self.recipe_ids)
+        }
+        self.fingerprint = hashlib.sha1(
+            "\n".join(self.recipe_ids).encode("utf-8")
+        ).hexdigest()[:16]
+        self.full_mask = (1 << len(self.recipe_ids)) - 1
+
+    def encode(self, recipe_ids: Iterable[str]) -> "UnlockMask":
+        """
+        Encode recipe IDs as an UnlockMask (unknown IDs are ignored).
+
+        Args:
+            recipe_ids: Iterable of recipe IDs (or an UnlockMask)
+
+        Returns:
+            UnlockMask
+        """
+        if isinstance(recipe_ids, UnlockMask) and recipe_ids.codec is self:
+            return recipe_ids
+        index = self.recipe_index
+        bits = 0
+        for recipe_id in recipe_ids:
+            r = index.get(recipe_id)
+            if r is not None:
+                bits |= 1 << r
+        return UnlockMask(bits, self)
+
+    def from_bits(self, bits: int) -> "UnlockMask":
+        """Wrap a raw int bitset (extra high bits are dropped)."""
+        return UnlockMask(bits & self.full_mask, self)
+
+    def from_hex(self, key: str) -> "UnlockMask":
+        """
+        Decode a key produced by UnlockMask.hex().
+
+        Raises:
+            ValueError: If the key was made for a different recipe ordering
+        """
+        fingerprint, _, bits = key.partition(":")
+        if fingerprint != self.fingerprint:
+            raise ValueError("Unlock mask was encoded for a different recipe database")
+        return self.from_bits(int(bits, 16))
+
+    def none(self) -> "UnlockMask":
+        """Empty unlocked set."""
+        return UnlockMask(0, self)
+
+    def all(self) -> "UnlockMask":
+        """Every recipe unlocked."""
+        return UnlockMask(self.full_mask, self)
+
+
+class UnlockMask(AbstractSet):
+    """Immutable set of unlocked recipe IDs backed by an int bitmask."""
+
+    __slots__ = ("bits", "codec", "_hash_value")
+
+    def __init__(self, bits: int, codec: UnlockCodec):
+        self.bits = bits
+        self.codec = codec
+        self._hash_value: Optional[int] = None
+
+    # Set protocol
+
+    def __contains__(self, recipe_id) -> bool:
+        r = self.codec.recipe_index.get(recipe_id)
+        return r is not None and bool(self.bits >> r & 1)
+
+    def __iter__(self) -> Iterator[str]:
+        bits = self.bits
+        recipe_ids = self.codec.recipe_ids
+        while bits:
+            low = bits & -bits
+            yield recipe_ids[low.bit_length() - 1]
+            bits ^= low
+
+    def __len__(self) -> int:
+        return bin(self.bits).count("1")
+
+    def __bool__(self) -> bool:
+        return self.bits != 0
+
+    # Fast paths for masks of the same codec; anything else goes through Set
+
+    def _coerce(self, other) -> Optional["UnlockMask"]:
+        if isinstance(other, UnlockMask) and other.codec is self.codec:
+            return other
+        return None
+
+    def _operand(self, other) -> "UnlockMask":
+        # Set algebra also accepts raw int bitsets and plain iterables of IDs
+        mask = self._coerce(other)
+        if mask is not None:
+            return mask
+        if isinstance(other, int) and not isinstance(other, bool):
+            return self.codec.from_bits(other)
+        return self.codec.encode(other)
+
+    def _from_iterable(self, recipe_ids: Iterable[str]) -> "UnlockMask":
+        # Used by the Set mixin methods; results stay in this codec
+        return self.codec.encode(recipe_ids)
+
+    def __eq__(self, other) -> bool:
+        mask = self._coerce(other)
+        if mask is not None:
+            return self.bits == mask.bits
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        # Must agree with frozenset hashing, since __eq__ accepts other sets
+        if self._hash_value is None:
+            self._hash_value = self._hash()
+        return self._hash_value
+
+    def __or__(self, other):
+        return UnlockMask(self.bits | self._operand(other).bits, self.codec)
+
+    def __and__(self, other):
+        return UnlockMask(self.bits & self._operand(other).bits, self.codec)
+
+    def __sub__(self, other):
+        return UnlockMask(self.bits & ~self._operand(other).bits, self.codec)
+
+    def __xor__(self, other):
+        return UnlockMask(self.bits ^ self._operand(other).bits, self.codec)
+
+    __ror__ = __or__
+    __rand__ = __and__
+    __rxor__ = __xor__
+
+    def __rsub__(self, other):
+        return UnlockMask(self._operand(other).bits & ~self.bits, self.codec)
+
+    def __le__(self, other) -> bool:
+        mask = self._coerce(other)
+        if mask is not None:
+            return self.bits & ~mask.bits == 0
+        return super().__le__(other)
+
+    def __ge__(self, other) -> bool:
+        mask = self._coerce(other)
+        if mask is not None:
+            return mask.bits & ~self.bits == 0
+        return super().__ge__(other)
+
+    def isdisjoint(self, other) -> bool:
+        mask = self._coerce(other)
+        if mask is not None:
+            return self.bits & mask.bits == 0
+        return super().isdisjoint(other)
+
+    # Conversions
+
+    def __int__(self) -> int:
+        return self.bits
+
+    def hex(self) -> str:
+        """Stable string key: recipe-ordering fingerprint plus the mask in hex."""
+        return f"{self.codec.fingerprint}:{self.bits:x}"
+
+    def to_set(self) -> set:
+        """Get a mutable set of recipe IDs."""
+        return set(self)
+
+    def __repr__(self) -> str:
+        return f"UnlockMask({len(self)} recipes, {self.hex()})"
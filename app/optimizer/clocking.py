@@ -0,0 +1,93 @@
+"""
+Clock-speed stage: turn a fractional machine requirement into clocked machines.
+
+The solvers work out how many machines (at 100% clock) an item needs, e.g.
+2.4 Constructors. Without clocking that is rounded up to 3 machines that
+together overproduce by 25% and draw power for it. This stage instead picks
+clock speeds so the machines make exactly the required rate:
+
+- UNDERCLOCK_EVEN: 3 machines at 80%. The cheapest in power, since power
+  grows faster than linearly with clock speed (see CLOCK_POWER_EXPONENT).
+- UNDERCLOCK_LAST: 2 machines at 100% and one at 40%. Fewer distinct clock
+  settings to configure in game.
+- OVERCLOCK: 1 machine at 240% with 3 power shards. Fewer machines, at the
+  cost of power shards and more power per item.
+
+Clocked machines also consume exactly what the required rate needs, so the
+demand passed upstream shrinks with them. Every solve defaults to NONE; a
+clock mode is only used when the caller asks for one. The mode is a solve
+setting independent of the objective: any objective can be combined with any
+mode, and the app offers one clock selectbox next to the objective rather than
+a mode per objective.
+"""
+
+import math
+from typing import List, NamedTuple
+
+from optimizer.models import ClockMode
+
+MIN_CLOCK_SPEED = 1.0  # percent
+MAX_CLOCK_SPEED = 250.0  # percent, with all power shards
+SHARD_CLOCK_STEP = 50.0  # clock percent unlocked by each power shard above 100%
+CLOCK_DECIMALS = 4  # clock speeds are set in game to 4 decimal places
+
+# Machine counts within this of a whole number are treated as whole
+_EPSILON = 1e-9
+
+
+class ClockGroup(NamedTuple):
+    """Machines of one node that run at the same clock speed."""
+    machines: int
+    clock_speed: float  # percent
+    power_shards: int = 0  # per machine
+
+    @property
+    def runs(self) -> float:
+        """Output of the group in machines at 100% clock."""
+        return self.machines * self.clock_speed / 100.0
+
+
+def shards_for(clock_speed: float) -> int:
+    """Power shards one machine needs to run at a clock speed."""
+    if clock_speed <= 100.0:
+        return 0
+    return math.ceil((clock_speed - 100.0) / SHARD_CLOCK_STEP - _EPSILON)
+
+
+def clock_groups(machines: float, mode: ClockMode) -> List[ClockGroup]:
+    """
+    Split a fractional machine requirement into clocked machine groups.
+
+    Args:
+        machines: Machines needed at 100% clock (> 0)
+        mode: Clock mode
+
+    Returns:
+        One group, or two for UNDERCLOCK_LAST (full machines, then the
+        underclocked one). Clock speeds are rounded up to CLOCK_DECIMALS and
+        clamped to [MIN_CLOCK_SPEED, MAX_CLOCK_SPEED], so output can exceed
+        the requirement by that rounding (or more for tiny requirements).
+    """
+    if mode == ClockMode.NONE:
+        return [ClockGroup(math.ceil(machines), 100.0)]
+
+    if mode == ClockMode.OVERCLOCK:
+        count = max(1, math.ceil(machines * 100.0 / MAX_CLOCK_SPEED - _EPSILON))
+    else:
+        count = max(1, math.ceil(machines - _EPSILON))
+
+    if mode == ClockMode.UNDERCLOCK_LAST and count > 1:
+        last_clock = _settable((machines - (count - 1)) * 100.0)
+        if last_clock == 100.0:
+            return [ClockGroup(count, 100.0)]
+        return [ClockGroup(count - 1, 100.0), ClockGroup(1, last_clock)]
+
+    clock_speed = _settable(machines * 100.0 / count)
+    return [ClockGroup(count, clock_speed, shards_for(clock_speed))]
+
+
+def _settable(clock_speed: float) -> float:
+    """Round a clock speed up to a value the game accepts, within its range."""
+    scale = 10 ** CLOCK_DECIMALS
+    clock_speed = math.ceil(clock_speed * scale - _EPSILON * scale) / scale
+    return min(MAX_CLOCK_SPEED, max(MIN_CLOCK_SPEED, clock_speed))
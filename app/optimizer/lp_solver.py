@@ -0,0 +1,240 @@
+"""
+Linear-programming production chain engine.
+
+Instead of picking one recipe per item and recursing, the whole chain is
+solved at once on the sparse recipe matrix:
+
+    minimize    sum_r cost_r * x_r  +  sum_i raw_cost_i * s_i
+    subject to  sum_r A[i, r] * x_r        >= demand_i   (crafted items)
+                sum_r A[i, r] * x_r + s_i  >= demand_i   (raw resources)
+                x_r >= 0, s_i >= 0
+
+where x_r is the (fractional) number of machines running recipe r, A holds
+items/min per machine (outputs positive, inputs negative) and s_i is the raw
+supply tapped. Byproducts may be in surplus, demand can be split across
+several recipes and recycling loops are solved exactly. Only recipes that can
+appear in the dependency closure of a target enter the model; several
+targets are solved as one factory.
+
+Machine counts in the result are the LP values rounded up to whole machines,
+or clocked to them exactly by the solver's clock mode (see clocking); flows
+are the balanced LP flows.
+"""
+
+from typing import Dict
+
+import pulp
+
+from data.dependency_closure import bit_indices
+from optimizer.clocking import clock_groups
+from optimizer.models import ItemFlow, MachineNode, OptimizationObjective, ProductionChainResult, SolverEngine
+from optimizer.solver import ProductionChainSolver
+
+# Machine counts / rates below this are treated as zero
+_EPSILON = 1e-6
+
+# Weight of the secondary term that keeps the plan free of needless extras
+_TIE_BREAK = 1e-3
+
+
+def recipe_cost(power: float, objective: OptimizationObjective) -> float:
+    """
+    Objective cost of running one machine of a recipe.
+
+    Args:
+        power: Power consumption of one machine (MW)
+        objective: Optimization objective
+
+    Returns:
+        Cost per machine
+    """
+    if objective == OptimizationObjective.MINIMIZE_MACHINES:
+        return 1.0
+    elif objective == OptimizationObjective.MINIMIZE_POWER:
+        return power
+    elif objective == OptimizationObjective.MINIMIZE_WASTE:
+        return _TIE_BREAK
+    else:
+        # Balanced: one machine weighs as much as one MW (see raw_costs)
+        return 1.0 + power
+
+
+class LPProductionChainSolver(ProductionChainSolver):
+    """Production chain solver backed by a linear program over the recipe matrix."""
+
+    engine = SolverEngine.LP
+
+    def _solve_targets(
+        self,
+        targets: Dict[str, float],
+        allow_locked: bool,
+        result: ProductionChainResult
+    ) -> bool:
+        """Solve the chain(s) as one LP and fill nodes / raw requirements."""
+        matrix = self.dataset.get_recipe_matrix()
+        closure = self.dataset.get_dependency_closure()
+        allowed_mask = self.allowed_recipes(allow_locked).bits
+        demand = {matrix.item_index[item_id]: rate for item_id, rate in targets.items()}
+        chain_mask = 0
+        for item_id in targets:
+            chain_mask |= closure.chain_recipes(item_id)
+        recipe_indices = list(bit_indices(chain_mask & allowed_mask))
+
+        # Raw targets outside every recipe's reach are tapped directly
+        crafted = [item_id for item_id in targets if not matrix.is_raw[matrix.item_index[item_id]]]
+        if not recipe_indices and crafted:
+            for item_id in crafted:
+                self._report_missing(item_id, allowed_mask, result)
+            return False
+
+        problem = pulp.LpProblem("production_chain", pulp.LpMinimize)
+        machines = {r: pulp.LpVariable(f"x{r}", lowBound=0) for r in recipe_indices}
+
+        # Net production per item: sum of A[i, r] * x_r over the model's recipes.
+        # An item on both sides of a recipe has two entries in its column;
+        # they are summed here, as LpAffineExpression keeps only the last one
+        net: Dict[int, Dict[int, float]] = {}
+        for r in recipe_indices:
+            for i, rate in matrix.recipe_column(r):
+                coefficients = net.setdefault(i, {})
+                coefficients[r] = coefficients.get(r, 0.0) + rate
+
+        for i in demand:
+            net.setdefault(i, {})
+
+        supply = {}
+        for i, coefficients in net.items():
+            expression = pulp.LpAffineExpression(
+                [(machines[r], rate) for r, rate in coefficients.items()]
+            )
+            if matrix.is_raw[i]:
+                supply[i] = pulp.LpVariable(f"s{i}", lowBound=0)
+                problem += expression + supply[i] >= demand.get(i, 0.0), f"raw_{i}"
+            else:
+                problem += expression >= demand.get(i, 0.0), f"item_{i}"
+
+        raw_weight = 1.0 if self.objective == OptimizationObjective.MINIMIZE_WASTE else _TIE_BREAK
+        problem += (
+            pulp.lpSum(recipe_cost(matrix.power[r], self.objective) * x for r, x in machines.items())
+            + raw_weight * pulp.lpSum(supply.values())
+        )
+
+        problem.solve(pulp.PULP_CBC_CMD(msg=False))
+        if pulp.LpStatus[problem.status] != "Optimal":
+            for item_id in crafted:
+                self._report_missing(item_id, allowed_mask, result)
+            if not result.missing_recipes:
+                result.add_message(
+                    f"{result.target_item_name} is only reachable through recycling loops "
+                    f"with no outside input under the current unlocks."
+                )
+            return False
+
+        counts = {r: x.varValue or 0.0 for r, x in machines.items()}
+        counts = {r: count for r, count in counts.items() if count > _EPSILON}
+
+        # Which item each recipe is run for: its first output (the primary one
+        # in game data) that the plan uses, so byproducts never name a node
+        used = set(demand)
+        for r in counts:
+            for i, rate in matrix.recipe_column(r):
+                if rate < 0:
+                    used.add(i)
+
+        # Nodes in dependency order of the chosen recipes themselves
+        depth = self.dataset.get_depth_table({matrix.recipe_ids[r] for r in counts})
+        planned = []
+        for r, count in counts.items():
+            record = self.dataset.get_recipe_record(matrix.recipe_ids[r])
+            outputs = [item_id for item_id, _ in record.rates.outputs]
+            produced = next(
+                (item_id for item_id in outputs if matrix.item_index[item_id] in used), outputs[0]
+            )
+            planned.append((depth.rank_of(produced), record, produced, count))
+        planned.sort(key=lambda entry: entry[0])
+
+        for _, record, produced, count in planned:
+            # LP noise around whole machines must not add a machine
+            whole = round(count)
+            if abs(count - whole) < _EPSILON:
+                count = float(whole)
+            groups = clock_groups(count, self.clock_mode)
+            runs = sum(group.runs for group in groups)
+            for group in groups:
+                share = count * group.runs / runs  # machines at 100% this group stands for
+                node_id = f"node_{len(self.nodes)}_{produced}"
+                node = MachineNode(
+                    node_id=node_id,
+                    recipe_id=record.id,
+                    recipe_name=record.name,
+                    machine_type=record.machine_type,
+                    item_produced=produced,
+                    item_produced_name=self.items[produced].name,
+                    target_rate=record.rates.output_rate(produced) * share,
+                    machine_count=group.machines,
+                    clock_speed=group.clock_speed,
+                    power_shards=group.power_shards,
+                    power_per_machine=record.power_consumption,
+                    tier=record.unlock_tier,
+                    is_alternate=record.alternate_recipe
+                )
+                for input_item_id, input_rate in record.rates.inputs:
+                    node.inputs.append(ItemFlow(
+                        item_id=input_item_id,
+                        item_name=self.items[input_item_id].name,
+                        rate=input_rate * share
+                    ))
+                for output_item_id, output_rate in record.rates.outputs:
+                    node.outputs.append(ItemFlow(
+                        item_id=output_item_id,
+                        item_name=self.items[output_item_id].name,
+                        rate=output_rate * share
+                    ))
+                    # Byproducts can feed other nodes too
+                    self.item_production.setdefault(output_item_id, []).append(node_id)
+                self.nodes.append(node)
+
+        for i, variable in supply.items():
+            amount = variable.varValue or 0.0
+            if amount > _EPSILON:
+                self.raw_requirements[matrix.item_ids[i]] = amount
+
+        # Only loops among the recipes the LP runs carry flow around a cycle
+        chain_components = self.dataset.get_component_analysis({node.recipe_id for node in self.nodes})
+        loops = [
+            self.items[item_id].name
+            for item_id in {node.item_produced for node in self.nodes}
+            if chain_components.in_loop(item_id)
+        ]
+        if loops:
+            result.add_message(f"Recycling loops balanced by the LP: {', '.join(sorted(loops))}")
+        return True
+
+    def _report_missing(self, target_item_id: str, allowed_mask: int, result: ProductionChainResult):
+        """Record items reachable through allowed recipes that have no allowed producer."""
+        closure = self.dataset.get_dependency_closure()
+        producers_of = {}
+        for r in range(len(closure.recipe_ids)):
+            for i in bit_indices(closure.recipe_outputs[r]):
+                producers_of.setdefault(i, []).append(r)
+
+        start = closure.item_index[target_item_id]
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            i = frontier.pop()
+            if closure.raw_mask >> i & 1:
+                continue
+            allowed = [r for r in producers_of.get(i, ()) if allowed_mask >> r & 1]
+            if not allowed:
+                item_id = closure.item_ids[i]
+                recipe_names = [recipe.name for recipe in self.dataset.get_recipe_records_for_item(item_id)]
+                result.add_missing_recipe(
+                    f"{self.items[item_id].name} (options: {', '.join(recipe_names)})"
+                )
+                continue
+            for r in allowed:
+                for j in bit_indices(closure.recipe_inputs[r]):
+                    if j not in seen:
+                        seen.add(j)
+                        frontier.append(j)
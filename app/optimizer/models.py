@@ -3,9 +3,13 @@ Data models for the production chain optimizer.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Optional, Set
+import math
+from typing import AbstractSet, List, Dict, Optional, Set
 from enum import Enum
 
+# Power draw grows with clock speed as (clock / 100) ** exponent (2.5x clock = 3.36x power)
+CLOCK_POWER_EXPONENT = math.log2(2.5)
+
 
 class OptimizationObjective(Enum):
     """Optimization priorities."""
@@ -15,6 +19,20 @@ class OptimizationObjective(Enum):
     BALANCED = "balanced"
 
 
+class SolverEngine(Enum):
+    """Algorithm used to build the production chain."""
+    GREEDY = "greedy"  # best-scored recipe per item, recursively
+    LP = "lp"          # linear program over the recipe matrix
+
+
+class ClockMode(Enum):
+    """How machines are clocked once their count is known."""
+    NONE = "none"                        # whole machines at 100%, output rounded up
+    UNDERCLOCK_EVEN = "underclock_even"  # all machines slowed evenly to the exact rate
+    UNDERCLOCK_LAST = "underclock_last"  # machines at 100%, the last one slowed
+    OVERCLOCK = "overclock"              # fewer machines, sped up with power shards
+
+
 class CalculationStatus(Enum):
     """Status of the calculation."""
     SUCCESS = "success"
@@ -45,6 +63,7 @@ class MachineNode:
     target_rate: float  # items/min output
     machine_count: int  # whole machines only (1, 2, 3, ...)
     clock_speed: float = 100.0  # percentage (100 = normal speed)
+    power_shards: int = 0  # per machine, for clock speeds above 100
     
     # Resource consumption
     power_per_machine: float = 0.0
@@ -58,9 +77,19 @@ class MachineNode:
     tier: int = 0
     is_alternate: bool = False
     
+    # Multi-target results: target item_id -> items/min of item_produced used for it
+    output_by_target: Dict[str, float] = field(default_factory=dict)
+    
     def __post_init__(self):
-        """Calculate total power."""
-        self.total_power = self.power_per_machine * self.machine_count * (self.clock_speed / 100.0)
+        """Calculate total power (non-linear in clock speed, as in game)."""
+        self.total_power = self.power_per_machine * self.machine_count * clock_power_factor(self.clock_speed)
+
+
+def clock_power_factor(clock_speed: float) -> float:
+    """Power draw of a machine at a clock speed, relative to 100%."""
+    if clock_speed == 100.0:
+        return 1.0
+    return (clock_speed / 100.0) ** CLOCK_POWER_EXPONENT
 
 
 @dataclass
@@ -88,7 +117,8 @@ class ProductionChainResult:
     """Result of a production chain calculation."""
     status: CalculationStatus
     
-    # Target information
+    # Target information (multi-target results: first target's ID, all
+    # names joined and the total rate; see targets)
     target_item_id: str
     target_item_name: str
     target_rate: float
@@ -101,6 +131,7 @@ class ProductionChainResult:
     # Summary statistics
     total_machines: int = 0
     total_power: float = 0.0
+    total_power_shards: int = 0
     total_raw_resources: int = 0
     
     # Messages and warnings
@@ -108,11 +139,23 @@ class ProductionChainResult:
     missing_recipes: List[str] = field(default_factory=list)
     warnings: List[str] = field(default_factory=list)
     
+    # Multi-target results: target item_id -> items/min (empty for one target)
+    targets: Dict[str, float] = field(default_factory=dict)
+    
     # Metadata
-    unlocked_recipes: Set[str] = field(default_factory=set)
+    unlocked_recipes: AbstractSet[str] = frozenset()  # Immutable (UnlockMask when solved), shared not copied
     optimization_objective: OptimizationObjective = OptimizationObjective.BALANCED
     timestamp: Optional[str] = None
     
+    # Solver settings, checked before the result is re-solved incrementally
+    engine: SolverEngine = SolverEngine.GREEDY
+    chain_aware_scoring: bool = False
+    clock_mode: ClockMode = ClockMode.NONE
+    dataset_name: Optional[str] = None
+    
+    # Greedy results: item_id -> rate its recipe was scored at (cached subchains are not scored)
+    choice_rates: Dict[str, float] = field(default_factory=dict)
+    
     def add_message(self, message: str):
         """Add a message."""
         self.messages.append(message)
@@ -130,6 +173,7 @@ class ProductionChainResult:
         """Calculate summary statistics."""
         self.total_machines = sum(node.machine_count for node in self.nodes)
         self.total_power = sum(node.total_power for node in self.nodes)
+        self.total_power_shards = sum(node.power_shards * node.machine_count for node in self.nodes)
         self.total_raw_resources = len(self.raw_resources)
 
 
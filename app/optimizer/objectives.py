@@ -2,12 +2,27 @@
 Optimization objective scoring functions.
 """
 
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List, Optional, Union
+from data import satisfactory_db
+from data.records import Recipe, recipe_from_dict
 from optimizer.models import OptimizationObjective
 
+if TYPE_CHECKING:
+    from optimizer.raw_costs import RawCostTable
+
+
+def _as_record(recipe: Union[Recipe, Dict]) -> Recipe:
+    """Accept a Recipe record or a RECIPES dict (kept for compatibility)."""
+    if isinstance(recipe, Recipe):
+        return recipe
+    record = satisfactory_db.get_recipe_record(recipe["id"])
+    if record is None or satisfactory_db.get_recipe_by_id(recipe["id"]) is not recipe:
+        record = recipe_from_dict(recipe)
+    return record
+
 
 def score_recipe(
-    recipe: Dict,
+    recipe: Union[Recipe, Dict],
     objective: OptimizationObjective,
     target_rate: float
 ) -> float:
@@ -16,7 +31,7 @@ def score_recipe(
     Higher score = better choice.
     
     Args:
-        recipe: Recipe dictionary from database
+        recipe: Recipe record (or dictionary) from database
         objective: Optimization objective
         target_rate: Target production rate (items/min)
     
@@ -24,12 +39,12 @@ def score_recipe(
         Score (higher is better)
     """
     # Base calculations
-    crafting_speed = recipe["craftingSpeed"]
-    power = recipe["powerConsumption"]
+    recipe = _as_record(recipe)
+    rates = recipe.rates
+    power = recipe.power_consumption
     
-    # Calculate output rate per machine
-    output_amount = sum(output["amount"] for output in recipe["outputs"])
-    output_rate_per_machine = (output_amount / crafting_speed) * 60  # items per minute
+    # Output rate per machine (items per minute)
+    output_rate_per_machine = rates.total_output
     
     # Calculate machines needed
     machines_needed = target_rate / output_rate_per_machine if output_rate_per_machine > 0 else float('inf')
@@ -38,12 +53,12 @@ def score_recipe(
     total_power = machines_needed * power
     
     # Calculate input complexity (number of input types)
-    input_complexity = len(recipe["inputs"])
+    input_complexity = len(recipe.inputs)
     
     # Calculate total input resources needed
     total_input_rate = sum(
-        (inp["amount"] / crafting_speed) * 60 * machines_needed
-        for inp in recipe["inputs"]
+        input_rate * machines_needed
+        for _, input_rate in rates.inputs
     )
     
     # Scoring based on objective
@@ -79,8 +94,8 @@ def score_recipe(
 
 
 def compare_recipes(
-    recipe1: Dict,
-    recipe2: Dict,
+    recipe1: Union[Recipe, Dict],
+    recipe2: Union[Recipe, Dict],
     objective: OptimizationObjective,
     target_rate: float
 ) -> int:
@@ -108,12 +123,14 @@ def compare_recipes(
 
 
 def select_best_recipe(
-    recipes: List[Dict],
+    recipes: List[Union[Recipe, Dict]],
     objective: OptimizationObjective,
     target_rate: float,
     unlocked_only: bool = True,
-    unlocked_recipes: set = None
-) -> Dict:
+    unlocked_recipes: set = None,
+    item_id: Optional[str] = None,
+    raw_costs: Optional["RawCostTable"] = None
+) -> Union[Recipe, Dict]:
     """
     Select the best recipe from a list based on objective.
     
@@ -122,17 +139,20 @@ def select_best_recipe(
         objective: Optimization objective
         target_rate: Target production rate
         unlocked_only: If True, only consider unlocked recipes
-        unlocked_recipes: Set of unlocked recipe IDs
+        unlocked_recipes: Set of unlocked recipe IDs; empty means none is
+            unlocked, None means no filter
+        item_id: Item the recipes are chosen for (required with raw_costs)
+        raw_costs: If given, rank by whole-chain cost instead of score_recipe
     
     Returns:
-        Best recipe (or first recipe if no unlocked recipes found)
+        Best recipe, or None if no unlocked recipe is found
     """
     if not recipes:
         return None
     
     # Filter for unlocked recipes if needed
-    if unlocked_only and unlocked_recipes:
-        available_recipes = [r for r in recipes if r["id"] in unlocked_recipes]
+    if unlocked_only and unlocked_recipes is not None:
+        available_recipes = [r for r in recipes if _as_record(r).id in unlocked_recipes]
         if not available_recipes:
             # No unlocked recipes available, return None
             return None
@@ -143,10 +163,16 @@ def select_best_recipe(
         return None
     
     # Score all recipes
-    scored_recipes = [
-        (recipe, score_recipe(recipe, objective, target_rate))
-        for recipe in available_recipes
-    ]
+    if raw_costs is not None:
+        scored_recipes = [
+            (recipe, raw_costs.recipe_score(_as_record(recipe), item_id))
+            for recipe in available_recipes
+        ]
+    else:
+        scored_recipes = [
+            (recipe, score_recipe(recipe, objective, target_rate))
+            for recipe in available_recipes
+        ]
     
     # Sort by score (descending)
     scored_recipes.sort(key=lambda x: x[1], reverse=True)
@@ -156,7 +182,7 @@ def select_best_recipe(
 
 
 def get_recipe_variants(
-    recipes: List[Dict],
+    recipes: List[Union[Recipe, Dict]],
     objective: OptimizationObjective,
     target_rate: float,
     unlocked_recipes: set = None,
@@ -180,7 +206,7 @@ def get_recipe_variants(
     
     # Filter for unlocked recipes
     if unlocked_recipes:
-        available_recipes = [r for r in recipes if r["id"] in unlocked_recipes]
+        available_recipes = [r for r in recipes if _as_record(r).id in unlocked_recipes]
     else:
         available_recipes = recipes
     
@@ -200,22 +226,21 @@ def get_recipe_variants(
     return scored_recipes[:max_variants]
 
 
-def calculate_recipe_efficiency(recipe: Dict) -> float:
+def calculate_recipe_efficiency(recipe: Union[Recipe, Dict]) -> float:
     """
     Calculate overall efficiency of a recipe.
     
     Args:
-        recipe: Recipe dictionary
+        recipe: Recipe record (or dictionary)
     
     Returns:
         Efficiency score (higher is better)
     """
-    crafting_speed = recipe["craftingSpeed"]
-    power = recipe["powerConsumption"]
+    recipe = _as_record(recipe)
+    power = recipe.power_consumption
     
-    # Calculate output per minute
-    output_amount = sum(output["amount"] for output in recipe["outputs"])
-    output_rate = (output_amount / crafting_speed) * 60
+    # Output per minute
+    output_rate = recipe.rates.total_output
     
     # Calculate efficiency: output per power per minute
     if power > 0:
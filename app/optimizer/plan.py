@@ -0,0 +1,418 @@
+"""
+Compiled production plans.
+
+Once the greedy solver has chosen a recipe for every item of a chain, the
+rest of the work - summing demand, rounding up to whole machines, building
+nodes and connections - no longer needs any recipe search. A ProductionPlan
+keeps those recipe choices in dependency order together with the per-machine
+rates of each step, so the same recipe choices can be realized at another
+target rate in O(steps + input edges):
+
+    plan = compile_production_plan("motor", 10.0, unlocked)
+    result = plan.scale(25.0)
+
+Machine counts are re-rounded at every rate exactly as the solver does, so
+`plan.scale(rate)` gives the same nodes as a solve that makes the same recipe
+choices. Recipe choices are fixed at compile time: unless the plan is
+rate_free (chain-aware scoring, power and waste objectives), a full solve
+at another rate may score recipes differently. The plan's clock_mode decides
+how machine counts are rounded and clocked (see optimizer/clocking.py).
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import AbstractSet, Dict, List, Mapping, NamedTuple, Optional, Tuple
+
+from data.components import ComponentAnalysis
+from data.records import Item, Recipe
+from optimizer.clocking import ClockGroup, clock_groups
+from optimizer.models import (
+    MachineNode, Connection, RawResourceRequirement, ProductionChainResult,
+    ItemFlow, OptimizationObjective, CalculationStatus, ClockMode
+)
+
+
+class PlanStep(NamedTuple):
+    """One item of a compiled chain."""
+    item_id: str
+    recipe: Optional[Recipe]  # None for raw resources
+    output_rate: float  # items/min of item_id per machine (0 for raw resources)
+    demand_inputs: Tuple[Tuple[str, float], ...]  # (input item, items/min per machine), loop edges left out
+    resolved: bool = True  # False if an input of the chain cannot be made
+
+
+def raw_target_message(item: Item, rate: float) -> str:
+    """Message shown when the target itself is a raw resource."""
+    return f"{item.name} is a raw resource. Required: {rate:.2f}/min"
+
+
+def connect_nodes(
+    nodes: List[MachineNode],
+    item_production: Dict[str, List[str]],
+    components: ComponentAnalysis
+) -> List[Connection]:
+    """
+    Build the connections between producer and consumer nodes.
+
+    An input made by several nodes is split between them in proportion to
+    their output of it.
+
+    Args:
+        nodes: Machine nodes of the chain
+        item_production: item_id -> IDs of the nodes producing it
+        components: Loop analysis of the chain's own recipes, used to flag
+            recycling connections
+
+    Returns:
+        List of connections
+    """
+    connections: List[Connection] = []
+
+    # Output of each producer node per item, to split inputs between producers
+    produced: Dict[Tuple[str, str], float] = {}
+    for node in nodes:
+        for output_flow in node.outputs:
+            produced[(node.node_id, output_flow.item_id)] = output_flow.rate
+
+    for node in nodes:
+        for input_flow in node.inputs:
+            # Find nodes that produce this input
+            if input_flow.item_id in item_production:
+                producer_ids = item_production[input_flow.item_id]
+                total = sum(produced.get((p, input_flow.item_id), 0.0) for p in producer_ids)
+                for producer_node_id in producer_ids:
+                    share = (
+                        produced.get((producer_node_id, input_flow.item_id), 0.0) / total
+                        if len(producer_ids) > 1 and total > 0 else 1.0
+                    )
+                    connections.append(Connection(
+                        connection_id=f"conn_{len(connections)}",
+                        from_node_id=producer_node_id,
+                        to_node_id=node.node_id,
+                        item_id=input_flow.item_id,
+                        item_name=input_flow.item_name,
+                        rate=input_flow.rate * share,
+                        is_recycling_loop=components.is_loop_edge(
+                            input_flow.item_id, node.item_produced
+                        )
+                    ))
+    return connections
+
+
+def split_by_target(
+    nodes: List[MachineNode],
+    connections: List[Connection],
+    targets: Mapping[str, float]
+):
+    """
+    Fill each node's output_by_target for a multi-target result.
+
+    Walks the nodes consumers first and hands every node's main output to
+    the targets in the proportions its consumers serve them, scaled so the
+    shares add up to the node's target_rate.
+    Recycling-loop connections point back up the chain, so they are only
+    followed for nodes that no plain connection reaches; those nodes take
+    their shares from their loop consumers once these are known. Byproduct
+    flows are not followed.
+
+    Args:
+        nodes: Machine nodes
+        connections: Connections between the nodes
+        targets: Target item_id -> items/min
+    """
+    outgoing: Dict[str, List[Connection]] = {}
+    looped: Dict[str, List[Connection]] = {}
+    for connection in connections:
+        edges = looped if connection.is_recycling_loop else outgoing
+        edges.setdefault(connection.from_node_id, []).append(connection)
+
+    # Target demand served by each node making a target item, by output share
+    produced: Dict[str, float] = {}
+    for node in nodes:
+        if node.item_produced in targets:
+            produced[node.item_produced] = produced.get(node.item_produced, 0.0) + node.target_rate
+
+    by_node: Dict[str, MachineNode] = {node.node_id: node for node in nodes}
+
+    def shares_of(node: MachineNode, edges: List[Connection]) -> Dict[str, float]:
+        shares: Dict[str, float] = {}
+        if node.item_produced in targets and produced[node.item_produced] > 0:
+            shares[node.item_produced] = (
+                targets[node.item_produced] * node.target_rate / produced[node.item_produced]
+            )
+        for connection in edges:
+            if connection.item_id != node.item_produced:
+                continue
+            consumer = by_node[connection.to_node_id].output_by_target
+            served = sum(consumer.values())
+            if served <= 0:
+                continue
+            for target_id, rate in consumer.items():
+                shares[target_id] = shares.get(target_id, 0.0) + connection.rate * rate / served
+        total = sum(shares.values())
+        if total <= 0:
+            return {}
+        return {target_id: rate * node.target_rate / total for target_id, rate in shares.items()}
+
+    # Consumers first, along the main-output connections that carry shares.
+    # Cycles among them are flagged as loops, except through raw items (water
+    # made as a byproduct); nodes left on such a cycle go last
+    waiting_on = {node.node_id: 0 for node in nodes}
+    producers: Dict[str, List[str]] = {}
+    for edges in outgoing.values():
+        for connection in edges:
+            if connection.item_id == by_node[connection.from_node_id].item_produced:
+                waiting_on[connection.from_node_id] += 1
+                producers.setdefault(connection.to_node_id, []).append(connection.from_node_id)
+    order = [node for node in reversed(nodes) if waiting_on[node.node_id] == 0]
+    for node in order:
+        for producer_id in producers.get(node.node_id, ()):
+            waiting_on[producer_id] -= 1
+            if waiting_on[producer_id] == 0:
+                order.append(by_node[producer_id])
+    ordered = {node.node_id for node in order}
+    order.extend(node for node in reversed(nodes) if node.node_id not in ordered)
+
+    for node in order:
+        node.output_by_target = shares_of(node, outgoing.get(node.node_id, []))
+
+    # Nodes fed back only through loops, each round reaching one step further
+    pending = [node for node in order if not node.output_by_target and node.node_id in looped]
+    while pending:
+        waiting = []
+        for node in pending:
+            shares = shares_of(node, outgoing.get(node.node_id, []) + looped[node.node_id])
+            if shares:
+                node.output_by_target = shares
+            else:
+                waiting.append(node)
+        if len(waiting) == len(pending):
+            break
+        pending = waiting
+
+
+def chain_depths(nodes: List[MachineNode], connections: List[Connection]) -> Dict[str, int]:
+    """
+    Longest path from raw resources to each node, over the chain's own connections.
+
+    A node fed only by raw resources has depth 1. Recycling-loop connections
+    are not followed, and a cycle through a raw byproduct is cut where the
+    walk meets it, so every node gets a depth.
+
+    Args:
+        nodes: Machine nodes
+        connections: Connections between the nodes
+
+    Returns:
+        node_id -> depth
+    """
+    producers: Dict[str, List[str]] = {}
+    for connection in connections:
+        if not connection.is_recycling_loop and connection.from_node_id != connection.to_node_id:
+            producers.setdefault(connection.to_node_id, []).append(connection.from_node_id)
+
+    depth: Dict[str, int] = {}
+    for node in nodes:
+        if node.node_id in depth:
+            continue
+        # Iterative depth-first walk: chains can be deeper than the recursion limit
+        active = {node.node_id}
+        stack = [(node.node_id, iter(producers.get(node.node_id, ())))]
+        while stack:
+            node_id, pending = stack[-1]
+            for producer_id in pending:
+                if producer_id not in depth and producer_id not in active:
+                    active.add(producer_id)
+                    stack.append((producer_id, iter(producers.get(producer_id, ()))))
+                    break
+            else:
+                stack.pop()
+                active.discard(node_id)
+                depth[node_id] = 1 + max(
+                    (depth[p] for p in producers.get(node_id, ()) if p in depth), default=0
+                )
+    return depth
+
+
+@dataclass
+class ProductionPlan:
+    """Recipe choices of a solved chain, ready to be realized at other rates."""
+    target_item_id: str
+    target_item_name: str
+    objective: OptimizationObjective
+    unlocked_recipes: AbstractSet[str]
+    items: Mapping[str, Item]
+    components: ComponentAnalysis  # loops among the plan's own recipes
+
+    # Chain items in dependency order (inputs before their consumers)
+    steps: List[PlanStep]
+
+    # Multi-target plans: target item_id -> fraction of the total rate
+    target_mix: Dict[str, float] = field(default_factory=dict)
+
+    # How machine counts are clocked; recipe choices do not depend on it
+    clock_mode: ClockMode = ClockMode.NONE
+
+    # Recipe choices would be the same at any rate, so scale() matches a solve
+    rate_free: bool = False
+
+    # Settings of the solve, carried into every scaled result
+    chain_aware_scoring: bool = False
+    dataset_name: Optional[str] = None
+
+    # item_id -> rate its recipe was scored at (see ProductionChainResult)
+    choice_rates: Dict[str, float] = field(default_factory=dict)
+
+    # Outcome of the solve the plan was compiled from (rate independent)
+    status: CalculationStatus = CalculationStatus.SUCCESS
+    messages: List[str] = field(default_factory=list)
+    warnings: List[str] = field(default_factory=list)
+    missing_recipes: List[str] = field(default_factory=list)
+
+    def target_rates(self, target_rate: float) -> Dict[str, float]:
+        """Rate of every target when the plan runs at a (total) target rate."""
+        if not self.target_mix:
+            return {self.target_item_id: target_rate}
+        return {item_id: share * target_rate for item_id, share in self.target_mix.items()}
+
+    def size(self, target_rate: float) -> Tuple[Dict[str, float], Dict[str, List[ClockGroup]]]:
+        """
+        Total demand and clocked machines per item at a target rate.
+
+        Steps are walked consumers first, so every demand is final when read.
+        Inputs are demanded for what the clocked machines actually run.
+
+        Args:
+            target_rate: Desired production rate of the target, or the total
+                of all targets for a multi-target plan (items/min)
+
+        Returns:
+            (item_id -> items/min demanded, item_id -> clocked machine groups)
+        """
+        demand: Dict[str, float] = self.target_rates(target_rate)
+        machines: Dict[str, List[ClockGroup]] = {}
+        for step in reversed(self.steps):
+            rate = demand.get(step.item_id, 0.0)
+            if step.recipe is None or rate <= 0:
+                continue
+            groups = clock_groups(rate / step.output_rate, self.clock_mode)
+            machines[step.item_id] = groups
+            runs = sum(group.runs for group in groups)
+            for input_item_id, input_rate_per_machine in step.demand_inputs:
+                demand[input_item_id] = demand.get(input_item_id, 0.0) + input_rate_per_machine * runs
+        return demand, machines
+
+    def build(
+        self,
+        target_rate: float
+    ) -> Tuple[List[MachineNode], Dict[str, List[str]], Dict[str, float]]:
+        """
+        Build the nodes of every chain item, sized for its total demand.
+
+        An item gets one node per clock group (two for ClockMode.UNDERCLOCK_LAST
+        when the last machine is slowed), each with its share of the demand.
+
+        Args:
+            target_rate: Desired production rate (total for multi-target plans)
+
+        Returns:
+            (nodes, item_id -> producing node IDs, raw item_id -> items/min)
+        """
+        demand, machines = self.size(target_rate)
+        nodes: List[MachineNode] = []
+        item_production: Dict[str, List[str]] = {}
+        raw_requirements: Dict[str, float] = {}
+
+        for step in self.steps:
+            item_id = step.item_id
+            if step.recipe is None:
+                if demand.get(item_id, 0.0) > 0:
+                    raw_requirements[item_id] = demand[item_id]
+                continue
+            if item_id not in machines or not step.resolved:
+                continue
+
+            recipe = step.recipe
+            groups = machines[item_id]
+            runs = sum(group.runs for group in groups)
+            for group in groups:
+                node_id = f"node_{len(nodes)}_{item_id}"
+                node = MachineNode(
+                    node_id=node_id,
+                    recipe_id=recipe.id,
+                    recipe_name=recipe.name,
+                    machine_type=recipe.machine_type,
+                    item_produced=item_id,
+                    item_produced_name=self.items[item_id].name,
+                    target_rate=demand[item_id] * (group.runs / runs),
+                    machine_count=group.machines,
+                    clock_speed=group.clock_speed,
+                    power_shards=group.power_shards,
+                    power_per_machine=recipe.power_consumption,
+                    tier=recipe.unlock_tier,
+                    is_alternate=recipe.alternate_recipe
+                )
+                for input_item_id, input_rate_per_machine in recipe.rates.inputs:
+                    node.inputs.append(ItemFlow(
+                        item_id=input_item_id,
+                        item_name=self.items[input_item_id].name,
+                        rate=input_rate_per_machine * group.runs
+                    ))
+                for output_item_id, output_rate_per_machine in recipe.rates.outputs:
+                    node.outputs.append(ItemFlow(
+                        item_id=output_item_id,
+                        item_name=self.items[output_item_id].name,
+                        rate=output_rate_per_machine * group.runs
+                    ))
+
+                nodes.append(node)
+                item_production.setdefault(item_id, []).append(node_id)
+
+        return nodes, item_production, raw_requirements
+
+    def scale(self, target_rate: float) -> ProductionChainResult:
+        """
+        Realize the plan at a target rate without solving again.
+
+        Args:
+            target_rate: Desired production rate (total for multi-target plans)
+
+        Returns:
+            ProductionChainResult, including connections
+        """
+        result = ProductionChainResult(
+            status=self.status,
+            target_item_id=self.target_item_id,
+            target_item_name=self.target_item_name,
+            target_rate=target_rate,
+            unlocked_recipes=self.unlocked_recipes,
+            optimization_objective=self.objective,
+            chain_aware_scoring=self.chain_aware_scoring,
+            clock_mode=self.clock_mode,
+            dataset_name=self.dataset_name,
+            choice_rates=dict(self.choice_rates),
+            messages=list(self.messages),
+            warnings=list(self.warnings),
+            missing_recipes=list(self.missing_recipes),
+            timestamp=datetime.now().isoformat()
+        )
+        target_item = self.items[self.target_item_id]
+        if target_item.is_raw_resource and not self.target_mix:
+            result.add_message(raw_target_message(target_item, target_rate))
+
+        nodes, item_production, raw_requirements = self.build(target_rate)
+        result.nodes = nodes
+        result.connections = connect_nodes(nodes, item_production, self.components)
+        result.raw_resources = [
+            RawResourceRequirement(
+                item_id=item_id,
+                item_name=self.items[item_id].name,
+                rate=rate
+            )
+            for item_id, rate in raw_requirements.items()
+        ]
+        if self.target_mix:
+            result.targets = self.target_rates(target_rate)
+            split_by_target(result.nodes, result.connections, result.targets)
+        result.calculate_summary()
+        return result
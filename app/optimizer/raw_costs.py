@@ -0,0 +1,307 @@
+"""
+Precomputed minimum raw-resource cost of every item.
+
+For one dataset, unlocked set and objective, each item gets the cheapest
+objective cost per unit (item/min) of output over its whole chain, together
+with the raw-resource vector of that cheapest chain. With the table built,
+estimating a target is a dictionary lookup and recipes can be ranked by the
+cost of everything below them instead of one level deep (see score_recipe).
+
+Costs are computed by dynamic programming in dependency order. Recycling
+loops (rubber / plastic, packaging, ...) are handled by repeating the sweep
+until no cost improves, so an item can take its cheapest route through a loop.
+"""
+
+import math
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import AbstractSet, Dict, List, Optional, Tuple
+
+from data.dataset import Dataset
+from data.records import Recipe
+from optimizer.models import OptimizationObjective
+
+# Relative improvement below which a cost is considered converged
+_TOLERANCE = 1e-9
+
+# Number of (dataset, unlocked set, objective) tables kept in memory
+TABLE_CACHE_SIZE = 32
+
+
+def recipe_local_cost(recipe: Recipe, item_id: str, objective: OptimizationObjective) -> float:
+    """
+    Objective cost of the recipe's own machines per item/min of one output.
+
+    Raw-resource usage is accounted for by the raw items themselves, so the
+    local cost of MINIMIZE_WASTE is zero.
+
+    Args:
+        recipe: Recipe record
+        item_id: Output item the cost is charged to
+        objective: Optimization objective
+
+    Returns:
+        Cost per item/min (math.inf if the recipe does not produce the item)
+    """
+    output_rate = recipe.rates.output_rate(item_id)
+    if not output_rate:
+        return math.inf
+    machines = 1.0 / output_rate
+    power = recipe.power_consumption * machines
+
+    if objective == OptimizationObjective.MINIMIZE_MACHINES:
+        return machines
+    elif objective == OptimizationObjective.MINIMIZE_POWER:
+        return power
+    elif objective == OptimizationObjective.MINIMIZE_WASTE:
+        return 0.0
+    else:
+        # Balanced: one machine weighs as much as one MW, as in score_recipe
+        return machines + power
+
+
+def _raw_unit_cost(objective: OptimizationObjective) -> float:
+    # Only the waste objective charges for raw resources themselves
+    return 1.0 if objective == OptimizationObjective.MINIMIZE_WASTE else 0.0
+
+
+@dataclass
+class RawCostTable:
+    """Cheapest per-unit chain cost and raw-resource vector of every item."""
+    objective: OptimizationObjective
+    unlocked_recipes: AbstractSet[str]
+
+    # item_id -> objective cost per item/min (math.inf if not buildable)
+    costs: Dict[str, float]
+
+    # item_id -> {raw item_id: items/min per item/min of output}
+    raw_vectors: Dict[str, Dict[str, float]]
+
+    # item_id -> recipe ID of the cheapest chain (absent for raw / unbuildable)
+    best_recipes: Dict[str, str]
+
+    def cost(self, item_id: str) -> float:
+        """Objective cost per item/min of an item (math.inf if not buildable)."""
+        return self.costs.get(item_id, math.inf)
+
+    def is_buildable(self, item_id: str) -> bool:
+        """Check whether the item has a finite-cost chain."""
+        return self.cost(item_id) < math.inf
+
+    def best_recipe(self, item_id: str) -> Optional[str]:
+        """Recipe ID that starts the cheapest chain of an item."""
+        return self.best_recipes.get(item_id)
+
+    def estimate(self, item_id: str, rate: float) -> Dict[str, float]:
+        """
+        Raw resources needed for an item at a given rate, ignoring machine rounding.
+
+        Args:
+            item_id: Target item
+            rate: Target rate (items/min)
+
+        Returns:
+            Dictionary of raw item_id -> items/min (empty if not buildable)
+        """
+        return {
+            raw_id: amount * rate
+            for raw_id, amount in self.raw_vectors.get(item_id, {}).items()
+        }
+
+    def estimate_cost(self, item_id: str, rate: float) -> float:
+        """Objective cost of producing an item at a given rate."""
+        return self.cost(item_id) * rate
+
+    def recipe_cost(self, recipe: Recipe, item_id: str) -> float:
+        """
+        Chain cost per item/min of an item when made with a given recipe.
+
+        Args:
+            recipe: Recipe record producing the item
+            item_id: Output item
+
+        Returns:
+            Cost per item/min (math.inf if any input is not buildable)
+        """
+        output_rate = recipe.rates.output_rate(item_id)
+        if not output_rate:
+            return math.inf
+        cost = recipe_local_cost(recipe, item_id, self.objective)
+        for input_id, input_rate in recipe.rates.inputs:
+            cost += input_rate / output_rate * self.cost(input_id)
+        return cost
+
+    def recipe_score(self, recipe: Recipe, item_id: str) -> float:
+        """Chain-aware recipe score (higher is better), for use like score_recipe."""
+        cost = self.recipe_cost(recipe, item_id)
+        return 1000.0 / (cost + 1) if cost < math.inf else -math.inf
+
+
+def _dependency_order(dataset: Dataset, recipes: List[Recipe]) -> List[str]:
+    """Items ordered so that, outside of loops, inputs come before outputs."""
+    inputs_of: Dict[str, List[str]] = {}
+    for recipe in recipes:
+        for output_id, _ in recipe.rates.outputs:
+            inputs_of.setdefault(output_id, []).extend(
+                input_id for input_id, _ in recipe.rates.inputs
+            )
+
+    order: List[str] = []
+    visited = set()
+    for root in dataset.get_item_records():
+        if root in visited:
+            continue
+        visited.add(root)
+        # Iterative post-order DFS
+        stack: List[Tuple[str, int]] = [(root, 0)]
+        while stack:
+            item_id, position = stack[-1]
+            children = inputs_of.get(item_id, ())
+            if position < len(children):
+                stack[-1] = (item_id, position + 1)
+                child = children[position]
+                if child not in visited:
+                    visited.add(child)
+                    stack.append((child, 0))
+            else:
+                stack.pop()
+                order.append(item_id)
+    return order
+
+
+def build_raw_cost_table(
+    dataset: Dataset,
+    unlocked_recipes: AbstractSet[str],
+    objective: OptimizationObjective
+) -> RawCostTable:
+    """
+    Compute the cheapest chain cost and raw-resource vector of every item.
+
+    Args:
+        dataset: Game dataset
+        unlocked_recipes: Recipes that may be used
+        objective: Optimization objective the costs are measured in
+
+    Returns:
+        RawCostTable
+    """
+    items = dataset.get_item_records()
+    recipe_records = dataset.get_recipe_records()
+    recipes = [recipe_records[recipe_id] for recipe_id in unlocked_recipes if recipe_id in recipe_records]
+    order = _dependency_order(dataset, recipes)
+
+    costs: Dict[str, float] = {}
+    raw_vectors: Dict[str, Dict[str, float]] = {}
+    best_recipes: Dict[str, str] = {}
+
+    raw_cost = _raw_unit_cost(objective)
+    for item_id, item in items.items():
+        if item.is_raw_resource:
+            costs[item_id] = raw_cost
+            raw_vectors[item_id] = {item_id: 1.0}
+        else:
+            costs[item_id] = math.inf
+
+    producers: Dict[str, List[Recipe]] = {}
+    for recipe in recipes:
+        for output_id, _ in recipe.rates.outputs:
+            producers.setdefault(output_id, []).append(recipe)
+
+    # One sweep settles every acyclic item; loops need further sweeps. Each
+    # sweep that changes something improves at least one item, and a chain
+    # can pass through each item at most once, so len(order) + 1 sweeps bound
+    # the search for the best loop-free route.
+    for _ in range(len(order) + 1):
+        changed = False
+        for item_id in order:
+            if items[item_id].is_raw_resource:
+                continue
+            best_cost = costs[item_id]
+            best_recipe = None
+            for recipe in producers.get(item_id, ()):
+                output_rate = recipe.rates.output_rate(item_id)
+                cost = recipe_local_cost(recipe, item_id, objective)
+                for input_id, input_rate in recipe.rates.inputs:
+                    cost += input_rate / output_rate * costs.get(input_id, math.inf)
+                if cost < best_cost * (1 - _TOLERANCE):
+                    best_cost = cost
+                    best_recipe = recipe
+            if best_recipe is not None:
+                costs[item_id] = best_cost
+                best_recipes[item_id] = best_recipe.id
+                changed = True
+        if not changed:
+            break
+
+    # Raw vectors follow the cheapest recipe of every buildable item; inside
+    # loops they are swept to a fixpoint the same way as the costs
+    for _ in range(len(order) + 1):
+        changed = False
+        for item_id in order:
+            recipe_id = best_recipes.get(item_id)
+            if recipe_id is None:
+                continue
+            recipe = recipe_records[recipe_id]
+            output_rate = recipe.rates.output_rate(item_id)
+            vector: Dict[str, float] = {}
+            for input_id, input_rate in recipe.rates.inputs:
+                for raw_id, amount in raw_vectors.get(input_id, {}).items():
+                    vector[raw_id] = vector.get(raw_id, 0.0) + input_rate / output_rate * amount
+            previous = raw_vectors.get(item_id)
+            if previous is None or any(
+                abs(amount - previous.get(raw_id, 0.0)) > _TOLERANCE * max(amount, 1.0)
+                for raw_id, amount in vector.items()
+            ):
+                changed = True
+            raw_vectors[item_id] = vector
+        if not changed:
+            break
+
+    return RawCostTable(
+        objective=objective,
+        unlocked_recipes=unlocked_recipes,
+        costs=costs,
+        raw_vectors=raw_vectors,
+        best_recipes=best_recipes,
+    )
+
+
+_TABLE_CACHE: "OrderedDict[tuple, RawCostTable]" = OrderedDict()
+_TABLE_CACHE_LOCK = threading.Lock()
+
+
+def get_raw_cost_table(
+    dataset: Dataset,
+    unlocked_recipes: AbstractSet[str],
+    objective: OptimizationObjective
+) -> RawCostTable:
+    """
+    Get the raw cost table for an unlocked set and objective, building it on first use.
+
+    Tables are cached per (dataset, unlocked bitmask, objective); the least
+    recently used ones are dropped beyond TABLE_CACHE_SIZE.
+
+    Args:
+        dataset: Game dataset
+        unlocked_recipes: Unlocked recipe IDs (or an UnlockMask)
+        objective: Optimization objective
+
+    Returns:
+        RawCostTable
+    """
+    mask = dataset.encode_unlocked(unlocked_recipes)
+    key = (dataset, mask.bits, objective)
+    with _TABLE_CACHE_LOCK:
+        table = _TABLE_CACHE.get(key)
+        if table is not None:
+            _TABLE_CACHE.move_to_end(key)
+            return table
+
+    table = build_raw_cost_table(dataset, mask, objective)
+    with _TABLE_CACHE_LOCK:
+        _TABLE_CACHE[key] = table
+        _TABLE_CACHE.move_to_end(key)
+        while len(_TABLE_CACHE) > TABLE_CACHE_SIZE:
+            _TABLE_CACHE.popitem(last=False)
+    return table
@@ -2,25 +2,181 @@
 Production chain solver - core algorithm for computing optimal production chains.
 """
 
-from typing import Dict, List, Set, Optional, Tuple
+from typing import Callable, Dict, Iterable, List, Mapping, NamedTuple, Set, Optional, Tuple, Union
+from collections import OrderedDict
 from datetime import datetime
-import uuid
+import math
+import threading
 
 from data import satisfactory_db
+from data.components import ComponentAnalysis
+from data.dataset import Dataset
+from data.records import Recipe
+from data.unlock_mask import UnlockMask
 from optimizer.models import (
     MachineNode, Connection, RawResourceRequirement, ProductionChainResult,
-    ItemFlow, OptimizationObjective, CalculationStatus
+    OptimizationObjective, CalculationStatus, SolverEngine, ClockMode
 )
 from optimizer.objectives import select_best_recipe
+from optimizer.plan import PlanStep, ProductionPlan, connect_nodes, raw_target_message, split_by_target
+from optimizer.raw_costs import RawCostTable, get_raw_cost_table
+
+
+# Number of solved subchains kept by SUBCHAIN_CACHE
+SUBCHAIN_CACHE_SIZE = 1024
+
+# Objectives whose score_recipe ranking does not depend on the rate an item
+# is needed at. Only with these (or chain-aware scoring) is a subchain's
+# recipe choice the same wherever it is reached, so only then is it memoized
+# or kept across unlock changes at any rate.
+_RATE_FREE_OBJECTIVES = frozenset({
+    OptimizationObjective.MINIMIZE_POWER,
+    OptimizationObjective.MINIMIZE_WASTE,
+})
+
+
+class SubchainEntry(NamedTuple):
+    """Phase 1 outcome for one item and everything below it, rate free."""
+    steps: Tuple[PlanStep, ...]  # dependency order, the item itself last
+    loop_edges: Tuple[Tuple[str, str], ...]  # (consumer item, input item)
+    events: Tuple[Tuple[Optional[str], str, str], ...]  # (consumer item, kind, text)
+    success: bool
+
+
+class CacheStats(NamedTuple):
+    """Hit / miss counters of a SubchainCache."""
+    hits: int
+    misses: int
+    size: int
+    max_size: int
+    
+    @property
+    def hit_rate(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+class SubchainCache:
+    """
+    Bounded, thread-safe LRU cache of solved subchains.
+    
+    Keys are (dataset token, item, relevant-unlock bitmask, objective,
+    chain-aware scoring, allow locked). The bitmask is the unlocked set
+    narrowed to the item's dependency closure
+    (DependencyClosure.relevant_unlocks), so unlocking recipes elsewhere in
+    the tree does not miss. Keys hold Dataset.token rather than the dataset,
+    so the cache never keeps a dataset alive; entries of an unregistered
+    version are dropped (see satisfactory_db.on_unregister).
+    
+    Entries hold the recipe chosen for each item of the subchain, not sized
+    subchains; rates are applied when the chain is sized (phase 2), so one
+    entry serves every rate. Solvers whose objective ranks recipes by rate
+    (see _RATE_FREE_OBJECTIVES) bypass the cache.
+    """
+    
+    def __init__(self, max_size: int = SUBCHAIN_CACHE_SIZE):
+        self.max_size = max_size
+        self._entries: "OrderedDict[tuple, SubchainEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+    
+    def __len__(self) -> int:
+        return len(self._entries)
+    
+    def get(self, key: tuple) -> Optional[SubchainEntry]:
+        """Look up a subchain, counting the hit or miss."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self._misses += 1
+                return None
+            self._hits += 1
+            self._entries.move_to_end(key)
+            return entry
+    
+    def put(self, key: tuple, entry: SubchainEntry):
+        """Store a subchain, dropping the least recently used beyond max_size."""
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+    
+    def invalidate(self, dataset: Optional[Dataset] = None, item_id: Optional[str] = None) -> int:
+        """
+        Drop cached subchains.
+        
+        Args:
+            dataset: Only drop subchains of this dataset (default: any)
+            item_id: Only drop subchains that contain this item (default: any)
+        
+        Returns:
+            Number of entries dropped
+        """
+        with self._lock:
+            stale = [
+                key for key, entry in self._entries.items()
+                if (dataset is None or key[0] == dataset.token)
+                and (item_id is None or any(step.item_id == item_id for step in entry.steps))
+            ]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+    
+    def stats(self) -> CacheStats:
+        """Current hit / miss counters and size."""
+        with self._lock:
+            return CacheStats(self._hits, self._misses, len(self._entries), self.max_size)
+    
+    def reset_stats(self):
+        """Zero the hit / miss counters."""
+        with self._lock:
+            self._hits = 0
+            self._misses = 0
+
+
+# Shared by every solver (and session) in the process
+SUBCHAIN_CACHE = SubchainCache()
+satisfactory_db.on_unregister(SUBCHAIN_CACHE.invalidate)
+
+
+class _ChainFrame:
+    """An item whose inputs are being visited in phase 1."""
+    
+    __slots__ = (
+        "item_id", "recipe", "machines", "next_input", "success",
+        "entry", "low", "order_start", "loop_start", "event_start"
+    )
+    
+    def __init__(self, item_id: str, recipe: Recipe, machines: int, entry: int):
+        self.item_id = item_id
+        self.recipe = recipe
+        self.machines = machines
+        self.next_input = 0
+        self.success = True
+        # Visit number, and the lowest visit number the subtree refers to:
+        # the subtree is self-contained (cacheable) if low >= entry
+        self.entry = entry
+        self.low = entry
+        self.order_start = 0
+        self.loop_start = 0
+        self.event_start = 0
 
 
 class ProductionChainSolver:
     """Solves production chains for Satisfactory items."""
     
+    engine = SolverEngine.GREEDY
+    
     def __init__(
         self,
         unlocked_recipes: Set[str],
-        objective: OptimizationObjective = OptimizationObjective.BALANCED
+        objective: OptimizationObjective = OptimizationObjective.BALANCED,
+        dataset: Optional[Dataset] = None,
+        chain_aware_scoring: bool = False,
+        memoize: bool = True,
+        clock_mode: ClockMode = ClockMode.NONE
     ):
         """
         Initialize the solver.
@@ -28,21 +184,202 @@ class ProductionChainSolver:
         Args:
             unlocked_recipes: Set of unlocked recipe IDs
             objective: Optimization objective
+            dataset: Game dataset to solve against (default: base dataset)
+            chain_aware_scoring: Rank recipes by the precomputed cost of their
+                whole chain instead of scoring one level deep
+            memoize: Reuse subchains from SUBCHAIN_CACHE where recipe choices
+                do not depend on rates (chain-aware scoring, power and waste
+                objectives)
+            clock_mode: How machines are clocked to the exact rate (default:
+                whole machines at 100%, see clocking)
         """
-        self.unlocked_recipes = unlocked_recipes
+        self.dataset = dataset if dataset is not None else satisfactory_db.get_dataset()
+        # Immutable bitmask form: shared by every result, never copied. An
+        # empty set unlocks nothing; see allowed_recipes()
+        self.unlocked_recipes = self.dataset.encode_unlocked(unlocked_recipes)
         self.objective = objective
-        self.all_items = satisfactory_db.get_all_items()
-        self.all_recipes = satisfactory_db.get_all_recipes()
-        self.raw_resources = satisfactory_db.get_raw_resources()
+        self.clock_mode = clock_mode
+        self.all_items = self.dataset.get_all_items()
+        self.all_recipes = self.dataset.get_all_recipes()
+        self.raw_resources = self.dataset.get_raw_resources()
+        self.items = self.dataset.get_item_records()
+        self.chain_aware_scoring = chain_aware_scoring
+        # Recipe choices do not depend on the rate an item is reached at
+        self.rate_free = chain_aware_scoring or objective in _RATE_FREE_OBJECTIVES
+        self.raw_costs: Optional[RawCostTable] = None
+        self.components: Optional[ComponentAnalysis] = None  # SCCs of the item graph
         
         # State tracking
         self.nodes: List[MachineNode] = []
         self.connections: List[Connection] = []
         self.raw_requirements: Dict[str, float] = {}  # item_id -> rate
         self.item_production: Dict[str, List[str]] = {}  # item_id -> [node_ids producing it]
-        self.visited_items: Set[str] = set()  # For cycle detection
-        self.processing_stack: List[str] = []  # For cycle detection
+        self.visited_items: Set[str] = set()  # Items whose recipe is already chosen
+        self.processing_stack: Set[str] = set()  # Items being expanded, for cycle detection
+        
+        # Phase 1 output: chosen recipe per item, items in dependency order
+        # (inputs before consumers) and input edges that close a loop
+        self.recipe_choices: Dict[str, Recipe] = {}
+        self.chain_order: List[str] = []
+        self.loop_edges: Set[Tuple[str, str]] = set()  # (consumer item, input item)
+        self.unresolved_items: Set[str] = set()  # chosen, but an input cannot be made
+        self.choice_rates: Dict[str, float] = {}  # item_id -> rate its recipe was scored at
+        self.plan: Optional[ProductionPlan] = None  # Phase 2 input, reusable at other rates
+        # item_id -> (recipe kept from a previous result, rate it holds at; None: any rate)
+        self.pinned_recipes: Dict[str, Tuple[Recipe, Optional[float]]] = {}
+        
+        # Subchain memoization (see SubchainCache)
+        self.subchain_cache: Optional[SubchainCache] = (
+            SUBCHAIN_CACHE
+            if memoize and self.rate_free
+            else None
+        )
+        self._cache_mask = 0  # Unlocked bitmask the cache keys are narrowed from
+        self._entry_of: Dict[str, int] = {}  # item_id -> visit number
+        self._loop_log: List[Tuple[str, str]] = []  # loop_edges in discovery order
+        self._events: List[Tuple[Optional[str], str, str]] = []  # reported (consumer, kind, text)
+        
+    def reuse_choices(
+        self,
+        previous: ProductionChainResult,
+        added_recipes: Iterable[str] = (),
+        removed_recipes: Iterable[str] = (),
+        allow_locked: bool = False
+    ) -> Set[str]:
+        """
+        Keep the recipe choices of a previous result that an unlock change cannot affect.
+        
+        With score_recipe an item's choice only depends on its own producers
+        and the rate it is scored at, so only the outputs of the added or
+        removed recipes are dirty. Every other item keeps its recipe: under
+        the power and waste objectives at any rate, under the rate-dependent
+        ones (balanced, minimize machines) as long as the next solve reaches
+        it at the rate it was scored at before; otherwise it is scored again.
+        With chain-aware scoring any recipe in an item's dependency closure
+        can change its cost, so the closure bitsets decide instead.
+        
+        Args:
+            previous: Result solved before the change
+            added_recipes: Recipe IDs unlocked since
+            removed_recipes: Recipe IDs locked since
+            allow_locked: The next solve allows locked recipes
+        
+        Returns:
+            IDs of the previous chain's items that are chosen again
+        
+        Raises:
+            ValueError: If the previous result was solved with other settings
+        """
+        self._check_previous(previous)
+        changed = set(added_recipes) | set(removed_recipes)
+        self.pinned_recipes = {}
+        
+        # Only items whose nodes all run one recipe carry one recipe choice
+        chosen: Dict[str, str] = {}
+        shared: Set[str] = set()
+        for node in previous.nodes:
+            if chosen.get(node.item_produced, node.recipe_id) != node.recipe_id:
+                shared.add(node.item_produced)
+            chosen[node.item_produced] = node.recipe_id
+        
+        if self.chain_aware_scoring:
+            closure = self.dataset.get_dependency_closure()
+            changed_mask = closure.recipe_mask(changed)
+            dirty = {
+                item_id for item_id in chosen
+                if closure.chain_recipes(item_id) & changed_mask
+            }
+        else:
+            dirty = set()
+            for recipe_id in changed:
+                recipe = self.dataset.get_recipe_record(recipe_id)
+                if recipe is None:
+                    continue
+                dirty.update(
+                    output_item_id for output_item_id, _ in recipe.rates.outputs
+                    if output_item_id in chosen
+                )
+        
+        # Nothing carries over a change to or from an empty unlocked set
+        # (results exported by older versions solved an empty set with
+        # every recipe)
+        if not (previous.unlocked_recipes and self.unlocked_recipes):
+            return set(chosen)
+        
+        for item_id, recipe_id in chosen.items():
+            if item_id in dirty or item_id in shared:
+                continue
+            if self.rate_free:
+                rate = None
+            elif item_id in previous.choice_rates:
+                rate = previous.choice_rates[item_id]
+            else:
+                continue
+            recipe = self.dataset.get_recipe_record(recipe_id)
+            if recipe is not None and recipe_id in self.allowed_recipes(allow_locked):
+                self.pinned_recipes[item_id] = (recipe, rate)
+        return dirty
+    
+    def _check_previous(self, previous: ProductionChainResult):
+        """Raise if a previous result was solved with settings other than this solver's."""
+        if previous.engine != self.engine:
+            raise ValueError(
+                f"Cannot reuse a {previous.engine.value} result with the {self.engine.value} engine"
+            )
+        mismatched = [
+            setting for setting, ours, theirs in (
+                ("dataset", self.dataset.name, previous.dataset_name),
+                ("objective", self.objective, previous.optimization_objective),
+                ("chain-aware scoring", self.chain_aware_scoring, previous.chain_aware_scoring),
+                ("clock mode", self.clock_mode, previous.clock_mode),
+            )
+            if ours != theirs
+        ]
+        if mismatched:
+            raise ValueError(f"Previous result was solved with a different {', '.join(mismatched)}")
+    
+    def allowed_recipes(self, allow_locked: bool = False) -> UnlockMask:
+        """
+        Get the recipes a solve may use.
+        
+        Every engine and every derived table (raw costs, components, cache
+        keys, recipe selection) goes through here, so they agree: an empty
+        unlocked set means no recipe is available, and only allow_locked
+        opens up every recipe.
+        
+        Args:
+            allow_locked: Use every recipe instead of the unlocked ones
+        
+        Returns:
+            UnlockMask
+        """
+        return self.dataset.get_unlock_codec().all() if allow_locked else self.unlocked_recipes
+    
+    def get_raw_costs(self, allow_locked: bool = False) -> RawCostTable:
+        """
+        Get the precomputed minimum raw cost table for this solver's unlocks and objective.
+        
+        Args:
+            allow_locked: Use every recipe instead of the unlocked ones
         
+        Returns:
+            RawCostTable
+        """
+        return get_raw_cost_table(self.dataset, self.allowed_recipes(allow_locked), self.objective)
+    
+    def estimate_raw_resources(self, item_id: str, rate: float) -> Dict[str, float]:
+        """
+        Instant raw-resource estimate for an item, ignoring machine rounding.
+        
+        Args:
+            item_id: Target item
+            rate: Target rate (items/min)
+        
+        Returns:
+            Dictionary of raw item_id -> items/min (empty if not buildable)
+        """
+        return self.get_raw_costs().estimate(item_id, rate)
+    
     def solve(
         self,
         target_item_id: str,
@@ -61,74 +398,148 @@ class ProductionChainSolver:
             ProductionChainResult with the solution
         """
         # Initialize result
-        target_item = self.all_items.get(target_item_id)
+        target_item = self.items.get(target_item_id)
         if not target_item:
-            result = ProductionChainResult(
+            result = self._new_result(
                 status=CalculationStatus.IMPOSSIBLE_RATE,
                 target_item_id=target_item_id,
                 target_item_name="Unknown",
-                target_rate=target_rate,
-                optimization_objective=self.objective
+                target_rate=target_rate
             )
             result.add_message(f"Item '{target_item_id}' not found in database.")
             return result
         
-        result = ProductionChainResult(
+        result = self._new_result(
             status=CalculationStatus.SUCCESS,
             target_item_id=target_item_id,
-            target_item_name=target_item["name"],
+            target_item_name=target_item.name,
             target_rate=target_rate,
-            unlocked_recipes=self.unlocked_recipes.copy(),
-            optimization_objective=self.objective,
+            unlocked_recipes=self.unlocked_recipes,
             timestamp=datetime.now().isoformat()
         )
         
         # Check if target is a raw resource
-        if target_item["isRawResource"]:
+        if target_item.is_raw_resource:
             self.raw_requirements[target_item_id] = target_rate
             result.raw_resources.append(RawResourceRequirement(
                 item_id=target_item_id,
-                item_name=target_item["name"],
+                item_name=target_item.name,
                 rate=target_rate
             ))
-            result.add_message(f"{target_item['name']} is a raw resource. Required: {target_rate:.2f}/min")
+            result.add_message(raw_target_message(target_item, target_rate))
             result.calculate_summary()
             return result
         
-        # Reset state
+        self._reset(allow_locked_preview)
+        
+        # Build production chain
+        success = self._solve_targets({target_item_id: target_rate}, allow_locked_preview, result)
+        self._finish_result(result, success)
+        return result
+    
+    def solve_targets(
+        self,
+        targets: Mapping[str, float],
+        allow_locked_preview: bool = False
+    ) -> ProductionChainResult:
+        """
+        Solve one factory for several target items at once.
+        
+        Intermediates shared by the targets get one recipe choice and one
+        node sized for their total demand, so rounding is not repeated per
+        target. Each node's output_by_target tells how much of its output
+        goes to each target (filled once connections are built, see
+        calculate_factory).
+        
+        Args:
+            targets: Target item_id -> desired production rate (items/min)
+            allow_locked_preview: If True, temporarily enable locked recipes for preview
+        
+        Returns:
+            One combined ProductionChainResult; its target fields hold the
+            first target's ID, the joined names and the total rate
+        """
+        targets = dict(targets)
+        unknown = [item_id for item_id in targets if item_id not in self.items]
+        names = " + ".join(
+            self.items[item_id].name if item_id in self.items else "Unknown" for item_id in targets
+        )
+        result = self._new_result(
+            status=CalculationStatus.SUCCESS,
+            target_item_id=next(iter(targets), ""),
+            target_item_name=names,
+            target_rate=sum(targets.values()),
+            targets=targets,
+            unlocked_recipes=self.unlocked_recipes,
+            timestamp=datetime.now().isoformat()
+        )
+        if unknown or not targets:
+            result.status = CalculationStatus.IMPOSSIBLE_RATE
+            for item_id in unknown:
+                result.add_message(f"Item '{item_id}' not found in database.")
+            if not targets:
+                result.add_message("No target items given.")
+            return result
+        
+        self._reset(allow_locked_preview)
+        success = self._solve_targets(targets, allow_locked_preview, result)
+        self._finish_result(result, success)
+        return result
+    
+    def _new_result(self, **fields) -> ProductionChainResult:
+        """A result carrying this solver's settings."""
+        return ProductionChainResult(
+            optimization_objective=self.objective,
+            engine=self.engine,
+            chain_aware_scoring=self.chain_aware_scoring,
+            clock_mode=self.clock_mode,
+            dataset_name=self.dataset.name,
+            **fields
+        )
+    
+    def _reset(self, allow_locked: bool):
+        """Clear the state of a previous solve."""
         self.nodes = []
         self.connections = []
         self.raw_requirements = {}
         self.item_production = {}
         self.visited_items = set()
-        self.processing_stack = []
-        
-        # Recursively build production chain
-        success = self._build_chain(
-            item_id=target_item_id,
-            required_rate=target_rate,
-            allow_locked=allow_locked_preview,
-            result=result
-        )
-        
+        self.processing_stack = set()
+        self.recipe_choices = {}
+        self.chain_order = []
+        self.loop_edges = set()
+        self.unresolved_items = set()
+        self.choice_rates = {}
+        self.plan = None
+        self._entry_of = {}
+        self._loop_log = []
+        self._events = []
+        allowed = self.allowed_recipes(allow_locked)
+        self._cache_mask = allowed.bits
+        self.raw_costs = self.get_raw_costs(allow_locked) if self.chain_aware_scoring else None
+        self.components = self.dataset.get_component_analysis(allowed)
+    
+    def _finish_result(self, result: ProductionChainResult, success: bool):
+        """Set the final status and copy nodes / raw requirements into the result."""
         if not success:
             if result.missing_recipes:
                 result.status = CalculationStatus.INSUFFICIENT_RECIPES
                 result.add_message(
-                    f"Cannot produce {target_item['name']} - missing recipes. "
+                    f"Cannot produce {result.target_item_name} - missing recipes. "
                     f"Unlock the following: {', '.join(result.missing_recipes)}"
                 )
             else:
                 result.status = CalculationStatus.IMPOSSIBLE_RATE
-                result.add_message(f"Cannot produce {target_item['name']} at the requested rate.")
+                result.add_message(f"Cannot produce {result.target_item_name} at the requested rate.")
         
         # Build result
         result.nodes = self.nodes
+        result.choice_rates = dict(self.choice_rates)
         result.connections = self.connections
         result.raw_resources = [
             RawResourceRequirement(
                 item_id=item_id,
-                item_name=self.all_items[item_id]["name"],
+                item_name=self.items[item_id].name,
                 rate=rate
             )
             for item_id, rate in self.raw_requirements.items()
@@ -136,8 +547,43 @@ class ProductionChainSolver:
         
         # Calculate summary
         result.calculate_summary()
+    
+    def _solve_targets(
+        self,
+        targets: Dict[str, float],
+        allow_locked: bool,
+        result: ProductionChainResult
+    ) -> bool:
+        """
+        Fill nodes, item_production and raw_requirements for the targets.
         
-        return result
+        The greedy engine works in two phases: _build_chain picks a recipe for
+        every item in the chains of all targets, then _aggregate_demand sums
+        the demand of all consumers of each item in dependency order, so every
+        item gets one node sized for its total demand. Engines other than the
+        greedy recursion override this step; result assembly and connections
+        are shared.
+        
+        Args:
+            targets: Item to produce -> desired production rate (items/min);
+                a single target is never a raw resource
+            allow_locked: Allow locked recipes
+            result: Result object to add messages, warnings and missing recipes to
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        success = True
+        for target_item_id, target_rate in targets.items():
+            if not self._build_chain(
+                item_id=target_item_id,
+                required_rate=target_rate,
+                allow_locked=allow_locked,
+                result=result
+            ):
+                success = False
+        self._aggregate_demand(targets, result)
+        return success
     
     def _build_chain(
         self,
@@ -147,172 +593,351 @@ class ProductionChainSolver:
         result: ProductionChainResult
     ) -> bool:
         """
-        Recursively build production chain for an item.
+        Choose a recipe for an item and everything it needs (phase 1).
+        
+        Depth-first over recipe inputs with an explicit stack, so deep or
+        modded chains are not bound by Python's recursion limit. Recipes are
+        scored at the rate of the first branch that reaches an item; rates
+        are not accumulated here.
         
         Args:
             item_id: Item to produce
-            required_rate: Required production rate
+            required_rate: Rate used to score candidate recipes
             allow_locked: Allow locked recipes
             result: Result object to populate
         
         Returns:
             True if successful, False otherwise
         """
-        item = self.all_items.get(item_id)
-        if not item:
-            return False
+        entered = self._enter_item(item_id, required_rate, None, allow_locked, result)
+        if not isinstance(entered, _ChainFrame):
+            return entered
+        
+        stack = [entered]
+        while True:
+            frame = stack[-1]
+            inputs = frame.recipe.rates.inputs
+            if frame.next_input < len(inputs):
+                # Choose recipes for all inputs, so every missing recipe is reported
+                input_item_id, input_rate_per_machine = inputs[frame.next_input]
+                frame.next_input += 1
+                entered = self._enter_item(
+                    input_item_id,
+                    input_rate_per_machine * frame.machines,
+                    frame,
+                    allow_locked,
+                    result
+                )
+                if isinstance(entered, _ChainFrame):
+                    stack.append(entered)
+                    continue
+                success = entered
+            else:
+                stack.pop()
+                success = self._finish_item(frame, allow_locked)
+                if not stack:
+                    return success
+                stack[-1].low = min(stack[-1].low, frame.low)
+                frame = stack[-1]
+            
+            if not success and not allow_locked:
+                frame.success = False
+    
+    def _enter_item(
+        self,
+        item_id: str,
+        required_rate: float,
+        consumer: Optional[_ChainFrame],
+        allow_locked: bool,
+        result: ProductionChainResult
+    ) -> Union[bool, _ChainFrame]:
+        """
+        Visit an item in phase 1 and choose its recipe.
+        
+        Args:
+            item_id: Item to produce
+            required_rate: Rate used to score candidate recipes
+            consumer: Frame whose inputs are being visited (None for the target)
+            allow_locked: Allow locked recipes
+            result: Result object to populate
+        
+        Returns:
+            True / False if the item is settled right away (including a cached
+            subchain), otherwise a frame whose inputs still have to be visited
+        """
+        # Item IDs come from a verified dataset (see data/integrity.py)
+        item = self.items[item_id]
+        consumer_id = consumer.item_id if consumer is not None else None
         
         # Check for circular dependency
         if item_id in self.processing_stack:
             # Circular dependency detected - mark as recycling loop
-            result.add_warning(f"Circular dependency detected for {item['name']} - recycling loop")
+            self._report(consumer_id, "warning", f"Circular dependency detected for {item.name} - recycling loop", result)
+            self.loop_edges.add((consumer_id, item_id))
+            self._loop_log.append((consumer_id, item_id))
+            self._refer(consumer, item_id)
             return True  # Don't fail, just mark it
         
-        # If already processed, just ensure we have enough production
+        # If already chosen, its demand is aggregated in phase 2
         if item_id in self.visited_items:
-            return True
-        
-        # Mark as being processed
-        self.processing_stack.append(item_id)
+            self._refer(consumer, item_id)
+            return item_id not in self.unresolved_items
         
-        # If it's a raw resource, add to requirements
-        if item["isRawResource"]:
-            if item_id not in self.raw_requirements:
-                self.raw_requirements[item_id] = 0
-            self.raw_requirements[item_id] += required_rate
-            self.processing_stack.remove(item_id)
+        # Raw resources are leaves
+        if item.is_raw_resource:
+            self._entry_of[item_id] = len(self._entry_of)
+            self.visited_items.add(item_id)
+            self.chain_order.append(item_id)
             return True
         
-        # Find recipes that produce this item
-        producing_recipes = satisfactory_db.get_recipes_for_item(item_id)
-        if not producing_recipes:
-            result.add_message(f"No recipes found for {item['name']}")
-            self.processing_stack.remove(item_id)
-            return False
-        
-        # Select best recipe
-        unlocked_set = None if allow_locked else self.unlocked_recipes
-        best_recipe = select_best_recipe(
-            recipes=producing_recipes,
-            objective=self.objective,
-            target_rate=required_rate,
-            unlocked_only=not allow_locked,
-            unlocked_recipes=unlocked_set
-        )
+        # Reuse a cached subchain unless it runs back into the current path
+        if self.subchain_cache is not None:
+            cached = self.subchain_cache.get(self._subchain_key(item_id, allow_locked))
+            if cached is not None and not any(
+                step.item_id in self.processing_stack for step in cached.steps
+            ):
+                return self._splice(cached, consumer, result)
         
-        if not best_recipe:
-            # No unlocked recipe available
-            recipe_names = [r["name"] for r in producing_recipes]
-            result.add_missing_recipe(f"{item['name']} (options: {', '.join(recipe_names)})")
-            self.processing_stack.remove(item_id)
-            return False
-        
-        # Calculate machines needed
-        crafting_speed = best_recipe["craftingSpeed"]
-        output_data = next(
-            (out for out in best_recipe["outputs"] if out["item"] == item_id),
-            best_recipe["outputs"][0]
-        )
-        output_amount = output_data["amount"]
-        output_rate_per_machine = (output_amount / crafting_speed) * 60  # items per minute
-        
-        # Calculate machines needed (round up to whole machines)
-        import math
-        machines_needed = math.ceil(required_rate / output_rate_per_machine) if output_rate_per_machine > 0 else 0
-        
-        # Create machine node
-        node_id = f"node_{len(self.nodes)}_{item_id}"
-        node = MachineNode(
-            node_id=node_id,
-            recipe_id=best_recipe["id"],
-            recipe_name=best_recipe["name"],
-            machine_type=best_recipe["machineType"],
-            item_produced=item_id,
-            item_produced_name=item["name"],
-            target_rate=required_rate,
-            machine_count=machines_needed,
-            power_per_machine=best_recipe["powerConsumption"],
-            tier=best_recipe["unlockTier"],
-            is_alternate=best_recipe["alternateRecipe"]
-        )
+        # Recipe kept from a previous result, if it holds at this rate (see reuse_choices)
+        best_recipe = None
+        pinned = self.pinned_recipes.get(item_id)
+        if pinned is not None and (pinned[1] is None or pinned[1] == required_rate):
+            best_recipe = pinned[0]
         
-        # Process inputs recursively
-        for input_data in best_recipe["inputs"]:
-            input_item_id = input_data["item"]
-            input_amount = input_data["amount"]
-            input_rate_per_machine = (input_amount / crafting_speed) * 60
-            total_input_rate = input_rate_per_machine * machines_needed
-            
-            # Add to node inputs
-            input_item = self.all_items.get(input_item_id)
-            node.inputs.append(ItemFlow(
-                item_id=input_item_id,
-                item_name=input_item["name"] if input_item else input_item_id,
-                rate=total_input_rate
-            ))
+        if best_recipe is None:
+            # Find recipes that produce this item
+            producing_recipes = self.dataset.get_recipe_records_for_item(item_id)
+            if not producing_recipes:
+                self._report(consumer_id, "message", f"No recipes found for {item.name}", result)
+                return False
             
-            # Recursively build chain for input
-            success = self._build_chain(
-                item_id=input_item_id,
-                required_rate=total_input_rate,
-                allow_locked=allow_locked,
-                result=result
+            # Select best recipe
+            best_recipe = select_best_recipe(
+                recipes=producing_recipes,
+                objective=self.objective,
+                target_rate=required_rate,
+                unlocked_recipes=self.allowed_recipes(allow_locked),
+                item_id=item_id,
+                raw_costs=self.raw_costs
             )
             
-            if not success and not allow_locked:
-                self.processing_stack.remove(item_id)
+            if not best_recipe:
+                # No unlocked recipe available
+                recipe_names = [r.name for r in producing_recipes]
+                self._report(
+                    consumer_id, "missing", f"{item.name} (options: {', '.join(recipe_names)})", result
+                )
                 return False
         
-        # Add outputs to node
-        for output_data in best_recipe["outputs"]:
-            output_item_id = output_data["item"]
-            output_amount = output_data["amount"]
-            output_rate_per_machine = (output_amount / crafting_speed) * 60
-            total_output_rate = output_rate_per_machine * machines_needed
-            
-            output_item = self.all_items.get(output_item_id)
-            node.outputs.append(ItemFlow(
-                item_id=output_item_id,
-                item_name=output_item["name"] if output_item else output_item_id,
-                rate=total_output_rate
-            ))
+        self.choice_rates[item_id] = required_rate
         
-        # Add node
-        self.nodes.append(node)
+        # Whole machines at this branch's rate, to score the inputs' recipes
+        machines_needed = math.ceil(required_rate / best_recipe.rates.output_rate(item_id))
+        self.processing_stack.add(item_id)
+        frame = _ChainFrame(item_id, best_recipe, machines_needed, len(self._entry_of))
+        self._entry_of[item_id] = frame.entry
+        frame.order_start = len(self.chain_order)
+        frame.loop_start = len(self._loop_log)
+        frame.event_start = len(self._events)
+        return frame
+    
+    def _finish_item(self, frame: _ChainFrame, allow_locked: bool) -> bool:
+        """Record an item's recipe choice once all its inputs are visited."""
+        item_id = frame.item_id
+        self.processing_stack.discard(item_id)
+        self.recipe_choices[item_id] = frame.recipe
+        self.chain_order.append(item_id)
+        self.visited_items.add(item_id)
+        if not frame.success:
+            self.unresolved_items.add(item_id)
+        
+        # Only a subtree that refers to nothing visited before it is the
+        # item's whole subchain
+        if self.subchain_cache is not None and frame.low >= frame.entry:
+            self.subchain_cache.put(
+                self._subchain_key(item_id, allow_locked),
+                SubchainEntry(
+                    steps=tuple(self._compile_steps(frame.order_start)),
+                    loop_edges=tuple(self._loop_log[frame.loop_start:]),
+                    events=tuple(self._events[frame.event_start:]),
+                    success=frame.success
+                )
+            )
+        return frame.success
+    
+    def _subchain_key(self, item_id: str, allow_locked: bool) -> tuple:
+        closure = self.dataset.get_dependency_closure()
+        return (
+            self.dataset.token,
+            item_id,
+            closure.relevant_unlocks(item_id, self._cache_mask),
+            self.objective,
+            self.raw_costs is not None,
+            allow_locked,
+        )
+    
+    def _refer(self, consumer: Optional[_ChainFrame], item_id: str):
+        """Note that a frame's subtree uses an item visited elsewhere."""
+        if consumer is not None:
+            consumer.low = min(consumer.low, self._entry_of[item_id])
+    
+    def _report(self, consumer_id: Optional[str], kind: str, text: str, result: ProductionChainResult):
+        """Add a phase 1 warning / message / missing recipe, keeping it for the subchain cache."""
+        self._events.append((consumer_id, kind, text))
+        if kind == "warning":
+            result.add_warning(text)
+        elif kind == "missing":
+            result.add_missing_recipe(text)
+        else:
+            result.add_message(text)
+    
+    def _splice(self, cached: SubchainEntry, consumer: Optional[_ChainFrame], result: ProductionChainResult) -> bool:
+        """
+        Add a cached subchain to the chain as if it had been visited.
+        
+        Items already in the chain keep their recipe, exactly as a fresh visit
+        would stop at them; only what the new items reported is replayed.
+        """
+        added = set()
+        for step in cached.steps:
+            if step.item_id in self.visited_items:
+                self._refer(consumer, step.item_id)
+                continue
+            self._entry_of[step.item_id] = len(self._entry_of)
+            self.visited_items.add(step.item_id)
+            self.chain_order.append(step.item_id)
+            if step.recipe is not None:
+                self.recipe_choices[step.item_id] = step.recipe
+            if not step.resolved:
+                self.unresolved_items.add(step.item_id)
+            added.add(step.item_id)
         
-        # Track production
-        if item_id not in self.item_production:
-            self.item_production[item_id] = []
-        self.item_production[item_id].append(node_id)
+        for edge in cached.loop_edges:
+            if edge[0] in added:
+                self.loop_edges.add(edge)
+                self._loop_log.append(edge)
+        for consumer_id, kind, text in cached.events:
+            if consumer_id in added:
+                self._report(consumer_id, kind, text, result)
+        return cached.success
+    
+    def _aggregate_demand(self, targets: Dict[str, float], result: ProductionChainResult):
+        """
+        Size one node per chosen item for the total demand on it (phase 2).
         
-        # Mark as visited
-        self.visited_items.add(item_id)
-        self.processing_stack.remove(item_id)
+        The phase 1 choices are compiled into a ProductionPlan, which sums the
+        demand of all consumers of each item in O(items + input edges) and
+        builds the nodes. Loop edges found in phase 1 do not feed demand back.
         
-        return True
+        Args:
+            targets: Item to produce -> desired production rate (items/min)
+            result: Result whose target fields name the plan
+        """
+        target_mix = {}
+        if result.targets and result.target_rate > 0:
+            target_mix = {item_id: rate / result.target_rate for item_id, rate in targets.items()}
+        steps = self._compile_steps()
+        self.plan = ProductionPlan(
+            target_item_id=result.target_item_id,
+            target_item_name=result.target_item_name,
+            objective=self.objective,
+            unlocked_recipes=self.unlocked_recipes,
+            items=self.items,
+            components=self.dataset.get_component_analysis(
+                {step.recipe.id for step in steps if step.recipe is not None}
+            ),
+            steps=steps,
+            target_mix=target_mix,
+            clock_mode=self.clock_mode,
+            rate_free=self.rate_free,
+            chain_aware_scoring=self.chain_aware_scoring,
+            dataset_name=self.dataset.name,
+            choice_rates=dict(self.choice_rates)
+        )
+        nodes, item_production, raw_requirements = self.plan.build(result.target_rate)
+        self.nodes.extend(nodes)
+        self.item_production.update(item_production)
+        self.raw_requirements.update(raw_requirements)
+    
+    def _compile_steps(self, start: int = 0) -> List[PlanStep]:
+        """Phase 1 recipe choices as plan steps, in dependency order (from chain_order[start])."""
+        steps = []
+        for item_id in self.chain_order[start:]:
+            recipe = self.recipe_choices.get(item_id)
+            if recipe is None:
+                steps.append(PlanStep(item_id=item_id, recipe=None, output_rate=0.0, demand_inputs=()))
+                continue
+            steps.append(PlanStep(
+                item_id=item_id,
+                recipe=recipe,
+                output_rate=recipe.rates.output_rate(item_id),
+                demand_inputs=tuple(
+                    (input_item_id, rate)
+                    for input_item_id, rate in recipe.rates.inputs
+                    if (item_id, input_item_id) not in self.loop_edges
+                ),
+                resolved=item_id not in self.unresolved_items
+            ))
+        return steps
     
     def _build_connections(self):
         """Build connections between nodes after chain is complete."""
         # This will be called after all nodes are created
-        # to establish explicit connections for visualization
-        connection_id = 0
-        
-        for node in self.nodes:
-            for input_flow in node.inputs:
-                # Find nodes that produce this input
-                if input_flow.item_id in self.item_production:
-                    for producer_node_id in self.item_production[input_flow.item_id]:
-                        connection = Connection(
-                            connection_id=f"conn_{connection_id}",
-                            from_node_id=producer_node_id,
-                            to_node_id=node.node_id,
-                            item_id=input_flow.item_id,
-                            item_name=input_flow.item_name,
-                            rate=input_flow.rate,
-                            is_recycling_loop=False  # TODO: detect actual loops
-                        )
-                        self.connections.append(connection)
-                        connection_id += 1
+        # to establish explicit connections for visualization. Only loops
+        # among the chain's own recipes are recycling loops: the unlocked
+        # graph as a whole can tie most items into one component
+        components = self.dataset.get_component_analysis({node.recipe_id for node in self.nodes})
+        self.connections.extend(connect_nodes(self.nodes, self.item_production, components))
+
+
+def _run_solver(
+    run: Callable[[ProductionChainSolver], ProductionChainResult],
+    unlocked_recipes: Set[str],
+    objective: OptimizationObjective,
+    dataset: Optional[Dataset],
+    version: Optional[str],
+    chain_aware_scoring: bool = False,
+    engine: SolverEngine = SolverEngine.GREEDY,
+    clock_mode: ClockMode = ClockMode.NONE,
+    connect: bool = True
+) -> Tuple[ProductionChainSolver, ProductionChainResult]:
+    """
+    Shared body of the entry points below.
+    
+    Resolves the dataset, builds a solver for the engine, lets `run` solve
+    with it and, if `connect`, builds the result's connections (split between
+    targets for multi-target results).
+    
+    Returns:
+        (solver, result)
+    """
+    if dataset is None:
+        dataset = satisfactory_db.get_dataset(version)
+    
+    solver_class = ProductionChainSolver
+    if engine == SolverEngine.LP:
+        # Imported lazily: lp_solver builds on this module
+        from optimizer.lp_solver import LPProductionChainSolver
+        solver_class = LPProductionChainSolver
+    
+    solver = solver_class(
+        unlocked_recipes=unlocked_recipes,
+        objective=objective,
+        dataset=dataset,
+        chain_aware_scoring=chain_aware_scoring,
+        clock_mode=clock_mode
+    )
+    result = run(solver)
+    
+    if connect:
+        # Build connections for visualization, then split nodes between targets
+        solver.connections = []
+        solver._build_connections()
+        result.connections = solver.connections
+        if result.targets:
+            split_by_target(result.nodes, result.connections, result.targets)
+    
+    return solver, result
 
 
 def calculate_production_chain(
@@ -320,7 +945,12 @@ def calculate_production_chain(
     target_rate: float,
     unlocked_recipes: Set[str],
     objective: OptimizationObjective = OptimizationObjective.BALANCED,
-    allow_locked_preview: bool = False
+    allow_locked_preview: bool = False,
+    dataset: Optional[Dataset] = None,
+    version: Optional[str] = None,
+    chain_aware_scoring: bool = False,
+    engine: SolverEngine = SolverEngine.GREEDY,
+    clock_mode: ClockMode = ClockMode.NONE
 ) -> ProductionChainResult:
     """
     Main entry point for calculating production chain.
@@ -331,24 +961,210 @@ def calculate_production_chain(
         unlocked_recipes: Set of unlocked recipe IDs
         objective: Optimization objective
         allow_locked_preview: If True, show what would be possible with all recipes
+        dataset: Game dataset to solve against (default: base dataset)
+        version: Registered game data version key, used when no dataset is given
+        chain_aware_scoring: Rank recipes by whole-chain raw cost (see raw_costs)
+        engine: GREEDY recursion or LP over the recipe matrix (see lp_solver)
+        clock_mode: Clock stage (default: whole machines at 100%, see clocking)
     
     Returns:
         ProductionChainResult
     """
-    solver = ProductionChainSolver(
-        unlocked_recipes=unlocked_recipes,
-        objective=objective
+    _, result = _run_solver(
+        lambda solver: solver.solve(
+            target_item_id=target_item_id,
+            target_rate=target_rate,
+            allow_locked_preview=allow_locked_preview
+        ),
+        unlocked_recipes, objective, dataset, version, chain_aware_scoring, engine, clock_mode
     )
+    return result
+
+
+def calculate_factory(
+    targets: Mapping[str, float],
+    unlocked_recipes: Set[str],
+    objective: OptimizationObjective = OptimizationObjective.BALANCED,
+    allow_locked_preview: bool = False,
+    dataset: Optional[Dataset] = None,
+    version: Optional[str] = None,
+    chain_aware_scoring: bool = False,
+    engine: SolverEngine = SolverEngine.GREEDY,
+    clock_mode: ClockMode = ClockMode.NONE
+) -> ProductionChainResult:
+    """
+    Entry point for a factory with several target items.
     
-    result = solver.solve(
-        target_item_id=target_item_id,
-        target_rate=target_rate,
-        allow_locked_preview=allow_locked_preview
+    All targets are solved in one pass, so shared intermediates get a single
+    node sized (and rounded) for their combined demand.
+    
+    Args:
+        targets: Target item_id -> desired production rate (items/min),
+            e.g. {"heavy_modular_frame": 10, "computer": 5, "motor": 20}
+        unlocked_recipes: Set of unlocked recipe IDs
+        objective: Optimization objective
+        allow_locked_preview: If True, show what would be possible with all recipes
+        dataset: Game dataset to solve against (default: base dataset)
+        version: Registered game data version key, used when no dataset is given
+        chain_aware_scoring: Rank recipes by whole-chain raw cost (see raw_costs)
+        engine: GREEDY recursion or LP over the recipe matrix (see lp_solver)
+        clock_mode: Clock stage (default: whole machines at 100%, see clocking)
+    
+    Returns:
+        Combined ProductionChainResult; result.targets lists the targets and
+        each node's output_by_target splits its output between them
+    """
+    _, result = _run_solver(
+        lambda solver: solver.solve_targets(targets, allow_locked_preview=allow_locked_preview),
+        unlocked_recipes, objective, dataset, version, chain_aware_scoring, engine, clock_mode
     )
+    return result
+
+
+def recalculate_production_chain(
+    previous: ProductionChainResult,
+    added_recipes: Iterable[str] = (),
+    removed_recipes: Iterable[str] = (),
+    allow_locked_preview: bool = False,
+    dataset: Optional[Dataset] = None,
+    version: Optional[str] = None
+) -> ProductionChainResult:
+    """
+    Re-solve a greedy result after recipes were unlocked or locked.
+    
+    The objective, scoring and clock settings are taken from the previous
+    result. Items whose recipe the change cannot affect keep it instead of
+    being scored again (see ProductionChainSolver.reuse_choices); under the
+    rate-dependent objectives that holds only while an item is reached at
+    the rate it was scored at before. Demand is then summed and nodes are
+    sized as usual, so the result matches a fresh solve.
     
-    # Build connections for visualization
-    solver.connections = []
-    solver._build_connections()
-    result.connections = solver.connections
+    Args:
+        previous: Greedy result to update (single or multi-target)
+        added_recipes: Recipe IDs unlocked since the previous result
+        removed_recipes: Recipe IDs locked since the previous result
+        allow_locked_preview: If True, show what would be possible with all recipes
+        dataset: Game dataset the previous result was solved against (default: base dataset)
+        version: Registered game data version key, used when no dataset is given
+    
+    Returns:
+        ProductionChainResult for the new unlocked set
     
+    Raises:
+        ValueError: If the previous result came from another engine or dataset
+    """
+    added_recipes = set(added_recipes)
+    removed_recipes = set(removed_recipes)
+    
+    def run(solver: ProductionChainSolver) -> ProductionChainResult:
+        solver.reuse_choices(previous, added_recipes, removed_recipes, allow_locked_preview)
+        if previous.targets:
+            return solver.solve_targets(previous.targets, allow_locked_preview=allow_locked_preview)
+        return solver.solve(
+            target_item_id=previous.target_item_id,
+            target_rate=previous.target_rate,
+            allow_locked_preview=allow_locked_preview
+        )
+    
+    _, result = _run_solver(
+        run,
+        (set(previous.unlocked_recipes) - removed_recipes) | added_recipes,
+        previous.optimization_objective,
+        dataset,
+        version,
+        previous.chain_aware_scoring,
+        clock_mode=previous.clock_mode
+    )
     return result
+
+
+def compile_production_plan(
+    target_item_id: str,
+    target_rate: float,
+    unlocked_recipes: Set[str],
+    objective: OptimizationObjective = OptimizationObjective.BALANCED,
+    allow_locked_preview: bool = False,
+    dataset: Optional[Dataset] = None,
+    version: Optional[str] = None,
+    chain_aware_scoring: bool = False,
+    previous: Optional[ProductionChainResult] = None,
+    clock_mode: ClockMode = ClockMode.NONE
+) -> ProductionPlan:
+    """
+    Solve a chain once with the greedy engine and keep it for rescaling.
+    
+    Recipes are chosen at target_rate; plan.scale(rate) then realizes the
+    same choices at another rate without searching again. That matches a
+    solve at the new rate only if plan.rate_free (see optimizer/plan.py).
+    
+    Args:
+        target_item_id: Target item to produce
+        target_rate: Production rate the recipes are chosen at (items/min)
+        unlocked_recipes: Set of unlocked recipe IDs
+        objective: Optimization objective
+        allow_locked_preview: If True, use all recipes
+        dataset: Game dataset to solve against (default: base dataset)
+        version: Registered game data version key, used when no dataset is given
+        chain_aware_scoring: Rank recipes by whole-chain raw cost (see raw_costs)
+        previous: Earlier greedy result for the same target and settings;
+            recipe choices the unlock difference cannot affect are kept (see
+            reuse_choices)
+        clock_mode: Clock stage (default: whole machines at 100%, see clocking)
+    
+    Returns:
+        ProductionPlan
+    
+    Raises:
+        ValueError: If the target item does not exist, or previous was solved
+            for another target or with other settings
+    """
+    def run(solver: ProductionChainSolver) -> ProductionChainResult:
+        if previous is not None:
+            if previous.targets or previous.target_item_id != target_item_id:
+                raise ValueError(f"Previous result was solved for another target than '{target_item_id}'")
+            previous_unlocked = solver.dataset.encode_unlocked(previous.unlocked_recipes)
+            solver.reuse_choices(
+                previous,
+                added_recipes=solver.unlocked_recipes - previous_unlocked,
+                removed_recipes=previous_unlocked - solver.unlocked_recipes,
+                allow_locked=allow_locked_preview
+            )
+        return solver.solve(
+            target_item_id=target_item_id,
+            target_rate=target_rate,
+            allow_locked_preview=allow_locked_preview
+        )
+    
+    # The plan builds its own connections per rate (see ProductionPlan.scale)
+    solver, result = _run_solver(
+        run, unlocked_recipes, objective, dataset, version, chain_aware_scoring,
+        clock_mode=clock_mode, connect=False
+    )
+    dataset = solver.dataset
+    
+    plan = solver.plan
+    if plan is None:
+        target_item = solver.items.get(target_item_id)
+        if target_item is None:
+            raise ValueError(f"Item '{target_item_id}' not found in database.")
+        # Raw target: a single step, its message is rebuilt per rate
+        plan = ProductionPlan(
+            target_item_id=target_item_id,
+            target_item_name=target_item.name,
+            objective=objective,
+            unlocked_recipes=solver.unlocked_recipes,
+            items=solver.items,
+            components=dataset.get_component_analysis(()),
+            steps=[PlanStep(item_id=target_item_id, recipe=None, output_rate=0.0, demand_inputs=())],
+            clock_mode=solver.clock_mode,
+            rate_free=True,
+            chain_aware_scoring=chain_aware_scoring,
+            dataset_name=dataset.name
+        )
+        return plan
+    
+    plan.status = result.status
+    plan.messages = list(result.messages)
+    plan.warnings = list(result.warnings)
+    plan.missing_recipes = list(result.missing_recipes)
+    return plan
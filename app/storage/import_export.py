@@ -9,7 +9,8 @@ from dataclasses import asdict
 
 from optimizer.models import (
     ProductionChainResult, MachineNode, Connection, 
-    RawResourceRequirement, OptimizationObjective, CalculationStatus
+    RawResourceRequirement, OptimizationObjective, CalculationStatus,
+    SolverEngine, ClockMode
 )
 
 
@@ -31,8 +32,14 @@ def export_result_to_json(result: ProductionChainResult) -> str:
             "item_name": result.target_item_name,
             "rate": result.target_rate
         },
+        "targets": result.targets,
         "status": result.status.value,
         "optimization_objective": result.optimization_objective.value,
+        "engine": result.engine.value,
+        "chain_aware_scoring": result.chain_aware_scoring,
+        "clock_mode": result.clock_mode.value,
+        "dataset_name": result.dataset_name,
+        "choice_rates": result.choice_rates,
         "unlocked_recipes": list(result.unlocked_recipes),
         "nodes": [
             {
@@ -45,10 +52,12 @@ def export_result_to_json(result: ProductionChainResult) -> str:
                 "target_rate": node.target_rate,
                 "machine_count": node.machine_count,
                 "clock_speed": node.clock_speed,
+                "power_shards": node.power_shards,
                 "power_per_machine": node.power_per_machine,
                 "total_power": node.total_power,
                 "tier": node.tier,
                 "is_alternate": node.is_alternate,
+                "output_by_target": node.output_by_target,
                 "inputs": [
                     {
                         "item_id": inp.item_id,
@@ -91,6 +100,7 @@ def export_result_to_json(result: ProductionChainResult) -> str:
         "summary": {
             "total_machines": result.total_machines,
             "total_power": result.total_power,
+            "total_power_shards": result.total_power_shards,
             "total_raw_resources": result.total_raw_resources
         },
         "messages": result.messages,
@@ -124,8 +134,14 @@ def import_result_from_json(json_string: str) -> Optional[ProductionChainResult]
             target_item_id=data["target"]["item_id"],
             target_item_name=data["target"]["item_name"],
             target_rate=data["target"]["rate"],
-            unlocked_recipes=set(data["unlocked_recipes"]),
+            targets=data.get("targets", {}),
+            unlocked_recipes=frozenset(data["unlocked_recipes"]),
             optimization_objective=objective,
+            engine=SolverEngine(data.get("engine", SolverEngine.GREEDY.value)),
+            chain_aware_scoring=data.get("chain_aware_scoring", False),
+            clock_mode=ClockMode(data.get("clock_mode", ClockMode.NONE.value)),
+            dataset_name=data.get("dataset_name"),
+            choice_rates=data.get("choice_rates", {}),
             timestamp=data.get("timestamp")
         )
         
@@ -142,10 +158,12 @@ def import_result_from_json(json_string: str) -> Optional[ProductionChainResult]
                 target_rate=node_data["target_rate"],
                 machine_count=node_data["machine_count"],
                 clock_speed=node_data.get("clock_speed", 100.0),
+                power_shards=node_data.get("power_shards", 0),
                 power_per_machine=node_data["power_per_machine"],
                 total_power=node_data["total_power"],
                 tier=node_data.get("tier", 0),
                 is_alternate=node_data.get("is_alternate", False),
+                output_by_target=node_data.get("output_by_target", {}),
                 inputs=[
                     ItemFlow(
                         item_id=inp["item_id"],
@@ -196,6 +214,7 @@ def import_result_from_json(json_string: str) -> Optional[ProductionChainResult]
         summary = data.get("summary", {})
         result.total_machines = summary.get("total_machines", 0)
         result.total_power = summary.get("total_power", 0.0)
+        result.total_power_shards = summary.get("total_power_shards", 0)
         result.total_raw_resources = summary.get("total_raw_resources", 0)
         
         return result
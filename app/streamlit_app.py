@@ -12,8 +12,9 @@ app_dir = Path(__file__).parent
 sys.path.insert(0, str(app_dir))
 
 from data import satisfactory_db
-from optimizer.models import OptimizationObjective, CalculationStatus
-from optimizer.solver import calculate_production_chain
+from optimizer.models import OptimizationObjective, CalculationStatus, SolverEngine, ClockMode
+from optimizer.raw_costs import get_raw_cost_table
+from optimizer.solver import calculate_production_chain, compile_production_plan
 from viz import graphviz_render
 from storage import import_export, local_storage_component
 from utils import validation
@@ -38,6 +39,11 @@ if 'unlocked_recipes' not in st.session_state:
 if 'calculation_result' not in st.session_state:
     st.session_state.calculation_result = None
 
+if 'production_plan' not in st.session_state:
+    # Compiled greedy chain of the last calculation, rescaled when only the rate changes
+    st.session_state.production_plan = None
+    st.session_state.plan_settings = None
+
 if 'show_advanced' not in st.session_state:
     st.session_state.show_advanced = False
 
@@ -115,33 +121,51 @@ with st.sidebar:
     
     all_recipes = satisfactory_db.get_all_recipes()
     
-    # Group recipes by category
-    categories = {}
-    for recipe_id, recipe in all_recipes.items():
-        category = recipe["category"]
-        if category not in categories:
-            categories[category] = []
-        categories[category].append((recipe_id, recipe))
-    
-    # Display by category
-    for category in sorted(categories.keys()):
-        with st.expander(f"{category} ({len(categories[category])} recipes)", expanded=False):
-            for recipe_id, recipe in sorted(categories[category], key=lambda x: x[1]["name"]):
-                is_unlocked = recipe_id in st.session_state.unlocked_recipes
-                
-                label = recipe["name"]
-                if recipe["alternateRecipe"]:
-                    label += " (ALT)"
-                
-                if st.checkbox(
-                    label,
-                    value=is_unlocked,
-                    key=f"recipe_{recipe_id}",
-                    help=f"Machine: {recipe['machineType']} | Tier: {recipe['unlockTier']}"
-                ):
-                    st.session_state.unlocked_recipes.add(recipe_id)
-                else:
-                    st.session_state.unlocked_recipes.discard(recipe_id)
+    def recipe_checkbox(recipe_id, recipe):
+        """Render the unlock checkbox of one recipe and sync the unlocked set."""
+        is_unlocked = recipe_id in st.session_state.unlocked_recipes
+        
+        label = recipe["name"]
+        if recipe["alternateRecipe"]:
+            label += " (ALT)"
+        
+        if st.checkbox(
+            label,
+            value=is_unlocked,
+            key=f"recipe_{recipe_id}",
+            help=f"Machine: {recipe['machineType']} | Tier: {recipe['unlockTier']}"
+        ):
+            st.session_state.unlocked_recipes.add(recipe_id)
+        else:
+            st.session_state.unlocked_recipes.discard(recipe_id)
+    
+    recipe_query = st.text_input(
+        "Search recipes",
+        placeholder="e.g. pure iron, motor",
+        help="Matches word prefixes of recipe names and categories; typos are tolerated"
+    )
+    
+    if recipe_query.strip():
+        # Only the matching recipes are rendered
+        recipe_hits = satisfactory_db.search(recipe_query, kinds=("recipe",), limit=50)
+        if not recipe_hits:
+            st.caption("No matching recipes")
+        for hit in recipe_hits:
+            recipe_checkbox(hit.id, all_recipes[hit.id])
+    else:
+        # Group recipes by category
+        categories = {}
+        for recipe_id, recipe in all_recipes.items():
+            category = recipe["category"]
+            if category not in categories:
+                categories[category] = []
+            categories[category].append((recipe_id, recipe))
+        
+        # Display by category
+        for category in sorted(categories.keys()):
+            with st.expander(f"{category} ({len(categories[category])} recipes)", expanded=False):
+                for recipe_id, recipe in sorted(categories[category], key=lambda x: x[1]["name"]):
+                    recipe_checkbox(recipe_id, recipe)
 
 # Main content area
 col_left, col_right = st.columns([2, 1])
@@ -149,33 +173,62 @@ col_left, col_right = st.columns([2, 1])
 with col_left:
     st.header("🎯 Production Target")
     
-    # Get craftable items (non-raw resources)
+    # Craftable items (non-raw resources), built once per dataset
     all_items = satisfactory_db.get_all_items()
-    craftable_items = {
-        item_id: item for item_id, item in all_items.items()
-        if not item["isRawResource"]
-    }
+    craftable_items = satisfactory_db.get_craftable_items()
     
-    # Sort items by category and name
-    sorted_items = sorted(
-        craftable_items.items(),
-        key=lambda x: (x[1]["category"], x[1]["name"])
+    item_query = st.text_input(
+        "Search items",
+        placeholder="e.g. heavy frame, computer",
+        help="Narrow the target list; matches word prefixes and tolerates typos"
     )
     
+    item_hits = []
+    if item_query.strip():
+        item_hits = [
+            hit for hit in satisfactory_db.search(item_query, kinds=("item",), limit=30)
+            if hit.id in craftable_items
+        ]
+        if not item_hits:
+            st.caption("No matching items, showing all")
+    
+    if item_hits:
+        # Best matches first
+        sorted_items = [(hit.id, craftable_items[hit.id]) for hit in item_hits]
+    else:
+        sort_order = st.radio(
+            "Sort items by",
+            options=["Category", "Complexity"],
+            horizontal=True,
+            help="Complexity = longest production path from raw resources"
+        )
+        if sort_order == "Complexity":
+            depth_table = satisfactory_db.get_depth_table(st.session_state.unlocked_recipes)
+            sort_key = lambda x: (depth_table.depth_of(x[0]), x[1]["name"])
+        else:
+            # Sort items by category and name
+            sort_key = lambda x: (x[1]["category"], x[1]["name"])
+        sorted_items = sorted(craftable_items.items(), key=sort_key)
+    
+    # Items that cannot be built with the current unlocks are marked as locked
+    closure = satisfactory_db.get_dependency_closure()
+    unlocked_mask = satisfactory_db.encode_unlocked(st.session_state.unlocked_recipes)
+    buildable_mask = closure.buildable_items(unlocked_mask.bits)
+    
     # Target item selection
     item_options = {
-        f"{item['name']} ({item['category']})": item_id
+        item_id: f"{item['name']} ({item['category']})"
+        + ("" if buildable_mask >> closure.item_index[item_id] & 1 else " 🔒")
         for item_id, item in sorted_items
     }
     
-    selected_item_display = st.selectbox(
+    target_item_id = st.selectbox(
         "Target Item",
         options=list(item_options.keys()),
-        help="Select the item you want to produce"
+        format_func=item_options.get,
+        help="Select the item you want to produce (🔒 = not buildable with current unlocks)"
     )
     
-    target_item_id = item_options[selected_item_display]
-    
     # Target rate input
     col1, col2 = st.columns([3, 1])
     
@@ -209,6 +262,19 @@ with col_left:
     
     objective = objective_options[selected_objective]
     
+    # Instant estimate from the precomputed raw cost table (no solve needed)
+    raw_costs = get_raw_cost_table(
+        satisfactory_db.get_dataset(), unlocked_mask, objective
+    )
+    raw_estimate = raw_costs.estimate(target_item_id, target_rate)
+    if raw_estimate:
+        st.caption(
+            "Estimated raw input: " + ", ".join(
+                f"{all_items[raw_id]['name']} {rate:.1f}/min"
+                for raw_id, rate in sorted(raw_estimate.items(), key=lambda x: -x[1])
+            )
+        )
+    
     # Advanced options
     with st.expander("⚙️ Advanced Options", expanded=False):
         allow_locked_preview = st.checkbox(
@@ -216,6 +282,33 @@ with col_left:
             value=False,
             help="Preview what would be possible if all recipes were unlocked"
         )
+        chain_aware_scoring = st.checkbox(
+            "Chain-aware recipe selection",
+            value=False,
+            help="Pick recipes by the cost of their whole chain instead of one step at a time"
+        )
+        engine_options = {
+            "Greedy (fast)": SolverEngine.GREEDY,
+            "Linear program (balanced)": SolverEngine.LP
+        }
+        selected_engine = st.radio(
+            "Solver engine",
+            options=list(engine_options.keys()),
+            help="The linear program balances byproducts, splits demand across recipes and solves loops"
+        )
+        engine = engine_options[selected_engine]
+        clock_options = {
+            "Whole machines at 100%": ClockMode.NONE,
+            "Underclock all machines evenly": ClockMode.UNDERCLOCK_EVEN,
+            "Underclock the last machine": ClockMode.UNDERCLOCK_LAST,
+            "Overclock with power shards": ClockMode.OVERCLOCK
+        }
+        selected_clock = st.selectbox(
+            "Clock speeds",
+            options=list(clock_options.keys()),
+            help="Clock machines to the exact rate instead of rounding up to whole machines at 100%"
+        )
+        clock_mode = clock_options[selected_clock]
     
     # Calculate button
     st.markdown("---")
@@ -235,6 +328,60 @@ with col_left:
                 st.session_state.calculation_result = None
                 st.rerun()
     
+    # Everything but the rate: a compiled plan is reused while these stay the same
+    plan_settings = (target_item_id, objective, unlocked_mask, allow_locked_preview, chain_aware_scoring, clock_mode)
+    stored_settings = st.session_state.plan_settings
+    has_plan = (
+        engine == SolverEngine.GREEDY
+        and st.session_state.production_plan is not None
+        and stored_settings is not None
+    )
+    # Only plans whose recipe choices do not depend on the rate can be rescaled
+    # and still match a solve; the others are solved again on Calculate
+    plan_matches = (
+        has_plan
+        and stored_settings == plan_settings
+        and st.session_state.production_plan.rate_free
+    )
+    rate_changed = (
+        st.session_state.calculation_result is not None
+        and st.session_state.calculation_result.target_rate != target_rate
+    )
+    if (
+        has_plan
+        and stored_settings == plan_settings
+        and not plan_matches
+        and rate_changed
+        and not calculate_button
+    ):
+        st.info(
+            "ℹ️ This objective picks recipes by rate, so the shown plan cannot be "
+            "rescaled. Click Calculate to solve again at the new rate."
+        )
+    
+    # Only the unlocked recipes changed: patch the previous result instead of a full solve
+    unlocks_changed = (
+        has_plan
+        and stored_settings[2] != plan_settings[2]
+        and stored_settings[:2] == plan_settings[:2]
+        and stored_settings[3:] == plan_settings[3:]
+    )
+    previous_result = st.session_state.calculation_result if unlocks_changed else None
+    
+    def compile_plan():
+        """Compile the greedy plan for the current settings and keep it."""
+        st.session_state.production_plan = compile_production_plan(
+            target_item_id=target_item_id,
+            target_rate=target_rate,
+            unlocked_recipes=st.session_state.unlocked_recipes,
+            objective=objective,
+            allow_locked_preview=allow_locked_preview,
+            chain_aware_scoring=chain_aware_scoring,
+            previous=previous_result,
+            clock_mode=clock_mode
+        )
+        st.session_state.plan_settings = plan_settings
+    
     # Perform calculation
     if calculate_button:
         # Validate inputs
@@ -249,17 +396,34 @@ with col_left:
         else:
             with st.spinner("Calculating production chain..."):
                 try:
-                    result = calculate_production_chain(
-                        target_item_id=target_item_id,
-                        target_rate=target_rate,
-                        unlocked_recipes=st.session_state.unlocked_recipes,
-                        objective=objective,
-                        allow_locked_preview=allow_locked_preview
-                    )
+                    if engine == SolverEngine.GREEDY:
+                        if not plan_matches:
+                            compile_plan()
+                        result = st.session_state.production_plan.scale(target_rate)
+                    else:
+                        st.session_state.production_plan = None
+                        st.session_state.plan_settings = None
+                        result = calculate_production_chain(
+                            target_item_id=target_item_id,
+                            target_rate=target_rate,
+                            unlocked_recipes=st.session_state.unlocked_recipes,
+                            objective=objective,
+                            allow_locked_preview=allow_locked_preview,
+                            chain_aware_scoring=chain_aware_scoring,
+                            engine=engine,
+                            clock_mode=clock_mode
+                        )
                     st.session_state.calculation_result = result
                 except Exception as e:
                     st.error(f"❌ Calculation error: {str(e)}")
                     st.exception(e)
+    elif plan_matches and rate_changed:
+        # Only the rate changed: rescale the compiled plan, no new search
+        st.session_state.calculation_result = st.session_state.production_plan.scale(target_rate)
+    elif unlocks_changed and previous_result is not None:
+        # Recipes were toggled: re-choose only what the change can affect
+        compile_plan()
+        st.session_state.calculation_result = st.session_state.production_plan.scale(target_rate)
 
 with col_right:
     st.header("ℹ️ Info")
@@ -331,6 +495,9 @@ if st.session_state.calculation_result is not None:
         with col4:
             st.metric("Raw Resources", result.total_raw_resources)
         
+        if result.total_power_shards:
+            st.caption(f"⚡ Overclocking uses {result.total_power_shards} power shards")
+        
         # Raw resources
         if result.raw_resources:
             st.subheader("⛏️ Raw Resources Required")
@@ -348,6 +515,9 @@ if st.session_state.calculation_result is not None:
                     f"- Machine: {validation.format_machine_count(node.machine_count)}x "
                     f"{node.machine_type}"
                 )
+                if node.clock_speed != 100.0:
+                    st.markdown(f"- Clock: {validation.format_clock_speed(node.clock_speed)}"
+                                + (f" ({node.power_shards} power shards each)" if node.power_shards else ""))
                 st.markdown(f"- Output: {validation.format_rate(node.target_rate)} {node.item_produced_name}")
                 st.markdown(f"- Power: {validation.format_power(node.total_power)}")
                 
@@ -363,10 +533,15 @@ if st.session_state.calculation_result is not None:
         
         try:
             # Render SVG
+            group_by_stage = st.checkbox(
+                "Group machines by production stage",
+                value=False
+            )
             svg_html = graphviz_render.get_svg_with_interactivity(
                 result,
                 show_rates=True,
-                show_power=True
+                show_power=True,
+                collapse_by_tier=group_by_stage
             )
             
             st.components.v1.html(svg_html, height=600, scrolling=True)
@@ -0,0 +1,77 @@
+"""
+Shared pytest setup: make the app directory importable, as streamlit_app does.
+"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+app_dir = Path(__file__).parent.parent
+sys.path.insert(0, str(app_dir))
+
+from data import satisfactory_db  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def all_recipes():
+    """Every recipe ID of the base dataset."""
+    return set(satisfactory_db.RECIPES)
+
+
+@pytest.fixture(scope="session")
+def standard_recipes():
+    """Recipe IDs of the base dataset without alternates."""
+    return {
+        recipe_id for recipe_id, recipe in satisfactory_db.RECIPES.items()
+        if not recipe["alternateRecipe"]
+    }
+
+
+def net_flows(result):
+    """Item_id -> produced + supplied - consumed items/min over a result's nodes."""
+    net = {}
+    for node in result.nodes:
+        for flow in node.outputs:
+            net[flow.item_id] = net.get(flow.item_id, 0.0) + flow.rate
+        for flow in node.inputs:
+            net[flow.item_id] = net.get(flow.item_id, 0.0) - flow.rate
+    for requirement in result.raw_resources:
+        net[requirement.item_id] = net.get(requirement.item_id, 0.0) + requirement.rate
+    return net
+
+
+def producer_edges(unlocked):
+    """
+    (input, output) item pairs the component analysis links for these unlocks.
+
+    Raw outputs are leaves; an output is linked from the recipes that make it
+    as their main output, else as a byproduct, else by unpacking.
+    """
+    recipes = {recipe_id: satisfactory_db.RECIPES[recipe_id] for recipe_id in unlocked}
+    shapes = {
+        recipe_id: (
+            frozenset(flow["item"] for flow in recipe["inputs"]),
+            frozenset(flow["item"] for flow in recipe["outputs"]),
+        )
+        for recipe_id, recipe in recipes.items()
+    }
+    unpacking = {
+        recipe_id for recipe_id, (inputs, outputs) in shapes.items()
+        if (outputs, inputs) in shapes.values() and len(outputs) > len(inputs)
+    }
+    main_made = {recipes[r]["outputs"][0]["item"] for r in recipes if r not in unpacking}
+    made = {item_id for r in recipes if r not in unpacking for item_id in shapes[r][1]}
+    edges = set()
+    for recipe_id, recipe in recipes.items():
+        for n, out in enumerate(recipe["outputs"]):
+            item_id = out["item"]
+            if satisfactory_db.ITEMS[item_id]["isRawResource"]:
+                continue
+            if recipe_id in unpacking:
+                linked = item_id not in made
+            else:
+                linked = n == 0 or item_id not in main_made
+            if linked:
+                edges.update((inp["item"], item_id) for inp in recipe["inputs"])
+    return edges
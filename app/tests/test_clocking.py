@@ -0,0 +1,90 @@
+"""
+Tests for the clock-speed stage.
+"""
+
+import math
+
+import pytest
+
+from optimizer.clocking import CLOCK_DECIMALS, MAX_CLOCK_SPEED, MIN_CLOCK_SPEED, ClockGroup, clock_groups
+from optimizer.models import ClockMode, OptimizationObjective, clock_power_factor
+from optimizer.solver import ProductionChainSolver, calculate_production_chain
+from storage.import_export import export_result_to_json, import_result_from_json
+
+from conftest import net_flows
+
+TOLERANCE = 1e-6
+ROUNDING = 10 ** -CLOCK_DECIMALS
+CLOCKED_MODES = [ClockMode.UNDERCLOCK_EVEN, ClockMode.UNDERCLOCK_LAST, ClockMode.OVERCLOCK]
+REQUIREMENTS = [0.3, 1.0, 1.7, 2.4, 3.0, 6.999, 12.345678]
+
+
+@pytest.mark.parametrize("machines", REQUIREMENTS)
+def test_no_clocking_rounds_up_to_whole_machines(machines):
+    assert clock_groups(machines, ClockMode.NONE) == [ClockGroup(math.ceil(machines), 100.0)]
+
+
+@pytest.mark.parametrize("mode", CLOCKED_MODES)
+@pytest.mark.parametrize("machines", REQUIREMENTS)
+def test_clock_speeds_are_settable_and_cover_the_requirement(machines, mode):
+    groups = clock_groups(machines, mode)
+    count = sum(group.machines for group in groups)
+    runs = sum(group.runs for group in groups)
+    assert runs >= machines - TOLERANCE
+    assert runs <= machines + ROUNDING * count / 100.0 + TOLERANCE
+    for group in groups:
+        assert MIN_CLOCK_SPEED <= group.clock_speed <= MAX_CLOCK_SPEED
+        assert group.clock_speed == round(group.clock_speed, CLOCK_DECIMALS)
+
+
+def test_underclock_even_keeps_the_machine_count():
+    assert clock_groups(2.4, ClockMode.UNDERCLOCK_EVEN) == [ClockGroup(3, 80.0)]
+
+
+def test_underclock_last_slows_only_the_last_machine():
+    assert clock_groups(2.4, ClockMode.UNDERCLOCK_LAST) == [ClockGroup(2, 100.0), ClockGroup(1, 40.0)]
+    assert clock_groups(3.0, ClockMode.UNDERCLOCK_LAST) == [ClockGroup(3, 100.0)]
+
+
+def test_overclock_uses_power_shards():
+    assert clock_groups(2.4, ClockMode.OVERCLOCK) == [ClockGroup(1, 240.0, 3)]
+    assert clock_groups(3.0, ClockMode.OVERCLOCK) == [ClockGroup(2, 150.0, 1)]
+    assert clock_groups(0.5, ClockMode.OVERCLOCK) == [ClockGroup(1, 50.0, 0)]
+
+
+def test_clock_power_factor():
+    assert clock_power_factor(100.0) == pytest.approx(1.0)
+    assert clock_power_factor(250.0) == pytest.approx(2.5 ** 1.3219, rel=1e-4)
+    assert clock_power_factor(50.0) < 0.5
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+def test_clocking_is_off_by_default(standard_recipes, objective):
+    assert ProductionChainSolver(standard_recipes, objective).clock_mode == ClockMode.NONE
+    result = calculate_production_chain("motor", 7.0, standard_recipes, objective)
+    assert all(node.clock_speed == 100.0 for node in result.nodes)
+
+
+@pytest.mark.parametrize("mode", CLOCKED_MODES)
+@pytest.mark.parametrize("target", ["motor", "computer", "heavy_modular_frame"])
+def test_clocked_chain_meets_the_target_with_no_more_machines(standard_recipes, target, mode):
+    rate = 60.0
+    whole = calculate_production_chain(target, rate, standard_recipes, clock_mode=ClockMode.NONE)
+    clocked = calculate_production_chain(target, rate, standard_recipes, clock_mode=mode)
+    net = net_flows(clocked)
+    assert net[target] >= rate - TOLERANCE
+    assert all(value >= -TOLERANCE for value in net.values())
+    assert clocked.total_machines <= whole.total_machines
+    if mode == ClockMode.OVERCLOCK:
+        assert clocked.total_power_shards > 0
+    else:
+        assert clocked.total_power <= whole.total_power + TOLERANCE
+
+
+def test_power_shards_survive_a_json_roundtrip(standard_recipes):
+    result = calculate_production_chain("motor", 7.0, standard_recipes, clock_mode=ClockMode.OVERCLOCK)
+    restored = import_result_from_json(export_result_to_json(result))
+    assert restored.total_power_shards == result.total_power_shards
+    assert [(node.clock_speed, node.power_shards) for node in restored.nodes] == [
+        (node.clock_speed, node.power_shards) for node in result.nodes
+    ]
@@ -0,0 +1,72 @@
+"""
+Tests for the strongly connected components of the item graph.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from data import satisfactory_db
+
+from conftest import producer_edges
+
+IRON_RECIPES = {"iron_ingot", "iron_plate", "iron_rod", "screw", "reinforced_iron_plate"}
+
+
+@pytest.mark.parametrize("unlocked", ["iron", "standard", "all"])
+def test_components_are_topologically_ordered(unlocked, standard_recipes, all_recipes):
+    unlocked = {"iron": IRON_RECIPES, "standard": standard_recipes, "all": all_recipes}[unlocked]
+    analysis = satisfactory_db.get_component_analysis(unlocked)
+    index = analysis.item_index
+    for source, target in producer_edges(unlocked):
+        c, d = analysis.component_of[index[source]], analysis.component_of[index[target]]
+        assert c <= d
+        assert (c == d) == analysis.is_loop_edge(source, target)
+    for item_id in analysis.loop_items():
+        assert analysis.in_loop(item_id)
+        assert item_id in analysis.component(item_id)
+    assert sorted(analysis.loop_items()) == sorted(i for loop in analysis.loops() for i in loop)
+
+
+def test_plain_chains_have_no_loops():
+    analysis = satisfactory_db.get_component_analysis(IRON_RECIPES)
+    assert analysis.loop_items() == []
+    assert not analysis.in_loop("reinforced_iron_plate")
+    assert analysis.component("screw") == ["screw"]
+    assert analysis.component("no_such_item") == []
+
+
+def test_packaging_round_trips_and_byproducts_are_not_loops(standard_recipes, all_recipes):
+    # Rubber and plastic turn into each other through the residue recipes
+    analysis = satisfactory_db.get_component_analysis(all_recipes)
+    assert analysis.in_loop("plastic")
+    assert analysis.component("rubber") == analysis.component("plastic")
+    assert not analysis.in_loop("reinforced_iron_plate")
+    assert not analysis.in_loop("fuel")
+    assert not analysis.in_loop("empty_canister")
+    assert len(analysis.loop_items()) < 10
+    # Compacted coal made from rocket fuel's byproduct feeds turbofuel again
+    assert sorted(satisfactory_db.get_loop_items(standard_recipes)) == [
+        "compacted_coal", "rocket_fuel", "turbofuel"
+    ]
+
+
+def test_raw_resources_never_sit_in_loops(all_recipes):
+    loops = set(satisfactory_db.get_loop_items(all_recipes))
+    raw = {item_id for item_id, item in satisfactory_db.ITEMS.items() if item["isRawResource"]}
+    assert not loops & raw
+
+
+def test_analyses_are_cached_per_unlocked_set():
+    first = satisfactory_db.get_component_analysis(IRON_RECIPES)
+    assert satisfactory_db.get_component_analysis(list(IRON_RECIPES)) is first
+
+
+def test_cache_is_shared_safely_between_threads():
+    dataset = satisfactory_db.get_dataset().with_overlay()
+    unlock_sets = [sorted(IRON_RECIPES)[:n] for n in range(1, len(IRON_RECIPES) + 1)] * 20
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        analyses = list(pool.map(dataset.get_component_analysis, unlock_sets))
+    for unlocked, analysis in zip(unlock_sets, analyses):
+        assert dataset.get_component_analysis(unlocked) is analysis
+    assert len(dataset._components) == len(IRON_RECIPES)
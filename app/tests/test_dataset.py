@@ -0,0 +1,111 @@
+"""
+Tests for datasets and their overlays.
+"""
+
+import pytest
+
+from data import satisfactory_db
+from data.integrity import DatasetIntegrityError
+from optimizer.solver import calculate_production_chain
+
+MOD_RECIPE = {
+    "id": "mod_plate",
+    "name": "Mod Plate",
+    "category": "crafting1",
+    "unlockTier": 0,
+    "machineType": "Constructor",
+    "powerConsumption": 4,
+    "craftingSpeed": 6,
+    "alternateRecipe": False,
+    "inputs": [{"item": "mod_ore", "amount": 3}],
+    "outputs": [{"item": "iron_plate", "amount": 2}],
+}
+
+CHEAP_PLATE = {
+    "id": "cheap_plate",
+    "name": "Cheap Plate",
+    "category": "crafting1",
+    "unlockTier": 0,
+    "machineType": "Constructor",
+    "powerConsumption": 4,
+    "craftingSpeed": 6,
+    "alternateRecipe": False,
+    "inputs": [{"item": "iron_ore", "amount": 3}],
+    "outputs": [{"item": "iron_plate", "amount": 2}],
+}
+
+
+def _scan(recipes, side, item_id):
+    return [recipe["id"] for recipe in recipes.values() if any(flow["item"] == item_id for flow in recipe[side])]
+
+
+@pytest.fixture(scope="module")
+def overlay():
+    base = satisfactory_db.get_dataset()
+    slow_screw = dict(base.recipes["screw"], craftingSpeed=12)
+    return base.with_overlay(
+        recipes={"cheap_plate": CHEAP_PLATE, "screw": slow_screw},
+        removed_recipes=["iron_plate"],
+        name="cheap",
+    )
+
+
+def test_overlay_reads_through_to_its_parent(overlay):
+    base = satisfactory_db.get_dataset()
+    assert overlay.parent is base and overlay.name == "cheap"
+    assert list(overlay.recipes) == [recipe_id for recipe_id in base.recipes if recipe_id != "iron_plate"] + ["cheap_plate"]
+    assert len(overlay.recipes) == len(base.recipes)
+    assert "iron_plate" not in overlay.recipes and overlay.get_recipe_by_id("iron_plate") is None
+    assert overlay.recipes["screw"]["craftingSpeed"] == 12
+    assert overlay.items is not base.items and dict(overlay.items) == dict(base.items)
+
+
+def test_overlay_leaves_its_parent_untouched(overlay):
+    base = satisfactory_db.get_dataset()
+    assert "cheap_plate" not in base.recipes
+    assert base.recipes["screw"]["craftingSpeed"] != 12
+    assert [recipe["id"] for recipe in base.get_recipes_for_item("iron_plate")] == _scan(base.recipes, "outputs", "iron_plate")
+    assert base.get_recipe_record("screw").crafting_speed != 12
+
+
+def test_overlay_indexes_match_a_scan(overlay):
+    for item_id in overlay.items:
+        assert [recipe["id"] for recipe in overlay.get_recipes_for_item(item_id)] == _scan(overlay.recipes, "outputs", item_id)
+        assert [recipe["id"] for recipe in overlay.get_recipes_using_item(item_id)] == _scan(overlay.recipes, "inputs", item_id)
+        assert [record.id for record in overlay.get_recipe_records_for_item(item_id)] == _scan(overlay.recipes, "outputs", item_id)
+
+
+def test_overlay_rates_and_records_follow_the_changes(overlay):
+    base = satisfactory_db.get_dataset()
+    assert overlay.get_recipe_rates("screw").outputs[0][1] == base.get_recipe_rates("screw").outputs[0][1] / 2
+    assert overlay.get_recipe_record("screw").crafting_speed == 12
+    assert overlay.get_recipe_rates("iron_plate") is None
+    assert overlay.get_recipe_record("cheap_plate").rates.outputs == (("iron_plate", 20.0),)
+    assert overlay.get_recipe_rates("motor") is base.get_recipe_rates("motor")
+
+
+def test_solver_uses_the_overlay(overlay, standard_recipes):
+    unlocked = (standard_recipes - {"iron_plate"}) | {"cheap_plate"}
+    result = calculate_production_chain("iron_plate", 20.0, unlocked, dataset=overlay)
+    assert [node.recipe_id for node in result.nodes] == ["cheap_plate"]
+    assert [requirement.item_id for requirement in result.raw_resources] == ["iron_ore"]
+
+
+def test_overlay_with_dangling_reference_is_rejected():
+    """Overlays are checked like any other dataset, so the solver never meets bad data."""
+    with pytest.raises(DatasetIntegrityError, match="mod_ore"):
+        satisfactory_db.get_dataset().with_overlay(recipes={"mod_plate": MOD_RECIPE})
+
+
+def test_checked_overlay_solves():
+    mod_ore = {
+        "id": "mod_ore", "name": "Mod Ore", "category": "Raw Resource",
+        "stackSize": 100, "isRawResource": True,
+    }
+    overlay = satisfactory_db.get_dataset().with_overlay(
+        items={"mod_ore": mod_ore}, recipes={"mod_plate": MOD_RECIPE}
+    )
+    assert overlay.integrity is not None and overlay.integrity.ok
+
+    result = calculate_production_chain("iron_plate", 20.0, {"mod_plate"}, dataset=overlay)
+    assert [requirement.item_id for requirement in result.raw_resources] == ["mod_ore"]
@@ -0,0 +1,56 @@
+"""
+Tests for the per-item dependency closure bitsets.
+"""
+
+from data import satisfactory_db
+
+
+def _buildable_by_scan(unlocked):
+    """Items reachable from raw resources with the unlocked recipes, the slow way."""
+    buildable = {item_id for item_id, item in satisfactory_db.ITEMS.items() if item["isRawResource"]}
+    changed = True
+    while changed:
+        changed = False
+        for recipe_id in unlocked:
+            recipe = satisfactory_db.RECIPES[recipe_id]
+            if all(inp["item"] in buildable for inp in recipe["inputs"]):
+                for out in recipe["outputs"]:
+                    if out["item"] not in buildable:
+                        buildable.add(out["item"])
+                        changed = True
+    return buildable
+
+
+def test_masks_round_trip(standard_recipes):
+    closure = satisfactory_db.get_dependency_closure()
+    mask = closure.recipe_mask(standard_recipes | {"no_such_recipe"})
+    assert set(closure.recipes_in(mask)) == standard_recipes
+
+
+def test_chain_closure_of_an_item():
+    closure = satisfactory_db.get_dependency_closure()
+    recipes = set(closure.recipes_in(closure.chain_recipes("reinforced_iron_plate")))
+    assert {"reinforced_iron_plate", "iron_plate", "iron_rod", "screw", "iron_ingot"} <= recipes
+    assert "iron_ore" in closure.items_in(closure.chain_raw_resources("iron_plate"))
+    # Raw resources are leaves
+    assert closure.chain_recipes("iron_ore") == 0
+    assert closure.items_in(closure.chain_raw_resources("iron_ore")) == ["iron_ore"]
+    assert closure.chain_recipes("no_such_item") == 0
+
+
+def test_buildable_items_match_a_scan(standard_recipes):
+    closure = satisfactory_db.get_dependency_closure()
+    iron_only = {"iron_ingot", "iron_plate", "iron_rod", "screw", "reinforced_iron_plate"}
+    for unlocked in (set(), iron_only, standard_recipes):
+        buildable = closure.buildable_items(closure.recipe_mask(unlocked))
+        assert set(closure.items_in(buildable)) == _buildable_by_scan(unlocked)
+
+
+def test_can_build(standard_recipes):
+    closure = satisfactory_db.get_dependency_closure()
+    iron_only = closure.recipe_mask({"iron_ingot", "iron_plate", "iron_rod", "screw", "reinforced_iron_plate"})
+    assert closure.can_build("reinforced_iron_plate", iron_only)
+    assert not closure.can_build("motor", iron_only)
+    assert closure.can_build("iron_ore", 0)
+    assert closure.can_build("motor", closure.recipe_mask(standard_recipes))
+    assert not closure.can_build("no_such_item", iron_only)
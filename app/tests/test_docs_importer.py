@@ -0,0 +1,148 @@
+"""
+Tests for the streaming Docs.json importer.
+"""
+
+import json
+
+import pytest
+
+from data import docs_importer
+from data.docs_importer import DocsFormatError, convert_docs, iter_native_classes
+
+
+def _native(name):
+    return f"/Script/CoreUObject.Class'/Script/FactoryGame.{name}'"
+
+
+def _items(*flows):
+    return "(" + ",".join(
+        f"(ItemClass=\"/Script/Engine.BlueprintGeneratedClass'/Game/FactoryGame/Resource/{cls[5:-2]}.{cls}'\",Amount={amount})"
+        for cls, amount in flows
+    ) + ")"
+
+
+def _building(cls):
+    return f"(\"/Game/FactoryGame/Buildable/Factory/{cls[6:-2]}.{cls}\")"
+
+
+DOCS = [
+    {"NativeClass": _native("FGResourceDescriptor"), "Classes": [
+        {"ClassName": "Desc_OreIron_C", "mDisplayName": "Iron Ore", "mStackSize": "SS_HUGE", "mForm": "RF_SOLID"},
+        {"ClassName": "Desc_Water_C", "mDisplayName": "Water", "mStackSize": "SS_FLUID", "mForm": "RF_LIQUID"},
+    ]},
+    {"NativeClass": _native("FGItemDescriptor"), "Classes": [
+        {"ClassName": "Desc_IronIngot_C", "mDisplayName": "Iron Ingot", "mStackSize": "SS_MEDIUM", "mForm": "RF_SOLID"},
+        {"ClassName": "Desc_IronPlate_C", "mDisplayName": "Iron Plate", "mStackSize": "SS_BIG", "mForm": "RF_SOLID"},
+        {"ClassName": "Desc_Unused_C", "mDisplayName": "Unused Part", "mStackSize": "SS_SMALL", "mForm": "RF_SOLID"},
+    ]},
+    {"NativeClass": _native("FGBuildableManufacturer"), "Classes": [
+        {"ClassName": "Build_SmelterMk1_C", "mDisplayName": "Smelter", "mPowerConsumption": "4.000000"},
+        {"ClassName": "Build_ConstructorMk1_C", "mDisplayName": "Constructor", "mPowerConsumption": "4.000000"},
+        {"ClassName": "Build_OilRefinery_C", "mDisplayName": "Refinery", "mPowerConsumption": "30.000000"},
+    ]},
+    {"NativeClass": _native("FGRecipe"), "Classes": [
+        {
+            "ClassName": "Recipe_IngotIron_C", "mDisplayName": "Iron Ingot",
+            "mIngredients": _items(("Desc_OreIron_C", 1)), "mProduct": _items(("Desc_IronIngot_C", 1)),
+            "mManufactoringDuration": "2.000000", "mProducedIn": _building("Build_SmelterMk1_C"),
+        },
+        {
+            "ClassName": "Recipe_IronPlate_C", "mDisplayName": "Iron Plate",
+            "mIngredients": _items(("Desc_IronIngot_C", 3)), "mProduct": _items(("Desc_IronPlate_C", 2)),
+            "mManufactoringDuration": "6.000000",
+            "mProducedIn": _building("Build_ConstructorMk1_C") + _building("BP_WorkBenchComponent_C"),
+        },
+        {
+            "ClassName": "Recipe_Alternate_PureIronIngot_C", "mDisplayName": "Alternate: Pure Iron Ingot",
+            "mIngredients": _items(("Desc_OreIron_C", 7), ("Desc_Water_C", 4000)),
+            "mProduct": _items(("Desc_IronIngot_C", 13)),
+            "mManufactoringDuration": "12.000000", "mProducedIn": _building("Build_OilRefinery_C"),
+        },
+        {
+            "ClassName": "Recipe_HandPlate_C", "mDisplayName": "Hand Plate",
+            "mIngredients": _items(("Desc_OreIron_C", 1)), "mProduct": _items(("Desc_IronPlate_C", 1)),
+            "mManufactoringDuration": "1.000000", "mProducedIn": _building("BP_WorkBenchComponent_C"),
+        },
+    ]},
+    {"NativeClass": _native("FGSchematic"), "Classes": [
+        {"ClassName": "Schematic_1-1_C", "mTechTier": "1", "mUnlocks": [
+            {"Class": "BP_UnlockRecipe_C", "mRecipes": "(\"/Game/Recipes/Recipe_IronPlate.Recipe_IronPlate_C\")"},
+        ]},
+        {"ClassName": "Schematic_Alt_C", "mTechTier": "3", "mUnlocks": [
+            {"Class": "BP_UnlockRecipe_C", "mRecipes": "(\"/Game/Recipes/Recipe_Alternate_PureIronIngot.Recipe_Alternate_PureIronIngot_C\")"},
+        ]},
+    ]},
+]
+
+EXPECTED_ITEMS = {
+    "iron_ingot": {"category": "Ingot", "id": "iron_ingot", "isRawResource": False, "name": "Iron Ingot", "stackSize": 100},
+    "iron_ore": {"category": "Raw Resource", "id": "iron_ore", "isRawResource": True, "name": "Iron Ore", "stackSize": 500},
+    "iron_plate": {"category": "Component", "id": "iron_plate", "isRawResource": False, "name": "Iron Plate", "stackSize": 200},
+    "water": {"category": "Raw Resource", "id": "water", "isRawResource": True, "name": "Water", "stackSize": 1},
+}
+
+EXPECTED_RECIPES = {
+    "iron_ingot": {
+        "alternateRecipe": False, "category": "smelting1", "craftingSpeed": 2, "id": "iron_ingot",
+        "inputs": [{"amount": 30, "item": "iron_ore"}], "machineType": "Smelter", "name": "Iron Ingot",
+        "outputs": [{"amount": 30, "item": "iron_ingot"}], "powerConsumption": 4, "unlockTier": 0,
+    },
+    "iron_plate": {
+        "alternateRecipe": False, "category": "crafting1", "craftingSpeed": 6, "id": "iron_plate",
+        "inputs": [{"amount": 30, "item": "iron_ingot"}], "machineType": "Constructor", "name": "Iron Plate",
+        "outputs": [{"amount": 20, "item": "iron_plate"}], "powerConsumption": 4, "unlockTier": 1,
+    },
+    "pure_iron_ingot": {
+        "alternateRecipe": True, "category": "refining", "craftingSpeed": 12, "id": "pure_iron_ingot",
+        "inputs": [{"amount": 35, "item": "iron_ore"}, {"amount": 20, "item": "water"}],
+        "machineType": "Refinery", "name": "Alternate: Pure Iron Ingot",
+        "outputs": [{"amount": 65, "item": "iron_ingot"}], "powerConsumption": 30, "unlockTier": 3,
+    },
+}
+
+
+@pytest.fixture
+def docs_path(tmp_path):
+    """A small Docs.json as the game ships it: UTF-16 with a BOM, indented."""
+    path = tmp_path / "Docs.json"
+    path.write_text(json.dumps(DOCS, indent="\t"), encoding="utf-16")
+    return path
+
+
+def test_converts_items_and_recipes(docs_path):
+    dataset = convert_docs(docs_path)
+    assert dataset["items"] == EXPECTED_ITEMS
+    assert dataset["recipes"] == EXPECTED_RECIPES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 2, 3, 7, 64, 1 << 16])
+def test_chunk_boundaries_do_not_change_the_result(docs_path, monkeypatch, chunk_size):
+    """Tokens, strings and whole class objects split across reads are reassembled."""
+    monkeypatch.setattr(docs_importer, "CHUNK_SIZE", chunk_size)
+    classes = [(native, obj["ClassName"]) for native, obj in iter_native_classes(docs_path)]
+    assert classes == [
+        (group["NativeClass"].rsplit(".", 1)[1].rstrip("'"), obj["ClassName"])
+        for group in DOCS for obj in group["Classes"]
+    ]
+    assert convert_docs(docs_path)["recipes"] == EXPECTED_RECIPES
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-16-le", "utf-16-be", "utf-8", "utf-8-sig"])
+def test_encodings_are_detected(tmp_path, monkeypatch, encoding):
+    monkeypatch.setattr(docs_importer, "CHUNK_SIZE", 5)
+    path = tmp_path / "en-US.json"
+    path.write_text(json.dumps(DOCS), encoding=encoding)
+    dataset = convert_docs(path)
+    assert dataset["items"] == EXPECTED_ITEMS
+    assert dataset["recipes"] == EXPECTED_RECIPES
+
+
+def test_empty_and_malformed_files(tmp_path):
+    empty = tmp_path / "empty.json"
+    empty.write_text(" [ ] ", encoding="utf-8")
+    assert list(iter_native_classes(empty)) == []
+
+    not_docs = tmp_path / "object.json"
+    not_docs.write_text('{"Classes": []}', encoding="utf-8")
+    with pytest.raises(DocsFormatError):
+        list(iter_native_classes(not_docs))
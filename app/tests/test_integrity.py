@@ -0,0 +1,71 @@
+"""
+Tests for the one-time dataset integrity check.
+"""
+
+import pytest
+
+from data import integrity, satisfactory_db, snapshot
+from data.integrity import DatasetIntegrityError
+from data.readonly import thaw
+
+
+@pytest.fixture
+def data():
+    return thaw(satisfactory_db.ITEMS), thaw(satisfactory_db.RECIPES)
+
+
+def test_base_data_passes():
+    assert satisfactory_db.INTEGRITY.ok
+    assert integrity.check_dataset(satisfactory_db.ITEMS, satisfactory_db.RECIPES).ok
+
+
+def test_structural_errors_are_reported(data):
+    items, recipes = data
+    recipes["screw"]["inputs"][0]["item"] = "no_such_item"
+    recipes["motor"]["craftingSpeed"] = 0
+    recipes["rotor"]["id"] = "stator"
+    report = integrity.check_dataset(items, recipes)
+    assert not report.ok
+    assert len(report.errors) == 3
+    assert any("no_such_item" in error for error in report.errors)
+    with pytest.raises(DatasetIntegrityError, match="broken"):
+        integrity.require_valid(report, "broken")
+
+
+def test_unbuildable_items_are_warnings(data):
+    items, recipes = data
+    for recipe in satisfactory_db.get_recipes_for_item("iron_ingot"):
+        del recipes[recipe["id"]]
+    report = integrity.check_dataset(items, recipes)
+    assert report.ok
+    assert "Item 'iron_ingot' cannot be built from raw resources" in report.warnings
+
+
+def test_bad_versions_are_rejected(data):
+    items, recipes = data
+    recipes["screw"]["outputs"] = []
+    with pytest.raises(DatasetIntegrityError):
+        satisfactory_db.register_version("test_broken", items, recipes)
+    assert "test_broken" not in satisfactory_db.list_versions()
+
+
+def test_verdict_is_cached_per_source_hash(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    source = tmp_path / "game_data.py"
+    source.write_text("ITEMS = {}\n")
+    calls = []
+
+    def check(items, recipes):
+        calls.append(1)
+        return integrity.IntegrityReport(warnings=["checked"])
+
+    monkeypatch.setattr(integrity, "check_dataset", check)
+    for _ in range(2):
+        assert integrity.load_verdict({}, {}, source).warnings == ["checked"]
+    assert len(calls) == 1
+    source.write_text("ITEMS = {'x': {}}\n")
+    integrity.load_verdict({}, {}, source)
+    assert len(calls) == 2
+    monkeypatch.setattr(integrity, "CHECKER_VERSION", integrity.CHECKER_VERSION + 1)
+    integrity.load_verdict({}, {}, source)
+    assert len(calls) == 3
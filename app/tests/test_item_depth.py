@@ -0,0 +1,53 @@
+"""
+Tests for the topological rank and depth table of items.
+"""
+
+from data import satisfactory_db
+
+from conftest import producer_edges
+
+IRON_RECIPES = {"iron_ingot", "iron_plate", "iron_rod", "screw", "reinforced_iron_plate"}
+
+
+def test_depths_of_a_plain_chain():
+    table = satisfactory_db.get_depth_table(IRON_RECIPES)
+    assert table.depth_of("iron_ore") == 0
+    assert table.depth_of("iron_ingot") == 1
+    assert table.depth_of("iron_plate") == 2
+    assert table.depth_of("screw") == 3
+    assert table.depth_of("reinforced_iron_plate") == 4
+    assert table.depth_of("no_such_item") == 0
+    assert table.rank_of("no_such_item") is None
+    assert "reinforced_iron_plate" in table.stages()[4]
+
+
+def test_ranks_put_inputs_before_outputs(standard_recipes):
+    table = satisfactory_db.get_depth_table(standard_recipes)
+    analysis = satisfactory_db.get_component_analysis(standard_recipes)
+    order = table.topological_order()
+    assert sorted(order) == sorted(satisfactory_db.ITEMS)
+    for item_id, rank in zip(order, range(len(order))):
+        assert table.rank_of(item_id) == rank
+    for source, target in producer_edges(standard_recipes):
+        if analysis.is_loop_edge(source, target):
+            assert table.depth_of(source) == table.depth_of(target)
+        else:
+            assert table.rank_of(source) < table.rank_of(target)
+            assert table.depth_of(source) < table.depth_of(target)
+
+
+def test_depth_tables_are_cached_per_unlocked_set():
+    first = satisfactory_db.get_depth_table(IRON_RECIPES)
+    assert satisfactory_db.get_depth_table(sorted(IRON_RECIPES)) is first
+
+
+def test_depth_tables_accept_one_shot_iterables():
+    table = satisfactory_db.get_dataset().with_overlay().get_depth_table(iter(IRON_RECIPES))
+    assert table.depth_of("reinforced_iron_plate") == 4
+
+
+def test_depths_spread_out_with_every_recipe_unlocked(all_recipes):
+    table = satisfactory_db.get_depth_table(all_recipes)
+    assert table.depth_of("iron_plate") < table.depth_of("reinforced_iron_plate")
+    assert table.depth_of("reinforced_iron_plate") < table.depth_of("modular_frame")
+    assert len(table.stages()) > 10
@@ -0,0 +1,71 @@
+"""
+Tests for the linear-programming engine.
+"""
+
+import pytest
+
+from optimizer.models import CalculationStatus, OptimizationObjective, SolverEngine
+from optimizer.solver import calculate_production_chain
+from conftest import net_flows
+
+# LP values below the engine's epsilon are dropped from the result
+TOLERANCE = 1e-3
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+@pytest.mark.parametrize("target", [
+    "adaptive_control_unit", "aluminum_ingot", "plastic", "heavy_modular_frame", "computer",
+])
+def test_every_item_is_balanced(all_recipes, target, objective):
+    """No item is consumed faster than it is made or supplied."""
+    result = calculate_production_chain(
+        target, 10.0, all_recipes, objective, engine=SolverEngine.LP
+    )
+    assert result.status == CalculationStatus.SUCCESS
+    net = net_flows(result)
+    assert net[target] >= 10.0 - TOLERANCE
+    assert {item_id: rate for item_id, rate in net.items() if rate < -TOLERANCE} == {}
+
+
+@pytest.mark.parametrize("rate", [10.0, 60.0])
+@pytest.mark.parametrize("target", ["iron_plate", "reinforced_iron_plate", "motor"])
+def test_single_recipe_chains_pick_the_greedy_recipes(standard_recipes, target, rate):
+    """With one recipe per item both engines pick the same recipes; the LP runs no spare capacity."""
+    greedy = calculate_production_chain(target, rate, standard_recipes)
+    lp = calculate_production_chain(target, rate, standard_recipes, engine=SolverEngine.LP)
+    assert sorted(node.recipe_id for node in lp.nodes) == sorted(node.recipe_id for node in greedy.nodes)
+    greedy_raw = {requirement.item_id: requirement.rate for requirement in greedy.raw_resources}
+    assert set(greedy_raw) == {requirement.item_id for requirement in lp.raw_resources}
+    for requirement in lp.raw_resources:
+        assert requirement.rate <= greedy_raw[requirement.item_id] + TOLERANCE
+
+
+def test_nodes_are_named_for_their_primary_output(standard_recipes):
+    """Byproducts (water from aluminum scrap, silica from alumina) never name a node."""
+    result = calculate_production_chain(
+        "aluminum_ingot", 10.0, standard_recipes, OptimizationObjective.BALANCED,
+        engine=SolverEngine.LP
+    )
+    assert {node.recipe_id: node.item_produced for node in result.nodes} == {
+        "silica": "silica",
+        "alumina_solution": "alumina_solution",
+        "aluminum_scrap": "aluminum_scrap",
+        "aluminum_ingot": "aluminum_ingot",
+    }
+    for node in result.nodes:
+        produced = {flow.item_id: flow.rate for flow in node.outputs}
+        assert node.target_rate == pytest.approx(produced[node.item_produced])
+
+
+def test_loops_are_reported_only_when_the_solution_runs_one(all_recipes):
+    """Items sharing an SCC of the unlocked graph are not a loop of the solution."""
+    plain = calculate_production_chain(
+        "heavy_modular_frame", 10.0, all_recipes, OptimizationObjective.BALANCED,
+        engine=SolverEngine.LP
+    )
+    assert not any("Recycling loops" in message for message in plain.messages)
+
+    recycled = calculate_production_chain(
+        "rubber", 10.0, all_recipes, OptimizationObjective.MINIMIZE_WASTE, engine=SolverEngine.LP
+    )
+    assert "Recycling loops balanced by the LP: Plastic, Rubber" in recycled.messages
@@ -0,0 +1,63 @@
+"""
+Tests for compiled production plans.
+"""
+
+import pytest
+
+from optimizer.models import OptimizationObjective
+from optimizer.plan import chain_depths
+from optimizer.solver import calculate_production_chain, compile_production_plan
+
+TARGETS = ["motor", "computer", "heavy_modular_frame", "adaptive_control_unit", "plastic", "fuel"]
+
+
+def _chain(result):
+    return (
+        [(node.recipe_id, node.machine_count, node.target_rate) for node in result.nodes],
+        [(connection.from_node_id, connection.to_node_id, connection.rate) for connection in result.connections],
+        [(requirement.item_id, requirement.rate) for requirement in result.raw_resources],
+    )
+
+
+@pytest.mark.parametrize("objective, chain_aware_scoring", [
+    (OptimizationObjective.MINIMIZE_POWER, False),
+    (OptimizationObjective.MINIMIZE_WASTE, False),
+    (OptimizationObjective.BALANCED, True),
+    (OptimizationObjective.MINIMIZE_MACHINES, True),
+])
+@pytest.mark.parametrize("target", TARGETS)
+def test_rate_free_plan_scales_like_a_fresh_solve(all_recipes, target, objective, chain_aware_scoring):
+    plan = compile_production_plan(
+        target, 10.0, all_recipes, objective, chain_aware_scoring=chain_aware_scoring
+    )
+    assert plan.rate_free
+    for rate in (1.0, 7.5, 10.0, 45.0, 300.0):
+        fresh = calculate_production_chain(
+            target, rate, all_recipes, objective, chain_aware_scoring=chain_aware_scoring
+        )
+        assert _chain(plan.scale(rate)) == _chain(fresh), rate
+
+
+@pytest.mark.parametrize("objective", [
+    OptimizationObjective.BALANCED, OptimizationObjective.MINIMIZE_MACHINES
+])
+def test_rate_dependent_plan_is_flagged(standard_recipes, objective):
+    """Choices scored at the compile rate cannot be trusted at other rates."""
+    plan = compile_production_plan("motor", 10.0, standard_recipes, objective)
+    assert not plan.rate_free
+    fresh = calculate_production_chain("motor", 10.0, standard_recipes, objective)
+    assert _chain(plan.scale(10.0)) == _chain(fresh)
+
+
+def test_chain_depths_follow_the_chain_not_the_unlocked_graph(all_recipes):
+    """With every recipe unlocked most items share one SCC; the chain still has stages."""
+    result = calculate_production_chain(
+        "heavy_modular_frame", 10.0, all_recipes, OptimizationObjective.BALANCED
+    )
+    depths = chain_depths(result.nodes, result.connections)
+    assert set(depths) == {node.node_id for node in result.nodes}
+    assert len(set(depths.values())) > 3
+    for connection in result.connections:
+        assert depths[connection.from_node_id] < depths[connection.to_node_id]
+    target = next(node for node in result.nodes if node.item_produced == "heavy_modular_frame")
+    assert depths[target.node_id] == max(depths.values())
@@ -0,0 +1,51 @@
+"""
+Tests for the precomputed minimum raw-resource cost tables.
+"""
+
+import math
+
+import pytest
+
+from data import satisfactory_db
+from optimizer.models import CalculationStatus, OptimizationObjective
+from optimizer.raw_costs import build_raw_cost_table, get_raw_cost_table
+from optimizer.solver import ProductionChainSolver, calculate_production_chain
+
+
+def test_iron_plate_estimate(standard_recipes):
+    table = get_raw_cost_table(satisfactory_db.get_dataset(), standard_recipes, OptimizationObjective.BALANCED)
+    assert table.best_recipe("iron_ingot") == "iron_ingot"
+    assert table.estimate("iron_plate", 20.0) == {"iron_ore": pytest.approx(30.0)}
+    assert table.cost("iron_ore") == 0.0
+
+
+def test_locked_items_are_not_buildable():
+    table = build_raw_cost_table(satisfactory_db.get_dataset(), frozenset(), OptimizationObjective.BALANCED)
+    assert not table.is_buildable("iron_plate")
+    assert table.cost("iron_plate") == math.inf
+    assert table.estimate("iron_plate", 10.0) == {}
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+def test_every_standard_target_has_a_finite_cost(standard_recipes, objective):
+    table = get_raw_cost_table(satisfactory_db.get_dataset(), standard_recipes, objective)
+    for item_id in ("motor", "computer", "heavy_modular_frame"):
+        assert table.is_buildable(item_id)
+        assert table.cost(item_id) == pytest.approx(
+            table.recipe_cost(satisfactory_db.get_recipe_record(table.best_recipe(item_id)), item_id)
+        )
+
+
+def test_tables_are_cached_per_unlocked_set(standard_recipes):
+    dataset = satisfactory_db.get_dataset()
+    first = get_raw_cost_table(dataset, standard_recipes, OptimizationObjective.BALANCED)
+    assert get_raw_cost_table(dataset, set(standard_recipes), OptimizationObjective.BALANCED) is first
+    assert get_raw_cost_table(dataset, standard_recipes, OptimizationObjective.MINIMIZE_POWER) is not first
+
+
+def test_chain_aware_scoring_solves(standard_recipes):
+    result = calculate_production_chain("motor", 5.0, standard_recipes, chain_aware_scoring=True)
+    assert result.status == CalculationStatus.SUCCESS
+    assert ProductionChainSolver(standard_recipes).estimate_raw_resources("iron_plate", 20.0) == {
+        "iron_ore": pytest.approx(30.0)
+    }
@@ -0,0 +1,31 @@
+"""
+Tests for the shared read-only game data views.
+"""
+
+import pytest
+
+from data import satisfactory_db
+from data.readonly import freeze, thaw
+
+
+def test_game_data_cannot_be_modified():
+    with pytest.raises(TypeError):
+        satisfactory_db.ITEMS["motor"] = {}
+    with pytest.raises(TypeError):
+        satisfactory_db.RECIPES["motor"]["craftingSpeed"] = 1
+    with pytest.raises(AttributeError):
+        satisfactory_db.RECIPES["motor"]["inputs"].append({"item": "screw", "amount": 1})
+
+
+def test_freeze_and_thaw_round_trip():
+    data = {"a": [{"item": "x", "amount": 1}], "b": {"c": [1, 2]}}
+    frozen = freeze(data)
+    assert isinstance(frozen["a"], tuple)
+    assert thaw(frozen) == data
+    assert isinstance(thaw(frozen)["b"]["c"], list)
+
+
+def test_accessors_share_one_copy():
+    assert satisfactory_db.get_raw_resources() is satisfactory_db.get_raw_resources()
+    assert satisfactory_db.get_craftable_items() is satisfactory_db.get_craftable_items()
+    assert satisfactory_db.get_recipes_for_item("iron_plate") is satisfactory_db.get_recipes_for_item("iron_plate")
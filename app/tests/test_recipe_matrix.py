@@ -0,0 +1,88 @@
+"""
+Tests for the item x recipe stoichiometry matrix.
+"""
+
+import pytest
+
+from data import satisfactory_db
+from data.recipe_rates import build_recipe_rates
+
+
+def _expected_column(recipe):
+    per_minute = 60.0 / recipe["craftingSpeed"]
+    return [(inp["item"], -inp["amount"] * per_minute) for inp in recipe["inputs"]] + [
+        (out["item"], out["amount"] * per_minute) for out in recipe["outputs"]
+    ]
+
+
+def test_columns_hold_signed_rates_per_machine():
+    matrix = satisfactory_db.get_recipe_matrix()
+    assert matrix.recipe_ids == list(satisfactory_db.RECIPES)
+    assert matrix.item_ids == list(satisfactory_db.ITEMS)
+    for recipe_id, recipe in satisfactory_db.RECIPES.items():
+        column = [
+            (matrix.item_ids[i], rate)
+            for i, rate in matrix.recipe_column(matrix.recipe_index[recipe_id])
+        ]
+        expected = _expected_column(recipe)
+        assert [item_id for item_id, _ in column] == [item_id for item_id, _ in expected]
+        assert [rate for _, rate in column] == pytest.approx([rate for _, rate in expected])
+        assert matrix.power[matrix.recipe_index[recipe_id]] == recipe["powerConsumption"]
+
+
+def test_rows_are_the_transpose_of_the_columns():
+    matrix = satisfactory_db.get_recipe_matrix()
+    from_columns = sorted(
+        (i, r, rate)
+        for r in range(matrix.num_recipes)
+        for i, rate in matrix.recipe_column(r)
+    )
+    from_rows = sorted(
+        (i, r, rate)
+        for i in range(matrix.num_items)
+        for r, rate in matrix.item_row(i)
+    )
+    assert from_rows == from_columns
+    assert len(from_rows) == matrix.nnz
+
+
+def test_matrix_products_match_the_columns():
+    matrix = satisfactory_db.get_recipe_matrix()
+    r = matrix.recipe_index["motor"]
+    machines = [0.0] * matrix.num_recipes
+    machines[r] = 2.0
+    net = matrix.net_item_rates(machines)
+    expected = [0.0] * matrix.num_items
+    for i, rate in matrix.recipe_column(r):
+        expected[i] += 2.0 * rate
+    assert net == pytest.approx(expected)
+
+    weights = [float(i) for i in range(matrix.num_items)]
+    assert matrix.recipe_weights(weights)[r] == pytest.approx(
+        sum(rate * weights[i] for i, rate in matrix.recipe_column(r))
+    )
+
+
+def test_rates_are_per_minute_for_one_machine():
+    rates = build_recipe_rates({
+        "craftingSpeed": 6,
+        "inputs": [{"item": "iron_ingot", "amount": 3}],
+        "outputs": [{"item": "iron_plate", "amount": 2}, {"item": "iron_dust", "amount": 1}],
+    })
+    assert rates.inputs == (("iron_ingot", 30.0),)
+    assert rates.outputs == (("iron_plate", 20.0), ("iron_dust", 10.0))
+    assert rates.total_input == 30.0
+    assert rates.total_output == 30.0
+    assert rates.output_rate("iron_dust") == 10.0
+    assert rates.output_rate("iron_ingot") is None
+    assert rates.input_rate("iron_ingot") == 30.0
+
+
+def test_rate_table_covers_every_recipe():
+    for recipe_id, recipe in satisfactory_db.RECIPES.items():
+        rates = satisfactory_db.get_recipe_rates(recipe_id)
+        flows = list(rates.inputs) + list(rates.outputs)
+        expected = _expected_column(recipe)
+        assert [item_id for item_id, _ in flows] == [item_id for item_id, _ in expected]
+        assert [rate for _, rate in flows] == pytest.approx([abs(rate) for _, rate in expected])
+    assert satisfactory_db.get_recipe_rates("no_such_recipe") is None
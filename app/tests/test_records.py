@@ -0,0 +1,42 @@
+"""
+Tests for the immutable item and recipe records.
+"""
+
+from collections.abc import Mapping
+
+import pytest
+
+from data import satisfactory_db
+from data.records import item_to_dict, recipe_to_dict
+
+
+def _plain(value):
+    """Copy nested mappings and sequences into dicts and lists for comparison."""
+    if isinstance(value, Mapping):
+        return {key: _plain(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_plain(item) for item in value]
+    return value
+
+
+def test_records_round_trip_to_the_dict_schema():
+    for item_id, item in satisfactory_db.ITEMS.items():
+        assert item_to_dict(satisfactory_db.get_item_record(item_id)) == _plain(item)
+    for recipe_id, recipe in satisfactory_db.RECIPES.items():
+        record = satisfactory_db.get_recipe_record(recipe_id)
+        assert recipe_to_dict(record) == _plain(recipe)
+        assert record.rates == satisfactory_db.get_recipe_rates(recipe_id)
+
+
+def test_records_are_immutable_and_hashable():
+    record = satisfactory_db.get_recipe_record("motor")
+    with pytest.raises(AttributeError):
+        record.name = "Engine"
+    assert len({record, satisfactory_db.get_recipe_record("motor")}) == 1
+
+
+def test_producer_records_follow_the_producer_index():
+    for item_id in satisfactory_db.ITEMS:
+        assert [record.id for record in satisfactory_db.get_recipe_records_for_item(item_id)] == [
+            recipe["id"] for recipe in satisfactory_db.get_recipes_for_item(item_id)
+        ]
@@ -0,0 +1,64 @@
+"""
+Tests for the module-level lookups of satisfactory_db.
+"""
+
+import pytest
+
+from data import satisfactory_db
+from optimizer.solver import calculate_production_chain
+
+
+def _scan(side, item_id):
+    return [
+        recipe for recipe in satisfactory_db.RECIPES.values()
+        if any(flow["item"] == item_id for flow in recipe[side])
+    ]
+
+
+def test_producers_match_a_scan_of_recipes():
+    for item_id in satisfactory_db.ITEMS:
+        assert list(satisfactory_db.get_recipes_for_item(item_id)) == _scan("outputs", item_id)
+    assert list(satisfactory_db.get_recipes_for_item("no_such_item")) == []
+
+
+def test_consumers_match_a_scan_of_recipes():
+    for item_id in satisfactory_db.ITEMS:
+        assert list(satisfactory_db.get_recipes_using_item(item_id)) == _scan("inputs", item_id)
+    assert list(satisfactory_db.get_recipes_using_item("no_such_item")) == []
+
+
+@pytest.fixture
+def patched_version():
+    """A registered version with a slower motor recipe and no screw recipe."""
+    recipes = {recipe_id: dict(recipe) for recipe_id, recipe in satisfactory_db.RECIPES.items()}
+    recipes["motor"] = dict(recipes["motor"], craftingSpeed=24)
+    del recipes["reinforced_iron_plate"]
+    items = {item_id: dict(item) for item_id, item in satisfactory_db.ITEMS.items()}
+    dataset = satisfactory_db.register_version("test_patch", items, recipes)
+    yield dataset
+    satisfactory_db.unregister_version("test_patch")
+
+
+def test_versions_share_unchanged_records(patched_version):
+    base = satisfactory_db.get_dataset()
+    assert satisfactory_db.get_dataset("test_patch") is patched_version
+    assert "test_patch" in satisfactory_db.list_versions()
+    assert patched_version.recipes.changed_keys == {"motor"}
+    assert "reinforced_iron_plate" not in patched_version.recipes
+    assert patched_version.get_recipe_record("screw") is base.get_recipe_record("screw")
+    assert patched_version.get_recipe_record("motor").crafting_speed == 24
+    assert base.get_recipe_record("motor").crafting_speed != 24
+
+
+def test_solves_against_a_registered_version(patched_version, standard_recipes):
+    base = calculate_production_chain("motor", 60.0, standard_recipes)
+    patched = calculate_production_chain("motor", 60.0, standard_recipes, version="test_patch")
+    machines = lambda result: next(node.machine_count for node in result.nodes if node.recipe_id == "motor")
+    assert machines(patched) > machines(base)
+
+
+def test_unregistered_versions_are_gone():
+    with pytest.raises(KeyError):
+        satisfactory_db.get_dataset("test_patch")
+    with pytest.raises(ValueError):
+        satisfactory_db.unregister_version(satisfactory_db.DEFAULT_VERSION)
@@ -0,0 +1,37 @@
+"""
+Tests for the item / recipe search index.
+"""
+
+from data import satisfactory_db
+from data.search_index import FUZZY_THRESHOLD, build_search_index
+
+
+def test_word_prefixes_find_the_item():
+    hits = satisfactory_db.search("rein iron", kinds=("item",))
+    assert hits[0].id == "reinforced_iron_plate"
+    assert hits[0].score >= 1.0
+
+
+def test_exact_name_ranks_first():
+    hits = satisfactory_db.search("Motor")
+    assert (hits[0].kind, hits[0].id) in {("item", "motor"), ("recipe", "motor")}
+    assert hits[0].score == 4.0
+
+
+def test_typos_fall_back_to_fuzzy_matches():
+    hits = satisfactory_db.search("moter", kinds=("item",))
+    assert "motor" in [hit.id for hit in hits]
+    assert all(FUZZY_THRESHOLD <= hit.score < 1.0 for hit in hits)
+
+
+def test_kinds_and_limit():
+    recipes = satisfactory_db.search("iron", kinds=("recipe",), limit=5)
+    assert 0 < len(recipes) <= 5
+    assert all(hit.kind == "recipe" for hit in recipes)
+    assert satisfactory_db.search("   ") == []
+
+
+def test_hits_are_sorted_by_score_then_name():
+    index = build_search_index(satisfactory_db.ITEMS, satisfactory_db.RECIPES)
+    hits = index.search("plate", limit=100)
+    assert hits == sorted(hits, key=lambda hit: (-hit.score, hit.name))
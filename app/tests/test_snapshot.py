@@ -0,0 +1,50 @@
+"""
+Tests for hash-keyed data snapshots.
+"""
+
+import pytest
+
+from data import snapshot
+
+
+@pytest.fixture
+def source(tmp_path, monkeypatch):
+    monkeypatch.setattr(snapshot, "SNAPSHOT_DIR", tmp_path / "snapshots")
+    path = tmp_path / "game_data.py"
+    path.write_text("ITEMS = {}\n")
+    return path
+
+
+def _loader(calls, payload):
+    def build():
+        calls.append(1)
+        return payload
+    return build
+
+
+def test_snapshot_is_built_once_per_source_hash(source):
+    calls = []
+    payload = {"items": {"iron_ore": {"name": "Iron Ore", "amounts": [1, 2.5]}}}
+    assert snapshot.load_cached(source, _loader(calls, payload)) == payload
+    assert snapshot.load_cached(source, _loader(calls, payload)) == payload
+    assert len(calls) == 1
+
+
+def test_changed_source_rebuilds_and_drops_the_old_snapshot(source):
+    calls = []
+    snapshot.load_cached(source, _loader(calls, {"version": 1}))
+    old = snapshot.snapshot_path(source, snapshot.file_hash(source))
+    assert old.exists()
+
+    source.write_text("ITEMS = {'iron_ore': {}}\n")
+    assert snapshot.load_cached(source, _loader(calls, {"version": 2})) == {"version": 2}
+    assert len(calls) == 2
+    assert not old.exists()
+
+
+def test_unreadable_snapshot_is_rebuilt(source):
+    calls = []
+    snapshot.load_cached(source, _loader(calls, {"version": 1}))
+    snapshot.snapshot_path(source, snapshot.file_hash(source)).write_bytes(b"not marshal")
+    assert snapshot.load_cached(source, _loader(calls, {"version": 1})) == {"version": 1}
+    assert len(calls) == 2
@@ -0,0 +1,291 @@
+"""
+Tests for the greedy production chain solver.
+"""
+import dataclasses
+import gc
+import random
+import weakref
+
+import pytest
+
+from data import satisfactory_db
+from optimizer import solver
+from optimizer.models import CalculationStatus, ClockMode, OptimizationObjective, SolverEngine
+from optimizer.objectives import select_best_recipe
+from optimizer.solver import (
+    SUBCHAIN_CACHE, ProductionChainSolver, calculate_factory, calculate_production_chain,
+    compile_production_plan, recalculate_production_chain
+)
+
+from conftest import net_flows
+
+TOLERANCE = 1e-6
+RATE_FREE_OBJECTIVES = [OptimizationObjective.MINIMIZE_POWER, OptimizationObjective.MINIMIZE_WASTE]
+
+
+def _chain(result):
+    return (
+        [(node.recipe_id, node.machine_count, node.target_rate) for node in result.nodes],
+        [(requirement.item_id, requirement.rate) for requirement in result.raw_resources],
+    )
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+@pytest.mark.parametrize("target", ["heavy_modular_frame", "computer", "adaptive_control_unit"])
+def test_shared_intermediates_get_one_node_sized_for_every_consumer(standard_recipes, target, objective):
+    result = calculate_production_chain(target, 10.0, standard_recipes, objective)
+    produced = [node.item_produced for node in result.nodes]
+    assert len(produced) == len(set(produced))
+    net = net_flows(result)
+    assert net[target] >= 10.0 - TOLERANCE
+    assert all(value >= -TOLERANCE for value in net.values())
+
+
+def test_deep_chains_do_not_hit_the_recursion_limit():
+    depth = 1200
+    item = dict(satisfactory_db.ITEMS["iron_plate"])
+    recipe = dict(satisfactory_db.RECIPES["iron_plate"])
+    items, recipes = {}, {}
+    previous = "iron_plate"
+    for level in range(depth):
+        item_id = f"deep_part_{level}"
+        items[item_id] = dict(item, id=item_id, name=f"Deep Part {level}")
+        recipes[item_id] = dict(
+            recipe, id=item_id, name=f"Deep Part {level}",
+            inputs=({"item": previous, "amount": 20},), outputs=({"item": item_id, "amount": 20},)
+        )
+        previous = item_id
+    dataset = satisfactory_db.get_dataset().with_overlay(items=items, recipes=recipes, name="deep")
+    unlocked = {"iron_ingot", "iron_plate"} | set(recipes)
+    result = calculate_production_chain(previous, 20.0, unlocked, dataset=dataset)
+    assert len(result.nodes) == depth + 2
+    assert [requirement.item_id for requirement in result.raw_resources] == ["iron_ore"]
+    assert net_flows(result)[previous] >= 20.0 - TOLERANCE
+
+
+@pytest.mark.parametrize("chain_aware_scoring", [False, True])
+@pytest.mark.parametrize("objective", RATE_FREE_OBJECTIVES)
+def test_memoized_subchains_match_unmemoized_solves(all_recipes, objective, chain_aware_scoring):
+    SUBCHAIN_CACHE.invalidate()
+    SUBCHAIN_CACHE.reset_stats()
+    for target in ("motor", "computer", "heavy_modular_frame", "adaptive_control_unit"):
+        for rate in (5.0, 30.0):
+            fresh = ProductionChainSolver(
+                all_recipes, objective, chain_aware_scoring=chain_aware_scoring, memoize=False
+            ).solve(target, rate)
+            memoized = ProductionChainSolver(
+                all_recipes, objective, chain_aware_scoring=chain_aware_scoring
+            ).solve(target, rate)
+            assert _chain(memoized) == _chain(fresh), (target, rate)
+    stats = SUBCHAIN_CACHE.stats()
+    assert stats.hits > 0
+    assert stats.size <= stats.max_size
+
+
+def test_invalidate_drops_entries_by_item(all_recipes):
+    SUBCHAIN_CACHE.invalidate()
+    ProductionChainSolver(all_recipes, OptimizationObjective.MINIMIZE_POWER).solve("motor", 10.0)
+    assert len(SUBCHAIN_CACHE) > 0
+    assert SUBCHAIN_CACHE.invalidate(item_id="rotor") > 0
+    SUBCHAIN_CACHE.invalidate(dataset=satisfactory_db.get_dataset())
+    assert len(SUBCHAIN_CACHE) == 0
+
+
+def test_cache_does_not_keep_datasets_alive(all_recipes):
+    SUBCHAIN_CACHE.invalidate()
+    overlay = satisfactory_db.get_dataset().with_overlay()
+    ProductionChainSolver(all_recipes, OptimizationObjective.MINIMIZE_POWER, dataset=overlay).solve("motor", 10.0)
+    assert len(SUBCHAIN_CACHE) > 0
+    ref = weakref.ref(overlay)
+    del overlay
+    gc.collect()
+    assert ref() is None
+
+
+def test_unregistering_a_version_drops_its_subchains(all_recipes):
+    SUBCHAIN_CACHE.invalidate()
+    dataset = satisfactory_db.register_version(
+        "test_cache", dict(satisfactory_db.ITEMS), dict(satisfactory_db.RECIPES)
+    )
+    ProductionChainSolver(all_recipes, OptimizationObjective.MINIMIZE_POWER, dataset=dataset).solve("motor", 10.0)
+    ProductionChainSolver(all_recipes, OptimizationObjective.MINIMIZE_POWER).solve("motor", 10.0)
+    size = len(SUBCHAIN_CACHE)
+    satisfactory_db.unregister_version("test_cache")
+    assert 0 < len(SUBCHAIN_CACHE) < size
+    assert SUBCHAIN_CACHE.invalidate(dataset=dataset) == 0
+
+
+def test_rate_dependent_objectives_bypass_the_cache(all_recipes):
+    SUBCHAIN_CACHE.invalidate()
+    for objective in (OptimizationObjective.MINIMIZE_MACHINES, OptimizationObjective.BALANCED):
+        solver_ = ProductionChainSolver(all_recipes, objective)
+        assert solver_.subchain_cache is None
+        solver_.solve("motor", 10.0)
+    assert len(SUBCHAIN_CACHE) == 0
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+def test_factory_produces_every_target(standard_recipes, objective):
+    targets = {"heavy_modular_frame": 10.0, "computer": 5.0, "motor": 20.0}
+    factory = calculate_factory(targets, standard_recipes, objective)
+    net = net_flows(factory)
+    for target, rate in targets.items():
+        assert net[target] >= rate - TOLERANCE
+    assert all(value >= -TOLERANCE for value in net.values())
+    produced = [node.item_produced for node in factory.nodes]
+    assert len(produced) == len(set(produced))
+    separate = sum(
+        calculate_production_chain(target, rate, standard_recipes, objective).total_machines
+        for target, rate in targets.items()
+    )
+    assert factory.total_machines <= separate
+
+
+@pytest.mark.parametrize("engine", list(SolverEngine))
+def test_loop_free_chain_has_no_recycling_connections(all_recipes, engine):
+    """With every recipe unlocked most items share one SCC; the chain itself has no loop."""
+    result = calculate_production_chain(
+        "heavy_modular_frame", 10.0, all_recipes, OptimizationObjective.BALANCED, engine=engine
+    )
+    assert result.connections
+    assert not any(connection.is_recycling_loop for connection in result.connections)
+
+
+def test_recycling_connections_follow_the_chosen_loop(all_recipes):
+    """Packaging alumina solution and unpackaging it again is a loop of the chain."""
+    result = calculate_production_chain(
+        "aluminum_ingot", 10.0, all_recipes, OptimizationObjective.BALANCED
+    )
+    recipes = {node.recipe_id for node in result.nodes}
+    assert {"packaged_alumina_solution", "unpackage_alumina_solution"} <= recipes
+    flagged = {connection.item_id for connection in result.connections if connection.is_recycling_loop}
+    assert flagged == {"packaged_alumina_solution", "alumina_solution", "empty_canister"}
+
+
+@pytest.mark.parametrize("engine", list(SolverEngine))
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+@pytest.mark.parametrize("unlocked", ["standard_recipes", "all_recipes"])
+def test_target_shares_add_up_to_each_node(request, unlocked, objective, engine):
+    """Every node's output is handed out to the targets in full."""
+    targets = {"heavy_modular_frame": 10.0, "computer": 5.0, "motor": 20.0, "aluminum_ingot": 5.0}
+    result = calculate_factory(targets, request.getfixturevalue(unlocked), objective, engine=engine)
+    assert result.targets == targets
+    for node in result.nodes:
+        assert sum(node.output_by_target.values()) == pytest.approx(node.target_rate), node.node_id
+
+
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+def test_incremental_resolve_matches_fresh_solve(all_recipes, objective):
+    """A re-chosen consumer changes the rates its inputs are scored at."""
+    added = {"packaged_turbofuel"}
+    removed = {"automated_wiring", "electrode_circuit_board"}
+    before = (all_recipes | removed) - added
+    after = (before - removed) | added
+
+    previous = calculate_production_chain("adaptive_control_unit", 30.0, before, objective)
+    incremental = recalculate_production_chain(previous, added, removed)
+    fresh = calculate_production_chain("adaptive_control_unit", 30.0, after, objective)
+    assert _chain(incremental) == _chain(fresh)
+
+
+@pytest.mark.parametrize("chain_aware_scoring", [False, True])
+@pytest.mark.parametrize("objective", list(OptimizationObjective))
+def test_incremental_resolve_matches_fresh_solve_on_random_toggles(
+    standard_recipes, all_recipes, objective, chain_aware_scoring
+):
+    rng = random.Random(7)
+    recipe_ids = sorted(all_recipes)
+    for target in ("motor", "computer", "heavy_modular_frame", "adaptive_control_unit", "fuel"):
+        unlocked = set(standard_recipes)
+        previous = calculate_production_chain(
+            target, 30.0, unlocked, objective, chain_aware_scoring=chain_aware_scoring
+        )
+        for _ in range(8):
+            recipe_id = rng.choice(recipe_ids)
+            added, removed = (set(), {recipe_id}) if recipe_id in unlocked else ({recipe_id}, set())
+            unlocked = (unlocked - removed) | added
+            incremental = recalculate_production_chain(previous, added, removed)
+            fresh = calculate_production_chain(
+                target, 30.0, unlocked, objective, chain_aware_scoring=chain_aware_scoring
+            )
+            assert _chain(incremental) == _chain(fresh), (target, recipe_id)
+            previous = incremental
+
+
+@pytest.mark.parametrize("objective", [OptimizationObjective.BALANCED, OptimizationObjective.MINIMIZE_MACHINES])
+def test_rate_dependent_objectives_keep_choices_the_change_cannot_affect(
+    monkeypatch, standard_recipes, objective
+):
+    previous = calculate_production_chain("motor", 30.0, standard_recipes, objective)
+    chain = {node.item_produced for node in previous.nodes}
+    unrelated = next(
+        recipe_id for recipe_id in sorted(satisfactory_db.RECIPES)
+        if recipe_id not in standard_recipes
+        and not {out["item"] for out in satisfactory_db.RECIPES[recipe_id]["outputs"]} & chain
+    )
+    scored = []
+    select_best_recipe = solver.select_best_recipe
+    monkeypatch.setattr(
+        solver, "select_best_recipe", lambda *args, **kwargs: scored.append(1) or select_best_recipe(*args, **kwargs)
+    )
+    incremental = recalculate_production_chain(previous, {unrelated})
+    assert scored == []
+    fresh = calculate_production_chain("motor", 30.0, standard_recipes | {unrelated}, objective)
+    assert _chain(incremental) == _chain(fresh)
+
+
+def test_results_carry_their_solver_settings(standard_recipes):
+    result = calculate_production_chain(
+        "motor", 7.0, standard_recipes, OptimizationObjective.MINIMIZE_POWER,
+        chain_aware_scoring=True, clock_mode=ClockMode.UNDERCLOCK_EVEN
+    )
+    assert result.engine == SolverEngine.GREEDY
+    assert result.dataset_name == satisfactory_db.DEFAULT_VERSION
+    assert calculate_production_chain("motor", 7.0, standard_recipes).choice_rates["motor"] == 7.0
+    again = recalculate_production_chain(result, removed_recipes={"rotor"})
+    assert (again.chain_aware_scoring, again.clock_mode) == (True, ClockMode.UNDERCLOCK_EVEN)
+    lp = calculate_production_chain("motor", 7.0, standard_recipes, engine=SolverEngine.LP)
+    assert lp.engine == SolverEngine.LP
+
+
+def test_results_solved_differently_are_not_reused(standard_recipes):
+    previous = calculate_production_chain("motor", 10.0, standard_recipes)
+    with pytest.raises(ValueError, match="objective"):
+        compile_production_plan(
+            "motor", 10.0, standard_recipes, OptimizationObjective.MINIMIZE_POWER, previous=previous
+        )
+    with pytest.raises(ValueError, match="clock mode"):
+        compile_production_plan(
+            "motor", 10.0, standard_recipes, clock_mode=ClockMode.OVERCLOCK, previous=previous
+        )
+    with pytest.raises(ValueError, match="target"):
+        compile_production_plan("rotor", 10.0, standard_recipes, previous=previous)
+    lp = calculate_production_chain("motor", 10.0, standard_recipes, engine=SolverEngine.LP)
+    with pytest.raises(ValueError, match="engine"):
+        recalculate_production_chain(lp, {"alternate_steel_rotor"})
+
+
+@pytest.mark.parametrize("engine", list(SolverEngine))
+def test_an_empty_unlocked_set_unlocks_nothing(engine):
+    result = calculate_production_chain("motor", 10.0, set(), engine=engine)
+    assert result.status != CalculationStatus.SUCCESS
+    assert result.nodes == []
+    assert select_best_recipe(
+        satisfactory_db.get_recipe_records_for_item("motor"), OptimizationObjective.BALANCED, 10.0,
+        unlocked_recipes=set()
+    ) is None
+
+
+def test_changes_to_or_from_an_empty_set_choose_everything_again(standard_recipes):
+    previous = calculate_production_chain("motor", 10.0, standard_recipes)
+    emptied = ProductionChainSolver(set())
+    assert emptied.reuse_choices(previous, removed_recipes=standard_recipes) == {
+        node.item_produced for node in previous.nodes
+    }
+    assert emptied.pinned_recipes == {}
+    empty = dataclasses.replace(previous, unlocked_recipes=frozenset())
+    refilled = ProductionChainSolver(standard_recipes)
+    refilled.reuse_choices(empty, added_recipes=standard_recipes)
+    assert refilled.pinned_recipes == {}
+    fresh = calculate_production_chain("motor", 10.0, standard_recipes)
+    assert _chain(recalculate_production_chain(empty, added_recipes=standard_recipes)) == _chain(fresh)
@@ -0,0 +1,57 @@
+"""
+Tests for the bitmask form of unlocked recipe sets.
+"""
+
+import pytest
+
+from data import satisfactory_db
+from data.unlock_mask import UnlockCodec
+
+IRON = {"iron_ingot", "iron_plate", "iron_rod", "screw"}
+COPPER = {"copper_ingot", "wire", "cable"}
+
+
+@pytest.fixture
+def codec():
+    return satisfactory_db.get_unlock_codec()
+
+
+def test_encoding_round_trips(codec, standard_recipes):
+    mask = codec.encode(standard_recipes | {"no_such_recipe"})
+    assert set(mask) == standard_recipes
+    assert len(mask) == len(standard_recipes)
+    assert "iron_plate" in mask and "no_such_recipe" not in mask
+    assert codec.encode(mask) is mask
+    assert codec.from_hex(mask.hex()) == mask
+    assert not codec.none() and set(codec.all()) == set(satisfactory_db.RECIPES)
+
+
+def test_masks_are_canonical_keys(codec):
+    a = codec.encode(["screw", "iron_plate", "iron_rod", "iron_ingot"])
+    b = codec.encode(sorted(IRON))
+    assert a == b and hash(a) == hash(b)
+    assert a == IRON and hash(a) == hash(frozenset(IRON))
+    assert len({a, b, frozenset(IRON)}) == 1
+    assert {frozenset(IRON): "iron"}[a] == "iron"
+
+
+def test_set_algebra_matches_plain_sets(codec):
+    iron = codec.encode(IRON)
+    copper = codec.encode(COPPER)
+    both = iron | copper
+    assert set(both) == IRON | COPPER
+    assert set(both & IRON) == IRON
+    assert set(both - copper) == IRON
+    assert set(iron ^ (IRON | {"wire"})) == {"wire"}
+    assert set(IRON | copper) == IRON | COPPER
+    assert (IRON | COPPER) - iron == copper
+    assert isinstance((IRON | COPPER) - iron, type(iron))
+    assert isinstance(int(both) - iron, type(iron))
+    assert iron <= both and both >= copper and iron.isdisjoint(copper)
+    assert iron <= IRON | {"wire"}
+
+
+def test_hex_keys_are_tied_to_the_recipe_order(codec):
+    other = UnlockCodec(list(reversed(codec.recipe_ids)))
+    with pytest.raises(ValueError):
+        other.from_hex(codec.encode(IRON).hex())
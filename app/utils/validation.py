@@ -150,6 +150,19 @@ def format_power(power: float) -> str:
         return f"{power:.0f} MW"
 
 
+def format_clock_speed(clock_speed: float) -> str:
+    """
+    Format a clock speed for display, to the game's 4 decimal places.
+    
+    Args:
+        clock_speed: Clock speed in percent
+    
+    Returns:
+        Formatted string
+    """
+    return f"{clock_speed:.4f}".rstrip("0").rstrip(".") + "%"
+
+
 def sanitize_filename(filename: str) -> str:
     """
     Sanitize filename for safe file system usage.
@@ -262,9 +275,14 @@ def format_summary_stats(result) -> str:
         Formatted summary string
     """
     lines = []
-    lines.append(f"**Target:** {result.target_rate:.1f} {result.target_item_name}/min")
+    if result.targets:
+        lines.append(f"**Targets:** {result.target_item_name} ({format_rate(result.target_rate)} total)")
+    else:
+        lines.append(f"**Target:** {result.target_rate:.1f} {result.target_item_name}/min")
     lines.append(f"**Total Machines:** {result.total_machines}")
     lines.append(f"**Total Power:** {format_power(result.total_power)}")
+    if result.total_power_shards:
+        lines.append(f"**Power Shards:** {result.total_power_shards}")
     lines.append(f"**Raw Resources:** {result.total_raw_resources} types")
     
     if result.raw_resources:
@@ -3,12 +3,14 @@ Graphviz rendering for production chain visualization.
 """
 
 import graphviz
-from typing import List, Optional
+from typing import List
 import tempfile
 import os
 from pathlib import Path
 
-from optimizer.models import ProductionChainResult, MachineNode, Connection
+from optimizer.models import ProductionChainResult, MachineNode, Connection, ProductionStage
+from optimizer.plan import chain_depths
+from utils.validation import format_clock_speed
 
 # Configure Graphviz executable path for Windows
 if os.name == 'nt':  # Windows
@@ -30,7 +32,7 @@ def create_production_graph(
         result: Production chain result
         show_rates: Show production rates on edges
         show_power: Show power consumption on nodes
-        collapse_by_tier: Group nodes by tier (for large diagrams)
+        collapse_by_tier: Group nodes into production stages (for large diagrams)
     
     Returns:
         Graphviz Digraph object
@@ -47,17 +49,15 @@ def create_production_graph(
     dot.attr('edge', fontname='Arial', fontsize='10')
     
     # Add nodes
-    for node in result.nodes:
-        label = _create_node_label(node, show_power)
-        color = _get_node_color(node)
-        tooltip = _create_node_tooltip(node)
-        
-        dot.node(
-            node.node_id,
-            label=label,
-            fillcolor=color,
-            tooltip=tooltip
-        )
+    if collapse_by_tier:
+        for stage in build_production_stages(result):
+            with dot.subgraph(name=f"cluster_stage_{stage.stage_number}") as cluster:
+                cluster.attr(label=stage.stage_name, style='dashed', color='gray')
+                for node in stage.nodes:
+                    _add_machine_node(cluster, node, show_power)
+    else:
+        for node in result.nodes:
+            _add_machine_node(dot, node, show_power)
     
     # Add raw resource nodes
     for raw_resource in result.raw_resources:
@@ -104,6 +104,40 @@ def create_production_graph(
     return dot
 
 
+def build_production_stages(result: ProductionChainResult) -> List[ProductionStage]:
+    """
+    Group the nodes of a result into stages by production depth.
+    
+    Depth is taken from the chain's own connections, so it does not depend
+    on the unlocked recipes or the dataset the result was solved with.
+    
+    Args:
+        result: Production chain result
+    
+    Returns:
+        Non-empty stages, from raw-resource processing up to the target
+    """
+    depths = chain_depths(result.nodes, result.connections)
+    by_depth = {}
+    for node in result.nodes:
+        by_depth.setdefault(depths[node.node_id], []).append(node)
+    
+    return [
+        ProductionStage(stage_number=depth, stage_name=f"Stage {depth}", nodes=nodes)
+        for depth, nodes in sorted(by_depth.items())
+    ]
+
+
+def _add_machine_node(dot: graphviz.Digraph, node: MachineNode, show_power: bool):
+    """Add a machine node to a graph or subgraph."""
+    dot.node(
+        node.node_id,
+        label=_create_node_label(node, show_power),
+        fillcolor=_get_node_color(node),
+        tooltip=_create_node_tooltip(node)
+    )
+
+
 def _create_node_label(node: MachineNode, show_power: bool) -> str:
     """Create label for a machine node."""
     lines = []
@@ -118,6 +152,10 @@ def _create_node_label(node: MachineNode, show_power: bool) -> str:
     else:
         lines.append(f"{node.machine_count:.2f}x {node.machine_type}")
     
+    # Clock speed, if not running at 100%
+    if node.clock_speed != 100.0:
+        lines.append(f"@ {format_clock_speed(node.clock_speed)}")
+    
     # Output rate
     lines.append(f"→ {node.target_rate:.1f} {node.item_produced_name}/min")
     
@@ -147,9 +185,12 @@ def _create_node_tooltip(node: MachineNode) -> str:
         f"Recipe: {node.recipe_name}",
         f"Machine: {node.machine_type}",
         f"Count: {node.machine_count:.2f}",
+        f"Clock: {format_clock_speed(node.clock_speed)}",
         f"Output: {node.target_rate:.2f} {node.item_produced_name}/min",
         f"Power: {node.total_power:.2f} MW"
     ]
+    if node.power_shards:
+        lines.append(f"Power shards: {node.power_shards} per machine")
     
     if node.inputs:
         lines.append("Inputs:")
@@ -337,6 +378,11 @@ def create_summary_text(result: ProductionChainResult) -> str:
     lines = []
     lines.append(f"Production Chain for {result.target_item_name}")
     lines.append(f"Target Rate: {result.target_rate:.2f}/min")
+    if result.targets:
+        names = {node.item_produced: node.item_produced_name for node in result.nodes}
+        names.update((rr.item_id, rr.item_name) for rr in result.raw_resources)
+        for item_id, rate in result.targets.items():
+            lines.append(f"  - {names.get(item_id, item_id)}: {rate:.2f}/min")
     lines.append(f"Status: {result.status.value}")
     lines.append("")
     